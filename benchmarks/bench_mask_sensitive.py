@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""mask_sensitive_data benchmark.
+
+Compares the per-pattern masking chain (one regex pass per secret pattern
+plus the emoji-id stash/restore) with the combined single-pass scanner on
+traceback-shaped payloads of several sizes, with and without secrets.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_mask_sensitive [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from core.lib.utils.logger import _mask_sensitive_chain, mask_sensitive_data
+
+FRAME = (
+    '  File "/home/user/MCUB/core/lib/loader/module_loader.py", line {n}, '
+    "in _load_module\n"
+    "    await self._run_setup(module, kernel_proxy)\n"
+)
+SECRETS = (
+    "RPCError: api_id=12345678 api_hash=0123456789abcdef0123456789abcdef\n"
+    "bot token='1234567890:AAHdqTcvCH1vGWJxfSeofSAs0K5PALDsaw'\n"
+    '<tg-emoji emoji-id="5368324170671202286">👍</tg-emoji> user 79991234567\n'
+)
+SIZES = (1, 10, 100)
+
+
+def _payload(frames: int, secrets: bool) -> str:
+    body = "Traceback (most recent call last):\n" + "".join(
+        FRAME.format(n=100 + i) for i in range(frames)
+    )
+    tail = SECRETS if secrets else "ValueError: module setup failed\n"
+    return body + tail
+
+
+def _time(func, text: str, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func(text)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main(rounds: int) -> None:
+    print(
+        f"{'frames':>6} {'bytes':>7} {'secrets':>8} "
+        f"{'chain':>10} {'single':>10} {'speedup':>8}   (us/op)"
+    )
+    for frames in SIZES:
+        for secrets in (False, True):
+            text = _payload(frames, secrets)
+            assert mask_sensitive_data(text) == _mask_sensitive_chain(text)
+            chain = _time(_mask_sensitive_chain, text, rounds)
+            single = _time(mask_sensitive_data, text, rounds)
+            print(
+                f"{frames:>6} {len(text):>7} {secrets!s:>8} "
+                f"{chain:>10.1f} {single:>10.1f} {chain / single:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.rounds)
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""Module config read/write benchmark.
+
+Compares the previous ConfigManager behaviour (``json.loads`` of the whole
+blob on every key read, ``json.dumps(indent=2)`` on every write) with the
+parsed-config cache at several config sizes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_module_config [--reads N] [--writes N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from types import SimpleNamespace
+
+from core.lib.base.config import ConfigManager
+
+SIZES = (10, 100, 1000)
+
+
+def _make_kernel(store: dict[tuple[str, str], str]) -> SimpleNamespace:
+    async def db_get(module, key):
+        return store.get((module, key))
+
+    async def db_set(module, key, value):
+        store[(module, key)] = value
+
+    async def db_delete(module, key):
+        store.pop((module, key), None)
+
+    logger = logging.getLogger("bench.module_config")
+    logger.setLevel(logging.WARNING)
+    return SimpleNamespace(
+        db_get=db_get, db_set=db_set, db_delete=db_delete, logger=logger
+    )
+
+
+def _make_config(size: int) -> dict:
+    return {f"key_{i}": (i if i % 3 else f"value {i}") for i in range(size)}
+
+
+class _LegacyConfig:
+    """The pre-cache read/write path, kept here as the baseline."""
+
+    def __init__(self, kernel: SimpleNamespace) -> None:
+        self.k = kernel
+
+    async def get_key(self, module_name, key, default=None):
+        raw = await self.k.db_get("module_configs", module_name)
+        config = json.loads(raw) if raw else {}
+        return config.get(key, default)
+
+    async def set_key(self, module_name, key, value):
+        raw = await self.k.db_get("module_configs", module_name)
+        config = json.loads(raw) if raw else {}
+        config[key] = value
+        await self.k.db_set(
+            "module_configs",
+            module_name,
+            json.dumps(config, ensure_ascii=False, indent=2),
+        )
+        return True
+
+
+async def _time(coro_factory, count: int) -> float:
+    started = time.perf_counter()
+    for i in range(count):
+        await coro_factory(i)
+    return (time.perf_counter() - started) / count * 1e6
+
+
+async def _bench(size: int, reads: int, writes: int) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for name, factory in (("legacy", _LegacyConfig), ("cached", ConfigManager)):
+        store = {("module_configs", "bench"): json.dumps(_make_config(size), indent=2)}
+        manager = factory(_make_kernel(store))
+        results[f"{name}_read"] = await _time(
+            lambda i, m=manager: m.get_key("bench", f"key_{i % size}"), reads
+        )
+        results[f"{name}_write"] = await _time(
+            lambda i, m=manager: m.set_key("bench", f"key_{i % size}", i), writes
+        )
+    return results
+
+
+async def main(reads: int, writes: int) -> None:
+    print(
+        f"{'keys':>6} {'legacy read':>12} {'cached read':>12} "
+        f"{'legacy write':>13} {'cached write':>13}   (us/op)"
+    )
+    for size in SIZES:
+        r = await _bench(size, reads, writes)
+        print(
+            f"{size:>6} {r['legacy_read']:>12.1f} {r['cached_read']:>12.1f} "
+            f"{r['legacy_write']:>13.1f} {r['cached_write']:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--writes", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.reads, args.writes))
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""PipelineParser benchmark.
+
+Parses ``.echo <text> | .grep x`` style command texts from 10 B to 1 MB,
+with a plain payload and with one full of quotes, escapes and operator
+characters, and reports the uncached tokenizer cost alongside the cached
+parse used for repeated texts (aliases, macros).
+
+Run from the repository root::
+
+    python -m benchmarks.bench_pipeline_parser [--budget SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from utils.arg_parser import PipelineParser
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+PLAIN = "lorem ipsum dolor sit amet "
+NOISY = "a|b & 'c | d' \\&& \"e && f\" x||y "
+
+
+def _command(size: int, filler: str) -> str:
+    head, tail = ".echo ", " | .grep x"
+    body_len = max(size - len(head) - len(tail), 0)
+    body = (filler * (body_len // len(filler) + 1))[:body_len]
+    return head + body + tail
+
+
+def _time(func, text: str, budget: float) -> tuple[float, int]:
+    rounds = 0
+    started = time.perf_counter()
+    while True:
+        func(text)
+        rounds += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= budget:
+            return elapsed / rounds * 1e6, rounds
+
+
+def main(budget: float) -> None:
+    print(
+        f"{'payload':<7} {'bytes':>9} {'segments':>8} "
+        f"{'tokenize':>12} {'MB/s':>8} {'cached':>9}   (us/op)"
+    )
+    for name, filler in (("plain", PLAIN), ("noisy", NOISY)):
+        for size in SIZES:
+            text = _command(size, filler)
+            segments = len(PipelineParser(text).segments)
+            cold, _ = _time(PipelineParser._tokenize, text, budget)
+            cached, _ = _time(PipelineParser, text, budget)
+            rate = len(text) / cold if cold else 0.0
+            print(
+                f"{name:<7} {len(text):>9} {segments:>8} "
+                f"{cold:>12.1f} {rate:>8.1f} {cached:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=0.2)
+    args = parser.parse_args()
+    main(args.budget)
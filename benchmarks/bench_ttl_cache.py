@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""TTLCache benchmark.
+
+Measures the per-operation cost of the kernel cache for the access patterns
+modules actually use: hits, misses, overwriting a live key, inserting new
+keys into a full cache (LRU eviction) and batch reads.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_ttl_cache [--rounds N] [--size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from core.lib.time.cache import TTLCache
+
+
+def _time(func, rounds: int) -> float:
+    started = time.perf_counter()
+    func(rounds)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main(rounds: int, size: int) -> None:
+    keys = [f"cfg_view_{i}" for i in range(size)]
+    cache = TTLCache(max_size=size, ttl=600)
+    for key in keys:
+        cache.set(key, key)
+
+    def get_hit(n: int) -> None:
+        get = cache.get
+        for i in range(n):
+            get(keys[i % size])
+
+    def get_miss(n: int) -> None:
+        get = cache.get
+        for _ in range(n):
+            get("info:missing")
+
+    def set_update(n: int) -> None:
+        put = cache.set
+        for i in range(n):
+            put(keys[i % size], i)
+
+    def set_evict(n: int) -> None:
+        put = cache.set
+        for i in range(n):
+            put(f"module_nav_{i}", i)
+
+    def get_batch(n: int) -> None:
+        batch = keys[:10]
+        get_many = getattr(cache, "get_many", None)
+        for _ in range(n // 10):
+            if get_many is not None:
+                get_many(batch)
+            else:
+                for key in batch:
+                    cache.get(key)
+
+    print(f"{'operation':<12} {'us/op':>8}   (size={size}, rounds={rounds})")
+    for name, func in (
+        ("get hit", get_hit),
+        ("get miss", get_miss),
+        ("set update", set_update),
+        ("set evict", set_evict),
+        ("get x10", get_batch),
+    ):
+        print(f"{name:<12} {_time(func, rounds):>8.3f}")
+    heap = getattr(cache, "_expiry_heap", ())
+    print(f"entries={cache.size()} heap={len(heap)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200000)
+    parser.add_argument("--size", type=int, default=500)
+    args = parser.parse_args()
+    main(args.rounds, args.size)
@@ -52,6 +52,7 @@ except Exception as err:
 
 try:
     from core.lib.utils.case_insensitive import CaseInsensitiveDict
+    from core.lib.utils.versioned_dict import VersionedDict
     from utils.strings import Strings
 
     from ..lib.base.client import ClientManager
@@ -63,7 +64,7 @@ try:
     from ..lib.loader.loader import ModuleLoader
     from ..lib.loader.register import Register, _collect_command_docs
     from ..lib.loader.repository import RepositoryManager
-    from ..lib.time.cache import TTLCache
+    from ..lib.time.cache import KERNEL_CACHE_BUDGETS, KERNEL_CACHE_MAX_SIZE, TTLCache
     from ..lib.time.scheduler import TaskScheduler
     from ..lib.utils.colors import Colors
     from ..lib.utils.exceptions import CommandConflictError
@@ -177,7 +178,7 @@ class Kernel:
         self.bot_command_handlers: dict = {}
         self.bot_command_owners: dict = {}
         self.bot_command_docs: dict = {}  # {cmd: {lang: description}}
-        self.inline_handlers: dict = {}
+        self.inline_handlers: VersionedDict = VersionedDict()
         self.inline_handlers_owners: dict = {}
         self.callback_handlers: dict = {}
         self.aliases: dict = {}
@@ -221,7 +222,9 @@ class Kernel:
         self.UPDATE_REPO = "https://raw.githubusercontent.com/hairpin01/MCUB-fork/main/"
         self.default_repo = self.MODULES_REPO
 
-        self.cache = TTLCache(max_size=500, ttl=600)
+        self.cache = TTLCache(
+            max_size=KERNEL_CACHE_MAX_SIZE, ttl=600, budgets=KERNEL_CACHE_BUDGETS
+        )
         self.logger = setup_logging()
         self.register = Register(self)
         self.callback_permissions = CallbackPermissionManager()
@@ -822,6 +825,12 @@ class Kernel:
                         type(client).__name__,
                     )
                     continue
+                router = getattr(wrapper, "__watcher_router__", None)
+                if router is not None:
+                    # Routed watchers share one binding per client.
+                    if router.ensure_bound():
+                        restored.append(f"watcher_router:{module_name}")
+                    continue
                 if _has_binding(wrapper, event_obj):
                     self.logger.debug(
                         "[module_handlers] watcher-present reason=%r module=%r watcher=%r event=%r",
@@ -889,6 +898,11 @@ class Kernel:
             if seen_key in seen_watchers:
                 continue
             seen_watchers.add(seen_key)
+            router = getattr(wrapper, "__watcher_router__", None)
+            if router is not None:
+                if router.ensure_bound():
+                    restored.append(f"central_watcher_router:{module_name}")
+                continue
             if _has_binding(wrapper, event_obj):
                 continue
             client = entry[2] if len(entry) > 2 else self.client
@@ -1034,8 +1048,8 @@ class Kernel:
     def unregister_module_inline_handlers(self, module_name: str) -> None:
         self._inline.unregister_module_inline_handlers(module_name)
 
-    def register_callback_handler(self, pattern, handler) -> None:
-        self._inline.register_callback_handler(pattern, handler)
+    def register_callback_handler(self, pattern, handler, owner=None) -> None:
+        self._inline.register_callback_handler(pattern, handler, owner)
 
     async def inline_query_and_click(self, chat_id, query, **kwargs):
         return await self._inline.inline_query_and_click(chat_id, query, **kwargs)
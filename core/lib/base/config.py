@@ -3,12 +3,15 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import os
 import sys
 from typing import TYPE_CHECKING, Any
 
+from core.lib.utils.versioned_dict import VersionedDict
+
 try:
     from utils.security import ensure_locked_after_write
 except ImportError:
@@ -36,6 +39,18 @@ if TYPE_CHECKING:
     from kernel import Kernel
 
 
+def _detached(config: dict) -> dict:
+    """Copy *config* so callers cannot mutate the cached parse.
+
+    Scalars are shared; only nested containers are deep-copied, which keeps
+    the common all-scalar config a plain dict copy.
+    """
+    return {
+        key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        for key, value in config.items()
+    }
+
+
 class ConfigManager:
     """Handles kernel config file I/O and per-module config stored in the DB."""
 
@@ -45,6 +60,10 @@ class ConfigManager:
         self.k = kernel
         self._backup_api_hash = ""
         self._previous_config = {}
+        # Parsed module configs: module -> (stored JSON text, parsed dict).
+        # Reused while the stored text is unchanged, so per-message key
+        # lookups skip json.loads.
+        self._module_configs: dict[str, tuple[str, dict]] = {}
 
     def _get_api_hash(self, cfg: dict) -> str:
         """Generate hash from api_id + api_hash (SHA256, same as security.py)."""
@@ -355,7 +374,12 @@ class ConfigManager:
                 }
             else:
                 k.owner_prefixes = {}
-            k.aliases = k.config.get("aliases", {})
+            aliases = k.config.get("aliases")
+            if not isinstance(aliases, VersionedDict):
+                aliases = VersionedDict(aliases or {})
+                if "aliases" in k.config:
+                    k.config["aliases"] = aliases
+            k.aliases = aliases
             k.power_save_mode = k.config.get("power_save_mode", False)
             k.API_ID = int(k.config["api_id"])
             k.API_HASH = str(k.config["api_hash"])
@@ -490,6 +514,25 @@ class ConfigManager:
                 print(f"\n{_C.MUTED}Setup interrupted{_C.RESET}\n")
                 sys.exit(1)
 
+    async def _load_module_config(self, module_name: str) -> tuple[Any, int]:
+        """Return ``(parsed config or None, stored size)`` for *module_name*.
+
+        The stored text is still read through ``db_get`` (served from the DB
+        read cache), so writes made by any other path are picked up; only the
+        JSON parse is skipped when the text is unchanged.
+        """
+        raw = await self.k.db_get("module_configs", module_name)
+        if not raw:
+            self._module_configs.pop(module_name, None)
+            return None, 0
+        cached = self._module_configs.get(module_name)
+        if cached is not None and cached[0] == raw:
+            return cached[1], len(raw)
+        parsed = json.loads(raw)
+        if isinstance(parsed, dict):
+            self._module_configs[module_name] = (raw, parsed)
+        return parsed, len(raw)
+
     async def get_module_config(self, module_name: str, default: Any = None) -> dict:
         """Load a module's config dict from the database.
 
@@ -498,18 +541,20 @@ class ConfigManager:
             default: Returned when no config exists (defaults to ``{}``).
 
         Returns:
-            Deserialized config dict.
+            Deserialized config dict (a copy the caller may modify).
         """
         k = self.k
         try:
-            raw = await k.db_get("module_configs", module_name)
+            parsed, size = await self._load_module_config(module_name)
             k.logger.debug(
                 "Loaded module config module=%r found=%s bytes=%d",
                 module_name,
-                bool(raw),
-                len(raw) if raw else 0,
+                bool(size),
+                size,
             )
-            return json.loads(raw) if raw else (default if default is not None else {})
+            if not size:
+                return default if default is not None else {}
+            return _detached(parsed) if isinstance(parsed, dict) else parsed
         except Exception as e:
             k.logger.error(f"Error loading config for {module_name}: {e}")
             return default if default is not None else {}
@@ -517,6 +562,8 @@ class ConfigManager:
     async def save_module_config(self, module_name: str, config_data: dict) -> bool:
         """Persist a module's config dict to the database.
 
+        Stored as compact JSON.
+
         Returns:
             True on success.
         """
@@ -527,10 +574,11 @@ class ConfigManager:
                 module_name,
                 sorted(config_data.keys()),
             )
+            self._module_configs.pop(module_name, None)
             await k.db_set(
                 "module_configs",
                 module_name,
-                json.dumps(config_data, ensure_ascii=False, indent=2),
+                json.dumps(config_data, ensure_ascii=False, separators=(",", ":")),
             )
             k.logger.debug("Module config saved module=%r", module_name)
             return True
@@ -545,6 +593,7 @@ class ConfigManager:
             True on success.
         """
         k = self.k
+        self._module_configs.pop(module_name, None)
         try:
             k.logger.debug("Deleting module config module=%r", module_name)
             await k.db_delete("module_configs", module_name)
@@ -565,22 +614,53 @@ class ConfigManager:
         Returns:
             The stored value or *default*.
         """
-        config = await self.get_module_config(module_name, {})
+        try:
+            config, _size = await self._load_module_config(module_name)
+        except Exception as e:
+            self.k.logger.error(f"Error loading config for {module_name}: {e}")
+            return default
+        if not isinstance(config, dict):
+            config = {}
         self.k.logger.debug(
             "Config key lookup module=%r key=%r hit=%s",
             module_name,
             key,
             key in config,
         )
-        return config.get(key, default)
+        value = config.get(key, default)
+        # Don't hand out the cached containers themselves.
+        if isinstance(value, (dict, list)) and key in config:
+            return copy.deepcopy(value)
+        return value
+
+    @staticmethod
+    def _same_value(old: Any, new: Any) -> bool:
+        """Compare as stored: ``1``, ``1.0`` and ``True`` are different values."""
+        try:
+            encoded = [
+                json.dumps(v, ensure_ascii=False, separators=(",", ":"))
+                for v in (old, new)
+            ]
+        except (TypeError, ValueError):
+            return False
+        return encoded[0] == encoded[1]
 
     async def set_key(self, module_name: str, key: str, value: Any) -> bool:
         """Set a single key in a module's config.
 
+        Writing the value a key already holds is a no-op.
+
         Returns:
             True on success.
         """
         config = await self.get_module_config(module_name, {})
+        if key in config and self._same_value(config[key], value):
+            self.k.logger.debug(
+                "Config key set skipped module=%r key=%r reason=unchanged",
+                module_name,
+                key,
+            )
+            return True
         config[key] = value
         self.k.logger.debug("Config key set module=%r key=%r", module_name, key)
         return await self.save_module_config(module_name, config)
@@ -610,6 +690,14 @@ class ConfigManager:
             True on success.
         """
         config = await self.get_module_config(module_name, {})
+        if all(
+            k_ in config and self._same_value(config[k_], v_)
+            for k_, v_ in updates.items()
+        ):
+            self.k.logger.debug(
+                "Config update skipped module=%r reason=unchanged", module_name
+            )
+            return True
         config.update(updates)
         self.k.logger.debug(
             "Config updated module=%r updated_keys=%s",
@@ -3,12 +3,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
 from typing import Any
 
 # author: @Hairpin00
-# version: 1.0.3
+# version: 1.0.4
 # description: SQLite database manager for the userbot.
 try:
     import aiosqlite
@@ -30,6 +34,113 @@ except ImportError:
     )
 
 
+_MISS = object()
+
+# Rough per-entry bookkeeping cost (tuple, dict slot, key object) in bytes.
+_CACHE_ENTRY_OVERHEAD = 96
+
+
+class DbGetCache:
+    """Byte-bounded LRU cache for ``db_get`` results.
+
+    Hits move the entry to the most-recent end, inserts evict from the
+    least-recent end until the approximate byte size fits ``max_bytes``.
+    Cached misses (``None``) expire after ``negative_ttl`` seconds so rows
+    written by other connections eventually become visible.
+
+    Sizes are estimated from string lengths, which is exact for ASCII and
+    close enough for budgeting otherwise.
+    """
+
+    def __init__(self, max_bytes: int, negative_ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        # Entries larger than this are never cached.
+        self.max_entry_bytes = max(1, max_bytes // 8)
+        self._data: OrderedDict[str, tuple[str | None, int, float]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISS) is not _MISS
+
+    def __getitem__(self, key: str) -> str | None:
+        value = self.get(key, _MISS)
+        if value is _MISS:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Peek at *key* without touching recency or counters."""
+        entry = self._data.get(key)
+        if entry is None or (entry[2] and entry[2] < time.monotonic()):
+            return default
+        return entry[0]
+
+    def lookup(self, key: str) -> Any:
+        """Return the cached value for *key* or :data:`_MISS`, counting it."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISS
+        value, size, expires = entry
+        if expires and expires < time.monotonic():
+            del self._data[key]
+            self.bytes -= size
+            self.expired += 1
+            self.misses += 1
+            return _MISS
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: str | None) -> None:
+        size = _CACHE_ENTRY_OVERHEAD + len(key) + (len(value) if value else 0)
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if size > self.max_entry_bytes:
+            return
+        expires = time.monotonic() + self.negative_ttl if value is None else 0.0
+        self._data[key] = (value, size, expires)
+        self.bytes += size
+        while self.bytes > self.max_bytes and self._data:
+            _key, (_value, old_size, _expires) = self._data.popitem(last=False)
+            self.bytes -= old_size
+            self.evictions += 1
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        self.bytes -= entry[1]
+        return entry[0]
+
+    def clear(self) -> int:
+        """Drop every entry; return the approximate number of bytes freed."""
+        freed = self.bytes
+        self._data.clear()
+        self.bytes = 0
+        return freed
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._data),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
+
+
 class DatabaseManager:
     """SQLite database manager for the userbot."""
 
@@ -82,22 +193,62 @@ class DatabaseManager:
                 return key[0] + "***" + key[-1]
         return key
 
-    # Hard cap on in-memory get-cache entries.  Beyond this the LRU sentinel
-    # (oldest key) is dropped.  Prevents unbounded growth when many modules
-    # each store dozens of keys (e.g. config module, trusted module, etc.).
-    _GET_CACHE_MAXSIZE = 2048
+    # Approximate byte budget of the db_get cache.  Least recently used
+    # entries are dropped beyond this, so many modules storing dozens of keys
+    # (config module, trusted module, ...) cannot grow it without bound.
+    _GET_CACHE_MAX_BYTES = 4 * 1024 * 1024
+    # Cached "no such row" answers are re-checked after this many seconds.
+    _GET_CACHE_NEGATIVE_TTL = 60.0
+    # SQLite's default host-parameter limit is 999; stay well below it.
+    _MANY_CHUNK = 500
+    _SIZED_SELECT = (
+        "SELECT key, LENGTH(value), CASE WHEN LENGTH(value) > ? THEN NULL "
+        "ELSE value END FROM module_data WHERE module = ?"
+    )
     _MAX_VALUE_BYTES = 16 * 1024 * 1024
+    # Passed to write listeners in place of a value when a row is deleted.
+    DELETED = object()
     _WAL_TRUNCATE_BYTES = 64 * 1024 * 1024
+    # Background maintenance (run on the kernel TaskScheduler).  Checkpoints
+    # wait until no write happened for _MAINTENANCE_IDLE_SECONDS, unless the
+    # WAL has already grown past _WAL_TRUNCATE_BYTES.
+    _MAINTENANCE_INTERVAL = 300.0
+    _MAINTENANCE_IDLE_SECONDS = 10.0
+    _INCREMENTAL_VACUUM_PAGES = 512
+    _SIZE_HISTORY = 48
+    # Write-behind (config ``db_write_behind``): pending rows are flushed in
+    # one transaction once this many distinct keys are buffered or after
+    # ``db_write_behind_delay`` seconds, whichever comes first.
+    _WRITE_BEHIND_MAX_ROWS = 256
+    _WRITE_BEHIND_DELAY = 0.5
 
     def __init__(self, kernel):
         self.kernel = kernel
         self.conn = None
         self.logger = kernel.logger
-        # Write-through LRU cache for db_get: { "module:key": value }
-        # Bounded to _GET_CACHE_MAXSIZE entries; cleared on db_set/db_delete.
-        self._get_cache: dict[str, str | None] = {}
-        # Pending write buffer for db_set_many / flush_writes.
-        self._write_buf: list[tuple[str, str, str]] = []
+        # LRU cache for db_get: "module:key" -> value, invalidated on
+        # db_set/db_delete.
+        self._get_cache = DbGetCache(
+            self._GET_CACHE_MAX_BYTES, self._GET_CACHE_NEGATIVE_TTL
+        )
+        # Write-behind buffer: { (module, key): stored value }.  Repeated
+        # db_set calls on the same key coalesce into a single row.
+        self._write_buf: dict[tuple[str, str], str] = {}
+        self.write_behind = False
+        self.write_behind_delay = self._WRITE_BEHIND_DELAY
+        self.write_behind_max_rows = self._WRITE_BEHIND_MAX_ROWS
+        self.write_stats = {"buffered": 0, "coalesced": 0, "flushes": 0, "rows": 0}
+        self._flush_task: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+        # Monotonic time of the last commit; maintenance waits for idle.
+        self._last_write = 0.0
+        # Called as listener(module, key, value) once a write is visible to
+        # db_get; value is DELETED for db_delete.
+        self._write_listeners: list[Callable[[str, str, Any], None]] = []
+        # (unix time, db bytes, wal bytes) samples taken by run_maintenance.
+        self.size_history: deque[tuple[float, int, int]] = deque(
+            maxlen=self._SIZE_HISTORY
+        )
 
     def _resolve_db_file(self) -> str:
         """Resolve database path from kernel settings with a safe fallback."""
@@ -133,6 +284,17 @@ class DatabaseManager:
 
         return self.DEFAULT_DB_FILE
 
+    def _configure_write_behind(self) -> None:
+        config = getattr(self.kernel, "__dict__", {}).get("config")
+        if not isinstance(config, dict):
+            return
+        self.write_behind = bool(config.get("db_write_behind", False))
+        try:
+            delay = float(config.get("db_write_behind_delay", self._WRITE_BEHIND_DELAY))
+        except (TypeError, ValueError):
+            delay = self._WRITE_BEHIND_DELAY
+        self.write_behind_delay = max(0.0, delay)
+
     def _strip_comments(self, query: str) -> str:
         """Remove SQL comments from query before validation."""
         query = re.sub(r"/\*.*?\*/", " ", query, flags=re.DOTALL)
@@ -224,8 +386,18 @@ class DatabaseManager:
             await self.conn.execute("PRAGMA temp_store = MEMORY")
             # Memory-map the first 64 MB of the DB file for O(1) reads.
             await self.conn.execute("PRAGMA mmap_size = 67108864")
+            # Lets run_maintenance return free pages in small steps.  Only
+            # takes effect on new databases (existing ones would need VACUUM).
+            await self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
 
             await self._create_tables()
+            self._configure_write_behind()
+            scheduler = getattr(self.kernel, "__dict__", {}).get("scheduler")
+            if scheduler is not None:
+                try:
+                    await self.schedule_maintenance(scheduler)
+                except Exception as e:
+                    self.logger.debug("[DB] maintenance not scheduled: %s", e)
             # Lock the DB file right after creation/open
             ensure_locked_after_write(db_file, self.logger)
             self.logger.info(f"=> Database initialized: {db_file}")
@@ -237,16 +409,14 @@ class DatabaseManager:
 
     async def _create_tables(self):
         """Create required tables."""
-        await self.conn.execute(
-            """
+        await self.conn.execute("""
             CREATE TABLE IF NOT EXISTS module_data (
                 module TEXT,
                 key TEXT,
                 value TEXT,
                 PRIMARY KEY (module, key)
             )
-        """
-        )
+        """)
         await self.conn.commit()
 
     def _validate_identifier(self, value: str) -> bool:
@@ -263,19 +433,12 @@ class DatabaseManager:
         return re.sub(r"[^a-zA-Z0-9_.\-:]+", "_", value)
 
     def _cache_put(self, cache_key: str, value: str | None) -> None:
-        """Insert into the bounded LRU get-cache, evicting the oldest entry if full."""
-        if cache_key in self._get_cache:
-            # Refresh: remove then re-insert at the end (OrderedDict not used here
-            # but plain dict preserves insertion order in CPython 3.7+).
-            del self._get_cache[cache_key]
-        elif len(self._get_cache) >= self._GET_CACHE_MAXSIZE:
-            # Drop the oldest entry (first in insertion order).
-            try:
-                oldest = next(iter(self._get_cache))
-                del self._get_cache[oldest]
-            except StopIteration:
-                pass
-        self._get_cache[cache_key] = value
+        """Insert into the byte-bounded LRU get-cache."""
+        self._get_cache.put(cache_key, value)
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and size of the db_get cache."""
+        return self._get_cache.stats()
 
     def _stringify_value(self, module: str, key: str, value: Any) -> str:
         text = str(value)
@@ -287,19 +450,112 @@ class DatabaseManager:
             )
         return text
 
-    async def _checkpoint_wal_if_needed(self) -> None:
+    def _file_sizes(self) -> tuple[int, int]:
+        db_file = self._resolve_db_file()
+        sizes = []
+        for path in (db_file, f"{db_file}-wal"):
+            try:
+                sizes.append(os.path.getsize(path))
+            except OSError:
+                sizes.append(0)
+        return sizes[0], sizes[1]
+
+    async def run_maintenance(self, force: bool = False) -> dict[str, Any]:
+        """Checkpoint, optimize and sample file sizes, off the write path.
+
+        The WAL is checkpointed in PASSIVE mode (never waits for readers or
+        writers) once the database has been idle for a while; an idle WAL
+        above ``_WAL_TRUNCATE_BYTES`` is truncated instead.
+
+        Args:
+            force: Checkpoint even if a write happened recently.
+
+        Returns:
+            Report with sizes, growth since the oldest sample and the
+            actions taken.
+        """
         if not self.conn:
-            return
+            return {}
+        actions: list[str] = []
+        db_bytes, wal_bytes = await asyncio.to_thread(self._file_sizes)
+        idle = time.monotonic() - self._last_write >= self._MAINTENANCE_IDLE_SECONDS
+
         try:
-            wal_path = f"{self._resolve_db_file()}-wal"
-            if (
-                os.path.exists(wal_path)
-                and os.path.getsize(wal_path) > self._WAL_TRUNCATE_BYTES
-            ):
-                await self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-                self.logger.debug("[DB] WAL checkpoint truncate done")
+            if force or idle or wal_bytes > self._WAL_TRUNCATE_BYTES:
+                if self._write_buf:
+                    await self.flush_writes()
+                mode = (
+                    "TRUNCATE"
+                    if idle and wal_bytes > self._WAL_TRUNCATE_BYTES
+                    else "PASSIVE"
+                )
+                await self.conn.execute(f"PRAGMA wal_checkpoint({mode})")
+                actions.append(f"checkpoint:{mode.lower()}")
+
+            await self.conn.execute("PRAGMA optimize")
+            actions.append("optimize")
+
+            cursor = await self.conn.execute("PRAGMA auto_vacuum")
+            row = await cursor.fetchone()
+            await cursor.close()
+            # 2 = INCREMENTAL; a no-op on databases created without it.
+            if idle and row and row[0] == 2:
+                await self.conn.execute(
+                    f"PRAGMA incremental_vacuum({self._INCREMENTAL_VACUUM_PAGES})"
+                )
+                await self.conn.commit()
+                actions.append("incremental_vacuum")
         except Exception as e:
-            self.logger.debug("[DB] WAL checkpoint skipped: %s", e)
+            self.logger.debug("[DB] maintenance step failed: %s", e)
+
+        if actions and actions[0].startswith("checkpoint"):
+            db_bytes, wal_bytes = await asyncio.to_thread(self._file_sizes)
+        self.size_history.append((time.time(), db_bytes, wal_bytes))
+        _ts, first_db, first_wal = self.size_history[0]
+        report = {
+            "db_bytes": db_bytes,
+            "wal_bytes": wal_bytes,
+            "db_growth": db_bytes - first_db,
+            "wal_growth": wal_bytes - first_wal,
+            "samples": len(self.size_history),
+            "actions": actions,
+        }
+        self.logger.debug(
+            "[DB] maintenance db=%d (%+d) wal=%d (%+d) actions=%s",
+            db_bytes,
+            report["db_growth"],
+            wal_bytes,
+            report["wal_growth"],
+            ",".join(actions) or "none",
+        )
+        return report
+
+    async def schedule_maintenance(self, scheduler: Any) -> bool:
+        """Register :meth:`run_maintenance` as an interval task on *scheduler*."""
+        add_interval_task = getattr(scheduler, "add_interval_task", None)
+        if add_interval_task is None:
+            return False
+        await add_interval_task(self.run_maintenance, self._MAINTENANCE_INTERVAL)
+        self.logger.debug(
+            "[DB] maintenance scheduled every %.0fs", self._MAINTENANCE_INTERVAL
+        )
+        return True
+
+    def add_write_listener(self, listener: Callable[[str, str, Any], None]) -> None:
+        """Call *listener* on every db_set/db_set_many/db_delete.
+
+        Lets in-memory snapshots of ``module_data`` kept outside this class
+        follow writes that do not go through them.
+        """
+        if listener not in self._write_listeners:
+            self._write_listeners.append(listener)
+
+    def _notify_write(self, module: str, key: str, value: Any) -> None:
+        for listener in self._write_listeners:
+            try:
+                listener(module, key, value)
+            except Exception as e:
+                self.logger.debug(f"[DB] write listener failed: {e}")
 
     async def db_set(self, module: str, key: str, value: Any):
         """Save value for a module key (write-through cache invalidate)."""
@@ -313,15 +569,84 @@ class DatabaseManager:
             )
 
         stored_value = self._stringify_value(module, key, value)
+        if self.write_behind:
+            # _buffer_write publishes the value before its first await.
+            self._notify_write(module, key, value)
+            await self._buffer_write(module, key, stored_value)
+            return
+
         await self.conn.execute(
             "INSERT OR REPLACE INTO module_data VALUES (?, ?, ?)",
             (module, key, stored_value),
         )
         await self.conn.commit()
-        await self._checkpoint_wal_if_needed()
+        self._last_write = time.monotonic()
         self._get_cache.pop(f"{module}:{key}", None)
+        self._notify_write(module, key, value)
         self.logger.debug("[DB] db_set done")
 
+    async def _buffer_write(self, module: str, key: str, stored_value: str) -> None:
+        """Queue a row for the next write-behind flush."""
+        buf_key = (module, key)
+        if buf_key in self._write_buf:
+            self.write_stats["coalesced"] += 1
+        self._write_buf[buf_key] = stored_value
+        self.write_stats["buffered"] += 1
+        # Read-your-writes: db_get serves the pending value from the cache.
+        self._cache_put(f"{module}:{key}", stored_value)
+
+        if len(self._write_buf) >= self.write_behind_max_rows:
+            await self.flush_writes()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_later()
+            )
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self.write_behind_delay)
+            await self.flush_writes()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error("[DB] write-behind flush failed: %s", e)
+        finally:
+            self._flush_task = None
+
+    def pending_writes(self, module: str) -> dict[str, str]:
+        """Return buffered, not yet flushed values for *module*."""
+        if not self._write_buf:
+            return {}
+        return {k: v for (m, k), v in self._write_buf.items() if m == module}
+
+    async def flush_writes(self) -> int:
+        """Commit all buffered writes in a single transaction.
+
+        Returns:
+            Number of rows written.
+        """
+        async with self._flush_lock:
+            if not self._write_buf or not self.conn:
+                return 0
+            pending = self._write_buf
+            self._write_buf = {}
+            rows = [(module, key, value) for (module, key), value in pending.items()]
+            try:
+                await self.conn.executemany(
+                    "INSERT OR REPLACE INTO module_data VALUES (?, ?, ?)", rows
+                )
+                await self.conn.commit()
+            except Exception:
+                # Keep the rows; newer writes made meanwhile take precedence.
+                for buf_key, value in pending.items():
+                    self._write_buf.setdefault(buf_key, value)
+                raise
+            self._last_write = time.monotonic()
+            self.write_stats["flushes"] += 1
+            self.write_stats["rows"] += len(rows)
+        self.logger.debug("[DB] write-behind flushed %d rows", len(rows))
+        return len(rows)
+
     async def db_set_many(self, rows: list[tuple[str, str, Any]]) -> None:
         """Write multiple (module, key, value) rows in a single transaction.
 
@@ -337,6 +662,7 @@ class DatabaseManager:
             raise RuntimeError("Database is not initialized")
 
         validated = []
+        accepted = []
         for module, key, value in rows:
             if not self._validate_identifier(module) or not self._validate_identifier(
                 key
@@ -351,6 +677,7 @@ class DatabaseManager:
                 self.logger.warning("[DB] db_set_many skipping oversized value: %s", e)
                 continue
             validated.append((module, key, stored_value))
+            accepted.append((module, key, value))
 
         if not validated:
             return
@@ -359,17 +686,21 @@ class DatabaseManager:
             "INSERT OR REPLACE INTO module_data VALUES (?, ?, ?)", validated
         )
         await self.conn.commit()
-        await self._checkpoint_wal_if_needed()
+        self._last_write = time.monotonic()
 
-        # Invalidate cache for all written keys.
+        # Invalidate cache for all written keys; these rows supersede any
+        # buffered write-behind value.
         for module, key, _ in validated:
             self._get_cache.pop(f"{module}:{key}", None)
+            self._write_buf.pop((module, key), None)
+        for module, key, value in accepted:
+            self._notify_write(module, key, value)
 
         self.logger.debug("[DB] db_set_many wrote %d rows", len(validated))
 
     async def db_get(self, module: str, key: str) -> str | None:
         """Get value for a module key (cached)."""
-        self.logger.debug(f"[DB] db_get module={module} key={self.mask_key(key)}")
+        self.logger.debug("[DB] db_get module=%s key=%s", module, self.mask_key(key))
         if not self.conn:
             raise RuntimeError("Database is not initialized")
 
@@ -378,43 +709,132 @@ class DatabaseManager:
                 "Invalid module or key name. Use only alphanumeric and underscore."
             )
 
+        pending = self._write_buf.get((module, key))
+        if pending is not None:
+            return pending
+
         cache_key = f"{module}:{key}"
-        cached = self._get_cache.get(cache_key, ...)
-        if cached is not ...:
-            self.logger.debug(f"[DB] db_get cache-hit key={self.mask_key(cache_key)}")
+        cached = self._get_cache.lookup(cache_key)
+        if cached is not _MISS:
+            self.logger.debug("[DB] db_get cache-hit key=%s", self.mask_key(cache_key))
             return cached
 
+        # One round-trip: the length decides whether the value is usable, the
+        # CASE keeps oversized values from being copied out of SQLite at all.
         cursor = await self.conn.execute(
-            "SELECT LENGTH(value) FROM module_data WHERE module = ? AND key = ?",
-            (module, key),
+            "SELECT LENGTH(value), CASE WHEN LENGTH(value) > ? THEN NULL "
+            "ELSE value END FROM module_data WHERE module = ? AND key = ?",
+            (self._MAX_VALUE_BYTES, module, key),
         )
-        size_row = await cursor.fetchone()
+        row = await cursor.fetchone()
         await cursor.close()
-        if not size_row:
+        if not row:
             self._cache_put(cache_key, None)
             self.logger.debug("[DB] db_get result=none")
             return None
 
-        value_size = size_row[0] or 0
-        if value_size > self._MAX_VALUE_BYTES:
-            self.logger.warning(
-                "[DB] oversized value skipped on read: %s.%s size=%d limit=%d",
-                module,
-                self.mask_key(key),
-                value_size,
-                self._MAX_VALUE_BYTES,
-            )
+        value_size, result = row
+        if not self._check_size(module, key, value_size):
             self._cache_put(cache_key, None)
             return None
 
+        self._cache_put(cache_key, result)
+        self.logger.debug("[DB] db_get result=%s", "found" if result else "none")
+        return result
+
+    def _check_size(self, module: str, key: str, size: int | None) -> bool:
+        if (size or 0) <= self._MAX_VALUE_BYTES:
+            return True
+        self.logger.warning(
+            "[DB] oversized value skipped on read: %s.%s size=%d limit=%d",
+            module,
+            self.mask_key(key),
+            size,
+            self._MAX_VALUE_BYTES,
+        )
+        return False
+
+    async def prefetch_module(self, module: str) -> dict[str, str]:
+        """Load every row of *module* with one query and warm the get-cache.
+
+        Returns:
+            ``{key: value}`` for all readable rows, pending writes included.
+        """
+        if not self.conn:
+            raise RuntimeError("Database is not initialized")
+        if not self._validate_identifier(module):
+            raise ValueError("Invalid module name")
+
+        # Rows buffered before the query may be flushed while it runs; they
+        # are still newer than what it returns.
+        pending = self.pending_writes(module)
         cursor = await self.conn.execute(
-            "SELECT value FROM module_data WHERE module = ? AND key = ?", (module, key)
+            self._SIZED_SELECT, (self._MAX_VALUE_BYTES, module)
         )
-        row = await cursor.fetchone()
+        rows = await cursor.fetchall()
         await cursor.close()
-        result = row[0] if row else None
-        self._cache_put(cache_key, result)
-        self.logger.debug(f"[DB] db_get result={'found' if result else 'none'}")
+        pending.update(self.pending_writes(module))
+
+        result: dict[str, str] = {}
+        for key, size, value in rows:
+            if key in pending or not self._check_size(module, key, size):
+                continue
+            result[key] = value
+            self._cache_put(f"{module}:{key}", value)
+        for key, value in pending.items():
+            # Keep read-your-writes: never cache the committed value over
+            # a buffered one.
+            result[key] = value
+            self._cache_put(f"{module}:{key}", value)
+        self.logger.debug("[DB] prefetch_module module=%s rows=%d", module, len(result))
+        return result
+
+    async def db_get_many(self, module: str, keys: list[str]) -> dict[str, str | None]:
+        """Get several keys of *module*, querying only the uncached ones.
+
+        Missing keys map to ``None`` and are cached as misses, so the
+        following ``db_get`` calls for them do not touch the database.
+        """
+        if not self.conn:
+            raise RuntimeError("Database is not initialized")
+        if not self._validate_identifier(module):
+            raise ValueError("Invalid module name")
+
+        result: dict[str, str | None] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            if not self._validate_identifier(key):
+                raise ValueError(
+                    "Invalid module or key name. Use only alphanumeric and underscore."
+                )
+            pending = self._write_buf.get((module, key))
+            if pending is not None:
+                result[key] = pending
+                continue
+            cached = self._get_cache.lookup(f"{module}:{key}")
+            if cached is _MISS:
+                missing.append(key)
+            else:
+                result[key] = cached
+
+        for start in range(0, len(missing), self._MANY_CHUNK):
+            chunk = missing[start : start + self._MANY_CHUNK]
+            cursor = await self.conn.execute(
+                f"{self._SIZED_SELECT} AND key IN ({', '.join('?' * len(chunk))})",
+                (self._MAX_VALUE_BYTES, module, *chunk),
+            )
+            rows = await cursor.fetchall()
+            await cursor.close()
+            found = {
+                key: value
+                for key, size, value in rows
+                if self._check_size(module, key, size)
+            }
+            for key in chunk:
+                value = found.get(key)
+                result[key] = value
+                self._cache_put(f"{module}:{key}", value)
+
         return result
 
     async def db_delete(self, module: str, key: str):
@@ -427,11 +847,14 @@ class DatabaseManager:
                 "Invalid module or key name. Use only alphanumeric and underscore."
             )
 
+        self._write_buf.pop((module, key), None)
         await self.conn.execute(
             "DELETE FROM module_data WHERE module = ? AND key = ?", (module, key)
         )
         await self.conn.commit()
+        self._last_write = time.monotonic()
         self._get_cache.pop(f"{module}:{key}", None)
+        self._notify_write(module, key, self.DELETED)
 
     async def db_query(self, query: str, parameters: tuple = ()):
         """Execute custom SQL query (SELECT/PRAGMA/EXPLAIN only)."""
@@ -446,6 +869,8 @@ class DatabaseManager:
                 "Query blocked by security policy. Only SELECT, PRAGMA, and EXPLAIN are allowed."
             )
 
+        if self._write_buf:
+            await self.flush_writes()
         cursor = await self.conn.execute(query, parameters)
         rows = await cursor.fetchall()
         await cursor.close()
@@ -459,6 +884,8 @@ class DatabaseManager:
         if not self._validate_identifier(module):
             raise ValueError("Invalid module name")
 
+        if self._write_buf:
+            await self.flush_writes()
         cursor = await self.conn.execute(
             "SELECT key FROM module_data WHERE module = ?", (module,)
         )
@@ -471,6 +898,8 @@ class DatabaseManager:
         if not self.conn:
             raise RuntimeError("Database is not initialized")
 
+        if self._write_buf:
+            await self.flush_writes()
         cursor = await self.conn.execute(
             "SELECT key, value FROM module_data WHERE module = 'module_configs'"
         )
@@ -14,6 +14,7 @@ import time
 from typing import Any
 
 from core.lib.types.event import Event
+from core.lib.utils.versioned_dict import VersionedDict
 
 # McubTelethonError (graceful fallback)───────
 try:
@@ -100,7 +101,7 @@ except Exception as e:
     RepositoryManager = None
 
 try:
-    from ..lib.time.cache import TTLCache
+    from ..lib.time.cache import KERNEL_CACHE_BUDGETS, KERNEL_CACHE_MAX_SIZE, TTLCache
 except Exception as e:
     print(f"\033[93m⚠  Degraded: TTLCache not loaded - using dict cache: {e}\033[0m")
     TTLCache = None
@@ -206,16 +207,19 @@ class KernelCoreMixin:
         self.loaded_modules = CaseInsensitiveDict()
         self._live_module_configs = CaseInsensitiveDict()
         self.system_modules = CaseInsensitiveDict()
-        self.command_handlers = {}
-        self.command_owners = {}
+        # Versioned so the dispatcher's command index can detect changes.
+        self.command_handlers = VersionedDict()
+        self.command_owners = VersionedDict()
         self.command_docs = {}
         self.bot_command_handlers = {}
         self.bot_command_owners = {}
         self.bot_command_docs = {}
-        self.inline_handlers = {}
+        # Versioned so the inline command listing cache notices changes.
+        self.inline_handlers = VersionedDict()
         self.inline_handlers_owners = {}
-        self.callback_handlers = {}
-        self.aliases = {}
+        # Versioned so the callback router notices direct edits.
+        self.callback_handlers = VersionedDict()
+        self.aliases = VersionedDict()
         self._module_commands_index = {}
         self._pipe_vars = {}
         self._pipe_macros = {}
@@ -279,7 +283,15 @@ class KernelCoreMixin:
         """Initialize core subsystems (each wrapped - kernel survives partial failure)."""
         # Cache
         try:
-            self.cache = TTLCache(max_size=500, ttl=600) if TTLCache else _DictCache()
+            self.cache = (
+                TTLCache(
+                    max_size=KERNEL_CACHE_MAX_SIZE,
+                    ttl=600,
+                    budgets=KERNEL_CACHE_BUDGETS,
+                )
+                if TTLCache
+                else _DictCache()
+            )
         except Exception as e:
             self._warn("TTLCache", e)
             self.cache = _DictCache()
@@ -572,7 +584,7 @@ class KernelCoreMixin:
     def is_admin(self, user_id: int) -> bool:
         """Return True if user_id matches the authorized admin."""
         result = hasattr(self, "ADMIN_ID") and user_id == self.ADMIN_ID
-        self.logger.debug(f"[Kernel] is_admin user_id={user_id} result={result}")
+        self.logger.debug("[Kernel] is_admin user_id=%r result=%r", user_id, result)
         return result
 
     def should_process_command_event(self, event: Event) -> bool:
@@ -245,6 +245,12 @@ class KernelHandlersMixin:
                         type(client).__name__,
                     )
                     continue
+                router = getattr(wrapper, "__watcher_router__", None)
+                if router is not None:
+                    # Routed watchers share one binding per client.
+                    if router.ensure_bound():
+                        restored.append(f"watcher_router:{module_name}")
+                    continue
                 if _has_binding(wrapper, event_obj):
                     self.logger.debug(
                         "[module_handlers] watcher-present reason=%r "
@@ -317,6 +323,11 @@ class KernelHandlersMixin:
             if seen_key in seen_watchers:
                 continue
             seen_watchers.add(seen_key)
+            router = getattr(wrapper, "__watcher_router__", None)
+            if router is not None:
+                if router.ensure_bound():
+                    restored.append(f"central_watcher_router:{module_name}")
+                continue
             if _has_binding(wrapper, event_obj):
                 continue
             client = entry[2] if len(entry) > 2 else self.client
@@ -377,9 +388,11 @@ class KernelHandlersMixin:
         """Remove all inline handlers for a module."""
         self._inline.unregister_module_inline_handlers(module_name)
 
-    def register_callback_handler(self, pattern: str, handler: Any) -> None:
+    def register_callback_handler(
+        self, pattern: str, handler: Any, owner: str | None = None
+    ) -> None:
         """Register a callback query handler."""
-        self._inline.register_callback_handler(pattern, handler)
+        self._inline.register_callback_handler(pattern, handler, owner)
 
     @property
     def InlineMessage(self) -> type[_InlineMessage]:
@@ -381,6 +381,13 @@ class KernelLifecycleMixin:
                     else:
                         ratio = 0.0
 
+                    # Bytes above the level-1 threshold: level 1 evicts only
+                    # that much, cheapest caches first.
+                    target = RSS_L1
+                    if _psutil is not None and total > 0:
+                        target = min(target, int(total * PCT_L1))
+                    excess = max(rss - target, 0)
+
                     if ratio >= PCT_L3 or rss >= RSS_L3:
                         level = 3
                     elif ratio >= PCT_L2 or rss >= RSS_L2:
@@ -391,15 +398,27 @@ class KernelLifecycleMixin:
                         level = 0
 
                     if level:
-                        result = purge_caches(self, level=level)
+                        result = purge_caches(self, level=level, target_bytes=excess)
                         cleared = result.get("cleared", [])
                         self.logger.info(
-                            "[memmon] RSS %.0f MB (%.1f%%) - " "purge level %d: %s",
+                            "[memmon] RSS %.0f MB (%.1f%%) - "
+                            "purge level %d freed ~%.1f MB: %s",
                             rss / 1024 / 1024,
                             ratio * 100,
                             level,
+                            result.get("freed_estimate", 0) / 1024 / 1024,
                             ", ".join(cleared) if cleared else "nothing",
                         )
+                        db_stats = result.get("db_get_cache")
+                        if db_stats:
+                            self.logger.debug(
+                                "[memmon] db_get cache hits=%d misses=%d "
+                                "evictions=%d bytes=%d",
+                                db_stats["hits"],
+                                db_stats["misses"],
+                                db_stats["evictions"],
+                                db_stats["bytes"],
+                            )
                 except Exception as exc:
                     self.logger.debug("[memmon] check error: %s", exc)
 
@@ -494,6 +513,21 @@ class KernelLifecycleMixin:
             except Exception:
                 pass
 
+        job_table = self.__dict__.get("job_table")
+        if job_table is not None:
+            try:
+                await job_table.kill_all()
+            except Exception:
+                pass
+
+        # Flush barrier: commit buffered write-behind rows before teardown.
+        db_manager = getattr(self, "db_manager", None)
+        if db_manager is not None and hasattr(db_manager, "flush_writes"):
+            try:
+                await db_manager.flush_writes()
+            except Exception as e:
+                self.logger.error("Write-behind flush on shutdown failed: %s", e)
+
         if hasattr(self, "_telegram_handler") and self._telegram_handler:
             try:
                 await self._telegram_handler.stop()
@@ -7,14 +7,63 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import concurrent.futures
+import copy
 import os
 import re
 import traceback
+from types import SimpleNamespace
 from typing import Any
 
+from core.lib.loader.command_index import LEGACY
 from core.lib.types.event import Event
 from core.lib.utils.event_helpers import make_simple_event, run_and_capture
+from core.lib.utils.jobs import Job, get_job_table
+from core.lib.utils.pipe_stream import (
+    PipeStream,
+    accepts_stream,
+    is_pipe_barrier,
+    read_pipe,
+)
+
+
+class _CaptureEvent:
+    """Event stand-in for an ``@(cmd)`` substitution that records edits."""
+
+    def __init__(
+        self, cmd: str, parent: Any, pipe_input: str, active_prefix: str
+    ) -> None:
+        self.text = cmd
+        self.piped = True
+        self.pipe_input = pipe_input
+        self.pipe_output = None
+        self.pipe_stream = None
+        self.pipe_stream_ok = False
+        self.pipe_exit_code = 0
+        self.no_add_args_to_input = False
+        self.chat_id = getattr(parent, "chat_id", None) if parent else None
+        self.sender_id = getattr(parent, "sender_id", None)
+        self._captured: list[str] = []
+        self._prefix = active_prefix
+
+    async def edit(self, new_text: str, *a: Any, **kw: Any) -> None:
+        self._captured.append(new_text)
+
+    async def respond(self, new_text: str, *a: Any, **kw: Any) -> None:
+        self._captured.append(new_text)
+
+    async def reply(self, new_text: str, *a: Any, **kw: Any) -> None:
+        self._captured.append(new_text)
+
+    async def delete(self) -> None:
+        pass
+
+    async def _(self, *a: Any, **kw: Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return object.__getattribute__(self, "_")
 
 
 class KernelPipelineMixin:
@@ -22,6 +71,10 @@ class KernelPipelineMixin:
 
     MAX_PATTERN_LENGTH = 256
     PATTERN_TIMEOUT = 0.1
+    # Defaults for ``@(cmd)`` substitution; overridden by the
+    # ``pipe_subst_concurrency`` / ``pipe_subst_timeout`` config keys.
+    PIPE_SUBST_CONCURRENCY = 4
+    PIPE_SUBST_TIMEOUT = 30.0
 
     _SAFE_OPS: dict = {
         ast.Add: lambda l, r: l + r,
@@ -247,7 +300,13 @@ class KernelPipelineMixin:
         event: Event | None = None,
         active_prefix: str = "",
     ) -> str:
-        """Like ``pipe_interpolate`` but also resolves ``@(cmd)``."""
+        """Like ``pipe_interpolate`` but also resolves ``@(cmd)``.
+
+        Substitutions run concurrently (at most ``pipe_subst_concurrency``
+        at a time, each bounded by ``pipe_subst_timeout`` seconds), and
+        identical ``@(...)`` expressions run once.  Commands marked
+        ``@pipe_barrier`` keep left-to-right order with their neighbours.
+        """
         text = self.pipe_interpolate(text, pipe_input)
 
         if "@(" not in text:
@@ -257,99 +316,144 @@ class KernelPipelineMixin:
         if dispatcher is None:
             return text
 
-        async def _replace_cmd(m: re.Match) -> str:
-            cmd = m.group(1).strip()
-            captured: list[str] = []
-            chat_id = getattr(event, "chat_id", None) if event else None
-
-            # Skip if parent event has no_owner (like pipeline does)
-            if event and hasattr(event, "no_owner"):
-                return ""
-
-            # Build proxy event that captures edits
-            class _CaptureEvent:
-                def __init__(self_):
-                    self_.text = cmd
-                    self_.piped = True
-                    self_.pipe_input = parent_pipe_input
-                    self_.pipe_output = None
-                    self_.pipe_exit_code = 0
-                    self_.no_add_args_to_input = False
-                    self_.chat_id = chat_id
-                    self_.sender_id = getattr(event, "sender_id", None)
-                    self_._captured = captured
-                    self_._prefix = active_prefix
-
-                async def edit(self_, new_text: str, *a: Any, **kw: Any) -> None:
-                    self_._captured.append(new_text)
-
-                async def respond(self_, new_text: str, *a: Any, **kw: Any) -> None:
-                    self_._captured.append(new_text)
-
-                async def reply(self_, new_text: str, *a: Any, **kw: Any) -> None:
-                    self_._captured.append(new_text)
-
-                async def delete(self_) -> None:
-                    pass
-
-                async def _(self_, *a: Any, **kw: Any) -> None:
-                    pass
-
-                def __getattr__(self_, name: str) -> Any:
-                    return object.__getattribute__(self_, "_")
-
-            parent_pipe_input = (
-                getattr(event, "pipe_input", None) or "" if event else ""
-            )
-            proxy = _CaptureEvent()
-            try:
-                try:
-                    ok = await dispatcher.process_command(proxy, depth=1)
-                except TypeError as exc:
-                    if "unexpected keyword argument 'depth'" not in str(exc):
-                        raise
-                    ok = await dispatcher.process_command(proxy)
-                exit_code = getattr(proxy, "pipe_exit_code", 0) or 0
-                # Propagate exit_code back to parent event
-                if event is not None:
-                    event.pipe_exit_code = exit_code
-                self.logger.debug(
-                    "[pipe] @(cmd) %r ok=%s captured=%d exit_code=%d",
-                    cmd,
-                    ok,
-                    len(captured),
-                    exit_code,
-                )
-            except Exception as exc:
-                log_warning = getattr(self.logger, "warning", None)
-                if log_warning is not None:
-                    log_warning("[pipe] @(cmd) %r raised: %s", cmd, exc)
-                return f"<@{type(exc).__name__}>"
-            if not captured:
-                pipe_out = getattr(proxy, "pipe_output", None)
-                if pipe_out:
-                    return str(pipe_out)
-                self.logger.debug("[pipe] @(cmd) %r - no edit captured", cmd)
-                if exit_code == 5:
-                    return f"<@cmd_not_found: {cmd}>"
-                return ""
-            return captured[-1]
-
         matches = list(self._AT_CMD_PATTERN.finditer(text))
         if not matches:
             return text
 
+        cmds = [m.group(1).strip() for m in matches]
+        # Skip if parent event has no_owner (like pipeline does)
+        if event and hasattr(event, "no_owner"):
+            results: list[tuple[str, int | None]] = [("", None)] * len(cmds)
+        else:
+            results = await self._run_substitutions(
+                dispatcher, cmds, event, active_prefix
+            )
+
+        # Propagate exit_code back to parent event, as if run left to right
+        if event is not None:
+            for _text, exit_code in results:
+                if exit_code is not None:
+                    event.pipe_exit_code = exit_code
+
         parts = []
         last = 0
-        for m in matches:
+        for m, (replacement, _exit_code) in zip(matches, results, strict=True):
             parts.append(text[last : m.start()])
-            replacement = await _replace_cmd(m)
-            parts.append("" if replacement is None else str(replacement))
+            parts.append(replacement)
             last = m.end()
         parts.append(text[last:])
 
         return "".join(parts)
 
+    async def _run_substitutions(
+        self,
+        dispatcher: Any,
+        cmds: list[str],
+        event: Event | None,
+        active_prefix: str,
+    ) -> list[tuple[str, int | None]]:
+        """Run the ``@(cmd)`` substitutions; return ``(text, exit_code)`` per cmd.
+
+        Identical commands share one run unless a ``@pipe_barrier`` command
+        stands between them, since the barrier may change their output.
+        """
+        config = getattr(self, "config", None) or {}
+        limit = max(
+            int(config.get("pipe_subst_concurrency", self.PIPE_SUBST_CONCURRENCY)), 1
+        )
+        timeout = float(config.get("pipe_subst_timeout", self.PIPE_SUBST_TIMEOUT))
+        parent_pipe_input = getattr(event, "pipe_input", None) or "" if event else ""
+
+        # (epoch, cmd) keys; every barrier gets an epoch of its own.
+        keys: list[tuple[int, str]] = []
+        barriers: set[tuple[int, str]] = set()
+        epoch = 0
+        for cmd in cmds:
+            if is_pipe_barrier(self._stage_handler(cmd, active_prefix)):
+                epoch += 1
+                barriers.add((epoch, cmd))
+                keys.append((epoch, cmd))
+                epoch += 1
+            else:
+                keys.append((epoch, cmd))
+
+        done: dict[tuple[int, str], tuple[str, int | None]] = {}
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _run(key: tuple[int, str]) -> None:
+            async with semaphore:
+                done[key] = await self._substitute(
+                    dispatcher, key[1], event, parent_pipe_input, active_prefix, timeout
+                )
+
+        unique = list(dict.fromkeys(keys))
+        if limit == 1 or len(unique) == 1:
+            for key in unique:
+                await _run(key)
+            return [done[key] for key in keys]
+
+        pending: list[asyncio.Future] = []
+        for key in unique:
+            if key in barriers:
+                if pending:
+                    await asyncio.gather(*pending)
+                    pending.clear()
+                await _run(key)
+            else:
+                pending.append(asyncio.ensure_future(_run(key)))
+        if pending:
+            await asyncio.gather(*pending)
+        return [done[key] for key in keys]
+
+    async def _substitute(
+        self,
+        dispatcher: Any,
+        cmd: str,
+        event: Event | None,
+        pipe_input: str,
+        active_prefix: str,
+        timeout: float,
+    ) -> tuple[str, int | None]:
+        """Run one ``@(cmd)`` and return its replacement text and exit code."""
+        proxy = _CaptureEvent(cmd, event, pipe_input, active_prefix)
+        captured = proxy._captured
+        try:
+            try:
+                run = dispatcher.process_command(proxy, depth=1)
+            except TypeError as exc:
+                if "unexpected keyword argument 'depth'" not in str(exc):
+                    raise
+                run = dispatcher.process_command(proxy)
+            ok = await (asyncio.wait_for(run, timeout) if timeout > 0 else run)
+            exit_code = getattr(proxy, "pipe_exit_code", 0) or 0
+            self.logger.debug(
+                "[pipe] @(cmd) %r ok=%s captured=%d exit_code=%d",
+                cmd,
+                ok,
+                len(captured),
+                exit_code,
+            )
+        except TimeoutError:
+            log_warning = getattr(self.logger, "warning", None)
+            if log_warning is not None:
+                log_warning("[pipe] @(cmd) %r timed out after %ss", cmd, timeout)
+            return f"<@timeout: {cmd}>", None
+        except Exception as exc:
+            log_warning = getattr(self.logger, "warning", None)
+            if log_warning is not None:
+                log_warning("[pipe] @(cmd) %r raised: %s", cmd, exc)
+            return f"<@{type(exc).__name__}>", None
+        if not captured:
+            pipe_out = getattr(proxy, "pipe_output", None)
+            if pipe_out:
+                return await read_pipe(pipe_out), exit_code
+            self.logger.debug("[pipe] @(cmd) %r - no edit captured", cmd)
+            if exit_code == 5:
+                return f"<@cmd_not_found: {cmd}>", exit_code
+            return "", exit_code
+        replacement = captured[-1]
+        return ("" if replacement is None else str(replacement)), exit_code
+
     async def _execute_pipeline(self, event: Event, pipeline: Any, depth: int) -> bool:
         """Execute a multi-segment pipeline expression."""
         segments = pipeline.segments
@@ -366,86 +470,233 @@ class KernelPipelineMixin:
                 f"ignored pipeline command: {event.no_owner()}", parse_mode="html"
             )
             return False
+        if any(seg.operator == "&" for seg in segments[1:]):
+            return await self._execute_with_jobs(event, segments, depth)
 
         original_edit = getattr(event, "edit", None)
         original_text = event.text
         original_piped = getattr(event, "piped", False)
         original_pipe_input = getattr(event, "pipe_input", None)
+        original_pipe_stream = getattr(event, "pipe_stream", None)
         chat_id = getattr(event, "chat_id", None)
 
         current_event = event
         pipe_input = None
+        pipe_stream = None
+        # Streams handed to stages of the current ``|`` chain; closed as soon
+        # as the chain ends so an early-exiting consumer stops its producer.
+        open_streams: list[PipeStream] = []
         exit_code = 0
 
-        for i, seg in enumerate(segments):
-            next_seg = segments[i + 1] if i + 1 < len(segments) else None
-
-            if seg.operator == "||":
-                expected_exit_code = getattr(seg, "exit_code", None)
-                if expected_exit_code is not None:
-                    # ||[N] - run only if exit_code == N
-                    if exit_code != expected_exit_code:
+        try:
+            for i, seg in enumerate(segments):
+                next_seg = segments[i + 1] if i + 1 < len(segments) else None
+
+                if seg.operator == "||":
+                    expected_exit_code = getattr(seg, "exit_code", None)
+                    if expected_exit_code is not None:
+                        # ||[N] - run only if exit_code == N
+                        if exit_code != expected_exit_code:
+                            continue
+                    elif exit_code == 0:
                         continue
-                elif exit_code == 0:
-                    continue
-            elif seg.operator == "&&":
-                pipe_input = None
-                if not chat_id:
-                    continue
-                try:
-                    sent = await self.client.send_message(chat_id, seg.command)
-                    if not sent:
-                        exit_code = 1
+                elif seg.operator == "&&":
+                    pipe_input = pipe_stream = None
+                    await self._close_pipe_streams(open_streams)
+                    if not chat_id:
                         continue
-                    new_ev = self._make_simple_event(sent, seg.command, chat_id)
-                    new_ev.pipe_input = None
-                    is_piped = next_seg is not None and next_seg.operator == "|"
-                    new_ev.piped = is_piped
-                    if is_piped:
-                        pipe_input = await self._run_and_capture(new_ev, depth + 1)
-                    else:
-                        await self.process_command(new_ev, depth=depth + 1)
-                    exit_code = getattr(new_ev, "pipe_exit_code", 0) or 0
-                    current_event = new_ev
-                except Exception:
-                    exit_code = 1
-                continue
-
-            elif seg.operator == "&":
-                pipe_input = None
-                self._wrap_edit_with_fallback(current_event, chat_id)
+                    try:
+                        sent = await self.client.send_message(chat_id, seg.command)
+                        if not sent:
+                            exit_code = 1
+                            continue
+                        new_ev = self._make_simple_event(sent, seg.command, chat_id)
+                        new_ev.pipe_input = None
+                        is_piped = next_seg is not None and next_seg.operator == "|"
+                        new_ev.piped = is_piped
+                        if is_piped:
+                            pipe_input, pipe_stream = await self._capture_stage(
+                                new_ev, depth + 1, next_seg.command
+                            )
+                            if pipe_stream is not None:
+                                open_streams.append(pipe_stream)
+                        else:
+                            await self.process_command(new_ev, depth=depth + 1)
+                        exit_code = getattr(new_ev, "pipe_exit_code", 0) or 0
+                        current_event = new_ev
+                    except Exception:
+                        exit_code = 1
+                    continue
 
-            is_piped = next_seg is not None and next_seg.operator == "|"
+                is_piped = next_seg is not None and next_seg.operator == "|"
 
-            cmd_text = seg.command
+                cmd_text = seg.command
 
-            # Reconstruct the full command from the base segment.
-            if seg.operator == "|>":
-                base = self._find_base_command(segments, i)
-                cmd_text = (base + " " + seg.command).strip() if base else seg.command
+                # Reconstruct the full command from the base segment.
+                if seg.operator == "|>":
+                    base = self._find_base_command(segments, i)
+                    cmd_text = (
+                        (base + " " + seg.command).strip() if base else seg.command
+                    )
 
-            current_event.piped = is_piped
-            current_event.pipe_input = pipe_input
+                current_event.piped = is_piped
+                current_event.pipe_input = pipe_input
+                current_event.pipe_stream = pipe_stream
 
-            self._set_event_text(current_event, cmd_text)
+                self._set_event_text(current_event, cmd_text)
 
-            if is_piped:
-                pipe_input = await self._run_and_capture(current_event, depth)
-                exit_code = getattr(current_event, "pipe_exit_code", 0) or 0
-            else:
-                if current_event is event and original_edit is not None:
-                    current_event.edit = original_edit
-                await self.process_command(current_event, depth=depth)
-                exit_code = getattr(current_event, "pipe_exit_code", 0) or 0
-                pipe_input = None
+                if is_piped:
+                    pipe_input, pipe_stream = await self._capture_stage(
+                        current_event, depth, next_seg.command
+                    )
+                    exit_code = getattr(current_event, "pipe_exit_code", 0) or 0
+                    if pipe_stream is None:
+                        await self._close_pipe_streams(open_streams)
+                    else:
+                        open_streams.append(pipe_stream)
+                else:
+                    if current_event is event and original_edit is not None:
+                        current_event.edit = original_edit
+                    await self.process_command(current_event, depth=depth)
+                    exit_code = getattr(current_event, "pipe_exit_code", 0) or 0
+                    pipe_input = pipe_stream = None
+                    await self._close_pipe_streams(open_streams)
+        finally:
+            await self._close_pipe_streams(open_streams)
+            if current_event is not event:
+                current_event.pipe_stream = None
 
         event.piped = original_piped
         event.pipe_input = original_pipe_input
+        event.pipe_stream = original_pipe_stream
         if original_edit is not None:
             event.edit = original_edit
         self._set_event_text(event, original_text)
         return True
 
+    def _stage_handler(self, text: str, prefix: str) -> Any:
+        """Return the handler the command *text* dispatches to, if known."""
+        dispatcher = getattr(self, "dispatcher", None)
+        command_index = getattr(dispatcher, "command_index", None)
+        if command_index is None or not text.startswith(prefix):
+            return None
+        parts = text[len(prefix) :].split(None, 1)
+        if not parts:
+            return None
+        route = command_index.resolve(parts[0])
+        if route is None:
+            return None
+        if route is LEGACY:
+            return getattr(self, "command_handlers", {}).get(parts[0])
+        return route.handler
+
+    def _accepts_pipe_stream(self, event: Any, text: str) -> bool:
+        """Return True if the pipeline stage *text* runs a ``@streaming`` command.
+
+        Stages that interpolate ``@{...}`` / ``@(...)`` need their input as a
+        string up front and never get a stream.
+        """
+        if getattr(self, "dispatcher", None) is None or "@{" in text or "@(" in text:
+            return False
+        prefix = self.get_prefix_for_sender(getattr(event, "sender_id", None))
+        return accepts_stream(self._stage_handler(text, prefix))
+
+    async def _capture_stage(
+        self, ev: Any, depth: int, consumer: str
+    ) -> tuple[str | None, PipeStream | None]:
+        """Run a ``|`` producer stage and return ``(pipe_input, pipe_stream)``.
+
+        The stage may hand back a :class:`PipeStream` only when the consumer
+        accepts one; a stream offered to any other consumer is read into a
+        string here.
+        """
+        stream_ok = self._accepts_pipe_stream(ev, consumer)
+        ev.pipe_stream_ok = stream_ok
+        try:
+            output = await self._run_and_capture(ev, depth)
+        finally:
+            ev.pipe_stream_ok = False
+        if isinstance(output, PipeStream):
+            if stream_ok:
+                return None, output
+            return await read_pipe(output), None
+        return output, None
+
+    @staticmethod
+    async def _close_pipe_streams(streams: list[PipeStream]) -> None:
+        while streams:
+            await streams.pop().aclose()
+
+    async def _execute_with_jobs(
+        self, event: Event, segments: list, depth: int
+    ) -> bool:
+        """Run each ``&``-terminated group of segments as a background job.
+
+        ``.a | .b & .c`` starts ``.a | .b`` as a job in a message of its own
+        and runs ``.c`` on *event* right away.  Without a chat to post the
+        job message to, the groups run one after another on *event*.
+        """
+        groups: list[list] = [[]]
+        for seg in segments:
+            if seg.operator == "&" and groups[-1]:
+                seg = copy.copy(seg)
+                seg.operator = None
+                groups.append([])
+            groups[-1].append(seg)
+
+        chat_id = getattr(event, "chat_id", None)
+        for group in groups[:-1]:
+            if not chat_id or not await self._spawn_pipeline_job(group, chat_id, depth):
+                await self._execute_pipeline(
+                    event, SimpleNamespace(segments=group), depth
+                )
+        return await self._execute_pipeline(
+            event, SimpleNamespace(segments=groups[-1]), depth
+        )
+
+    async def _spawn_pipeline_job(
+        self, segments: list, chat_id: int, depth: int
+    ) -> Job | None:
+        """Post *segments* as a new message and run them there as a job."""
+        text = self._segments_text(segments)
+        try:
+            sent = await self.client.send_message(chat_id, text)
+        except Exception as exc:
+            self.logger.debug("[jobs] could not post job message: %s", exc)
+            return None
+        if not sent:
+            return None
+        ev = self._make_simple_event(sent, text, chat_id)
+
+        async def _run(job: Job) -> int:
+            edit = ev.edit
+
+            async def _recording_edit(new_text: Any, *args: Any, **kwargs: Any) -> Any:
+                job.record(new_text, kwargs.get("parse_mode"))
+                return await edit(new_text, *args, **kwargs)
+
+            ev.edit = _recording_edit
+            await self._execute_pipeline(
+                ev, SimpleNamespace(segments=segments), depth + 1
+            )
+            return getattr(ev, "pipe_exit_code", 0) or 0
+
+        job = get_job_table(self).spawn(text, _run, chat_id=chat_id)
+        self.logger.debug("[jobs] started [%d] %r", job.id, text)
+        return job
+
+    @staticmethod
+    def _segments_text(segments: list) -> str:
+        """Rebuild the command text of a run of pipeline segments."""
+        parts = []
+        for seg in segments:
+            if seg.operator is not None:
+                exit_code = getattr(seg, "exit_code", None)
+                op = seg.operator if exit_code is None else f"||[{exit_code}]"
+                parts.append(op)
+            parts.append(seg.command)
+        return " ".join(parts)
+
     @staticmethod
     def _find_base_command(segments: list, idx: int) -> str | None:
         """Find the base command (first word) for a ``|>`` segment.
@@ -463,36 +714,7 @@ class KernelPipelineMixin:
     def _make_simple_event(self, msg: Any, text: str, chat_id: int) -> Event:
         return make_simple_event(self, msg, text, chat_id)
 
-    def _wrap_edit_with_fallback(self, ev: Any, chat_id: int) -> None:
-        """Wrap ev.edit so that on failure it falls back to send_message."""
-        original_edit = getattr(ev, "edit", None)
-        kernel = self
-
-        async def _fallback_edit(new_text, *args, parse_mode=None, **kwargs):
-            if original_edit is not None:
-                try:
-                    return await original_edit(
-                        new_text, *args, parse_mode=parse_mode, **kwargs
-                    )
-                except Exception as _err:
-                    kernel.logger.debug(
-                        "[& edit-fallback] edit failed (%s), sending new message", _err
-                    )
-            try:
-                sent = await kernel.client.send_message(
-                    chat_id, new_text, parse_mode=parse_mode
-                )
-                if sent and hasattr(sent, "id"):
-                    ev.id = sent.id
-                    ev.message_id = sent.id
-                return sent
-            except Exception:
-                return None
-            return None
-
-        ev.edit = _fallback_edit
-
-    async def _run_and_capture(self, ev: Any, depth: int) -> str | None:
+    async def _run_and_capture(self, ev: Any, depth: int) -> str | PipeStream | None:
         return await run_and_capture(self, ev, depth)
 
     # User/Thread utilities
@@ -13,6 +13,7 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from core.lib.types.event import Event
+from core.lib.utils.expiry import track_inline_callback
 
 try:
     from core.lib.loader.kernel_proxy import wrap_event_for_module
@@ -603,16 +604,8 @@ class ModuleBase(ABC):
         cb_map = self.kernel.inline_callback_map
 
         with lock:
-            now = time.time()
-            expired = [
-                k
-                for k, v in list(cb_map.items())
-                if v.get("expires_at") and v["expires_at"] < now
-            ]
-            for k in expired:
-                cb_map.pop(k, None)
-
             cb_map[token] = callback_data
+        track_inline_callback(self.kernel, token, callback_data)
 
     def _track_callback_token(self, token: str) -> None:
         self._callback_tokens = getattr(self, "_callback_tokens", [])
@@ -0,0 +1,304 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.1.0
+# description: Prefix-trie router for legacy callback query handlers
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from core.lib.utils.versioned_dict import VersionedDict
+
+try:
+    from telethon import events
+except ImportError:
+    events = None
+
+try:
+    from core.lib.loader.kernel_proxy import wrap_event_for_module
+except ImportError:
+
+    def wrap_event_for_module(e, *a, **kw):
+        return e
+
+
+if TYPE_CHECKING:
+    from core.lib.types import Kernel
+
+# A pattern containing any of these is a regex (Telethon used re.match for
+# every pattern), not a literal prefix.
+_REGEX_META_RE = re.compile(rb"[.^$*+?{}\[\]\\|()]")
+
+
+def _as_bytes(pattern: Any) -> bytes:
+    if isinstance(pattern, bytes):
+        return pattern
+    if isinstance(pattern, (bytearray, memoryview)):
+        return bytes(pattern)
+    return str(pattern).encode("utf-8")
+
+
+def _compile_regex(key: bytes) -> re.Pattern[bytes] | None:
+    """Return *key* compiled if it is a regex rather than a literal prefix."""
+    if not _REGEX_META_RE.search(key):
+        return None
+    try:
+        return re.compile(key)
+    except re.error:
+        return None
+
+
+class CallbackRoute:
+    """Handler registered for one callback data prefix."""
+
+    __slots__ = ("handler", "owner", "pattern")
+
+    def __init__(self, pattern: bytes, handler: Callable, owner: str | None) -> None:
+        self.pattern = pattern
+        self.handler = handler
+        self.owner = owner
+
+    def __repr__(self) -> str:
+        return f"<CallbackRoute pattern={self.pattern!r} owner={self.owner!r}>"
+
+
+class _Node:
+    __slots__ = ("children", "route")
+
+    def __init__(self) -> None:
+        self.children: dict[int, _Node] = {}
+        self.route: CallbackRoute | None = None
+
+
+class CallbackRouter:
+    """Resolve callback data to the handler with the longest matching prefix.
+
+    Patterns live in a byte trie, so a lookup walks at most ``len(data)``
+    nodes no matter how many handlers are registered, and :meth:`add` /
+    :meth:`remove` only touch the nodes on one pattern's path.
+
+    ``kernel.callback_handlers`` stays the public registry: the router writes
+    through to it and rebuilds itself if something else mutated the dict
+    (detected via :class:`VersionedDict` version, or size for a plain dict).
+
+    Unlike the old linear scan, only one handler runs per click.  Registered
+    prefixes are not expected to shadow each other; if they do, the longer
+    (more specific) one wins.
+
+    Patterns with regex metacharacters (``rb"menu_\\d+"``) cannot live in
+    the trie; they keep Telethon's ``re.match`` semantics and are tried in
+    registration order when no literal prefix matches.
+    """
+
+    def __init__(self, kernel: Kernel | None = None) -> None:
+        self.kernel = kernel
+        self._root = _Node()
+        self._regex: dict[bytes, tuple[re.Pattern[bytes], CallbackRoute]] = {}
+        self._count = 0
+        self._stamp: tuple | None = None
+        self.event_obj = events.CallbackQuery() if events is not None else None
+
+    def __len__(self) -> int:
+        self.sync()
+        return self._count
+
+    def __contains__(self, pattern: Any) -> bool:
+        self.sync()
+        key = _as_bytes(pattern)
+        if key in self._regex:
+            return True
+        node = self._find(key)
+        return node is not None and node.route is not None
+
+    # Registry sync
+
+    def _registry(self) -> dict | None:
+        if self.kernel is None:
+            return None
+        table = getattr(self.kernel, "__dict__", {}).get("callback_handlers")
+        return table if isinstance(table, dict) else None
+
+    @staticmethod
+    def _stamp_of(table: dict) -> tuple:
+        if isinstance(table, VersionedDict):
+            return (id(table), table.version)
+        return (id(table), len(table))
+
+    def sync(self) -> None:
+        """Rebuild from ``kernel.callback_handlers`` if it changed behind our back."""
+        table = self._registry()
+        if table is None:
+            return
+        stamp = self._stamp_of(table)
+        if stamp == self._stamp:
+            return
+        owners = {route.pattern: route.owner for route in self.routes()}
+        self._root = _Node()
+        self._regex = {}
+        self._count = 0
+        for pattern, handler in list(table.items()):
+            key = _as_bytes(pattern)
+            self._insert(key, CallbackRoute(key, handler, owners.get(key)))
+        self._stamp = stamp
+
+    def _mark_synced(self) -> None:
+        table = self._registry()
+        if table is not None:
+            self._stamp = self._stamp_of(table)
+
+    # Trie operations
+
+    def _find(self, key: bytes) -> _Node | None:
+        node = self._root
+        for byte in key:
+            node = node.children.get(byte)
+            if node is None:
+                return None
+        return node
+
+    def _insert(self, key: bytes, route: CallbackRoute) -> None:
+        compiled = _compile_regex(key)
+        if compiled is not None:
+            if key not in self._regex:
+                self._count += 1
+            self._regex[key] = (compiled, route)
+            return
+        node = self._root
+        for byte in key:
+            child = node.children.get(byte)
+            if child is None:
+                child = node.children[byte] = _Node()
+            node = child
+        if node.route is None:
+            self._count += 1
+        node.route = route
+
+    def _delete(self, key: bytes) -> CallbackRoute | None:
+        if key in self._regex:
+            self._count -= 1
+            return self._regex.pop(key)[1]
+        path = [self._root]
+        node = self._root
+        for byte in key:
+            node = node.children.get(byte)
+            if node is None:
+                return None
+            path.append(node)
+        route = node.route
+        if route is None:
+            return None
+        node.route = None
+        self._count -= 1
+        # Prune now-empty branches so dead prefixes do not cost lookups.
+        for depth in range(len(key), 0, -1):
+            child = path[depth]
+            if child.route is not None or child.children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+        return route
+
+    def add(self, pattern: Any, handler: Callable, owner: str | None = None) -> None:
+        """Route data starting with *pattern* to *handler*."""
+        self.sync()
+        key = _as_bytes(pattern)
+        self._insert(key, CallbackRoute(key, handler, owner))
+        table = self._registry()
+        if table is not None:
+            table[key] = handler
+        self._mark_synced()
+
+    def remove(self, pattern: Any) -> bool:
+        self.sync()
+        key = _as_bytes(pattern)
+        removed = self._delete(key) is not None
+        table = self._registry()
+        if table is not None:
+            table.pop(key, None)
+            if not isinstance(pattern, bytes):
+                table.pop(pattern, None)
+        self._mark_synced()
+        return removed
+
+    def remove_module(self, module_name: str) -> int:
+        """Drop every route owned by *module_name*."""
+        self.sync()
+        stale = [r.pattern for r in self.routes() if r.owner == module_name]
+        for key in stale:
+            self.remove(key)
+        return len(stale)
+
+    def routes(self) -> list[CallbackRoute]:
+        result: list[CallbackRoute] = [route for _re, route in self._regex.values()]
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.route is not None:
+                result.append(node.route)
+            stack.extend(node.children.values())
+        return result
+
+    def match(self, data: Any) -> CallbackRoute | None:
+        """Return the route with the longest prefix of *data*, or ``None``.
+
+        Regex patterns are consulted only when no literal prefix matches.
+        """
+        if not data:
+            return None
+        self.sync()
+        data = _as_bytes(data)
+        node = self._root
+        best = node.route
+        for byte in data:
+            node = node.children.get(byte)
+            if node is None:
+                break
+            if node.route is not None:
+                best = node.route
+        if best is None:
+            for compiled, route in self._regex.values():
+                if compiled.match(data):
+                    return route
+        return best
+
+    # Telethon binding
+
+    def is_bound(self, client: Any) -> bool:
+        builders = getattr(client, "_event_builders", None)
+        if not isinstance(builders, list):
+            return False
+        return any(cb == self.dispatch for _ev, cb in builders)
+
+    def ensure_bound(self, client: Any) -> bool:
+        """Bind :meth:`dispatch` to *client* once; return True if (re)bound."""
+        if client is None or self.event_obj is None or self.is_bound(client):
+            return False
+        client.add_event_handler(self.dispatch, self.event_obj)
+        return True
+
+    async def dispatch(self, event: Any) -> None:
+        route = self.match(getattr(event, "data", None))
+        if route is None:
+            return
+        k = self.kernel
+        try:
+            module_event = wrap_event_for_module(
+                event, getattr(route.handler, "__module__", "callback"), k
+            )
+            await route.handler(module_event)
+        except Exception as e:
+            if k is None:
+                raise
+            await k.handle_error(e, message="Callback handler error", event=event)
+
+
+def get_callback_router(kernel: Kernel) -> CallbackRouter:
+    """Return the kernel's callback router, creating it on first use."""
+    router = getattr(kernel, "__dict__", {}).get("callback_router")
+    if not isinstance(router, CallbackRouter):
+        router = CallbackRouter(kernel)
+        kernel.callback_router = router
+    return router
@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.0.0
+# description: Flattened command/alias resolution index for the dispatcher
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from core.lib.utils.versioned_dict import VersionedDict
+
+if TYPE_CHECKING:
+    from core.lib.types import Kernel
+
+# Alias chains deeper than this fall back to the recursive dispatcher path,
+# which reports the recursion limit exactly like before.
+MAX_ALIAS_DEPTH = 5
+
+# Upper bound on memoized names; typed-but-unknown names are cached as misses.
+_MAX_ROUTES = 4096
+
+# Markers that make an alias expansion need the full process_command pass
+# (pipeline operators and @{...}/@(...) interpolation).
+_REPARSE_MARKERS = ("|", "&", "@{", "@(")
+
+
+def has_pipeline_operator(text: str) -> bool:
+    """Cheap pre-scan: every pipeline operator contains ``|`` or ``&``."""
+    return "|" in text or "&" in text
+
+
+class CommandRoute:
+    """Resolved target for one command name.
+
+    Attributes:
+        handler: Callable registered for the final command.
+        owner: Module owning the final command.
+        command: Final command name after alias expansion.
+        expansion: Replacement for the typed name (``None`` for direct
+            commands); the argument tail is appended unchanged.
+        hops: Number of aliases followed to reach ``command``.
+    """
+
+    __slots__ = ("command", "expansion", "handler", "hops", "owner")
+
+    def __init__(
+        self,
+        handler: Callable,
+        owner: str,
+        command: str,
+        expansion: str | None = None,
+        hops: int = 0,
+    ) -> None:
+        self.handler = handler
+        self.owner = owner
+        self.command = command
+        self.expansion = expansion
+        self.hops = hops
+
+    def __repr__(self) -> str:
+        return (
+            f"<CommandRoute command={self.command!r} owner={self.owner!r} "
+            f"expansion={self.expansion!r}>"
+        )
+
+
+# Returned when a name needs the legacy recursive path (broken alias target,
+# alias expanding to a pipeline, too-deep chain, ...).
+LEGACY = object()
+
+
+class CommandIndex:
+    """Memoized ``name -> CommandRoute`` lookup over the kernel registries.
+
+    Entries are computed on first lookup and dropped as soon as
+    ``command_handlers``, ``command_owners`` or ``aliases`` change; the
+    change check is a version comparison on :class:`VersionedDict`.  When a
+    registry is a plain dict (tests, foreign kernels) the index stays out of
+    the way and :meth:`resolve` always returns :data:`LEGACY`.
+    """
+
+    def __init__(self, kernel: Kernel) -> None:
+        self.kernel = kernel
+        self._stamp: tuple | None = None
+        self._routes: dict[str, Any] = {}
+
+    def _current_stamp(self) -> tuple | None:
+        k = self.kernel
+        tables = (
+            getattr(k, "command_handlers", None),
+            getattr(k, "command_owners", None),
+            getattr(k, "aliases", None),
+        )
+        stamp = []
+        for table in tables:
+            if not isinstance(table, VersionedDict):
+                return None
+            stamp.append(id(table))
+            stamp.append(table.version)
+        return tuple(stamp)
+
+    def invalidate(self) -> None:
+        self._routes.clear()
+        self._stamp = None
+
+    def resolve(self, name: str) -> Any:
+        """Return a :class:`CommandRoute`, ``None`` on a miss, or :data:`LEGACY`."""
+        stamp = self._current_stamp()
+        if stamp is None:
+            return LEGACY
+        if stamp != self._stamp:
+            self._routes.clear()
+            self._stamp = stamp
+        try:
+            return self._routes[name]
+        except KeyError:
+            if len(self._routes) >= _MAX_ROUTES:
+                self._routes.clear()
+            route = self._routes[name] = self._build(name)
+            return route
+
+    def _build(self, name: str) -> Any:
+        handlers = self.kernel.command_handlers
+        owners = self.kernel.command_owners
+        aliases = self.kernel.aliases
+
+        if name not in aliases:
+            if name not in handlers:
+                return None
+            return CommandRoute(handlers[name], owners.get(name, "unknown"), name)
+
+        expansion = aliases[name]
+        for hops in range(1, MAX_ALIAS_DEPTH + 1):
+            if not isinstance(expansion, str) or any(
+                marker in expansion for marker in _REPARSE_MARKERS
+            ):
+                return LEGACY
+            parts = expansion.split(None, 1)
+            if not parts:
+                return LEGACY
+            head = parts[0]
+            if head in aliases:
+                expansion = (
+                    aliases[head] + expansion[expansion.index(head) + len(head) :]
+                )
+                continue
+            if head not in handlers:
+                return LEGACY
+            return CommandRoute(
+                handlers[head], owners.get(head, "unknown"), head, expansion, hops
+            )
+        return LEGACY
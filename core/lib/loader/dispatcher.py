@@ -12,7 +12,13 @@ import logging
 import traceback
 from typing import TYPE_CHECKING, Any
 
+from core.lib.loader.command_index import (
+    LEGACY,
+    CommandIndex,
+    has_pipeline_operator,
+)
 from core.lib.types.event import Event
+from core.lib.utils.hot_path import debug_enabled, get_hot_trace
 
 try:
     from telethon import events
@@ -39,6 +45,18 @@ except ImportError:
     Strings = None
 
 
+def _event_text(event: Any) -> str:
+    """Return the plain command text of *event*.
+
+    Telethon events expose ``raw_text``; lightweight pipeline and capture
+    events only carry ``text``.
+    """
+    text = getattr(event, "raw_text", None)
+    if not isinstance(text, str):
+        text = getattr(event, "text", None)
+    return text if isinstance(text, str) else ""
+
+
 class CommandDispatcher:
     """
     Central dispatcher for userbot commands.
@@ -57,6 +75,8 @@ class CommandDispatcher:
     def __init__(self, kernel: Kernel) -> None:
         self.kernel = kernel
         self.logger = logging.getLogger(getattr(kernel, "logger_name", __name__))
+        self.command_index = CommandIndex(kernel)
+        self.trace = get_hot_trace()
         if Strings is None:
             self.strings = None
         else:
@@ -134,29 +154,32 @@ class CommandDispatcher:
                 return
 
         if not self.kernel.should_process_command_event(event):
-            self.logger.debug(
-                "[dispatcher] skip-nonoutgoing handler=watcher_message "
-                "text=%r sender=%r chat=%r out=%r admin=%r",
-                getattr(msg, "raw_text", None),
-                getattr(event, "sender_id", None),
-                getattr(event, "chat_id", None),
-                getattr(msg, "out", False),
-                self.kernel.is_admin(getattr(event, "sender_id", None)),
-            )
+            # Every foreign message ends here, keep it allocation-free.
+            if debug_enabled(self.logger):
+                self.logger.debug(
+                    "[dispatcher] skip-nonoutgoing handler=watcher_message "
+                    "text=%r sender=%r chat=%r out=%r",
+                    getattr(msg, "raw_text", None),
+                    getattr(event, "sender_id", None),
+                    getattr(event, "chat_id", None),
+                    getattr(msg, "out", False),
+                )
             return
 
         if self.kernel._is_command_event_processed(event):
-            self.logger.debug(
-                "[dispatcher] skip-duplicate handler=watcher_message "
-                "text=%r sender=%r chat=%r",
-                getattr(msg, "raw_text", None),
-                getattr(event, "sender_id", None),
-                getattr(event, "chat_id", None),
-            )
+            if debug_enabled(self.logger):
+                self.logger.debug(
+                    "[dispatcher] skip-duplicate handler=watcher_message "
+                    "text=%r sender=%r chat=%r",
+                    getattr(msg, "raw_text", None),
+                    getattr(event, "sender_id", None),
+                    getattr(event, "chat_id", None),
+                )
             return
 
         self.kernel._mark_command_event_processed(event)
 
+        started = self.trace.start()
         try:
             await self.process_command(event)
         except RPCError as e:
@@ -183,6 +206,8 @@ class CommandDispatcher:
                 )
             except Exception:
                 pass
+        finally:
+            self.trace.record("command", started)
 
     async def process_command(self, event: Event, depth: int = 0) -> bool:
         """
@@ -203,37 +228,42 @@ class CommandDispatcher:
             )
             return False
 
-        text = getattr(event, "raw_text", "") or ""
+        text = _event_text(event)
         active_prefix = self.kernel.get_prefix_for_sender(
             getattr(event, "sender_id", None)
         )
 
-        self.logger.debug(
-            "[process_command] depth=%d text=%r sender=%r chat=%r "
-            "handlers=%d aliases=%d",
-            depth,
-            text,
-            getattr(event, "sender_id", None),
-            getattr(event, "chat_id", None),
-            len(self.kernel.command_handlers),
-            len(self.kernel.aliases),
-        )
-
-        if not text or not text.startswith(active_prefix):
+        debug = debug_enabled(self.logger)
+        if debug:
             self.logger.debug(
-                "[process_command] ignored text=%r reason=no_prefix " "prefix=%r",
+                "[process_command] depth=%d text=%r sender=%r chat=%r "
+                "handlers=%d aliases=%d",
+                depth,
                 text,
-                active_prefix,
+                getattr(event, "sender_id", None),
+                getattr(event, "chat_id", None),
+                len(self.kernel.command_handlers),
+                len(self.kernel.aliases),
             )
+
+        if not text or not text.startswith(active_prefix):
+            if debug:
+                self.logger.debug(
+                    "[process_command] ignored text=%r reason=no_prefix prefix=%r",
+                    text,
+                    active_prefix,
+                )
             return False
 
-        # Try pipeline execution first
-        try:
-            from utils.arg_parser import PipelineParser
+        # Only run the full pipeline parser when an operator may be present.
+        pipeline = None
+        if has_pipeline_operator(text):
+            try:
+                from utils.arg_parser import PipelineParser
 
-            pipeline = PipelineParser(text)
-        except ImportError:
-            pipeline = None
+                pipeline = PipelineParser(text)
+            except ImportError:
+                pipeline = None
 
         piped_enabled = self.kernel.config.get("piped", True)
         if pipeline is not None and not pipeline.is_simple() and piped_enabled:
@@ -292,24 +322,45 @@ class CommandDispatcher:
         Resolves aliases, wraps the event for the owning module and
         calls the handler.
         """
-        text = getattr(event, "raw_text", "") or ""
+        text = _event_text(event)
 
         # Guarantee pipeline attributes exist
         for attr_name, default in (
             ("piped", False),
             ("pipe_input", None),
             ("pipe_output", None),
+            ("pipe_stream", None),
+            ("pipe_stream_ok", False),
             ("pipe_exit_code", 0),
             ("no_add_args_to_input", False),
         ):
             if not hasattr(event, attr_name):
                 setattr(event, attr_name, default)
 
-        cmd = (
-            text[len(active_prefix) :].split()[0]
-            if " " in text
-            else text[len(active_prefix) :]
-        )
+        parts = text[len(active_prefix) :].split(None, 1)
+        cmd = parts[0] if parts else ""
+
+        route = self.command_index.resolve(cmd)
+        if route is not LEGACY and (route is None or depth + route.hops <= 5):
+            if route is None:
+                return self._command_miss(event, cmd)
+            if route.expansion is not None:
+                new_text = (
+                    active_prefix
+                    + route.expansion
+                    + text[len(active_prefix) + len(cmd) :]
+                )
+                if debug_enabled(self.logger):
+                    self.logger.debug(
+                        "[process_command] alias-hit cmd=%r target=%r text=%r",
+                        cmd,
+                        route.expansion,
+                        text,
+                    )
+                self.kernel._set_event_text(event, new_text)
+            return await self._call_handler(
+                event, route.command, route.handler, route.owner
+            )
 
         # Alias resolution
         if cmd in self.kernel.aliases:
@@ -348,30 +399,48 @@ class CommandDispatcher:
 
         # Direct command dispatch
         if cmd in self.kernel.command_handlers:
-            handler = self.kernel.command_handlers[cmd]
+            return await self._call_handler(
+                event,
+                cmd,
+                self.kernel.command_handlers[cmd],
+                self.kernel.command_owners.get(cmd, "unknown"),
+            )
+
+        return self._command_miss(event, cmd)
+
+    async def _call_handler(
+        self, event: Any, cmd: str, handler: Any, owner: str
+    ) -> bool:
+        """Invoke a resolved command handler with the owner-wrapped event."""
+        if debug_enabled(self.logger):
             self.logger.debug(
                 "[process_command] dispatch cmd=%r owner=%r handler=%r",
                 cmd,
-                self.kernel.command_owners.get(cmd),
-                getattr(handler, "__name__", repr(handler)),
+                owner,
+                getattr(handler, "__name__", None) or handler,
             )
-            if not callable(handler):
-                self.logger.warning(
-                    "Command handler for '%s' is not callable, skipping",
-                    cmd,
-                )
-                event.pipe_exit_code = 5
-                return False
+        if not callable(handler):
+            self.logger.warning(
+                "Command handler for '%s' is not callable, skipping",
+                cmd,
+            )
+            event.pipe_exit_code = 5
+            return False
 
-            _mod = self.kernel.command_owners.get(cmd, "unknown")
-            await handler(wrap_event_for_module(event, _mod, self.kernel))
-            return True
+        started = self.trace.start()
+        try:
+            await handler(wrap_event_for_module(event, owner, self.kernel))
+        finally:
+            self.trace.record("handler", started, cmd=cmd, owner=owner)
+        return True
 
-        self.logger.debug(
-            "[process_command] miss cmd=%r known=%r",
-            cmd,
-            sorted(self.kernel.command_handlers.keys()),
-        )
+    def _command_miss(self, event: Any, cmd: str) -> bool:
+        if debug_enabled(self.logger):
+            self.logger.debug(
+                "[process_command] miss cmd=%r known=%d",
+                cmd,
+                len(self.kernel.command_handlers),
+            )
         event.pipe_exit_code = 5
         return False
 
@@ -2077,21 +2077,20 @@ async def load_hikka_module(
 
     db_proxy = getattr(instance, "db", None)
     if db_proxy is not None and getattr(kernel, "db_manager", None):
-        for owner in _instance_owner_names(instance, module_name):
-            try:
-                keys = await kernel.db_manager.db_get_module_keys(owner)
-            except Exception:
-                continue
-            for key in keys:
-                with contextlib.suppress(Exception):
-                    value = await kernel.db_get(owner, key)
-                    db_proxy._mem[db_proxy._mem_key(owner, key)] = value
-                    canonical_owner = getattr(instance, "_db_owner", None)
-                    if (
-                        canonical_owner
-                        and db_proxy._mem_key(canonical_owner, key) not in db_proxy._mem
-                    ):
-                        db_proxy._mem[db_proxy._mem_key(canonical_owner, key)] = value
+        owners = _instance_owner_names(instance, module_name)
+        if hasattr(db_proxy, "prefetch"):
+            with contextlib.suppress(Exception):
+                await db_proxy.prefetch(*owners)
+        canonical_owner = getattr(instance, "_db_owner", None)
+        if canonical_owner:
+            for owner in owners:
+                prefix = db_proxy._mem_key(owner, "")
+                for mk, value in list(db_proxy._mem.items()):
+                    if not mk.startswith(prefix):
+                        continue
+                    db_proxy._mem.setdefault(
+                        db_proxy._mem_key(canonical_owner, mk[len(prefix) :]), value
+                    )
 
     if hasattr(instance, "config") and (
         isinstance(instance.config, ModuleConfig)
@@ -9,6 +9,8 @@ import time
 import types
 import typing
 
+from core.lib.utils.expiry import track_inline_callback
+
 VALID_BUTTON_STYLES = {"danger", "primary", "success"}
 
 
@@ -190,12 +192,14 @@ def process_buttons(
                             )
                             return await _h(call_obj, *_a, **_k)
 
-                        cb_map[btn_copy["_callback_data"]] = {
+                        cb_key = btn_copy["_callback_data"]
+                        cb_map[cb_key] = {
                             "handler": _hikka_callback_wrapper,
                             "args": (),
                             "kwargs": {},
                             "expires_at": time.time() + ttl,
                         }
+                        track_inline_callback(kernel, cb_key, cb_map[cb_key])
 
             result_button = _build_button(btn_copy)
             if result_button:
@@ -16,6 +16,7 @@ import os
 import re
 import sqlite3
 import sys
+import threading
 import time
 import types
 import uuid
@@ -27,6 +28,7 @@ from typing import Any
 import aiohttp
 
 from core.lib.base.database import DatabaseManager
+from core.lib.utils.expiry import get_expiry_service, track_inline_callback
 
 from .types import get_callback_handlers, get_inline_handlers, get_watchers
 
@@ -591,6 +593,220 @@ class _NamedTupleMiddlewareDict:
         del self._pointer[key]
 
 
+_MISSING = object()
+_RO_CONNECTIONS: dict[str, sqlite3.Connection] = {}
+_RO_CONNECTIONS_LOCK = threading.Lock()
+_ROW_SELECT_SQL = (
+    "SELECT key, LENGTH(value), "
+    "CASE WHEN LENGTH(value) > ? THEN NULL ELSE value END "
+    "FROM module_data WHERE module = ?"
+)
+
+
+def _get_ro_connection(db_file: str) -> sqlite3.Connection:
+    """Return a shared read-only sqlite3 connection for *db_file*.
+
+    Connections are opened once per file and reused by every blocking
+    DbProxy read instead of reconnecting on each cache miss.
+    """
+    with _RO_CONNECTIONS_LOCK:
+        conn = _RO_CONNECTIONS.get(db_file)
+        if conn is None:
+            if db_file == ":memory:":
+                conn = sqlite3.connect(db_file, check_same_thread=False)
+            else:
+                conn = sqlite3.connect(
+                    f"{Path(db_file).resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                )
+            _RO_CONNECTIONS[db_file] = conn
+        return conn
+
+
+class _DbReadCache:
+    """Kernel-wide snapshot of ``module_data`` rows for synchronous reads.
+
+    Hikka modules call ``self.db.get()`` synchronously, so values must be in
+    memory before the call.  Modules are prefetched in bulk over the shared
+    ``DatabaseManager`` connection; a module listed in ``rows`` is complete,
+    which means a missing key is a real miss and never touches SQLite.
+    Every ``db_set``/``db_delete`` on the manager is mirrored through
+    :meth:`observe_write`, so writes made outside ``DbProxy`` stay visible.
+    """
+
+    def __init__(self):
+        self.rows: dict[str, dict[str, Any]] = {}
+        self.modules: set[str] | None = None
+        self._pending: dict[str, asyncio.Task] = {}
+        self._modules_task: asyncio.Task | None = None
+        # Writes seen while a module's rows are being fetched; applied on
+        # top of the fetched snapshot.
+        self._loading: dict[str, dict[str, Any]] = {}
+
+    def lookup(self, module: str, key: str) -> tuple[bool, Any]:
+        """Return ``(known, value)``; *known* is False if *module* is not loaded."""
+        rows = self.rows.get(module)
+        if rows is None:
+            return False, None
+        return True, rows.get(key, _MISSING)
+
+    def remember(self, module: str, key: str, value: Any) -> None:
+        rows = self.rows.get(module)
+        if rows is not None:
+            rows[key] = value
+        if self.modules is not None:
+            self.modules.add(module)
+
+    def forget(self, module: str, key: str) -> None:
+        rows = self.rows.get(module)
+        if rows is not None:
+            rows.pop(key, None)
+
+    def drop(self, module: str) -> None:
+        """Discard the snapshot of *module*; the next read fetches it again."""
+        self.rows.pop(module, None)
+
+    def observe_write(self, module: str, key: str, value: Any) -> None:
+        """``DatabaseManager`` write listener keeping ``rows`` current."""
+        loading = self._loading.get(module)
+        if loading is not None:
+            loading[key] = value
+        if value is DatabaseManager.DELETED:
+            self.forget(module, key)
+        else:
+            self.remember(module, key, value)
+
+    async def prefetch(self, kernel, module: str) -> dict[str, Any] | None:
+        """Load every row of *module* with a single query on the shared conn."""
+        if module in self.rows:
+            return self.rows[module]
+        conn = getattr(getattr(kernel, "db_manager", None), "conn", None)
+        if conn is None:
+            return None
+        add_write_listener = getattr(kernel.db_manager, "add_write_listener", None)
+        if callable(add_write_listener):
+            add_write_listener(self.observe_write)
+        written = self._loading.setdefault(module, {})
+        try:
+            cursor = await conn.execute(
+                _ROW_SELECT_SQL, (DatabaseManager._MAX_VALUE_BYTES, module)
+            )
+            fetched = await cursor.fetchall()
+            await cursor.close()
+        except Exception as e:
+            kernel.logger.debug(
+                f"[hikka_compat] DbProxy prefetch failed ({module}): {e}"
+            )
+            return None
+        finally:
+            if self._loading.get(module) is written:
+                del self._loading[module]
+
+        rows: dict[str, Any] = {}
+        for key, size, value in fetched:
+            if value is None and (size or 0) > DatabaseManager._MAX_VALUE_BYTES:
+                kernel.logger.warning(
+                    "[hikka_compat] DbProxy oversized value skipped on read: "
+                    "%s.%s size=%d",
+                    module,
+                    DatabaseManager.mask_key(key),
+                    size,
+                )
+                continue
+            rows[key] = _coerce_db_value(value)
+        pending_writes = getattr(kernel.db_manager, "pending_writes", None)
+        if callable(pending_writes):
+            for key, value in pending_writes(module).items():
+                rows[key] = _coerce_db_value(value)
+        for key, value in written.items():
+            if value is DatabaseManager.DELETED:
+                rows.pop(key, None)
+            else:
+                rows[key] = value
+        self.rows[module] = rows
+        return rows
+
+    def schedule_prefetch(self, kernel, module: str) -> bool:
+        """Warm *module* in the background so the next sync read is a hit.
+
+        Returns True if a new prefetch task was started.
+        """
+        if module in self.rows or module in self._pending:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        task = loop.create_task(self.prefetch(kernel, module))
+        self._pending[module] = task
+        task.add_done_callback(lambda _t: self._pending.pop(module, None))
+        return True
+
+    def schedule_module_list(self, kernel) -> None:
+        """Load the module list in the background, at most one task at a time."""
+        if self.modules is not None or self._modules_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.prefetch_module_list(kernel))
+        self._modules_task = task
+
+        def _done(_t):
+            self._modules_task = None
+
+        task.add_done_callback(_done)
+
+    async def prefetch_module_list(self, kernel) -> set[str] | None:
+        if self.modules is not None:
+            return self.modules
+        conn = getattr(getattr(kernel, "db_manager", None), "conn", None)
+        if conn is None:
+            return None
+        try:
+            cursor = await conn.execute("SELECT DISTINCT module FROM module_data")
+            fetched = await cursor.fetchall()
+            await cursor.close()
+        except Exception:
+            return None
+        self.modules = {row[0] for row in fetched if row and row[0]}
+        self.modules.update(self.rows)
+        return self.modules
+
+
+def _db_read_cache(kernel) -> _DbReadCache:
+    cache = getattr(kernel, "_hikka_compat_db_cache", None)
+    if not isinstance(cache, _DbReadCache):
+        cache = _DbReadCache()
+        kernel._hikka_compat_db_cache = cache
+    return cache
+
+
+def _blocking_reads_allowed(kernel) -> bool:
+    """Sync full-table scans are only allowed off-loop or with an explicit opt-in."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    config = getattr(kernel, "config", None)
+    return isinstance(config, dict) and bool(config.get("hikka_blocking_db_reads"))
+
+
+def _coerce_db_value(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    stripped = value.strip()
+    if not stripped:
+        return value
+    with contextlib.suppress(json.JSONDecodeError, TypeError, ValueError):
+        return json.loads(stripped)
+    with contextlib.suppress(SyntaxError, TypeError, ValueError):
+        return ast.literal_eval(stripped)
+    return value
+
+
 class _KernelDbFacade:
     def __init__(self, kernel):
         self._kernel = kernel
@@ -611,6 +827,7 @@ class _KernelDbFacade:
 
     def set(self, owner: str, key: str, value) -> bool:
         self._mem[self._mem_key(owner, key)] = value
+        _db_read_cache(self._kernel).remember(owner, key, value)
         if hasattr(self._kernel, "db_set"):
             try:
                 asyncio.get_event_loop().create_task(
@@ -732,16 +949,7 @@ class DbProxy:
             pass
 
     def _coerce_value(self, value: Any) -> Any:
-        if not isinstance(value, str):
-            return value
-        stripped = value.strip()
-        if not stripped:
-            return value
-        with contextlib.suppress(json.JSONDecodeError, TypeError, ValueError):
-            return json.loads(stripped)
-        with contextlib.suppress(SyntaxError, TypeError, ValueError):
-            return ast.literal_eval(stripped)
-        return value
+        return _coerce_db_value(value)
 
     def _coerce_to_default_shape(self, value: Any, default: Any) -> Any:
         if default is None:
@@ -761,35 +969,34 @@ class DbProxy:
         return value
 
     def _read_persistent(self, module: str, key: str, default: Any = None) -> Any:
+        cache = _db_read_cache(self._kernel)
+        known, value = cache.lookup(module, key)
+        if known:
+            return default if value is _MISSING else value
+
         db_manager = getattr(self._kernel, "db_manager", None)
         if db_manager is None or not hasattr(db_manager, "_resolve_db_file"):
             return default
 
+        if cache.schedule_prefetch(self._kernel, module):
+            # First read of a module that was not prefetched (e.g. another
+            # module's namespace) on the event loop: answer it with a single
+            # primary-key lookup and serve the following reads from memory.
+            self._kernel.logger.debug(
+                "[hikka_compat] DbProxy read of %s.%s before prefetch",
+                module,
+                DatabaseManager.mask_key(key),
+            )
+
         try:
-            conn = sqlite3.connect(db_manager._resolve_db_file())
-            try:
-                size_row = conn.execute(
-                    "SELECT LENGTH(value) FROM module_data WHERE module = ? AND key = ?",
-                    (module, key),
-                ).fetchone()
-                if not size_row:
-                    return default
-                value_size = size_row[0] or 0
-                if value_size > DatabaseManager._MAX_VALUE_BYTES:
-                    self._kernel.logger.warning(
-                        "[hikka_compat] DbProxy oversized value skipped on read: "
-                        "%s.%s size=%d",
-                        module,
-                        DatabaseManager.mask_key(key),
-                        value_size,
-                    )
-                    return default
+            conn = _get_ro_connection(db_manager._resolve_db_file())
+            with _RO_CONNECTIONS_LOCK:
                 row = conn.execute(
-                    "SELECT value FROM module_data WHERE module = ? AND key = ?",
-                    (module, key),
+                    "SELECT LENGTH(value), "
+                    "CASE WHEN LENGTH(value) > ? THEN NULL ELSE value END "
+                    "FROM module_data WHERE module = ? AND key = ?",
+                    (DatabaseManager._MAX_VALUE_BYTES, module, key),
                 ).fetchone()
-            finally:
-                conn.close()
         except Exception as e:
             self._kernel.logger.warning(
                 f"[hikka_compat] DbProxy read failed "
@@ -797,26 +1004,56 @@ class DbProxy:
             )
             return default
 
-        return self._coerce_value(row[0]) if row else default
+        if not row:
+            return default
+        value_size = row[0] or 0
+        if value_size > DatabaseManager._MAX_VALUE_BYTES:
+            self._kernel.logger.warning(
+                "[hikka_compat] DbProxy oversized value skipped on read: "
+                "%s.%s size=%d",
+                module,
+                DatabaseManager.mask_key(key),
+                value_size,
+            )
+            return default
+        return self._coerce_value(row[1])
 
     def _read_all_modules(self) -> list[str]:
+        cache = _db_read_cache(self._kernel)
+        if cache.modules is not None:
+            return sorted(cache.modules)
+
         db_manager = getattr(self._kernel, "db_manager", None)
         if db_manager is None or not hasattr(db_manager, "_resolve_db_file"):
             return []
 
+        if not _blocking_reads_allowed(self._kernel):
+            cache.schedule_module_list(self._kernel)
+            return sorted(cache.rows)
+
         try:
-            conn = sqlite3.connect(db_manager._resolve_db_file())
-            try:
+            conn = _get_ro_connection(db_manager._resolve_db_file())
+            with _RO_CONNECTIONS_LOCK:
                 rows = conn.execute(
                     "SELECT DISTINCT module FROM module_data ORDER BY module"
                 ).fetchall()
-            finally:
-                conn.close()
         except Exception:
             return []
 
         return [row[0] for row in rows if row and row[0]]
 
+    async def prefetch(self, *modules: str) -> None:
+        """Bulk-load all keys of *modules* into memory (one query per module).
+
+        Called by the loader before ``on_load``/``client_ready`` so that the
+        synchronous ``get()`` API is served without touching SQLite.
+        """
+        cache = _db_read_cache(self._kernel)
+        for module in modules or (self._module_name,):
+            rows = await cache.prefetch(self._kernel, module)
+            for key, value in (rows or {}).items():
+                self._mem.setdefault(self._mem_key(module, key), value)
+
     def _resolve_get_args(self, args, default=None):
         if len(args) == 1:
             return self._module_name, args[0], default
@@ -848,6 +1085,7 @@ class DbProxy:
             )
             return
         self._mem[self._mem_key(module, key)] = value
+        _db_read_cache(self._kernel).remember(module, key, value)
         self._schedule_write(module, key, value)
 
     def get(self, *args, default: Any = None) -> Any:
@@ -866,21 +1104,25 @@ class DbProxy:
         return list(values)
 
     def clear(self, module: str | None = None) -> bool:
+        cache = _db_read_cache(self._kernel)
         if module is None:
             prefix = f"{self._module_name}:"
             for key in list(self._mem):
                 if key.startswith(prefix):
                     self._mem.pop(key, None)
+            cache.drop(self._module_name)
             return True
 
         if ":" in str(module):
             self._mem.pop(module, None)
+            cache.drop(module.split(":", maxsplit=1)[0])
             return True
 
         prefix = f"{module}:"
         for key in list(self._mem):
             if key.startswith(prefix):
                 self._mem.pop(key, None)
+        cache.drop(module)
         return True
 
     def update(self, *args, **kwargs) -> bool:
@@ -927,6 +1169,12 @@ class DbProxy:
         mk = self._mem_key(module, key)
         if mk in self._mem:
             return self._mem[mk]
+        known, value = _db_read_cache(self._kernel).lookup(module, key)
+        if known:
+            if value is _MISSING:
+                return default
+            self._mem[mk] = value
+            return value
         try:
             result = await self._kernel.db_get(module, key)
             if result is not None:
@@ -941,6 +1189,7 @@ class DbProxy:
 
     async def async_set(self, module: str, key: str, value: Any) -> None:
         self._mem[self._mem_key(module, key)] = value
+        _db_read_cache(self._kernel).remember(module, key, value)
         try:
             await self._kernel.db_set(module, key, value)
         except Exception as e:
@@ -949,6 +1198,9 @@ class DbProxy:
             )
 
     async def preload(self, module: str, *keys: str) -> None:
+        if not keys:
+            await self.prefetch(module)
+            return
         for key in keys:
             await self.async_get(module, key)
 
@@ -1764,6 +2016,7 @@ class InlineProxy:
                         "expires_at": _time.time() + ttl,
                         "unit_id": unit_id,
                     }
+                    track_inline_callback(self._kernel, cb_data, cb_map[cb_data])
                 elif isinstance(cb, str):
                     btn["callback_data"] = cb
 
@@ -1958,44 +2211,39 @@ class InlineProxy:
         return result or None
 
     def _register_unit(self, unit_id: str, payload: dict) -> None:
-        self._cleanup_expired_units()
+        expiry = get_expiry_service(self._kernel)
+        expiry.expire()
         self._cleanup_custom_map()
         payload["module_name"] = self._module_name
         if len(self._units) >= self.MAX_UNITS:
             oldest = next(iter(self._units))
             self._unload_unit_sync(oldest)
         self._units[unit_id] = payload
-
-    def _cleanup_expired_units(self) -> int:
-        now = time.time()
-        removed = 0
-        for uid, unit in list(self._units.items()):
-            expires_at = unit.get("expires_at")
-            if expires_at and expires_at <= now:
-                if self._unload_unit_sync(uid):
-                    removed += 1
-        if removed:
-            self._kernel.logger.debug(
-                "[hikka_compat] inline expired units removed=%d", removed
+        expires_at = payload.get("expires_at")
+        if expires_at:
+            expiry.track(
+                "hikka_unit",
+                self._units,
+                unit_id,
+                payload,
+                expires_at - time.time(),
+                remove=self._unload_unit_sync,
             )
-        return removed
 
     def _cleanup_custom_map(self) -> int:
+        # Expired callback tokens and units are reaped by the expiry service;
+        # this drops callback tokens and custom_map payloads orphaned by a
+        # unit that is already gone.
         removed = 0
         live_units = set(self._units)
 
         cb_map = getattr(self._kernel, "inline_callback_map", None)
         if isinstance(cb_map, dict):
-            now = time.time()
             for key, payload in list(cb_map.items()):
-                if not isinstance(payload, dict):
-                    continue
-                unit_id = payload.get("unit_id")
-                expires_at = payload.get("expires_at")
-                if (unit_id and unit_id not in live_units) or (
-                    expires_at and expires_at <= now
-                ):
+                unit_id = payload.get("unit_id") if isinstance(payload, dict) else None
+                if unit_id and unit_id not in live_units:
                     cb_map.pop(key, None)
+                    removed += 1
 
         for key, payload in list(self._custom_map.items()):
             unit_id = payload.get("unit_id") if isinstance(payload, dict) else None
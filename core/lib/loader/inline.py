@@ -14,9 +14,9 @@ from html import escape as html_escape
 from typing import TYPE_CHECKING, Any
 
 try:
-    from telethon import Button, events
+    from telethon import Button
 except ImportError:
-    Button = events = None
+    Button = None
 
 try:
     from telethon.errors import BadRequestError, ChatSendInlineForbiddenError
@@ -44,6 +44,9 @@ except ImportError:
         return e
 
 
+from core.lib.loader.callback_router import get_callback_router
+from core.lib.utils.expiry import get_expiry_service
+
 try:
     from core_inline.handlers import InlineHandlers
 except ImportError:
@@ -73,37 +76,26 @@ class InlineManager:
         self._setup_temp_callback_handler()
         self.k.logger.debug("[InlineManager] __init__ done")
         self.s = Strings(self.k, {"name": "kernel"})
-        # Periodic cleanup counter: purge at most once every N operations
-        self._cleanup_counter = 0
-        self._cleanup_interval = 10  # every 10th put/get
-
-    def _purge_expired_sessions(self, force: bool = False) -> None:
-        """Remove expired sessions.  Runs at most every *cleanup_interval*
-        calls unless *force* is True."""
-        if not force:
-            self._cleanup_counter += 1
-            if self._cleanup_counter < self._cleanup_interval:
-                return
-            self._cleanup_counter = 0
-        now = time.monotonic()
-        expired = [k for k, v in self._sessions.items() if v.expires_at <= now]
-        for k in expired:
-            self._sessions.pop(k, None)
 
     def _session_put(self, key: str, data: dict[str, Any], ttl: int) -> None:
         self.k.logger.debug("[InlineManager] _session_put key=%s ttl=%d", key, ttl)
-        self._purge_expired_sessions()
-        self._sessions[key] = _Session(
-            expires_at=time.monotonic() + max(int(ttl), 1),
+        ttl = max(int(ttl), 1)
+        expiry = get_expiry_service(self.k)
+        # Writes reap whatever is already due; O(expired), never a full scan.
+        expiry.expire()
+        session = self._sessions[key] = _Session(
+            expires_at=time.monotonic() + ttl,
             data=data,
         )
+        expiry.track("session", self._sessions, key, session, ttl)
         self.k.logger.debug("[InlineManager] _session_put done key=%s", key)
 
     def _session_get(self, key: str, *, pop: bool = False) -> dict[str, Any] | None:
         self.k.logger.debug("[InlineManager] _session_get key=%s pop=%s", key, pop)
-        self._purge_expired_sessions()
         session = self._sessions.get(key)
-        if not session:
+        if not session or session.expires_at <= time.monotonic():
+            if session:
+                self._sessions.pop(key, None)
             self.k.logger.debug("[InlineManager] _session_get miss key=%s", key)
             return None
         if pop:
@@ -327,9 +319,7 @@ class InlineManager:
         gallery_data["current_index"] = current_index
         session = self._sessions.get(session_key)
         if session:
-            self._sessions[session_key] = _Session(
-                expires_at=session.expires_at, data=gallery_data
-            )
+            session.data = gallery_data
 
         gallery_text, media, _media_type = self._render_gallery(
             title, rows, current_index, escape_html=escape_html_flag
@@ -393,9 +383,7 @@ class InlineManager:
         list_data["page"] = page
         session = self._sessions.get(session_key)
         if session:
-            self._sessions[session_key] = _Session(
-                expires_at=session.expires_at, data=list_data
-            )
+            session.data = list_data
 
         nav_buttons = self._nav_buttons("list", list_uuid, page=page, total=total_pages)
         try:
@@ -444,9 +432,7 @@ class InlineManager:
         text_data["page"] = page
         session = self._sessions.get(session_key)
         if session:
-            self._sessions[session_key] = _Session(
-                expires_at=session.expires_at, data=text_data
-            )
+            session.data = text_data
 
         nav_buttons = self._nav_buttons("text", text_uuid, page=page, total=total_pages)
         try:
@@ -554,39 +540,37 @@ class InlineManager:
             k.inline_handlers_owners.pop(pattern, None)
             k.logger.debug(f"Removed inline handler: {pattern}")
 
-    def register_callback_handler(self, pattern, handler) -> None:
-        """Register a Telethon CallbackQuery handler for *pattern*.
+        removed = get_callback_router(k).remove_module(module_name)
+        if removed:
+            k.logger.debug(f"Removed {removed} callback handler(s) of {module_name}")
 
-        Attaches the handler to the client immediately if already connected.
+    def register_callback_handler(
+        self, pattern, handler, owner: str | None = None
+    ) -> None:
+        """Register a callback query handler for data starting with *pattern*.
+
+        The handler is added to the shared :class:`CallbackRouter`, which is
+        bound to the client once instead of once per pattern.
 
         Args:
-            pattern: Bytes or str pattern for callback data.
+            pattern: Bytes or str prefix of the callback data, or a regex
+                (matched with ``re.match``) if it contains metacharacters.
             handler: Async callable.
+            owner: Module the handler belongs to; its handlers are removed
+                when it is unloaded. Defaults to the module being loaded.
         """
         k = self.k
         k.logger.debug(f"[InlineManager] register_callback_handler pattern={pattern}")
         try:
-            # Telethon: `data=` is exact bytes match; `pattern=` uses `re.match` against bytes.
-            # Most callbacks here are prefix-based ("gallery_<id>_next"), so use `pattern=`.
-            pattern_bytes = pattern.encode() if isinstance(pattern, str) else pattern
-            k.callback_handlers[pattern_bytes] = handler
+            router = get_callback_router(k)
+            if owner is None:
+                owner = k.current_loading_module
+            router.add(pattern, handler, owner if isinstance(owner, str) else None)
             k.logger.debug(
-                f"[InlineManager] register_callback_handler added total={len(k.callback_handlers)}"
+                f"[InlineManager] register_callback_handler added total={len(router)}"
             )
-
             if k.client:
-
-                @k.client.on(events.CallbackQuery(pattern=pattern_bytes))
-                async def _wrapper(event):
-                    try:
-                        _pe = wrap_event_for_module(
-                            event, getattr(handler, "__module__", "callback"), k
-                        )
-                        await handler(_pe)
-                    except Exception as e:
-                        await k.handle_error(
-                            e, message="Callback handler error", event=event
-                        )
+                router.ensure_bound(k.client)
 
         except Exception as e:
             k.logger.error(f"Callback registration error: {e}")
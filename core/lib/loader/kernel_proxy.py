@@ -45,8 +45,10 @@ PROTECTED_KERNEL_NAMES = frozenset(
         "inline_handlers",
         "inline_handlers_owners",
         "callback_handlers",
+        "callback_router",
         "callback_permissions",
         "inline_callback_map",
+        "inline_expiry",
         "_inline_temp_map",
         "_inline_temp_uuids",
         "_class_module_instances",
@@ -249,6 +251,7 @@ class ModuleKernelProxy:
             "remove_inline_callback_tokens",
             "store_inline_callback",
             "allow_inline_callback_user",
+            "register_callback_handler",
             "set_live_module_config",
             "get_live_module_config",
             "_ensure_callback_storage",
@@ -431,19 +434,12 @@ class ModuleKernelProxy:
                 cb_map.pop(token, None)
 
     def store_inline_callback(self, token: str, data: dict[str, Any]) -> None:
-        import time
+        from core.lib.utils.expiry import track_inline_callback
 
         lock, cb_map = self._ensure_callback_storage()
         with lock:
-            now = time.time()
-            expired = [
-                key
-                for key, value in list(cb_map.items())
-                if value.get("expires_at") and value["expires_at"] < now
-            ]
-            for key in expired:
-                cb_map.pop(key, None)
             cb_map[token] = data
+        track_inline_callback(object.__getattribute__(self, "_kernel"), token, data)
 
     def allow_inline_callback_user(
         self, user_id: int, token: str, allow_ttl: int
@@ -457,6 +453,17 @@ class ModuleKernelProxy:
             kernel.callback_permissions = permissions
         permissions.allow(user_id, token, allow_ttl)
 
+    def register_callback_handler(self, pattern: Any, handler: Any) -> None:
+        """Register a callback handler owned by this module.
+
+        The owner is bound here rather than read from the loader state, so a
+        handler registered after loading is still removed with this module.
+        """
+        kernel = object.__getattribute__(self, "_kernel")
+        kernel.register_callback_handler(
+            pattern, handler, owner=object.__getattribute__(self, "_module_name")
+        )
+
     def set_live_module_config(self, module_name: str, config: Any) -> None:
         kernel = object.__getattribute__(self, "_kernel")
         live_configs = getattr(kernel, "_live_module_configs", None)
@@ -9,13 +9,21 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import re
 import time
 import uuid
+import weakref
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from core.lib.loader.watchers import (
+    WatcherEventFacts,
+    WatcherRouter,
+    compile_watcher_filter,
+)
+from core.lib.time.scheduler import ScheduledJob, TaskScheduler
 from core.lib.types.event import Event
+from core.lib.utils.expiry import get_expiry_service
+from core.lib.utils.hot_path import debug_enabled, get_hot_trace
 
 try:
     from telethon import events
@@ -76,6 +84,31 @@ except ImportError:
         pass
 
 
+# Cap for the exponential back-off of a loop whose iterations keep failing;
+# loops with a longer interval are never run more often than configured.
+_LOOP_MAX_BACKOFF = 600.0
+
+# Schedulers used by loops whose kernel has no running TaskScheduler (tests,
+# early boot), one per event loop.
+_fallback_schedulers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, TaskScheduler
+] = weakref.WeakKeyDictionary()
+
+
+def _loop_scheduler(kernel: Any) -> TaskScheduler:
+    """Return the scheduler module loops should be registered on."""
+    scheduler = getattr(kernel, "__dict__", {}).get("scheduler")
+    if isinstance(scheduler, TaskScheduler) and scheduler.running:
+        return scheduler
+    event_loop = asyncio.get_running_loop()
+    scheduler = _fallback_schedulers.get(event_loop)
+    if scheduler is None:
+        scheduler = _fallback_schedulers[event_loop] = TaskScheduler(None)
+    if not scheduler.running:
+        scheduler.start_nowait()
+    return scheduler
+
+
 class InfiniteLoop:
     """
     Managed background loop tied to a module's lifecycle.
@@ -83,6 +116,12 @@ class InfiniteLoop:
     Created by @kernel.register.loop(). The kernel starts it after the module
     loads (if autostart=True) and stops it automatically on unload.
 
+    Each running loop is an interval job on the kernel's TaskScheduler, so
+    iterations are fixed-rate and never overlap: a due iteration is skipped
+    (counted as an overrun) while the previous one is still running, skipped
+    while ``kernel.power_save_mode`` is on, and backed off exponentially
+    while iterations keep failing.
+
     Attributes:
         status (bool): True while the loop is running.
     """
@@ -93,27 +132,49 @@ class InfiniteLoop:
         interval: int,
         autostart: bool,
         wait_before: bool,
+        name: str | None = None,
     ) -> None:
         self.func = func
+        self.name = name or getattr(func, "__name__", "loop")
         self.interval = interval
         self.autostart = autostart
         self._wait_before = wait_before
-        self._task: asyncio.Task | None = None
+        self._scheduler: TaskScheduler | None = None
+        self._job_id: str | None = None
         self._kernel: Kernel | None = None
         self.status: bool = False
         self.last_run: float | None = None
         self.last_error: Exception | None = None
         self.fail_count: int = 0
 
+    @property
+    def job(self) -> ScheduledJob | None:
+        """The scheduler job driving this loop, or None when stopped."""
+        if self._scheduler is None or self._job_id is None:
+            return None
+        return self._scheduler.get_job(self._job_id)
+
     @property
     def is_running(self) -> bool:
-        return bool(self._task and not self._task.done() and self.status)
+        return bool(self.status and self.job is not None)
 
     def start(self) -> None:
         """Start the loop. No-op if already running."""
-        if self._task and not self._task.done():
+        if self.is_running:
             return
-        self._task = asyncio.ensure_future(self._run())
+        scheduler = _loop_scheduler(self._kernel)
+        self._scheduler = scheduler
+        self._job_id = scheduler.schedule_interval(
+            self._tick,
+            self.interval,
+            first_delay=self.interval if self._wait_before else 0.0,
+            max_backoff=_LOOP_MAX_BACKOFF,
+            on_error=self._on_error,
+            pause_if=self._paused,
+            task_id=f"loop_{self.name}_{id(self):x}",
+            name=f"loop_{self.name}",
+        )
+        self.status = True
 
     def restart(self) -> None:
         """Restart the loop regardless of its current state."""
@@ -123,153 +184,70 @@ class InfiniteLoop:
     def stop(self) -> None:
         """Stop the loop gracefully."""
         self.status = False
-        if self._task and not self._task.done():
-            self._task.cancel()
-        self._task = None
+        if self._scheduler is not None and self._job_id is not None:
+            self._scheduler.cancel_task(self._job_id)
+        self._scheduler = None
+        self._job_id = None
+
+    def _paused(self) -> bool:
+        return getattr(self._kernel, "power_save_mode", False) is True
+
+    async def _tick(self) -> None:
+        self.last_run = time.time()
+        await self.func(self._kernel)
+        self.last_error = None
+        self.fail_count = 0
+
+    async def _on_error(self, exc: Exception) -> None:
+        self.last_error = exc
+        self.fail_count += 1
+        if not self._kernel:
+            return
+        self._kernel.logger.error(f"InfiniteLoop error in '{self.name}': {exc}")
+        if hasattr(self._kernel, "handle_error"):
+            try:
+                result = self._kernel.handle_error(exc, source="infinite_loop")
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                pass
 
-    async def _run(self) -> None:
-        self.status = True
-        try:
-            while self.status:
-                if self._wait_before:
-                    await asyncio.sleep(self.interval)
-                if not self.status:
-                    break
-                try:
-                    self.last_run = time.time()
-                    await self.func(self._kernel)
-                    self.last_error = None
-                    self.fail_count = 0
-                except asyncio.CancelledError:
-                    break
-                except Exception as exc:
-                    self.last_error = exc
-                    self.fail_count += 1
-                    if self._kernel:
-                        self._kernel.logger.error(
-                            f"InfiniteLoop error in '{self.func.__name__}': {exc}"
-                        )
-                        if hasattr(self._kernel, "handle_error"):
-                            try:
-                                await self._kernel.handle_error(
-                                    exc, source="infinite_loop"
-                                )
-                            except Exception:
-                                pass
-                if not self._wait_before:
-                    await asyncio.sleep(self.interval)
-        finally:
-            self.status = False
+    def stats(self) -> dict[str, Any]:
+        """Return schedule and run statistics for this loop.
+
+        ``next_run_in`` is None while the loop is stopped; ``overruns`` counts
+        iterations skipped because the previous one was still running.
+        """
+        job = self.job
+        return {
+            "name": self.name,
+            "interval": self.interval,
+            "running": self.is_running,
+            "next_run_in": job.stats()["next_run_in"] if job else None,
+            "last_run": self.last_run,
+            "last_duration": job.last_duration if job else None,
+            "max_duration": job.max_duration if job else None,
+            "runs": job.runs if job else 0,
+            "overruns": job.skipped if job else 0,
+            "paused": job.paused if job else 0,
+            "fail_count": self.fail_count,
+            "last_error": repr(self.last_error) if self.last_error else None,
+        }
 
     def __repr__(self) -> str:
         return (
-            f"<InfiniteLoop func={self.func.__name__!r} "
+            f"<InfiniteLoop func={self.name!r} "
             f"interval={self.interval} running={self.status}>"
         )
 
 
-def _watcher_passes_filters(event: Event, tags: dict[str, Any]) -> bool:
+def _watcher_passes_filters(
+    event: Event, tags: dict[str, Any], facts: WatcherEventFacts | None = None
+) -> bool:
     """Return True if *event* satisfies all tag filters."""
-    msg = getattr(event, "message", event)
-
-    # outgoing / incoming
-    if tags.get("out") and not getattr(msg, "out", False):
-        return False
-    if tags.get("incoming") and getattr(msg, "out", False):
-        return False
-
-    # chat type
-    chat = getattr(event, "chat", None)
-    is_pm = (
-        bool(chat)
-        and not getattr(chat, "megagroup", False)
-        and not getattr(chat, "broadcast", False)
-        and not getattr(chat, "gigagroup", False)
-    )
-    is_group = getattr(chat, "megagroup", False) or getattr(chat, "gigagroup", False)
-    is_channel = getattr(chat, "broadcast", False)
-
-    if tags.get("only_pm") and not is_pm:
-        return False
-    if tags.get("no_pm") and is_pm:
-        return False
-    if tags.get("only_groups") and not is_group:
-        return False
-    if tags.get("no_groups") and is_group:
-        return False
-    if tags.get("only_channels") and not is_channel:
-        return False
-    if tags.get("no_channels") and is_channel:
-        return False
-
-    # media
-    media = getattr(msg, "media", None)
-    photo = media and hasattr(media, "photo")
-    video = media and hasattr(media, "video")
-    doc = media and hasattr(media, "document")
-    audio = doc and getattr(
-        getattr(media, "document", None), "mime_type", ""
-    ).startswith("audio")
-    sticker = doc and any(
-        type(a).__name__ == "DocumentAttributeSticker"
-        for a in getattr(getattr(media, "document", None), "attributes", [])
-    )
-
-    if tags.get("only_media") and not media:
-        return False
-    if tags.get("no_media") and media:
-        return False
-    if tags.get("only_photos") and not photo:
-        return False
-    if tags.get("no_photos") and photo:
-        return False
-    if tags.get("only_videos") and not video:
-        return False
-    if tags.get("no_videos") and video:
-        return False
-    if tags.get("only_audios") and not audio:
-        return False
-    if tags.get("no_audios") and audio:
-        return False
-    if tags.get("only_docs") and not doc:
-        return False
-    if tags.get("no_docs") and doc:
-        return False
-    if tags.get("only_stickers") and not sticker:
-        return False
-    if tags.get("no_stickers") and sticker:
-        return False
-
-    # forwards / replies
-    fwd = getattr(msg, "fwd_from", None)
-    reply = getattr(msg, "reply_to", None)
-    if tags.get("only_forwards") and not fwd:
-        return False
-    if tags.get("no_forwards") and fwd:
-        return False
-    if tags.get("only_reply") and not reply:
-        return False
-    if tags.get("no_reply") and reply:
-        return False
-
-    # text filters
-    text = getattr(msg, "text", "") or ""
-    if "regex" in tags and not re.search(tags["regex"], text):
-        return False
-    if "startswith" in tags and not text.startswith(tags["startswith"]):
-        return False
-    if "endswith" in tags and not text.endswith(tags["endswith"]):
-        return False
-    if "contains" in tags and tags["contains"] not in text:
-        return False
-
-    # sender / chat id filters
-    if "from_id" in tags and getattr(event, "sender_id", None) != tags["from_id"]:
-        return False
-    if "chat_id" in tags and getattr(event, "chat_id", None) != tags["chat_id"]:
-        return False
-
-    return True
+    if facts is None:
+        facts = WatcherEventFacts(event)
+    return compile_watcher_filter(tags)(facts)
 
 
 class Register:
@@ -289,6 +267,7 @@ class Register:
         self._method_modules: dict[str, Any] = {}
         self._all_watchers: list[tuple] = []
         self._all_event_handlers: list[tuple] = []
+        self._watcher_routers: dict[int, WatcherRouter] = {}
 
     def _get_disabled_watchers(self) -> set:
         disabled = getattr(self.kernel, "_disabled_watchers", None)
@@ -297,6 +276,16 @@ class Register:
             self.kernel._disabled_watchers = disabled
         return disabled
 
+    def get_watcher_router(self, client: Any) -> WatcherRouter:
+        """Return the shared watcher router bound to *client*."""
+        router = self._watcher_routers.get(id(client))
+        if router is None or router.client is not client:
+            router = WatcherRouter(
+                self.kernel, client, disabled_getter=self._get_disabled_watchers
+            )
+            self._watcher_routers[id(client)] = router
+        return router
+
     @staticmethod
     def _watcher_key(module_name: str, watcher_name: str) -> tuple[str, str]:
         return (module_name, watcher_name)
@@ -756,38 +745,19 @@ class Register:
 
             bound_instance = getattr(f, "__bound_instance__", None)
             raw_func = getattr(f, "__original__", f)
+            trace = get_hot_trace()
 
-            async def _wrapper(event: Event) -> None:
-                event_text = getattr(getattr(event, "message", event), "text", None)
-                self.kernel.logger.debug(
-                    "[watcher] enter module=%r watcher=%r chat_id=%r sender_id=%r text=%r",
-                    module_name,
-                    watcher_name,
-                    getattr(event, "chat_id", None),
-                    getattr(event, "sender_id", None),
-                    event_text,
-                )
-                if watcher_key in self._get_disabled_watchers():
-                    self.kernel.logger.debug(
-                        "[watcher] skipped-disabled module=%r watcher=%r",
-                        module_name,
-                        watcher_name,
-                    )
-                    return
-                if not _watcher_passes_filters(event, _tags):
-                    self.kernel.logger.debug(
-                        "[watcher] skipped-filters module=%r watcher=%r tags=%r",
-                        module_name,
-                        watcher_name,
-                        _tags,
-                    )
-                    return
+            async def _deliver(event: Event) -> None:
+                logger = self.kernel.logger
+                debug = debug_enabled(logger)
+                started = trace.start()
                 try:
-                    self.kernel.logger.debug(
-                        "[watcher] dispatch module=%r watcher=%r",
-                        module_name,
-                        watcher_name,
-                    )
+                    if debug:
+                        logger.debug(
+                            "[watcher] dispatch module=%r watcher=%r",
+                            module_name,
+                            watcher_name,
+                        )
                     _proxy_event = wrap_event_for_module(
                         event, module_name, self.kernel
                     )
@@ -795,17 +765,57 @@ class Register:
                         await raw_func(bound_instance, _proxy_event)
                     else:
                         await f(_proxy_event)
-                    self.kernel.logger.debug(
-                        "[watcher] done module=%r watcher=%r",
-                        module_name,
-                        watcher_name,
-                    )
+                    if debug:
+                        logger.debug(
+                            "[watcher] done module=%r watcher=%r",
+                            module_name,
+                            watcher_name,
+                        )
                 except Exception as exc:
                     self.kernel.logger.error(f"Watcher '{watcher_name}' raised: {exc}")
                     if hasattr(self.kernel, "handle_error"):
                         await self.kernel.handle_error(
                             exc, message="Module watcher error"
                         )
+                finally:
+                    trace.record("watcher", started, key=watcher_key)
+
+            async def _wrapper(event: Event) -> None:
+                """Standalone entry point: checks state and tags, then delivers.
+
+                The watcher router performs the same checks itself and calls
+                ``_deliver`` directly.
+                """
+                logger = self.kernel.logger
+                debug = debug_enabled(logger)
+                if debug:
+                    logger.debug(
+                        "[watcher] enter module=%r watcher=%r chat_id=%r "
+                        "sender_id=%r text=%r",
+                        module_name,
+                        watcher_name,
+                        getattr(event, "chat_id", None),
+                        getattr(event, "sender_id", None),
+                        getattr(getattr(event, "message", event), "text", None),
+                    )
+                if watcher_key in self._get_disabled_watchers():
+                    if debug:
+                        logger.debug(
+                            "[watcher] skipped-disabled module=%r watcher=%r",
+                            module_name,
+                            watcher_name,
+                        )
+                    return
+                if not _watcher_passes_filters(event, _tags):
+                    if debug:
+                        logger.debug(
+                            "[watcher] skipped-filters module=%r watcher=%r tags=%r",
+                            module_name,
+                            watcher_name,
+                            _tags,
+                        )
+                    return
+                await _deliver(event)
 
             _wrapper.__name__ = f"watcher:{module_name}:{watcher_name}"
             _wrapper.__module__ = module_name
@@ -814,8 +824,6 @@ class Register:
             _wrapper.__watcher_name__ = watcher_name
             _wrapper.__watcher_key__ = watcher_key
 
-            event_obj = events.NewMessage()
-
             if (
                 _use_bot_client
                 and hasattr(self.kernel, "bot_client")
@@ -840,13 +848,16 @@ class Register:
                     )
                     return f
 
-            tg_client.add_event_handler(_wrapper, event_obj)
+            router = self.get_watcher_router(tg_client)
+            event_obj = router.event_obj
+            router.add(_wrapper, watcher_key, _tags, callback=_deliver)
+            _wrapper.__watcher_router__ = router
             self.kernel.logger.debug(
-                "[register.watcher] bound module=%r watcher=%r client=%r event=%r",
+                "[register.watcher] routed module=%r watcher=%r client=%r watchers=%d",
                 module_name,
                 watcher_name,
                 type(tg_client).__name__,
-                type(event_obj).__name__,
+                len(router),
             )
 
             self._all_watchers.append(
@@ -947,7 +958,13 @@ class Register:
                     return await raw_func(bound_instance)
                 return await raw_func(kernel)
 
-            il = InfiniteLoop(loop_caller, interval, autostart, wait_before)
+            il = InfiniteLoop(
+                loop_caller,
+                interval,
+                autostart,
+                wait_before,
+                name=getattr(raw_func, "__name__", None),
+            )
 
             if module is None:
                 frame = inspect.stack()[1][0]
@@ -1233,6 +1250,24 @@ class Register:
                 loops.extend(reg.__loops__)
         return loops
 
+    def get_loop_stats(self) -> list[dict[str, Any]]:
+        """
+        Get schedule and run statistics for every module loop.
+
+        Returns:
+            List of :meth:`InfiniteLoop.stats` dicts with an added ``module``
+            key: next run time, last duration, overrun and failure counts.
+        """
+        stats = []
+        for module_name, module in {
+            **self.kernel.loaded_modules,
+            **self.kernel.system_modules,
+        }.items():
+            reg = getattr(module, "register", None)
+            for loop in getattr(reg, "__loops__", None) or ():
+                stats.append({"module": module_name, **loop.stats()})
+        return stats
+
     def unregister_command(self, cmd: str) -> bool:
         """
         Unregister a userbot command by name.
@@ -1428,7 +1463,7 @@ class Register:
 
         module_name = self.kernel.current_loading_module
 
-        self.kernel._inline_temp_map[temp_uuid] = {
+        entry = self.kernel._inline_temp_map[temp_uuid] = {
             "handler": func,
             "article": article,
             "data": data,
@@ -1438,12 +1473,34 @@ class Register:
             "allow_ttl": allow_ttl,
         }
         self.kernel._inline_temp_uuids.append(temp_uuid)
+        if ttl:
+            get_expiry_service(self.kernel).track(
+                "inline_temp",
+                self.kernel._inline_temp_map,
+                temp_uuid,
+                entry,
+                ttl,
+                remove=self._drop_inline_temp,
+            )
 
         self.kernel.logger.debug(
             f"[register.inline_temp] uuid={temp_uuid} ttl={ttl} module={module_name}"
         )
         return temp_uuid
 
+    def _drop_inline_temp(self, temp_uuid: str) -> bool:
+        temp_map = getattr(self.kernel, "_inline_temp_map", None)
+        if not temp_map or temp_map.pop(temp_uuid, None) is None:
+            return False
+        try:
+            self.kernel._inline_temp_uuids.remove(temp_uuid)
+        except (AttributeError, ValueError):
+            pass
+        cache = getattr(self.kernel, "cache", None)
+        if cache is not None:
+            cache.pop(f"inline_temp_{temp_uuid}", None)
+        return True
+
     def cleanup_inline_temp(self, force: bool = False) -> int:
         """Clean up expired temporary inline handlers.
 
@@ -1451,29 +1508,19 @@ class Register:
             force: If True, remove all. If False, only expired.
 
         Returns:
-            Number of handlers removed.
+            Number of entries removed.  Without *force* this runs the shared
+            expiry service, so other due inline state is reaped as well.
         """
         if not hasattr(self.kernel, "_inline_temp_map"):
             return 0
 
-        now = time.time()
-        removed = 0
-
-        for temp_uuid in list(self.kernel._inline_temp_map.keys()):
-            entry = self.kernel._inline_temp_map.get(temp_uuid)
-            if not entry:
-                continue
-
-            expires_at = entry.get("expires_at")
-            if force or (expires_at and expires_at < now):
-                del self.kernel._inline_temp_map[temp_uuid]
-                removed += 1
-
-                if hasattr(self.kernel, "_inline_temp_uuids"):
-                    try:
-                        self.kernel._inline_temp_uuids.remove(temp_uuid)
-                    except ValueError:
-                        pass
+        if not force:
+            removed = get_expiry_service(self.kernel).expire()
+        else:
+            removed = sum(
+                self._drop_inline_temp(temp_uuid)
+                for temp_uuid in list(self.kernel._inline_temp_map)
+            )
 
         if removed:
             self.kernel.logger.debug(
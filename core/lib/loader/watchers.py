@@ -0,0 +1,408 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.0.0
+# description: Single-handler watcher fan-out for module watchers
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from core.lib.types.event import Event
+from core.lib.utils.hot_path import get_hot_trace
+
+try:
+    from telethon import events
+except ImportError:
+    events = None
+
+if TYPE_CHECKING:
+    from core.lib.types import Kernel
+
+
+_UNSET = object()
+
+# Tags that only depend on message direction and chat type.  These decide
+# which routing bucket a watcher lands in; all other tags are checked per
+# watcher after the bucket lookup.
+ROUTING_TAGS = frozenset(
+    {
+        "out",
+        "incoming",
+        "only_pm",
+        "no_pm",
+        "only_groups",
+        "no_groups",
+        "only_channels",
+        "no_channels",
+    }
+)
+
+
+class WatcherEventFacts:
+    """Per-event facts shared by every watcher filter.
+
+    Direction and chat type are read eagerly because every routed event needs
+    them; media classification and text are derived on first access only.
+    """
+
+    __slots__ = (
+        "_audio",
+        "_doc",
+        "_media",
+        "_sticker",
+        "_text",
+        "event",
+        "is_channel",
+        "is_group",
+        "is_pm",
+        "msg",
+        "out",
+    )
+
+    def __init__(self, event: Event) -> None:
+        self.event = event
+        msg = getattr(event, "message", event)
+        self.msg = msg
+        self.out = bool(getattr(msg, "out", False))
+
+        chat = getattr(event, "chat", None)
+        megagroup = bool(getattr(chat, "megagroup", False))
+        gigagroup = bool(getattr(chat, "gigagroup", False))
+        broadcast = bool(getattr(chat, "broadcast", False))
+        self.is_pm = bool(chat) and not (megagroup or broadcast or gigagroup)
+        self.is_group = megagroup or gigagroup
+        self.is_channel = broadcast
+
+        self._media = _UNSET
+        self._doc = _UNSET
+        self._audio = _UNSET
+        self._sticker = _UNSET
+        self._text = _UNSET
+
+    @property
+    def route_key(self) -> tuple[bool, bool, bool, bool]:
+        return (self.out, self.is_pm, self.is_group, self.is_channel)
+
+    @property
+    def media(self) -> Any:
+        if self._media is _UNSET:
+            self._media = getattr(self.msg, "media", None)
+        return self._media
+
+    @property
+    def photo(self) -> bool:
+        media = self.media
+        return bool(media) and hasattr(media, "photo")
+
+    @property
+    def video(self) -> bool:
+        media = self.media
+        return bool(media) and hasattr(media, "video")
+
+    @property
+    def doc(self) -> bool:
+        if self._doc is _UNSET:
+            media = self.media
+            self._doc = bool(media) and hasattr(media, "document")
+        return self._doc
+
+    @property
+    def audio(self) -> bool:
+        if self._audio is _UNSET:
+            self._audio = self.doc and str(
+                getattr(getattr(self.media, "document", None), "mime_type", "") or ""
+            ).startswith("audio")
+        return self._audio
+
+    @property
+    def sticker(self) -> bool:
+        if self._sticker is _UNSET:
+            self._sticker = self.doc and any(
+                type(a).__name__ == "DocumentAttributeSticker"
+                for a in getattr(
+                    getattr(self.media, "document", None), "attributes", []
+                )
+                or []
+            )
+        return self._sticker
+
+    @property
+    def text(self) -> str:
+        if self._text is _UNSET:
+            self._text = getattr(self.msg, "text", "") or ""
+        return self._text
+
+    @property
+    def forwarded(self) -> bool:
+        return bool(getattr(self.msg, "fwd_from", None))
+
+    @property
+    def reply(self) -> bool:
+        return bool(getattr(self.msg, "reply_to", None))
+
+
+def route_accepts(tags: dict[str, Any], key: tuple[bool, bool, bool, bool]) -> bool:
+    """Return True if direction/chat-type *tags* accept the routing *key*."""
+    out, is_pm, is_group, is_channel = key
+    if tags.get("out") and not out:
+        return False
+    if tags.get("incoming") and out:
+        return False
+    if tags.get("only_pm") and not is_pm:
+        return False
+    if tags.get("no_pm") and is_pm:
+        return False
+    if tags.get("only_groups") and not is_group:
+        return False
+    if tags.get("no_groups") and is_group:
+        return False
+    if tags.get("only_channels") and not is_channel:
+        return False
+    if tags.get("no_channels") and is_channel:
+        return False
+    return True
+
+
+# Boolean tags in evaluation order: flag -> (fact attribute, required value).
+# Cheap attribute reads come first, document attribute walks last.
+_FLAG_TAGS: dict[str, tuple[str, bool]] = {
+    "out": ("out", True),
+    "incoming": ("out", False),
+    "only_pm": ("is_pm", True),
+    "no_pm": ("is_pm", False),
+    "only_groups": ("is_group", True),
+    "no_groups": ("is_group", False),
+    "only_channels": ("is_channel", True),
+    "no_channels": ("is_channel", False),
+    "only_forwards": ("forwarded", True),
+    "no_forwards": ("forwarded", False),
+    "only_reply": ("reply", True),
+    "no_reply": ("reply", False),
+    "only_media": ("media", True),
+    "no_media": ("media", False),
+    "only_photos": ("photo", True),
+    "no_photos": ("photo", False),
+    "only_videos": ("video", True),
+    "no_videos": ("video", False),
+    "only_docs": ("doc", True),
+    "no_docs": ("doc", False),
+    "only_audios": ("audio", True),
+    "no_audios": ("audio", False),
+    "only_stickers": ("sticker", True),
+    "no_stickers": ("sticker", False),
+}
+
+
+def _flag_check(attr: str, expected: bool) -> Callable[[WatcherEventFacts], bool]:
+    if expected:
+        return lambda facts: bool(getattr(facts, attr))
+    return lambda facts: not getattr(facts, attr)
+
+
+class WatcherFilter:
+    """Tag dict compiled into the minimal list of checks it needs.
+
+    Only the tags that are actually set produce a check, so a watcher with
+    ``only_pm=True`` never pays for sticker detection.  ``regex`` is compiled
+    once at construction instead of going through ``re``'s internal cache on
+    every event.
+    """
+
+    __slots__ = ("_checks", "tags")
+
+    def __init__(self, tags: dict[str, Any]) -> None:
+        self.tags = dict(tags)
+        checks: list[Callable[[WatcherEventFacts], bool]] = []
+
+        if "from_id" in tags:
+            from_id = tags["from_id"]
+            checks.append(
+                lambda facts: getattr(facts.event, "sender_id", None) == from_id
+            )
+        if "chat_id" in tags:
+            chat_id = tags["chat_id"]
+            checks.append(
+                lambda facts: getattr(facts.event, "chat_id", None) == chat_id
+            )
+
+        for name, (attr, expected) in _FLAG_TAGS.items():
+            if tags.get(name):
+                checks.append(_flag_check(attr, expected))
+
+        if "startswith" in tags:
+            prefix = tags["startswith"]
+            checks.append(lambda facts: facts.text.startswith(prefix))
+        if "endswith" in tags:
+            suffix = tags["endswith"]
+            checks.append(lambda facts: facts.text.endswith(suffix))
+        if "contains" in tags:
+            needle = tags["contains"]
+            checks.append(lambda facts: needle in facts.text)
+        if "regex" in tags:
+            pattern = tags["regex"]
+            search = (
+                pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
+            ).search
+            checks.append(lambda facts: search(facts.text) is not None)
+
+        self._checks = tuple(checks)
+
+    def __bool__(self) -> bool:
+        return bool(self._checks)
+
+    def __call__(self, facts: WatcherEventFacts) -> bool:
+        for check in self._checks:
+            if not check(facts):
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"<WatcherFilter checks={len(self._checks)} tags={self.tags!r}>"
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_frozen(frozen: tuple) -> WatcherFilter:
+    return WatcherFilter(dict(frozen))
+
+
+def compile_watcher_filter(tags: dict[str, Any]) -> WatcherFilter:
+    """Return a (cached) :class:`WatcherFilter` for *tags*."""
+    try:
+        return _compile_frozen(tuple(sorted(tags.items())))
+    except TypeError:
+        # Unhashable or unorderable tag values - compile without caching.
+        return WatcherFilter(tags)
+
+
+class _RoutedWatcher:
+    __slots__ = ("callback", "key", "module", "predicate", "tags")
+
+    def __init__(
+        self,
+        callback: Callable,
+        key: tuple[str, str],
+        tags: dict[str, Any],
+        predicate: Callable[[WatcherEventFacts], bool] | None,
+    ) -> None:
+        self.callback = callback
+        self.key = key
+        self.module = key[0]
+        self.tags = tags
+        self.predicate = predicate
+
+
+class WatcherRouter:
+    """Fan out one Telethon ``NewMessage`` binding to every module watcher.
+
+    Instead of binding a ``NewMessage`` builder per watcher, the router binds
+    itself once per client, computes the event facts once and only visits the
+    watchers whose direction/chat-type tags accept the event.  Buckets are
+    rebuilt lazily after watchers are added or removed.
+    """
+
+    def __init__(
+        self,
+        kernel: Kernel,
+        client: Any,
+        disabled_getter: Callable[[], set] | None = None,
+    ) -> None:
+        self.kernel = kernel
+        self.client = client
+        self.event_obj = events.NewMessage() if events is not None else None
+        self._disabled_getter = disabled_getter
+        self._watchers: dict[Callable, _RoutedWatcher] = {}
+        self._buckets: dict[tuple[bool, bool, bool, bool], tuple] = {}
+        self.trace = get_hot_trace()
+
+    def __len__(self) -> int:
+        return len(self._watchers)
+
+    def __contains__(self, handle: Callable) -> bool:
+        return handle in self._watchers
+
+    def add(
+        self,
+        handle: Callable,
+        key: tuple[str, str],
+        tags: dict[str, Any],
+        predicate: Callable[[WatcherEventFacts], bool] | None = None,
+        callback: Callable | None = None,
+    ) -> None:
+        """Route matching events for *handle*.
+
+        Args:
+            handle: Identity used by :meth:`remove` (the watcher wrapper).
+            key: ``(module, watcher)`` pair checked against disabled watchers.
+            tags: Watcher tags; only the routing tags are used here.
+            predicate: Checks the remaining tags against the event facts;
+                defaults to a compiled :class:`WatcherFilter` of those tags.
+            callback: Coroutine to await on match, defaults to *handle*.
+        """
+        if predicate is None:
+            compiled = compile_watcher_filter(
+                {k: v for k, v in tags.items() if k not in ROUTING_TAGS}
+            )
+            predicate = compiled if compiled else None
+        self._watchers[handle] = _RoutedWatcher(
+            callback or handle, key, dict(tags), predicate
+        )
+        self._buckets.clear()
+        self.ensure_bound()
+
+    def remove(self, handle: Callable) -> bool:
+        if self._watchers.pop(handle, None) is None:
+            return False
+        self._buckets.clear()
+        return True
+
+    def remove_module(self, module_name: str) -> int:
+        stale = [h for h, w in self._watchers.items() if w.module == module_name]
+        for handle in stale:
+            del self._watchers[handle]
+        if stale:
+            self._buckets.clear()
+        return len(stale)
+
+    def is_bound(self) -> bool:
+        builders = getattr(self.client, "_event_builders", None)
+        if not isinstance(builders, list):
+            return False
+        return any(cb == self.dispatch for _ev, cb in builders)
+
+    def ensure_bound(self) -> bool:
+        """Bind :meth:`dispatch` to the client once; return True if (re)bound."""
+        if self.event_obj is None or self.is_bound():
+            return False
+        self.client.add_event_handler(self.dispatch, self.event_obj)
+        return True
+
+    def _bucket(self, route_key: tuple[bool, bool, bool, bool]) -> tuple:
+        bucket = self._buckets.get(route_key)
+        if bucket is None:
+            bucket = tuple(
+                w for w in self._watchers.values() if route_accepts(w.tags, route_key)
+            )
+            self._buckets[route_key] = bucket
+        return bucket
+
+    async def dispatch(self, event: Event) -> None:
+        if not self._watchers:
+            return
+        started = self.trace.start()
+        facts = WatcherEventFacts(event)
+        bucket = self._bucket(facts.route_key)
+        if not bucket:
+            return
+        disabled = self._disabled_getter() if self._disabled_getter else ()
+        for watcher in bucket:
+            if disabled and watcher.key in disabled:
+                continue
+            if watcher.predicate is not None and not watcher.predicate(facts):
+                continue
+            await watcher.callback(event)
+        self.trace.record("watchers", started, candidates=len(bucket))
@@ -27,6 +27,13 @@ if TYPE_CHECKING:
 # Cache for detect_module_type results: {module_name: type_str}
 _MODULE_TYPE_CACHE: dict[str, str] = {}
 
+_INSTALL_FLAG_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9_.\-:]+")
+
+
+def _install_flag_key(module_name: str) -> str:
+    """Return the ``mcub_module_flags`` key marking *module_name* installed."""
+    return "__installed__" + _INSTALL_FLAG_UNSAFE_RE.sub("_", module_name)
+
 
 class ModuleDetectorMixin:
     """Mixin for detecting module type based on registration patterns."""
@@ -368,6 +375,46 @@ class ModuleDetectorMixin:
         else:
             fn(arg)
 
+    async def prefetch_module_data(
+        self,
+        module_names: list[str],
+        is_install: bool = False,
+        namespaces: bool = True,
+    ) -> None:
+        """Warm the DB read cache with the rows post-load is about to read.
+
+        One query per module for its own namespace plus one for all of their
+        ``module_configs`` rows (and install flags), instead of a ``db_get``
+        round-trip per key from ``on_load`` and config setup.
+
+        Args:
+            module_names: Modules about to run ``on_load``.
+            is_install: Also prefetch the ``on_install`` flags.
+            namespaces: Prefetch each module's own rows, not only configs.
+        """
+        k = self.k
+        db = getattr(k, "db_manager", None)
+        if db is None or getattr(db, "conn", None) is None:
+            return
+        if not hasattr(db, "prefetch_module"):
+            return
+        names = [n for n in dict.fromkeys(module_names) if db._validate_identifier(n)]
+        if not names:
+            return
+        try:
+            if namespaces:
+                for name in names:
+                    await db.prefetch_module(name)
+            await db.db_get_many("module_configs", names)
+            if is_install:
+                flags = [_install_flag_key(n) for n in names]
+                await db.db_get_many(
+                    "mcub_module_flags",
+                    [f for f in flags if db._validate_identifier(f)],
+                )
+        except Exception as e:
+            k.logger.debug("[loader.prefetch] skipped for %r: %s", names, e)
+
     async def run_post_load(
         self,
         module: Any,
@@ -393,6 +440,8 @@ class ModuleDetectorMixin:
             len(getattr(reg, "__event_handlers__", [])),
         )
 
+        await self.prefetch_module_data([module_name], is_install)
+
         instance = getattr(module, "_class_instance", None)
         if instance is not None:
             instance._loops.clear()
@@ -453,8 +502,7 @@ class ModuleDetectorMixin:
                     k.logger.error(f"on_reload error in {module_name}: {e}")
 
             if is_install:
-                sanitized = re.sub(r"[^a-zA-Z0-9_.\-:]+", "_", module_name)
-                flag = f"__installed__{sanitized}"
+                flag = _install_flag_key(module_name)
                 already = await k.db_get("mcub_module_flags", flag)
                 if not already:
                     try:
@@ -495,8 +543,7 @@ class ModuleDetectorMixin:
 
         on_install = getattr(reg, "__on_install__", None)
         if on_install is not None and is_install:
-            sanitized = re.sub(r"[^a-zA-Z0-9_.\-:]+", "_", module_name)
-            flag = f"__installed__{sanitized}"
+            flag = _install_flag_key(module_name)
             already = await k.db_get("mcub_module_flags", flag)
             if not already:
                 try:
@@ -80,6 +80,11 @@ class ModuleUnloaderMixin:
         if callable(_purge):
             _purge()
 
+        # Caches the module registered for memory-pressure eviction
+        cache_registry = getattr(k, "__dict__", {}).get("cache_registry")
+        if cache_registry is not None:
+            cache_registry.remove_owner(module_name)
+
         if module is not None:
             if reg is None:
                 k.logger.debug(
@@ -110,7 +115,11 @@ class ModuleUnloaderMixin:
                         type(event_obj).__name__,
                         type(client).__name__,
                     )
-                    client.remove_event_handler(wrapper, event_obj)
+                    router = getattr(wrapper, "__watcher_router__", None)
+                    if router is not None:
+                        router.remove(wrapper)
+                    else:
+                        client.remove_event_handler(wrapper, event_obj)
                 except Exception as e:
                     k.logger.error(f"Error removing watcher in {module_name}: {e}")
 
@@ -145,6 +154,10 @@ class ModuleUnloaderMixin:
                         != module_name
                     ]
                     removed_watchers = before_watchers - len(central_watchers)
+                    routers = getattr(central_register, "_watcher_routers", None)
+                    if isinstance(routers, dict):
+                        for router in routers.values():
+                            router.remove_module(module_name)
                     if removed_watchers:
                         k.logger.debug(
                             "[loader.unregister] pruned central watchers module=%r count=%d",
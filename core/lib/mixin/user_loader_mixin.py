@@ -102,6 +102,12 @@ class UserLoaderMixin:
         if callable(batch_install):
             await batch_install(modules_code)
 
+        # One query for every module's stored config; each module's own rows
+        # are prefetched by run_post_load right before its on_load.
+        prefetch = getattr(self, "prefetch_module_data", None)
+        if callable(prefetch):
+            await prefetch([name for name, _code in modules_code], namespaces=False)
+
         semaphore = asyncio.Semaphore(_LOAD_CONCURRENCY)
 
         _memguard = getattr(k, "_memory_guard_enabled", False)
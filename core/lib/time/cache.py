@@ -2,19 +2,38 @@
 # Copyright (c) 2026 Шмэлькa | @hairpin01
 
 # author: @Hairpin00
-# version: 1.1.0
+# version: 2.0.0
 # description: TTL Cache implementation with LRU eviction
 
+from __future__ import annotations
+
 import hashlib
 import heapq
+import itertools
 import logging
+import sys
 import time
 from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
-CacheType = OrderedDict[Any, tuple[float, Any]]
 logger = logging.getLogger(__name__)
 
+# Bytes of an entry record, its dict/linked-list slots and heap node,
+# excluding the key and value objects.
+_ENTRY_OVERHEAD = 240
+
+# Entry budgets of the kernel cache.  Config menu pages keep one entry per
+# inline button (about 20 per page) for a day, and that state cannot be
+# rebuilt once evicted, so each budget covers well over a hundred open
+# menus.  The budgets only stop runaway browsing from pushing every other
+# module's cached data out; KERNEL_CACHE_MAX_SIZE leaves room for both.
+KERNEL_CACHE_BUDGETS: dict[str, int] = {
+    "cfg_view_": 3000,
+    "module_": 3000,
+}
+KERNEL_CACHE_MAX_SIZE = 8000
+
 
 def _key_for_log(key: Any) -> str:
     """Return a stable, non-revealing key label for debug logs."""
@@ -26,6 +45,23 @@ def _key_for_log(key: Any) -> str:
     return f"{type(key).__name__}:{digest}"
 
 
+class _Entry:
+    __slots__ = ("expires", "heap_due", "key", "namespace", "value")
+
+    def __init__(
+        self, key: Any, value: Any, expires: float, namespace: str | None
+    ) -> None:
+        self.key = key
+        self.value = value
+        self.expires = expires
+        # Deadline of this entry's node on the expiry heap
+        self.heap_due = expires
+        self.namespace = namespace
+
+
+CacheType = OrderedDict[Any, _Entry]
+
+
 class TTLCache:
     """
     A Time-To-Live (TTL) cache implementation with LRU eviction policy.
@@ -34,36 +70,87 @@ class TTLCache:
     reaches its maximum size, it removes the least recently used item.
     Expired items are automatically removed upon access.
 
-    Performance notes (v1.1.0):
-    - ``_cleanup_expired`` was O(n) - now uses a min-heap of (expire_time, key)
-      so expiry sweeps are O(k log n) where k = number of expired keys.
-    - ``get`` is O(1) average; ``set`` is O(log n) amortised due to heap push.
+    Performance notes (v2.0.0):
+    - Deadlines use ``time.monotonic()``, so wall-clock adjustments neither
+      expire nor revive entries.
+    - Each key has a single node on the expiry heap.  Overwriting a key moves
+      its deadline in place; a node that comes due for an entry whose
+      deadline moved later is simply pushed again at the new deadline.
+    - ``get``/``set`` do no logging; only evictions, sweeps and ``clear``
+      are logged, and only when debug logging is enabled.
+
+    Keys can be grouped into namespaces with their own entry budget (see
+    :meth:`set_budget`); a namespace over budget drops its own least
+    recently used entry instead of pushing out everything else.
 
     Attributes:
         max_size (int): Maximum number of items the cache can hold
-        ttl (int): Default time-to-live in seconds for cache entries
+        ttl (float): Default time-to-live in seconds for cache entries
         cache (OrderedDict): The underlying data storage with LRU ordering
+        hits, misses, evictions, expired (int): Lifetime counters
     """
 
-    def __init__(self, max_size: int = 1000, ttl: int = 300) -> None:
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: float = 300,
+        *,
+        budgets: Mapping[str, int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """
         Initialize the TTL cache.
 
         Args:
             max_size: Maximum number of items the cache can hold (default: 1000)
             ttl: Default time-to-live for cache entries in seconds (default: 300)
+            budgets: Initial ``namespace -> max entries`` budgets
+            clock: Monotonic time source
         """
         self.cache: CacheType = OrderedDict()
         self.max_size = max_size
         self.ttl = ttl
-        # Min-heap of (expire_time, key) - lets _cleanup_expired stop early
-        # once it hits a non-expired entry instead of scanning the whole dict.
-        # Entries may be stale (key already evicted/updated); we skip them.
-        self._expiry_heap: list[tuple[float, int, Any]] = []
-        self._heap_seq = 0
-        logger.debug("[TTLCache] init max_size=%s ttl=%s", max_size, ttl)
-
-    def set(self, key: Any, value: Any, ttl: int | None = None) -> None:
+        self._clock = clock
+        # Min-heap of (deadline, seq, entry); see _cleanup_expired.
+        self._expiry_heap: list[tuple[float, int, _Entry]] = []
+        self._heap_seq = itertools.count()
+        self._budgets: dict[str, int] = {}
+        self._namespaces: dict[str, OrderedDict[Any, None]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+        for namespace, limit in (budgets or {}).items():
+            self.set_budget(namespace, limit)
+
+    def set_budget(self, namespace: str, max_entries: int | None) -> None:
+        """
+        Limit how many entries *namespace* may hold (None removes the limit).
+
+        String keys starting with a budgeted namespace belong to it unless
+        ``set`` is given another namespace explicitly, e.g. a ``"cfg_view_"``
+        budget covers every ``cfg_view_<id>`` key.
+        """
+        if max_entries is None:
+            self._budgets.pop(namespace, None)
+            return
+        self._budgets[namespace] = max(int(max_entries), 1)
+        self._enforce_budget(namespace)
+
+    def _namespace_for(self, key: Any) -> str | None:
+        if isinstance(key, str):
+            for namespace in self._budgets:
+                if key.startswith(namespace):
+                    return namespace
+        return None
+
+    def set(
+        self,
+        key: Any,
+        value: Any,
+        ttl: float | None = None,
+        namespace: str | None = None,
+    ) -> None:
         """
         Add or update a key-value pair in the cache.
 
@@ -71,86 +158,95 @@ class TTLCache:
             key: The key to store
             value: The value to associate with the key
             ttl: Optional custom TTL in seconds. If not provided, uses default TTL
+            namespace: Budget group of a new key (default: matched by prefix)
 
         Note:
             If the cache exceeds max_size after insertion, the least recently
             used item is removed. The new item becomes the most recently used.
+            A key keeps the namespace it was first stored with.
         """
-        if len(self.cache) >= self.max_size:
-            # Fast path: try to reclaim expired slots before evicting LRU.
-            self._cleanup_expired()
-            if len(self.cache) >= self.max_size:
-                evicted_key, _ = self.cache.popitem(last=False)
-                logger.debug(
-                    "[TTLCache] evict_lru key=%s size=%d heap=%d",
-                    _key_for_log(evicted_key),
-                    len(self.cache),
-                    len(self._expiry_heap),
-                )
-
-        expire_time = time.time() + (ttl if ttl is not None else self.ttl)
-        existed = key in self.cache
-        self.cache[key] = (expire_time, value)
-        self.cache.move_to_end(key)
-        # Push to the expiry heap so cleanup can find it in O(log n).
-        self._heap_seq += 1
-        heapq.heappush(self._expiry_heap, (expire_time, self._heap_seq, key))
-        logger.debug(
-            "[TTLCache] set key=%s ttl=%s existed=%s size=%d heap=%d",
-            _key_for_log(key),
-            ttl if ttl is not None else self.ttl,
-            existed,
-            len(self.cache),
-            len(self._expiry_heap),
-        )
-        self._compact_heap_if_needed()
+        expires = self._clock() + (self.ttl if ttl is None else ttl)
+        cache = self.cache
+        entry = cache.get(key)
+        if entry is not None:
+            entry.value = value
+            entry.expires = expires
+            cache.move_to_end(key)
+            if entry.namespace is not None:
+                self._namespaces[entry.namespace].move_to_end(key)
+            if expires < entry.heap_due:
+                self._push(entry)
+            return
+
+        if len(cache) >= self.max_size:
+            self._make_room()
+        if namespace is None and self._budgets:
+            namespace = self._namespace_for(key)
+        entry = _Entry(key, value, expires, namespace)
+        cache[key] = entry
+        self._push(entry)
+        if namespace is not None:
+            self._namespaces.setdefault(namespace, OrderedDict())[key] = None
+            if namespace in self._budgets:
+                self._enforce_budget(namespace)
 
-    def get(self, key: Any) -> Any | None:
+    def set_many(
+        self,
+        items: Mapping[Any, Any] | Iterable[tuple[Any, Any]],
+        ttl: float | None = None,
+        namespace: str | None = None,
+    ) -> None:
+        """Store every ``(key, value)`` pair of *items* with the same TTL."""
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            self.set(key, value, ttl, namespace)
+
+    def get(self, key: Any, default: Any = None) -> Any:
         """
         Retrieve a value from the cache by key.
 
         Args:
             key: The key to look up
+            default: Returned when the key is missing or expired
 
         Returns:
-            The associated value if found and not expired, None otherwise
+            The associated value if found and not expired, *default* otherwise
 
         Note:
             If an expired item is found, it is automatically removed from the cache.
         """
-        if key not in self.cache:
-            logger.debug(
-                "[TTLCache] miss key=%s size=%d", _key_for_log(key), len(self.cache)
-            )
-            return None
-
-        expire_time, value = self.cache[key]
-
-        if time.time() <= expire_time:
-            self.cache.move_to_end(key)
-            logger.debug(
-                "[TTLCache] hit key=%s size=%d", _key_for_log(key), len(self.cache)
-            )
-            return value
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if self._clock() > entry.expires:
+            # Expired - evict lazily.
+            self._remove(entry)
+            self.expired += 1
+            self.misses += 1
+            return default
+        self.cache.move_to_end(key)
+        if entry.namespace is not None:
+            self._namespaces[entry.namespace].move_to_end(key)
+        self.hits += 1
+        return entry.value
 
-        # Expired - evict lazily.
-        del self.cache[key]
-        logger.debug(
-            "[TTLCache] expired key=%s size=%d", _key_for_log(key), len(self.cache)
-        )
-        return None
+    def get_many(self, keys: Iterable[Any]) -> dict[Any, Any]:
+        """Return ``key -> value`` for each of *keys* that is cached and live."""
+        found: dict[Any, Any] = {}
+        missing = object()
+        for key in keys:
+            value = self.get(key, missing)
+            if value is not missing:
+                found[key] = value
+        return found
 
     def delete(self, key: Any) -> None:
         """Remove a single key from the cache if present."""
-        existed = key in self.cache
-        self.cache.pop(key, None)
-        logger.debug(
-            "[TTLCache] delete key=%s existed=%s size=%d",
-            _key_for_log(key),
-            existed,
-            len(self.cache),
-        )
-        self._compact_heap_if_needed()
+        entry = self.cache.get(key)
+        if entry is not None:
+            self._remove(entry)
+            self._compact_heap_if_needed()
 
     def clear(self) -> None:
         """Remove all items from the cache."""
@@ -158,65 +254,131 @@ class TTLCache:
         heap_size = len(self._expiry_heap)
         self.cache.clear()
         self._expiry_heap.clear()
-        self._heap_seq = 0
-        logger.debug("[TTLCache] clear size=%d heap=%d", cache_size, heap_size)
+        self._namespaces.clear()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[TTLCache] clear size=%d heap=%d", cache_size, heap_size)
 
     def size(self) -> int:
         """Get the current number of items in the cache."""
         return len(self.cache)
 
+    def approx_bytes(self) -> int:
+        """Estimate the memory held by the cache (shallow sizes of keys/values)."""
+        getsizeof = sys.getsizeof
+        return sum(
+            _ENTRY_OVERHEAD + getsizeof(key) + getsizeof(entry.value)
+            for key, entry in self.cache.items()
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry counts, hit/miss/eviction counters and namespaces."""
+        namespaces = {
+            namespace: {
+                "entries": len(self._namespaces.get(namespace, ())),
+                "budget": self._budgets.get(namespace),
+            }
+            for namespace in {*self._namespaces, *self._budgets}
+        }
+        return {
+            "entries": len(self.cache),
+            "max_size": self.max_size,
+            "heap": len(self._expiry_heap),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "namespaces": namespaces,
+        }
+
+    def _push(self, entry: _Entry) -> None:
+        entry.heap_due = entry.expires
+        heapq.heappush(self._expiry_heap, (entry.expires, next(self._heap_seq), entry))
+
+    def _remove(self, entry: _Entry) -> None:
+        del self.cache[entry.key]
+        if entry.namespace is not None:
+            order = self._namespaces.get(entry.namespace)
+            if order is not None:
+                order.pop(entry.key, None)
+                if not order:
+                    del self._namespaces[entry.namespace]
+
+    def _evict(self, entry: _Entry) -> None:
+        self._remove(entry)
+        self.evictions += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[TTLCache] evict_lru key=%s namespace=%s size=%d heap=%d",
+                _key_for_log(entry.key),
+                entry.namespace,
+                len(self.cache),
+                len(self._expiry_heap),
+            )
+
+    def _make_room(self) -> None:
+        # Reclaim expired slots before evicting the least recently used entry.
+        self._cleanup_expired()
+        while self.cache and len(self.cache) >= self.max_size:
+            self._evict(next(iter(self.cache.values())))
+        self._compact_heap_if_needed()
+
+    def _enforce_budget(self, namespace: str) -> None:
+        order = self._namespaces.get(namespace)
+        budget = self._budgets.get(namespace)
+        while order and budget is not None and len(order) > budget:
+            self._evict(self.cache[next(iter(order))])
+
     def _cleanup_expired(self) -> None:
         """Remove expired items using the min-heap for early termination.
 
-        Complexity: O(k log n) where k = expired entries found, vs O(n) before.
-        Stops as soon as the heap top is in the future - no need to scan the
-        entire cache.
+        Complexity: O(k log n) where k = heap nodes that came due.  A node is
+        stale when its entry was removed or given an earlier deadline (which
+        pushed a new node); a node whose entry was given a later deadline is
+        pushed again at that deadline.
         """
-        now = time.time()
+        heap = self._expiry_heap
+        now = self._clock()
         removed = 0
         stale = 0
-        while self._expiry_heap:
-            exp, _seq, key = self._expiry_heap[0]
-            if exp > now:
-                # All remaining heap entries expire in the future.
-                break
-            heapq.heappop(self._expiry_heap)
-            # The heap entry may be stale (key was already evicted or re-set
-            # with a newer expire_time).  Only delete if the stored expire_time
-            # matches the heap entry exactly.
-            entry = self.cache.get(key)
-            if entry is not None and entry[0] <= now:
-                del self.cache[key]
-                removed += 1
-            else:
+        while heap and heap[0][0] <= now:
+            due, _seq, entry = heapq.heappop(heap)
+            if due != entry.heap_due or self.cache.get(entry.key) is not entry:
                 stale += 1
-        if removed or stale:
+            elif entry.expires > now:
+                self._push(entry)
+            else:
+                self._remove(entry)
+                removed += 1
+        self.expired += removed
+        if (removed or stale) and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "[TTLCache] cleanup_expired removed=%d stale=%d size=%d heap=%d",
                 removed,
                 stale,
                 len(self.cache),
-                len(self._expiry_heap),
+                len(heap),
             )
-        self._compact_heap_if_needed()
 
     def _compact_heap_if_needed(self) -> None:
-        """Rebuild the expiry heap when stale entries outgrow live cache data."""
+        """Rebuild the expiry heap when stale nodes outgrow live cache data.
+
+        Stale nodes are left behind only by evicted or deleted entries.
+        """
         live_size = len(self.cache)
         heap_size = len(self._expiry_heap)
-        limit = max(self.max_size * 2, live_size * 2, 64)
-        if heap_size <= limit:
+        if heap_size <= max(self.max_size * 2, live_size * 2, 64):
             return
 
-        compacted: list[tuple[float, int, Any]] = []
-        for key, (exp, _value) in self.cache.items():
-            self._heap_seq += 1
-            compacted.append((exp, self._heap_seq, key))
+        compacted = [
+            (entry.heap_due, next(self._heap_seq), entry)
+            for entry in self.cache.values()
+        ]
+        heapq.heapify(compacted)
         self._expiry_heap = compacted
-        heapq.heapify(self._expiry_heap)
-        logger.debug(
-            "[TTLCache] compact_heap before=%d after=%d size=%d",
-            heap_size,
-            len(self._expiry_heap),
-            live_size,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[TTLCache] compact_heap before=%d after=%d size=%d",
+                heap_size,
+                len(compacted),
+                live_size,
+            )
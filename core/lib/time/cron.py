@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.0.0
+# description: Five-field cron expressions for the task scheduler
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+# (name, low, high) for minute, hour, day of month, month, day of week
+_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+# Feb 29 matches can be eight years apart (2096 -> 2104); an expression with
+# no match within that span never fires.
+_MAX_SEARCH_DAYS = 366 * 8
+
+
+def _parse_field(text: str, name: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, _, step_text = part.partition("/")
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise ValueError(f"Invalid step in cron {name} field: {text!r}")
+            step = int(step_text)
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, _, end_text = part.partition("-")
+            if not (start_text.isdigit() and end_text.isdigit()):
+                raise ValueError(f"Invalid range in cron {name} field: {text!r}")
+            start, end = int(start_text), int(end_text)
+        elif part.isdigit():
+            start = int(part)
+            end = high if step > 1 else start
+        else:
+            raise ValueError(f"Invalid cron {name} field: {text!r}")
+
+        if not (low <= start <= high and low <= end <= high and start <= end):
+            raise ValueError(f"Cron {name} field out of range {low}-{high}: {text!r}")
+        values.update(range(start, end + 1, step))
+    if name == "weekday":
+        # Both 0 and 7 mean Sunday.
+        values = {value % 7 for value in values}
+    return frozenset(values)
+
+
+class CronExpression:
+    """Standard five-field cron schedule (``minute hour day month weekday``).
+
+    Supports ``*``, lists (``1,15``), ranges (``1-5``), steps (``*/10``,
+    ``0-30/5``) and the ``@hourly`` / ``@daily`` / ``@weekly`` /
+    ``@monthly`` / ``@yearly`` aliases.  Weekdays count from Sunday = 0
+    (7 is accepted as Sunday too).  When both day of month and weekday are
+    restricted, a day matching either one fires, as in Vixie cron.
+
+    Example:
+        >>> CronExpression("30 9 * * 1-5").next_after(datetime(2026, 1, 2, 10))
+        datetime.datetime(2026, 1, 5, 9, 30)
+    """
+
+    __slots__ = (
+        "_any_day",
+        "_any_weekday",
+        "days",
+        "expression",
+        "hours",
+        "minutes",
+        "months",
+        "weekdays",
+    )
+
+    def __init__(self, expression: str) -> None:
+        text = _ALIASES.get(expression.strip().lower(), expression)
+        parts = text.split()
+        if len(parts) != len(_FIELDS):
+            raise ValueError(
+                f"Cron expression needs {len(_FIELDS)} fields, got {expression!r}"
+            )
+        parsed = [
+            _parse_field(part, name, low, high)
+            for part, (name, low, high) in zip(parts, _FIELDS, strict=True)
+        ]
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        # datetime.weekday() is Monday = 0; cron counts from Sunday.
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day:
+            return weekday_ok
+        if self._any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first matching minute strictly after *moment*."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=_MAX_SEARCH_DAYS)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year = candidate.year + candidate.month // 12
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(
+                    year=year, month=month, day=1, hour=0, minute=0
+                )
+                continue
+            if not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
@@ -2,30 +2,155 @@
 # Copyright (c) 2026 Шмэлькa | @hairpin01
 
 # author: @Hairpin00
-# version: 1.0.1
+# version: 2.1.0
 # description: Task scheduler for periodic and time-based tasks
 
 from __future__ import annotations
 
 import asyncio
+import heapq
+import inspect
+import itertools
+import random
+import time
 import traceback
 from collections.abc import Callable
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from core.lib.time.cron import CronExpression
+
 if TYPE_CHECKING:
     from core.lib.types import Kernel
 
 
+class ScheduledJob:
+    """A job waiting on the scheduler heap, with its run statistics.
+
+    Attributes:
+        job_id: Registry key (returned by the ``add_*`` methods)
+        name: Human-readable name, also used for the run tasks
+        kind: ``"interval"``, ``"daily"``, ``"cron"`` or ``"once"``
+        due: Monotonic time of the next run
+        running: Number of runs currently in flight
+        paused: Due runs skipped because ``pause_if`` returned True
+    """
+
+    __slots__ = (
+        "anchor",
+        "consecutive_failures",
+        "cron",
+        "due",
+        "failures",
+        "func",
+        "interval",
+        "jitter",
+        "job_id",
+        "kind",
+        "last_duration",
+        "last_lag",
+        "max_backoff",
+        "max_concurrency",
+        "max_duration",
+        "max_lag",
+        "misfire_grace",
+        "misfired",
+        "name",
+        "on_error",
+        "pause_if",
+        "paused",
+        "running",
+        "runs",
+        "skipped",
+        "tasks",
+        "total_duration",
+        "wall_target",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        func: Callable[[], Any],
+        name: str,
+        kind: str,
+        *,
+        interval: float | None = None,
+        cron: CronExpression | None = None,
+        jitter: float = 0.0,
+        misfire_grace: float | None = None,
+        max_concurrency: int = 1,
+        max_backoff: float | None = None,
+        on_error: Callable[[Exception], Any] | None = None,
+        pause_if: Callable[[], bool] | None = None,
+    ) -> None:
+        self.job_id = job_id
+        self.func = func
+        self.name = name
+        self.kind = kind
+        self.interval = interval
+        self.cron = cron
+        self.jitter = max(float(jitter), 0.0)
+        self.misfire_grace = misfire_grace
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.max_backoff = max_backoff
+        self.on_error = on_error
+        self.pause_if = pause_if
+
+        self.due = 0.0
+        # Interval grid point of the next run, before jitter is added
+        self.anchor = 0.0
+        # Wall-clock minute a daily/cron job is currently waiting for
+        self.wall_target: datetime | None = None
+        self.tasks: set[asyncio.Task] = set()
+        self.running = 0
+
+        self.runs = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.skipped = 0
+        self.misfired = 0
+        self.paused = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Return run counters, durations and lag (seconds) for this job."""
+        return {
+            "id": self.job_id,
+            "name": self.name,
+            "kind": self.kind,
+            "runs": self.runs,
+            "running": self.running,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "skipped": self.skipped,
+            "misfired": self.misfired,
+            "paused": self.paused,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+            "avg_duration": self.total_duration / self.runs if self.runs else 0.0,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "next_run_in": max(self.due - time.monotonic(), 0.0),
+        }
+
+
 class TaskScheduler:
     """
     A scheduler for managing periodic and time-based asynchronous tasks.
-    This class provides methods to schedule tasks that run at fixed intervals
-    or at specific times daily. It integrates with a kernel for error logging
-    and supports graceful shutdown of running tasks.
+    This class provides methods to schedule tasks that run at fixed intervals,
+    at specific times daily or on a cron schedule. It integrates with a kernel
+    for error logging and supports graceful shutdown of running tasks.
+
+    All jobs share one dispatcher task that sleeps until the earliest due
+    time in a min-heap keyed on ``time.monotonic()``; a job only owns an
+    asyncio task while it is actually running.
     Attributes:
         kernel: Reference to the main kernel/application for logging and services
-        tasks: List of currently scheduled asyncio tasks
+        tasks: List of job runs currently in progress
         running: Flag indicating whether the scheduler is active
     """
 
@@ -39,7 +164,12 @@ class TaskScheduler:
         """
         self.kernel = kernel
         self.tasks: list[asyncio.Task] = []
-        self._task_registry: dict[str, asyncio.Task] = {}
+        self._task_registry: dict[str, ScheduledJob] = {}
+        self._heap: list[tuple[float, int, ScheduledJob]] = []
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._wakeup = asyncio.Event()
+        self._dispatcher: asyncio.Task | None = None
         self.running = False
         if hasattr(kernel, "logger"):
             kernel.logger.debug("[Scheduler] __init__")
@@ -60,7 +190,12 @@ class TaskScheduler:
 
     async def start(self) -> None:
         """Start the task scheduler and mark it as running."""
+        self.start_nowait()
+
+    def start_nowait(self) -> None:
+        """Synchronous :meth:`start`; must be called with a running event loop."""
         self.running = True
+        self._ensure_dispatcher()
         if hasattr(self.kernel, "logger"):
             self.kernel.logger.debug("[Scheduler] start")
 
@@ -68,66 +203,313 @@ class TaskScheduler:
         """
         Stop all scheduled tasks and clean up resources.
 
-        This method cancels all running tasks and waits for them to complete
-        cancellation. It should be called before application shutdown.
+        This method cancels the dispatcher and all running jobs and waits for
+        them to complete cancellation. It should be called before application
+        shutdown.
         """
         if hasattr(self.kernel, "logger"):
             self.kernel.logger.debug("[Scheduler] stop start")
-        self.running = False
-
-        # Cancel all tasks
-        tasks = list(self.tasks)
-        for task in tasks:
-            if not task.done():
-                task.cancel()
+        tasks = self._cancel_everything()
 
         # Wait for all tasks to be cancelled
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
         self.tasks.clear()
-        self._task_registry.clear()
         if hasattr(self.kernel, "logger"):
             self.kernel.logger.debug("[Scheduler] stop done")
 
+    def _cancel_everything(self) -> list[asyncio.Task]:
+        self.running = False
+        tasks = list(self.tasks)
+        if self._dispatcher is not None:
+            tasks.append(self._dispatcher)
+            self._dispatcher = None
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        self._task_registry.clear()
+        self._heap.clear()
+        return tasks
+
+    # Dispatcher
+
+    def _ensure_dispatcher(self) -> None:
+        if not self.running:
+            return
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(
+                self._dispatch(), name="scheduler_dispatcher"
+            )
+
+    async def _dispatch(self) -> None:
+        """Single loop that starts every job when it is due."""
+        loop = asyncio.get_running_loop()
+        heap = self._heap
+        while self.running:
+            self._wakeup.clear()
+            now = time.monotonic()
+            while heap and heap[0][0] <= now:
+                due, _seq, job = heapq.heappop(heap)
+                # Cancelled or rescheduled jobs leave stale heap entries.
+                if due != job.due or self._task_registry.get(job.job_id) is not job:
+                    continue
+                self._fire(job, now)
+
+            if not heap:
+                await self._wakeup.wait()
+                continue
+            timer = loop.call_later(heap[0][0] - now, self._wakeup.set)
+            try:
+                await self._wakeup.wait()
+            finally:
+                timer.cancel()
+
+    def _push(self, job: ScheduledJob, due: float) -> None:
+        job.due = due
+        heapq.heappush(self._heap, (due, next(self._seq), job))
+        self._wakeup.set()
+
+    def _jittered(self, job: ScheduledJob, base: float) -> float:
+        return base + random.uniform(0, job.jitter) if job.jitter else base
+
+    def _schedule_next(self, job: ScheduledJob, now: float) -> None:
+        """Push *job*'s next run; fixed-rate for intervals, wall-clock for cron."""
+        if job.interval is not None:
+            anchor = job.anchor + job.interval
+            if anchor <= now:
+                # Missed ticks are coalesced; keep the original phase.
+                anchor += ((now - anchor) // job.interval + 1) * job.interval
+            job.anchor = anchor
+            self._push(job, self._jittered(job, anchor))
+        elif job.cron is not None:
+            wall_now = datetime.now()
+            after = wall_now
+            if job.wall_target is not None and job.wall_target > after:
+                # Fired a little early by the monotonic clock: do not pick the
+                # same minute again.
+                after = job.wall_target
+            target = job.cron.next_after(after)
+            job.wall_target = target
+            delay = (target - wall_now).total_seconds()
+            self._push(job, self._jittered(job, now + delay))
+
+    def _fire(self, job: ScheduledJob, now: float) -> None:
+        lag = now - job.due
+        job.last_lag = lag
+        job.max_lag = max(job.max_lag, lag)
+        if job.kind != "once":
+            self._schedule_next(job, now)
+
+        if job.pause_if is not None and job.pause_if():
+            job.paused += 1
+            return
+        if job.misfire_grace is not None and lag > job.misfire_grace:
+            job.misfired += 1
+            self._finish_once(job)
+            return
+        if job.running >= job.max_concurrency:
+            job.skipped += 1
+            self._finish_once(job)
+            return
+
+        task = asyncio.create_task(self._run(job), name=job.name)
+        job.running += 1
+        job.tasks.add(task)
+        task.add_done_callback(job.tasks.discard)
+        self._track_task(task)
+
+    async def _run(self, job: ScheduledJob) -> None:
+        started = time.monotonic()
+        try:
+            await job.func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.failures += 1
+            job.consecutive_failures += 1
+            if job.on_error is not None:
+                try:
+                    result = job.on_error(e)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    pass
+            else:
+                await self._report_error(job, e)
+            self._back_off(job)
+        else:
+            job.consecutive_failures = 0
+        finally:
+            duration = time.monotonic() - started
+            job.running -= 1
+            job.runs += 1
+            job.last_duration = duration
+            job.max_duration = max(job.max_duration, duration)
+            job.total_duration += duration
+            self._finish_once(job)
+
+    def _back_off(self, job: ScheduledJob) -> None:
+        """Push the next run of a repeatedly failing interval job further out.
+
+        The n-th failure in a row delays the next run to ``interval * 2**(n-1)``
+        from now, capped at ``max_backoff``; the first success restores the
+        normal grid.
+        """
+        if job.max_backoff is None or job.interval is None:
+            return
+        if (
+            job.consecutive_failures < 2
+            or self._task_registry.get(job.job_id) is not job
+        ):
+            return
+        delay = job.interval * 2 ** min(job.consecutive_failures - 1, 32)
+        delay = min(delay, max(job.max_backoff, job.interval))
+        anchor = time.monotonic() + delay
+        if anchor > job.anchor:
+            job.anchor = anchor
+            self._push(job, self._jittered(job, anchor))
+
+    def _finish_once(self, job: ScheduledJob) -> None:
+        if job.kind == "once" and self._task_registry.get(job.job_id) is job:
+            del self._task_registry[job.job_id]
+
+    async def _report_error(self, job: ScheduledJob, error: Exception) -> None:
+        # Log the error but keep the job scheduled
+        try:
+            if job.kind in ("daily", "cron"):
+                result = self.kernel.handle_error(error, message="Scheduled task error")
+                if inspect.isawaitable(result):
+                    await result
+                return
+            label = "Interval task" if job.kind == "interval" else "One-shot task"
+            error_msg = f"{label} error in {job.func.__name__}: {error}\n"
+            error_msg += traceback.format_exc()
+            self.kernel.log_error(error_msg)
+        except Exception:
+            pass
+
+    def _add_job(self, job: ScheduledJob, first_due: float) -> str:
+        old = self._task_registry.get(job.job_id)
+        if old is not None:
+            self._cancel_job(old)
+        self._task_registry[job.job_id] = job
+        self._push(job, first_due)
+        self._ensure_dispatcher()
+        return job.job_id
+
+    def _new_id(self, prefix: str, func: Callable[[], Any]) -> str:
+        return f"{prefix}_{getattr(func, '__name__', 'job')}_{next(self._ids)}"
+
+    # Public API
+
     async def add_interval_task(
-        self, func: Callable[[], Any], interval_seconds: float
-    ) -> None:
+        self,
+        func: Callable[[], Any],
+        interval_seconds: float,
+        *,
+        jitter: float = 0.0,
+        misfire_grace: float | None = None,
+        max_concurrency: int = 1,
+        first_delay: float | None = None,
+        max_backoff: float | None = None,
+        on_error: Callable[[Exception], Any] | None = None,
+        pause_if: Callable[[], bool] | None = None,
+        task_id: str | None = None,
+    ) -> str:
         """
         Schedule a function to run at fixed intervals.
 
-        The function will be called repeatedly, waiting for `interval_seconds`
-        between the end of one execution and the start of the next.
+        Runs are due every `interval_seconds` from the first run (fixed
+        rate), so the time `func` takes does not push later runs back. The
+        first run happens one interval after scheduling unless `first_delay`
+        says otherwise.
 
         Args:
             func: Async function to execute periodically
             interval_seconds: Time interval between executions in seconds
+            jitter: Random delay of up to this many seconds added to each run
+            misfire_grace: Skip a run that starts later than this many seconds
+                           after its due time (None = always run, once)
+            max_concurrency: Runs allowed in flight at once; a due run is
+                             skipped while the limit is reached
+            first_delay: Seconds until the first run (default: one interval)
+            max_backoff: Back off exponentially, up to this many seconds,
+                         while runs keep failing (None = never back off)
+            on_error: Called with the exception instead of the kernel error
+                      log when a run fails; may be async
+            pause_if: Checked at every due time; the run is skipped while it
+                      returns True
+            task_id: Optional identifier; auto-generated if not provided.
+                     Reusing an identifier replaces the previous job.
+
+        Returns:
+            The task_id string
 
         Example:
             >>> await scheduler.add_interval_task(update_cache, 60.0)
         """
+        return self.schedule_interval(
+            func,
+            interval_seconds,
+            jitter=jitter,
+            misfire_grace=misfire_grace,
+            max_concurrency=max_concurrency,
+            first_delay=first_delay,
+            max_backoff=max_backoff,
+            on_error=on_error,
+            pause_if=pause_if,
+            task_id=task_id,
+        )
+
+    def schedule_interval(
+        self,
+        func: Callable[[], Any],
+        interval_seconds: float,
+        *,
+        jitter: float = 0.0,
+        misfire_grace: float | None = None,
+        max_concurrency: int = 1,
+        first_delay: float | None = None,
+        max_backoff: float | None = None,
+        on_error: Callable[[Exception], Any] | None = None,
+        pause_if: Callable[[], bool] | None = None,
+        task_id: str | None = None,
+        name: str | None = None,
+    ) -> str:
+        """Synchronous :meth:`add_interval_task` for callers outside coroutines.
 
-        async def wrapper() -> None:
-            """Wrapper function that handles the interval logic and error catching."""
-            while self.running:
-                try:
-                    await asyncio.sleep(interval_seconds)
-                    await func()
-                except asyncio.CancelledError:
-                    # Task was cancelled, break out of the loop
-                    break
-                except Exception as e:
-                    # Log the error but keep the task running
-                    error_msg = f"Interval task error in {func.__name__}: {e}\n"
-                    error_msg += traceback.format_exc()
-                    self.kernel.log_error(error_msg)
-
-        task = asyncio.create_task(wrapper(), name=f"interval_{func.__name__}")
-        self._track_task(task)
+        *name* overrides the run task name (``interval_<func>`` by default).
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"Interval must be positive, got {interval_seconds}")
+        job = ScheduledJob(
+            task_id or self._new_id("interval", func),
+            func,
+            name or f"interval_{func.__name__}",
+            "interval",
+            interval=float(interval_seconds),
+            jitter=jitter,
+            misfire_grace=misfire_grace,
+            max_concurrency=max_concurrency,
+            max_backoff=max_backoff,
+            on_error=on_error,
+            pause_if=pause_if,
+        )
+        delay = job.interval if first_delay is None else max(float(first_delay), 0.0)
+        job.anchor = time.monotonic() + delay
+        return self._add_job(job, self._jittered(job, job.anchor))
 
     async def add_daily_task(
-        self, func: Callable[[], Any], hour: int, minute: int
-    ) -> None:
+        self,
+        func: Callable[[], Any],
+        hour: int,
+        minute: int,
+        *,
+        jitter: float = 0.0,
+        misfire_grace: float | None = None,
+        task_id: str | None = None,
+    ) -> str:
         """
         Schedule a function to run daily at a specific time.
 
@@ -138,6 +520,13 @@ class TaskScheduler:
             func: Async function to execute daily
             hour: Hour of the day (0-23) to run the task
             minute: Minute of the hour (0-59) to run the task
+            jitter: Random delay of up to this many seconds added to each run
+            misfire_grace: Skip a run that starts later than this many seconds
+                           after its due time (None = always run, once)
+            task_id: Optional identifier; auto-generated if not provided
+
+        Returns:
+            The task_id string
 
         Raises:
             ValueError: If hour or minute values are out of valid range
@@ -151,59 +540,101 @@ class TaskScheduler:
         if not (0 <= minute <= 59):
             raise ValueError(f"Minute must be between 0 and 59, got {minute}")
 
-        async def wrapper() -> None:
-            """Wrapper function that handles the daily scheduling and error catching."""
-
-            while self.running:
-                try:
-                    # Calculate time until next execution
-                    now = datetime.now()
-                    target_time = now.replace(
-                        hour=hour, minute=minute, second=0, microsecond=0
-                    )
-
-                    # If target time has passed today, schedule for tomorrow
-                    if now >= target_time:
-                        target_time += timedelta(days=1)
-
-                    # Calculate delay in seconds
-                    delay_seconds = (target_time - now).total_seconds()
+        return self._add_cron_job(
+            func,
+            CronExpression(f"{minute} {hour} * * *"),
+            kind="daily",
+            name=f"daily_{func.__name__}_{hour:02d}:{minute:02d}",
+            jitter=jitter,
+            misfire_grace=misfire_grace,
+            max_concurrency=1,
+            task_id=task_id,
+        )
+
+    async def add_cron_task(
+        self,
+        func: Callable[[], Any],
+        expression: str,
+        *,
+        jitter: float = 0.0,
+        misfire_grace: float | None = None,
+        max_concurrency: int = 1,
+        task_id: str | None = None,
+    ) -> str:
+        """
+        Schedule a function on a five-field cron expression.
 
-                    # Wait until the target time
-                    await asyncio.sleep(delay_seconds)
+        Args:
+            func: Async function to execute
+            expression: ``"minute hour day month weekday"``, e.g. ``"*/15 * * * *"``
+                        or ``"30 9 * * 1-5"``; ``@hourly``/``@daily`` etc. work too
+            jitter: Random delay of up to this many seconds added to each run
+            misfire_grace: Skip a run that starts later than this many seconds
+                           after its due time (None = always run, once)
+            max_concurrency: Runs allowed in flight at once
+            task_id: Optional identifier; auto-generated if not provided
 
-                    # Execute the scheduled function
-                    await func()
-                    await asyncio.sleep(1)  # Small delay before recalculating
+        Returns:
+            The task_id string
 
-                except asyncio.CancelledError:
-                    # Task was cancelled, break out of the loop
-                    break
-                except Exception as e:
-                    # Log the error but keep the task running
-                    error_msg = f"Daily task error in {func.__name__}: {e}\n"
-                    error_msg += traceback.format_exc()
-                    await self.kernel.handle_error(e, message="Scheduled task error")
-                    await asyncio.sleep(60)
-
-        task_name = f"daily_{func.__name__}_{hour:02d}:{minute:02d}"
-        task = asyncio.create_task(wrapper(), name=task_name)
-        self._track_task(task)
+        Raises:
+            ValueError: If the expression is invalid
+        """
+        return self._add_cron_job(
+            func,
+            CronExpression(expression),
+            kind="cron",
+            name=f"cron_{func.__name__}",
+            jitter=jitter,
+            misfire_grace=misfire_grace,
+            max_concurrency=max_concurrency,
+            task_id=task_id,
+        )
+
+    def _add_cron_job(
+        self,
+        func: Callable[[], Any],
+        cron: CronExpression,
+        *,
+        kind: str,
+        name: str,
+        jitter: float,
+        misfire_grace: float | None,
+        max_concurrency: int,
+        task_id: str | None,
+    ) -> str:
+        job = ScheduledJob(
+            task_id or self._new_id(kind, func),
+            func,
+            name,
+            kind,
+            cron=cron,
+            jitter=jitter,
+            misfire_grace=misfire_grace,
+            max_concurrency=max_concurrency,
+        )
+        wall_now = datetime.now()
+        job.wall_target = cron.next_after(wall_now)
+        delay = (job.wall_target - wall_now).total_seconds()
+        return self._add_job(job, self._jittered(job, time.monotonic() + delay))
 
     def get_active_tasks(self) -> list[asyncio.Task]:
         """
-        Get a list of all currently scheduled tasks.
+        Get a list of the job runs currently in progress.
 
         Returns:
-            List of asyncio.Task objects representing scheduled tasks
+            List of asyncio.Task objects, one per running job execution
         """
         self._prune_done_tasks()
         return self.tasks.copy()
 
     def get_task_count(self) -> int:
-        """Return the number of currently scheduled tasks."""
-        self._prune_done_tasks()
-        return len(self.tasks)
+        """Return the number of currently scheduled jobs."""
+        return len(self._task_registry)
+
+    def get_job(self, task_id: str) -> ScheduledJob | None:
+        """Return the scheduled job registered under *task_id*, if any."""
+        return self._task_registry.get(task_id)
 
     async def add_task(
         self,
@@ -222,74 +653,64 @@ class TaskScheduler:
         Returns:
             The task_id string
         """
-        if task_id is None:
-            task_id = f"once_{func.__name__}_{id(func)}"
-
-        async def wrapper() -> None:
-            try:
-                await asyncio.sleep(delay_seconds)
-                if self.running:
-                    await func()
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                error_msg = f"One-shot task error in {func.__name__}: {e}\n"
-                error_msg += traceback.format_exc()
-                self.kernel.log_error(error_msg)
-            finally:
-                self._task_registry.pop(task_id, None)
-
-        task = asyncio.create_task(wrapper(), name=f"once_{func.__name__}")
-        self._track_task(task)
-        self._task_registry[task_id] = task
-        return task_id
+        job = ScheduledJob(
+            task_id or self._new_id("once", func),
+            func,
+            f"once_{func.__name__}",
+            "once",
+        )
+        return self._add_job(job, time.monotonic() + max(delay_seconds, 0))
+
+    def _cancel_job(self, job: ScheduledJob) -> None:
+        if self._task_registry.get(job.job_id) is job:
+            del self._task_registry[job.job_id]
+        for task in list(job.tasks):
+            if not task.done():
+                task.cancel()
 
     def cancel_task(self, task_id: str) -> bool:
         """
-        Cancel a task by its ID (for tasks registered with add_task).
+        Cancel a job by its ID and any run of it in progress.
 
         Args:
-            task_id: The ID returned by add_task
+            task_id: The ID returned by one of the ``add_*`` methods
 
         Returns:
             True if found and cancelled, False otherwise
         """
-        task = self._task_registry.pop(task_id, None)
-        if task is None:
+        job = self._task_registry.get(task_id)
+        if job is None:
             return False
-        if not task.done():
-            task.cancel()
-        if task in self.tasks:
-            self.tasks.remove(task)
+        self._cancel_job(job)
         return True
 
     def cancel_all_tasks(self) -> None:
         """Cancel all tasks and stop the scheduler (alias for stop without await)."""
-        self.running = False
-        for task in list(self.tasks):
-            if not task.done():
-                task.cancel()
+        self._cancel_everything()
         self.tasks.clear()
-        self._task_registry.clear()
 
     def get_tasks(self) -> list[dict]:
         """
-        Return a status summary of all scheduled tasks.
+        Return a status summary of all scheduled jobs.
 
         Returns:
-            List of dicts with 'name' and 'status' keys
+            List of dicts with 'name' and 'status' keys plus the job statistics
         """
         return [
             {
-                "name": task.get_name(),
-                "status": "stopped" if task.done() else "running",
+                **job.stats(),
+                "status": "running" if job.running else "scheduled",
             }
-            for task in self.tasks
+            for job in self._task_registry.values()
         ]
 
+    def get_job_stats(self) -> dict[str, dict[str, Any]]:
+        """Return ``task_id -> stats`` (runs, duration and lag) for every job."""
+        return {job_id: job.stats() for job_id, job in self._task_registry.items()}
+
     async def remove_task(self, task: asyncio.Task) -> bool:
         """
-        Remove and cancel a specific task.
+        Remove and cancel a specific running task.
 
         Args:
             task: The task to remove and cancel
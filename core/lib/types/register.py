@@ -65,6 +65,7 @@ class Register(Protocol):
     def get_watchers(self) -> list[dict[str, Any]]: ...
     def get_events(self) -> list[tuple[Callable, Any, Any]]: ...
     def get_loops(self) -> list[Any]: ...
+    def get_loop_stats(self) -> list[dict[str, Any]]: ...
 
     def unregister_command(self, cmd: str) -> bool: ...
     def unregister_bot_command(self, cmd: str) -> bool: ...
@@ -5,12 +5,16 @@
 
 Three levels of aggression:
 
-    Level 1 - Safe caches
-        Clears TTL, inline sessions, callback maps, docs, metadata.
-        All auto-rebuild on next use.  Zero side-effects.
+    Level 1 - Registered caches
+        Drops expired inline state, then evicts caches from the kernel
+        :class:`~core.lib.utils.cache_registry.CacheRegistry` (TTL cache,
+        DB read cache, module type and catalog caches, module caches),
+        cheapest to rebuild first, until the requested number of bytes is
+        freed.  Live inline forms, command docs and pipe variables are not
+        caches and are left alone.
 
     Level 2 - Extended + stale registries
-        Adds stale sys.modules entries, pipe vars, orphan aliases,
+        Evicts every registered cache and adds stale sys.modules entries,
         callback permissions, live module configs of unloaded modules.
 
     Level 3 - Hardcore
@@ -24,11 +28,14 @@ import gc
 import sys
 from typing import TYPE_CHECKING, Any
 
-if TYPE_CHECKING:
-    from core.lib.types import Kernel
+from core.lib.utils.cache_registry import (
+    CacheRegistry,
+    dict_bytes,
+    get_cache_registry,
+)
 
 if TYPE_CHECKING:
-    pass
+    from core.lib.types import Kernel
 
 
 def _dict_clear(obj: Any, attr: str) -> None:
@@ -44,77 +51,91 @@ def _set_clear(obj: Any, attr: str) -> None:
         s.clear()
 
 
-def purge_caches(kernel: Kernel, level: int = 1) -> dict[str, Any]:
+def _register_kernel_caches(kernel: Kernel, registry: CacheRegistry) -> None:
+    """Register the kernel's own caches (idempotent, looked up lazily)."""
+
+    def attr_dict(attr: str) -> tuple[Any, Any]:
+        return (
+            lambda: dict_bytes(getattr(kernel, attr, None)),
+            lambda: _dict_clear(kernel, attr),
+        )
+
+    cache = getattr(kernel, "cache", None)
+    if cache is not None and hasattr(cache, "clear") and "ttl_cache" not in registry:
+        registry.register(
+            "ttl_cache",
+            size=lambda: (
+                kernel.cache.approx_bytes()
+                if hasattr(kernel.cache, "approx_bytes")
+                else 0
+            ),
+            clear=lambda: kernel.cache.clear(),
+            cost=2.0,
+            stats=(lambda: kernel.cache.stats()) if hasattr(cache, "stats") else None,
+        )
+
+    db = getattr(kernel, "db_manager", None)
+    get_cache = getattr(db, "_get_cache", None) if db else None
+    if (
+        get_cache is not None
+        and hasattr(get_cache, "clear")
+        and "db_get_cache" not in registry
+    ):
+        registry.register(
+            "db_get_cache",
+            size=lambda: getattr(kernel.db_manager._get_cache, "bytes", 0),
+            clear=lambda: kernel.db_manager._get_cache.clear(),
+            cost=1.0,
+            stats=(
+                (lambda: kernel.db_manager._get_cache.stats())
+                if hasattr(get_cache, "stats")
+                else None
+            ),
+        )
+
+    # Re-parsing a module's source to detect its type
+    if "module_type_cache" not in registry:
+        size, clear = attr_dict("_module_type_cache")
+        registry.register("module_type_cache", size=size, clear=clear, cost=1.5)
+
+    # Repository catalogs are fetched over the network again
+    if "catalog_cache" not in registry:
+        size, clear = attr_dict("catalog_cache")
+        registry.register("catalog_cache", size=size, clear=clear, cost=3.0)
+
+
+def purge_caches(
+    kernel: Kernel, level: int = 1, target_bytes: int | None = None
+) -> dict[str, Any]:
     """Purge kernel caches at *level* (1-3).
 
+    At level 1, *target_bytes* limits how much of the registered caches is
+    evicted (None evicts all of them); higher levels always evict all.
+
     Returns a dict with keys ``{"level", "cleared", "freed_estimate"}``
-    describing what was done.
+    describing what was done, plus the counters (e.g. ``"ttl_cache"``,
+    ``"db_get_cache"``) of evicted caches taken just before they were
+    cleared.
     """
     if not kernel:
         return {"level": level, "cleared": [], "freed_estimate": 0}
 
     cleared: list[str] = []
-    db = getattr(kernel, "db_manager", None)
-
-    # Level 1: Safe caches
-    # TTLCache
-    ttl = getattr(kernel, "cache", None)
-    if ttl and hasattr(ttl, "clear"):
-        ttl.clear()
-        cleared.append("ttl_cache")
-
-    # Inline sessions
-    im = getattr(kernel, "inline_message_manager", None)
-    if im and hasattr(im, "_sessions"):
-        im._sessions.clear()
-        cleared.append("inline_sessions")
-
-    # Callback map
-    _dict_clear(kernel, "inline_callback_map")
-    cleared.append("inline_callback_map")
-
-    # Hikka-compat inline state (units + custom_map)
-    hikka_state = getattr(kernel, "_hikka_compat_inline_state", None)
-    if isinstance(hikka_state, dict):
-        for _sub in ("units", "custom_map"):
-            sub = hikka_state.get(_sub)
-            if isinstance(sub, dict):
-                sub.clear()
-        cleared.append("hikka_compat_inline_state")
-
-    # Hikka-compat inline units direct references (aliases)
-    _dict_clear(kernel, "_hikka_compat_inline_units")
-    cleared.append("hikka_compat_inline_units")
-    _dict_clear(kernel, "_hikka_compat_inline_custom_map")
-    cleared.append("hikka_compat_inline_custom_map")
-
-    # Kernel runtime dicts
-    for attr in (
-        "catalog_cache",
-        "pending_confirmations",
-        "command_docs",
-        "command_metadata",
-        "_module_commands_index",
-        "_pipe_vars",
-        "_pipe_macros",
-    ):
-        _dict_clear(kernel, attr)
-        cleared.append(attr)
 
-    # Module type cache (ModuleDetectorMixin)
-    _dict_clear(kernel, "_module_type_cache")
-    cleared.append("module_type_cache")
-
-    # Database get cache
-    if db and hasattr(db, "_get_cache"):
-        _dict_clear(db, "_get_cache")
-        cleared.append("db_get_cache")
-
-    # Inline temp registries (ModuleBase class-level - shared across instances)
-    for mod_instance in getattr(kernel, "_class_module_instances", {}).values():
-        for reg_attr in ("_inline_temp_registry",):
-            _dict_clear(mod_instance, reg_attr)
-            cleared.append(f"inline_temp:{getattr(mod_instance, 'name', '?')}")
+    # Level 1: Registered caches
+    # Inline callbacks, sessions and hikka units past their deadline; live
+    # ones back forms that are still on screen.
+    expiry = getattr(kernel, "__dict__", {}).get("inline_expiry")
+    if expiry is not None and hasattr(expiry, "expire"):
+        expiry.expire()
+        expiry.compact()
+        cleared.append("inline_expired")
+
+    registry = get_cache_registry(kernel)
+    _register_kernel_caches(kernel, registry)
+    evicted = registry.evict(target_bytes if level < 2 else None)
+    cleared.extend(evicted["evicted"])
+    freed_estimate = evicted["freed"]
 
     # Level 2: Extended
     if level >= 2:
@@ -163,7 +184,7 @@ def purge_caches(kernel: Kernel, level: int = 1) -> dict[str, Any]:
             gc.collect(2)
         cleared.append("gc_collect")
 
-        # Telegram log queue flush
+        # Telegram log queue: move to the spill file, sent later
         from core.lib.utils.logger import _flush_log_queue
 
         _flush_log_queue()
@@ -198,6 +219,7 @@ def purge_caches(kernel: Kernel, level: int = 1) -> dict[str, Any]:
             except Exception:
                 pass
 
+        # Inline temp registries (ModuleBase class-level - shared across instances)
         class_mods = getattr(kernel, "_class_module_instances", {})
         if class_mods:
             for mod_name, inst in list(class_mods.items()):
@@ -207,12 +229,19 @@ def purge_caches(kernel: Kernel, level: int = 1) -> dict[str, Any]:
                     loops.clear()
             cleared.append(f"module_inline_clean:{len(class_mods)}")
 
-        # Scheduler task registry
+        # Scheduler: the registry holds only live jobs now, so just drop
+        # references to finished runs.
         sched = getattr(kernel, "scheduler", None)
-        if sched is not None:
-            reg = getattr(sched, "_task_registry", None)
-            if reg:
-                reg.clear()
-                cleared.append("scheduler_registry")
-
-    return {"level": level, "cleared": cleared}
+        prune = getattr(sched, "_prune_done_tasks", None)
+        if callable(prune):
+            prune()
+            cleared.append("scheduler_registry")
+
+    result: dict[str, Any] = {
+        "level": level,
+        "cleared": cleared,
+        "freed_estimate": freed_estimate,
+    }
+    for name, stats in evicted["stats"].items():
+        result.setdefault(name, stats)
+    return result
@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.0.0
+# description: Central registry of evictable caches with size and rebuild cost
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+# Rough per-item cost of a dict slot plus the key/value object headers, for
+# containers whose values are not worth measuring one by one.
+_ITEM_OVERHEAD = 96
+
+
+def dict_bytes(data: Any) -> int:
+    """Approximate the shallow footprint of a mapping and its items."""
+    if not isinstance(data, dict):
+        return 0
+    size = sys.getsizeof(data)
+    getsizeof = sys.getsizeof
+    for key, value in list(data.items()):
+        size += getsizeof(key) + getsizeof(value)
+    return size
+
+
+def len_bytes(data: Any, per_item: int = _ITEM_OVERHEAD) -> int:
+    """Approximate a sized container as *per_item* bytes per element."""
+    try:
+        return len(data) * per_item
+    except TypeError:
+        return 0
+
+
+class CacheEntry:
+    """A registered cache: how to measure it and how to drop it.
+
+    Attributes:
+        name: Registry key, also used in purge reports
+        cost: Relative cost of rebuilding one byte; cheaper caches go first
+        owner: Module that registered the cache, if any
+    """
+
+    __slots__ = ("clear", "cost", "name", "owner", "size", "stats")
+
+    def __init__(
+        self,
+        name: str,
+        size: Callable[[], int],
+        clear: Callable[[], Any],
+        cost: float,
+        owner: str | None,
+        stats: Callable[[], dict[str, Any]] | None,
+    ) -> None:
+        self.name = name
+        self.size = size
+        self.clear = clear
+        self.cost = cost
+        self.owner = owner
+        self.stats = stats
+
+    def measure(self) -> int:
+        try:
+            return max(int(self.size()), 0)
+        except Exception:
+            return 0
+
+
+class CacheRegistry:
+    """Caches that may be dropped under memory pressure, cheapest first.
+
+    Each cache reports an approximate size in bytes and a rebuild cost per
+    byte.  :meth:`evict` clears caches in order of increasing cost (largest
+    first among equal costs) until the requested number of bytes has been
+    freed, so a small overshoot of the memory target drops only the caches
+    that are cheapest to refill.
+
+    Example:
+        >>> registry = get_cache_registry(kernel)
+        >>> registry.register(
+        ...     "weather", size=lambda: dict_bytes(cache), clear=cache.clear,
+        ...     cost=3.0, owner="weather",
+        ... )
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, CacheEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def register(
+        self,
+        name: str,
+        *,
+        size: Callable[[], int],
+        clear: Callable[[], Any],
+        cost: float = 1.0,
+        owner: str | None = None,
+        stats: Callable[[], dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Register (or replace) the cache called *name*.
+
+        Args:
+            name: Unique cache name
+            size: Returns the approximate size in bytes
+            clear: Drops the cache contents; may return the bytes freed
+            cost: Rebuild cost per byte relative to a DB read cache (1.0)
+            owner: Module name; its caches are unregistered on unload
+            stats: Returns counters reported when the cache is evicted
+        """
+        self._entries[name] = CacheEntry(name, size, clear, float(cost), owner, stats)
+
+    def unregister(self, name: str) -> bool:
+        return self._entries.pop(name, None) is not None
+
+    def remove_owner(self, owner: str) -> int:
+        """Unregister every cache registered by *owner*; return how many."""
+        names = [name for name, e in self._entries.items() if e.owner == owner]
+        for name in names:
+            del self._entries[name]
+        return len(names)
+
+    def sizes(self) -> dict[str, int]:
+        """Return ``name -> approximate bytes`` for every registered cache."""
+        return {name: entry.measure() for name, entry in self._entries.items()}
+
+    def evict(self, target_bytes: int | None = None) -> dict[str, Any]:
+        """
+        Clear caches, cheapest to rebuild first, until *target_bytes* are freed.
+
+        Args:
+            target_bytes: Bytes to free; None clears every registered cache
+
+        Returns:
+            ``{"freed": int, "evicted": [names], "stats": {name: counters}}``
+            where ``stats`` holds the counters of evicted caches that provide
+            them, taken just before clearing.
+        """
+        measured = [(entry, entry.measure()) for entry in self._entries.values()]
+        measured.sort(key=lambda item: (item[0].cost, -item[1]))
+
+        freed = 0
+        evicted: list[str] = []
+        stats: dict[str, dict[str, Any]] = {}
+        for entry, size in measured:
+            if target_bytes is not None and freed >= target_bytes:
+                break
+            if target_bytes is not None and size == 0:
+                continue
+            if entry.stats is not None:
+                try:
+                    stats[entry.name] = entry.stats()
+                except Exception:
+                    pass
+            try:
+                result = entry.clear()
+            except Exception:
+                continue
+            freed += result if isinstance(result, int) else size
+            evicted.append(entry.name)
+        return {"freed": freed, "evicted": evicted, "stats": stats}
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Return name, owner, cost and approximate size of every cache."""
+        return [
+            {
+                "name": entry.name,
+                "owner": entry.owner,
+                "cost": entry.cost,
+                "bytes": entry.measure(),
+            }
+            for entry in self._entries.values()
+        ]
+
+
+def get_cache_registry(kernel: Any) -> CacheRegistry:
+    """Return the kernel's cache registry, creating it on first use."""
+    registry = getattr(kernel, "__dict__", {}).get("cache_registry")
+    if not isinstance(registry, CacheRegistry):
+        registry = CacheRegistry()
+        kernel.cache_registry = registry
+    return registry
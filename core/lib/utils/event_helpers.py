@@ -21,6 +21,7 @@ def make_simple_event(kernel: Any, msg: Any, text: str, chat_id: int) -> Any:
             self._client = kernel.client
             self.pipe_input = None
             self.pipe_output = None
+            self.pipe_stream = None
             self.pipe_exit_code = 0
             self.piped = False
             self.no_add_args_to_input = False
@@ -42,7 +43,11 @@ def make_simple_event(kernel: Any, msg: Any, text: str, chat_id: int) -> Any:
                 return None
 
         async def edit(
-            self, new_text: str, *args: Any, parse_mode: str | None = None, **kwargs: Any
+            self,
+            new_text: str,
+            *args: Any,
+            parse_mode: str | None = None,
+            **kwargs: Any,
         ) -> Any:
             try:
                 return await self._client.edit_message(
@@ -76,9 +81,14 @@ def make_simple_event(kernel: Any, msg: Any, text: str, chat_id: int) -> Any:
     return _SimpleEvent()
 
 
-async def run_and_capture(kernel: Any, ev: Any, depth: int) -> str | None:
-    """Run ev through process_command and return captured edit text."""
+async def run_and_capture(kernel: Any, ev: Any, depth: int) -> str | Any | None:
+    """Run ev through process_command and return captured edit text.
+
+    An explicit ``ev.pipe_output`` (a string, or a ``PipeStream`` when the
+    stage was offered one via ``ev.pipe_stream_ok``) takes precedence.
+    """
     captured: list[str] = []
+    ev.pipe_output = None
     orig_edit = getattr(ev, "edit", None)
 
     class _FakeMsg:
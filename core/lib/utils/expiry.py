@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.0.0
+# description: Heap-based expiry shared by inline callback tokens, sessions and units
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable, MutableMapping
+from typing import Any
+
+# Entries removed by hand before their deadline stay in the heap until due;
+# the heap is swept for them whenever it grows past this factor of its size
+# after the previous sweep.
+_COMPACT_FACTOR = 2
+_COMPACT_MIN = 1024
+
+
+class _Item:
+    __slots__ = ("entry", "key", "kind", "lock", "remove", "store")
+
+    def __init__(self, kind, store, key, entry, lock, remove) -> None:
+        self.kind = kind
+        self.store = store
+        self.key = key
+        self.entry = entry
+        self.lock = lock
+        self.remove = remove
+
+    def is_live(self) -> bool:
+        return self.store.get(self.key) is self.entry
+
+    def drop(self) -> bool:
+        if not self.is_live():
+            return False
+        if self.remove is not None:
+            self.remove(self.key)
+        else:
+            self.store.pop(self.key, None)
+        return True
+
+
+class ExpiryService:
+    """Single deadline heap for short-lived inline state.
+
+    Each tracked entry remembers the mapping it lives in and the exact value
+    object stored under its key.  When the deadline passes, the key is
+    removed only if it still maps to that object, so entries that were
+    popped or replaced in the meantime are skipped without any lookup of
+    their own.  :meth:`expire` pops due items only, so its cost is
+    proportional to what expired, not to how many entries are alive.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._heap: list[tuple[float, int, _Item]] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._tracked: dict[str, int] = {}
+        self._expired: dict[str, int] = {}
+        self._skipped: dict[str, int] = {}
+        self._compact_at = _COMPACT_MIN
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def track(
+        self,
+        kind: str,
+        store: MutableMapping,
+        key: Any,
+        entry: Any,
+        ttl: float,
+        *,
+        lock: Any = None,
+        remove: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Drop ``store[key]`` after *ttl* seconds if it is still *entry*.
+
+        Args:
+            kind: Metrics bucket (``"callback"``, ``"session"``, ...).
+            store: Mapping holding the entry.
+            key: Key of the entry in *store*.
+            entry: Value stored under *key*; compared by identity on expiry.
+            ttl: Seconds from now.
+            lock: Context manager guarding *store*, if any.
+            remove: Called with *key* instead of ``del store[key]``.
+        """
+        item = _Item(kind, store, key, entry, lock, remove)
+        deadline = self._clock() + max(float(ttl), 0.0)
+        with self._lock:
+            heapq.heappush(self._heap, (deadline, next(self._seq), item))
+            self._tracked[kind] = self._tracked.get(kind, 0) + 1
+            size = len(self._heap)
+        if size > self._compact_at:
+            self.compact()
+            self._compact_at = max(_COMPACT_MIN, len(self._heap) * _COMPACT_FACTOR)
+
+    def next_deadline(self) -> float | None:
+        """Return the earliest pending deadline on the service clock."""
+        heap = self._heap
+        return heap[0][0] if heap else None
+
+    def expire(self, now: float | None = None) -> int:
+        """Remove every entry whose deadline has passed; return the count."""
+        if now is None:
+            now = self._clock()
+        heap = self._heap
+        if not heap or heap[0][0] > now:
+            return 0
+        due: list[_Item] = []
+        with self._lock:
+            while heap and heap[0][0] <= now:
+                item = heapq.heappop(heap)[2]
+                self._tracked[item.kind] -= 1
+                due.append(item)
+        # Reap outside our own lock: store locks are also held by writers
+        # that call track(), so taking them here under self._lock could
+        # deadlock.
+        removed = 0
+        for item in due:
+            if self._reap(item):
+                removed += 1
+                self._expired[item.kind] = self._expired.get(item.kind, 0) + 1
+            else:
+                self._skipped[item.kind] = self._skipped.get(item.kind, 0) + 1
+        return removed
+
+    @staticmethod
+    def _reap(item: _Item) -> bool:
+        if item.lock is None:
+            return item.drop()
+        with item.lock:
+            return item.drop()
+
+    def compact(self) -> int:
+        """Drop heap items whose entry is already gone; return how many."""
+        with self._lock:
+            before = len(self._heap)
+            live = [t for t in self._heap if t[2].is_live()]
+            heapq.heapify(live)
+            self._heap = live
+            tracked: dict[str, int] = {}
+            for _deadline, _seq, item in live:
+                tracked[item.kind] = tracked.get(item.kind, 0) + 1
+            self._tracked = tracked
+        return before - len(live)
+
+    def clear(self, kind: str | None = None) -> None:
+        with self._lock:
+            if kind is None:
+                self._heap.clear()
+                self._tracked.clear()
+                return
+            self._heap = [t for t in self._heap if t[2].kind != kind]
+            heapq.heapify(self._heap)
+            self._tracked.pop(kind, None)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return ``kind -> {tracked, live, expired, skipped}``.
+
+        ``tracked`` counts pending heap items; ``live`` is how many of those
+        still point at their entry (computed on demand, O(tracked)).
+        """
+        with self._lock:
+            items = [t[2] for t in self._heap]
+            kinds = set(self._tracked) | set(self._expired) | set(self._skipped)
+            result = {
+                kind: {
+                    "tracked": self._tracked.get(kind, 0),
+                    "live": 0,
+                    "expired": self._expired.get(kind, 0),
+                    "skipped": self._skipped.get(kind, 0),
+                }
+                for kind in kinds
+            }
+        for item in items:
+            if item.is_live():
+                result[item.kind]["live"] += 1
+        return result
+
+
+def _real_kernel(kernel: Any) -> Any:
+    if type(kernel).__name__ == "ModuleKernelProxy":
+        return object.__getattribute__(kernel, "_kernel")
+    return kernel
+
+
+def get_expiry_service(kernel: Any) -> ExpiryService:
+    """Return the kernel's expiry service, creating it on first use."""
+    kernel = _real_kernel(kernel)
+    service = getattr(kernel, "__dict__", {}).get("inline_expiry")
+    if not isinstance(service, ExpiryService):
+        service = ExpiryService()
+        kernel.inline_expiry = service
+    return service
+
+
+def track_inline_callback(kernel: Any, token: str, entry: dict[str, Any]) -> None:
+    """Schedule removal of ``kernel.inline_callback_map[token]``.
+
+    Entries without ``expires_at`` (wall-clock seconds) never expire.
+    """
+    expires_at = entry.get("expires_at") if isinstance(entry, dict) else None
+    if not expires_at:
+        return
+    kernel = _real_kernel(kernel)
+    cb_map = getattr(kernel, "__dict__", {}).get("inline_callback_map")
+    if not isinstance(cb_map, dict):
+        return
+    get_expiry_service(kernel).track(
+        "callback",
+        cb_map,
+        token,
+        entry,
+        expires_at - time.time(),
+        lock=getattr(kernel, "__dict__", {}).get("_inline_cb_lock"),
+    )
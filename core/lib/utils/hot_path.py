@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.0.1
+# description: Cheap debug gating and ring-buffer stage tracing for hot paths
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from typing import Any
+
+_DEFAULT_TRACE_SIZE = 1024
+
+# Per-event debug records are opt-in: the kernel logger always runs at DEBUG
+# for the log file, so its level alone never skips anything.
+_HOT_DEBUG = os.environ.get("MCUB_HOT_DEBUG", "0").strip() not in ("", "0")
+
+
+def set_hot_debug(enabled: bool) -> None:
+    """Turn per-event hot-path debug records on or off (``MCUB_HOT_DEBUG``)."""
+    global _HOT_DEBUG
+    _HOT_DEBUG = bool(enabled)
+
+
+def debug_enabled(logger: Any) -> bool:
+    """Return True if hot-path debug records should be built for *logger*.
+
+    False unless hot-path debugging is switched on; then True if *logger*
+    would emit DEBUG records.  Loggers without ``isEnabledFor`` (test
+    doubles, adapters) are treated as enabled.
+    """
+    if not _HOT_DEBUG:
+        return False
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    if is_enabled_for is None:
+        return logger is not None
+    return bool(is_enabled_for(logging.DEBUG))
+
+
+class HotPathTrace:
+    """Opt-in per-stage timing collected into a fixed-size ring buffer.
+
+    Usage::
+
+        trace = get_hot_trace()
+        started = trace.start()
+        # ... do work ...
+        trace.record("dispatch", started, cmd="ping")
+
+    While disabled, :meth:`start` returns ``0.0`` and :meth:`record` returns
+    immediately, so the instrumentation costs one attribute read per stage.
+    """
+
+    def __init__(self, size: int = _DEFAULT_TRACE_SIZE, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._ring: deque[tuple[float, str, float, dict[str, Any] | None]] = deque(
+            maxlen=max(1, int(size))
+        )
+
+    @property
+    def size(self) -> int:
+        return self._ring.maxlen or 0
+
+    def enable(self, size: int | None = None) -> None:
+        if size is not None and size != self.size:
+            self._ring = deque(self._ring, maxlen=max(1, int(size)))
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        self._ring.clear()
+
+    def start(self) -> float:
+        """Return a start timestamp, or ``0.0`` while tracing is off."""
+        return time.perf_counter() if self.enabled else 0.0
+
+    def record(self, stage: str, started: float, **fields: Any) -> None:
+        """Append *stage* with the time elapsed since *started*."""
+        if not started or not self.enabled:
+            return
+        self._ring.append(
+            (time.time(), stage, time.perf_counter() - started, fields or None)
+        )
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return buffered records, oldest first."""
+        return [
+            {"ts": ts, "stage": stage, "elapsed": elapsed, **(fields or {})}
+            for ts, stage, elapsed, fields in self._ring
+        ]
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return ``stage -> {count, total, max}`` over the buffered records."""
+        result: dict[str, dict[str, float]] = {}
+        for _ts, stage, elapsed, _fields in self._ring:
+            info = result.get(stage)
+            if info is None:
+                result[stage] = {"count": 1, "total": elapsed, "max": elapsed}
+                continue
+            info["count"] += 1
+            info["total"] += elapsed
+            if elapsed > info["max"]:
+                info["max"] = elapsed
+        return result
+
+
+# Module-level singleton for global usage
+_HOT_TRACE: HotPathTrace | None = None
+
+
+def get_hot_trace() -> HotPathTrace:
+    """Return the shared trace; ``MCUB_HOT_TRACE=1`` (or a size) enables it."""
+    global _HOT_TRACE
+    if _HOT_TRACE is None:
+        raw = os.environ.get("MCUB_HOT_TRACE", "0").strip()
+        size = int(raw) if raw.isdigit() and int(raw) > 1 else _DEFAULT_TRACE_SIZE
+        _HOT_TRACE = HotPathTrace(size=size, enabled=raw not in ("", "0"))
+    return _HOT_TRACE
+
+
+def enable_hot_trace(size: int | None = None) -> HotPathTrace:
+    """Force-enable the shared trace and return it."""
+    trace = get_hot_trace()
+    trace.enable(size)
+    return trace
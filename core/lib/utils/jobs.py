@@ -0,0 +1,293 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.0.0
+# description: Background job table for ``&`` pipeline segments
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine, Generator
+from typing import Any
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+KILLED = "killed"
+
+# Output kept per job; older edits are dropped first.
+MAX_OUTPUT_CHARS = 16_000
+# Finished jobs kept for ``jobs`` / ``wait`` before the oldest is forgotten.
+MAX_FINISHED_JOBS = 50
+
+
+class _Accounted:
+    """Await *coro* while charging the CPU time of each step to *job*.
+
+    Every resumption of the coroutine on the event loop is timed with
+    ``time.thread_time()``, so the figure is the loop time the job used,
+    not time spent waiting or in worker threads.
+    """
+
+    __slots__ = ("_coro", "_job")
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], job: Job) -> None:
+        self._coro = coro
+        self._job = job
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        coro = self._coro
+        job = self._job
+        clock = time.thread_time
+        send: Any = None
+        throw: BaseException | None = None
+        while True:
+            started = clock()
+            try:
+                if throw is not None:
+                    yielded = coro.throw(throw)
+                else:
+                    yielded = coro.send(send)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                job.cpu_time += clock() - started
+            try:
+                send = yield yielded
+                throw = None
+            except BaseException as exc:
+                send = None
+                throw = exc
+
+
+class Job:
+    """One background pipeline job.
+
+    Attributes:
+        id: Job number shown by ``jobs`` and accepted by ``kill`` / ``wait``
+        command: Command text the job runs
+        status: ``running``, ``done``, ``failed`` or ``killed``
+        exit_code: Pipeline exit code once the job has finished
+        cpu_time: Event-loop CPU seconds spent running the job
+    """
+
+    __slots__ = (
+        "_output",
+        "_output_chars",
+        "chat_id",
+        "command",
+        "cpu_time",
+        "error",
+        "exit_code",
+        "finished",
+        "id",
+        "started",
+        "status",
+        "task",
+    )
+
+    def __init__(self, job_id: int, command: str, chat_id: Any, now: float) -> None:
+        self.id = job_id
+        self.command = command
+        self.chat_id = chat_id
+        self.started = now
+        self.finished: float | None = None
+        self.status = RUNNING
+        self.exit_code: int | None = None
+        self.error: str | None = None
+        self.cpu_time = 0.0
+        self.task: asyncio.Task | None = None
+        # (text, parse_mode) per edit; parse_mode is None if none was given.
+        self._output: deque[tuple[str, Any]] = deque()
+        self._output_chars = 0
+
+    @property
+    def running(self) -> bool:
+        return self.status == RUNNING
+
+    def wall_time(self, now: float | None = None) -> float:
+        end = self.finished if self.finished is not None else now
+        if end is None:
+            end = time.monotonic()
+        return max(end - self.started, 0.0)
+
+    def record(self, text: Any, parse_mode: Any = None) -> None:
+        """Append one output (an edit or reply) to the bounded buffer.
+
+        *parse_mode* is the one the output was sent with, so it can be
+        re-sent the same way.
+        """
+        if not isinstance(text, str) or not text:
+            return
+        output = self._output
+        output.append((text, parse_mode))
+        self._output_chars += len(text)
+        while len(output) > 1 and self._output_chars > MAX_OUTPUT_CHARS:
+            self._output_chars -= len(output.popleft()[0])
+
+    @property
+    def output(self) -> str:
+        """The most recent output of the job (its last edit)."""
+        return self._output[-1][0] if self._output else ""
+
+    @property
+    def output_parse_mode(self) -> Any:
+        """Parse mode of :attr:`output`, or None if it was sent without one."""
+        return self._output[-1][1] if self._output else None
+
+    def outputs(self) -> list[str]:
+        """Every buffered output, oldest first."""
+        return [text for text, _parse_mode in self._output]
+
+    def info(self, now: float | None = None) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "command": self.command,
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "error": self.error,
+            "wall_time": self.wall_time(now),
+            "cpu_time": self.cpu_time,
+            "outputs": len(self._output),
+        }
+
+
+class JobTable:
+    """Background jobs started by ``&``, with ids, output and accounting.
+
+    Example:
+        >>> jobs = get_job_table(kernel)
+        >>> job = jobs.spawn(".t make", run_pipeline_coro, chat_id=chat_id)
+        >>> await jobs.wait(job.id, timeout=60)
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._jobs: dict[int, Job] = {}
+        self._ids = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def spawn(
+        self,
+        command: str,
+        factory: Callable[[Job], Coroutine[Any, Any, Any]],
+        *,
+        chat_id: Any = None,
+    ) -> Job:
+        """
+        Start ``factory(job)`` as a background task and register it.
+
+        Args:
+            command: Command text, shown by ``jobs``
+            factory: Builds the job coroutine; it receives the job so it can
+                ``record`` output. An int result becomes the exit code.
+            chat_id: Chat the job was started from
+
+        Returns:
+            The running job
+        """
+        job = Job(next(self._ids), command, chat_id, self._clock())
+        self._jobs[job.id] = job
+        job.task = asyncio.ensure_future(self._run(job, factory(job)))
+        self._prune()
+        return job
+
+    async def _run(self, job: Job, coro: Coroutine[Any, Any, Any]) -> None:
+        try:
+            result = await _Accounted(coro, job)
+        except asyncio.CancelledError:
+            job.status = KILLED
+            raise
+        except Exception as exc:
+            job.status = FAILED
+            job.error = f"{type(exc).__name__}: {exc}"
+            if job.exit_code is None:
+                job.exit_code = 1
+        else:
+            job.status = DONE
+            if isinstance(result, int):
+                job.exit_code = result
+        finally:
+            job.finished = self._clock()
+
+    def get(self, job_id: int) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def jobs(self, chat_id: Any = None) -> list[Job]:
+        """Return jobs oldest first, optionally only those of *chat_id*."""
+        return [
+            job
+            for job in self._jobs.values()
+            if chat_id is None or job.chat_id == chat_id
+        ]
+
+    def running(self) -> list[Job]:
+        return [job for job in self._jobs.values() if job.running]
+
+    def kill(self, job_id: int) -> bool:
+        """Cancel a running job; return False if it is unknown or finished."""
+        job = self._jobs.get(job_id)
+        if job is None or not job.running or job.task is None:
+            return False
+        job.task.cancel()
+        return True
+
+    async def wait(self, job_id: int, timeout: float | None = None) -> Job | None:
+        """Wait until the job finishes (or *timeout* passes) and return it."""
+        job = self._jobs.get(job_id)
+        if job is None or job.task is None:
+            return job
+        try:
+            await asyncio.wait_for(asyncio.shield(job.task), timeout)
+        except TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            # A killed job is a result; our own cancellation is not.
+            if not job.task.cancelled():
+                raise
+        return job
+
+    async def kill_all(self) -> int:
+        """Cancel every running job and wait for them to unwind."""
+        tasks = [job.task for job in self.running() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return len(tasks)
+
+    def forget(self, job_id: int) -> bool:
+        """Drop a finished job from the table."""
+        job = self._jobs.get(job_id)
+        if job is None or job.running:
+            return False
+        del self._jobs[job_id]
+        return True
+
+    def _prune(self) -> None:
+        finished = [job.id for job in self._jobs.values() if not job.running]
+        for job_id in finished[: max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[job_id]
+
+    def stats(self) -> dict[str, Any]:
+        now = self._clock()
+        return {
+            "running": len(self.running()),
+            "total": len(self._jobs),
+            "jobs": [job.info(now) for job in self._jobs.values()],
+        }
+
+
+def get_job_table(kernel: Any) -> JobTable:
+    """Return the kernel's job table, creating it on first use."""
+    table = getattr(kernel, "__dict__", {}).get("job_table")
+    if not isinstance(table, JobTable):
+        table = JobTable()
+        kernel.job_table = table
+    return table
@@ -8,15 +8,18 @@ import hashlib
 import html
 import inspect
 import io
+import json
 import logging
 import os
 import re
 import sys
+import threading
+import time
 import traceback
 import uuid
 import weakref
 from collections import deque
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from types import TracebackType
@@ -68,6 +71,14 @@ _TELEGRAM_LOG_BATCH_SIZE = 5
 _TELEGRAM_LOG_BATCH_INTERVAL = 2.0
 _TELEGRAM_LOG_RATE_LIMIT = 10
 _TELEGRAM_LOG_RATE_WINDOW = 60
+_TELEGRAM_LOG_QUEUE_SIZE = 2000
+_TELEGRAM_LOG_SPILL_FILE = f"{_LOG_DIR}/telegram_spill.log"
+_TELEGRAM_LOG_SPILL_MAX_BYTES = 5 * 1024 * 1024
+_TELEGRAM_LOG_MAX_BACKOFF = 300.0
+# Telegram rejects messages over 4096 characters; keep batches below that.
+_TELEGRAM_LOG_MAX_CHARS = 4000
+# Failed sends of the same batch before it is dropped.
+_TELEGRAM_LOG_MAX_ATTEMPTS = 5
 _TELEGRAM_LOG_HANDLERS: weakref.WeakSet = weakref.WeakSet()
 
 _NETWORK_ERRORS = (
@@ -79,30 +90,15 @@ _NETWORK_ERRORS = (
 )
 
 _EMOJI_ID_RE = re.compile(r'emoji-id=["\'](\d+)["\']', re.IGNORECASE)
-_TOKEN_RE = re.compile(
-    r"""token(?:['"\s:=]|&#x27;|&quot;)+(?:['"\s]|&#x27;|&quot;)?([A-Za-z0-9_\-:,.]+)""",
-    re.IGNORECASE,
-)
-_API_ID_RE = re.compile(
-    r"""api[_-]?id(?:['"\s:=]|&#x27;|&quot;)+(?:['"\s]|&#x27;|&quot;)?(\d+)""",
-    re.IGNORECASE,
-)
-_API_HASH_RE = re.compile(
-    r"""api[_-]?hash(?:['"\s:=]|&#x27;|&quot;)+(?:['"\s]|&#x27;|&quot;)?([A-Za-z0-9_-]+)""",
-    re.IGNORECASE,
-)
-_API_KEY_RE = re.compile(
-    r"""api[_-]?key(?:['"\s:=]|&#x27;|&quot;)+(?:['"\s]|&#x27;|&quot;)?([^,}\])"']+)""",
-    re.IGNORECASE,
-)
-_PASSWORD_RE = re.compile(
-    r"""password(?:['"\s:=]|&#x27;|&quot;)+(?:['"\s]|&#x27;|&quot;)?([^\s"'&]+)""",
-    re.IGNORECASE,
-)
-_SESSION_RE = re.compile(
-    r"""session(?:['"\s:=]|&#x27;|&quot;)+(?:['"\s]|&#x27;|&quot;)?([A-Za-z0-9_-]+)""",
-    re.IGNORECASE,
-)
+# Separator between a secret's name and its value: quotes, whitespace, ":"
+# or "=", raw or HTML-escaped.
+_SECRET_SEP = r"""(?:['"\s:=]|&#x27;|&quot;)+(?:['"\s]|&#x27;|&quot;)?"""
+_TOKEN_RE = re.compile(rf"token{_SECRET_SEP}([A-Za-z0-9_\-:,.]+)", re.IGNORECASE)
+_API_ID_RE = re.compile(rf"api[_-]?id{_SECRET_SEP}(\d+)", re.IGNORECASE)
+_API_HASH_RE = re.compile(rf"api[_-]?hash{_SECRET_SEP}([A-Za-z0-9_-]+)", re.IGNORECASE)
+_API_KEY_RE = re.compile(rf"""api[_-]?key{_SECRET_SEP}([^,}}\])"']+)""", re.IGNORECASE)
+_PASSWORD_RE = re.compile(rf"""password{_SECRET_SEP}([^\s"'&]+)""", re.IGNORECASE)
+_SESSION_RE = re.compile(rf"session{_SECRET_SEP}([A-Za-z0-9_-]+)", re.IGNORECASE)
 _LONG_NUMBERS_RE = re.compile(r"\b\d{10,}\b")
 _AUTH_HEADER_RE = re.compile(r"Authorization:\s*.+", re.IGNORECASE)
 
@@ -116,17 +112,76 @@ SENSITIVE_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     (_AUTH_HEADER_RE, "Authorization: ***"),
 ]
 
+# All of the above as one alternation, so a message is scanned once instead
+# of once per pattern.  Every named secret pattern is wrapped in a group
+# named after its position in SENSITIVE_PATTERNS; emoji ids are matched only
+# to be skipped, exactly like the placeholders of the per-pattern chain.
+_MASK_RE = re.compile(
+    "|".join(
+        [
+            rf"(?P<emoji>{_EMOJI_ID_RE.pattern})",
+            rf"(?P<number>{_LONG_NUMBERS_RE.pattern})",
+        ]
+        + [
+            f"(?P<s{i}>{pattern.pattern})"
+            for i, (pattern, _repl) in enumerate(SENSITIVE_PATTERNS)
+        ]
+    ),
+    re.IGNORECASE,
+)
+_MASK_REPLACEMENTS = {f"s{i}": repl for i, (_p, repl) in enumerate(SENSITIVE_PATTERNS)}
+_API_ID_GROUP = f"s{[p for p, _r in SENSITIVE_PATTERNS].index(_API_ID_RE)}"
+# A secret name inside another match (e.g. a password whose value runs into
+# "token=...") is where the per-pattern chain and a single scan can differ;
+# such text goes through the chain instead.
+_NESTED_SECRET_RE = re.compile(
+    r"token|api[_-]?(?:id|hash|key)|password|session|authorization|emoji-id",
+    re.IGNORECASE,
+)
+# Every alternative of _MASK_RE starts with one of these or with a digit.
+_SECRET_PREFIXES = ("token", "api", "password", "session", "authorization", "emoji-id")
+_DIGITS_TO_ZERO = str.maketrans("123456789", "000000000")
+_TEN_ZEROS = "0" * 10
+_DIGIT_RUN_RE = re.compile(r"\d{10,}")
+
+
+class _NeedChain(Exception):
+    pass
+
 
 def _mask_long_numbers(m: re.Match[str]) -> str:
     """Mask a long number sequence."""
     return "X" * len(m.group())
 
 
-def mask_sensitive_data(text: str) -> str:
-    """Mask sensitive data in text before HTML escaping."""
-    if not text:
-        return text
+def _mask_match(m: re.Match[str]) -> str:
+    kind = m.lastgroup
+    if kind == "emoji":
+        start = m.start()
+        if start and (m.string[start - 1].isalnum() or m.string[start - 1] == "_"):
+            # The chain's placeholder puts a word boundary here, which can
+            # complete a long number ending right before the emoji id.
+            raise _NeedChain
+        return m.group()
+    if kind == "number":
+        return "X" * len(m.group())
+    if _NESTED_SECRET_RE.search(m.string, m.start() + 1, m.end()):
+        raise _NeedChain
+    if kind == _API_ID_GROUP:
+        # The chain masks long numbers first, which leaves a long api_id
+        # value with nothing to match; keep that result.
+        value = m.group(m.re.groupindex[kind] + 1)
+        end = m.end()
+        if len(value) >= 10 and (
+            end == len(m.string)
+            or not (m.string[end].isalnum() or m.string[end] == "_")
+        ):
+            return m.group()[: -len(value)] + "X" * len(value)
+    return _MASK_REPLACEMENTS[kind]
+
 
+def _mask_sensitive_chain(text: str) -> str:
+    """Per-pattern masking; the reference behaviour of the combined scan."""
     placeholders: dict[str, str] = {}
 
     def _stash(m: re.Match[str]) -> str:
@@ -144,6 +199,84 @@ def mask_sensitive_data(text: str) -> str:
     return masked
 
 
+def _mask_candidates(text: str) -> list[int]:
+    """Sorted offsets where a :data:`_MASK_RE` match may start.
+
+    ``str.find`` / ``str.translate`` locate secret names and ten-digit runs
+    far faster than the regex engine trying each alternative of
+    :data:`_MASK_RE` at every offset, and text without any of them (most
+    tracebacks) is returned without running a regex at all.
+    """
+    lowered = text.lower()
+    ascii_only = text.isascii()
+    # Case-insensitive regex matching also maps dotless i / long s onto
+    # ASCII letters, and some characters change length when lowered.
+    if not ascii_only and (
+        len(lowered) != len(text) or "\u0131" in text or "\u017f" in text
+    ):
+        raise _NeedChain
+
+    starts: list[int] = []
+    for prefix in _SECRET_PREFIXES:
+        pos = lowered.find(prefix)
+        while pos != -1:
+            starts.append(pos)
+            pos = lowered.find(prefix, pos + 1)
+
+    if ascii_only:
+        digits = text.translate(_DIGITS_TO_ZERO)
+        pos = digits.find(_TEN_ZEROS)
+        while pos != -1:
+            starts.append(pos)
+            pos = digits.find(_TEN_ZEROS, pos + len(_TEN_ZEROS))
+    else:
+        for m in _DIGIT_RUN_RE.finditer(text):
+            # Non-ASCII digits are masked by the chain before the secret
+            # patterns run, which then match the X's; only the chain
+            # reproduces that.
+            if not m.group().isascii():
+                raise _NeedChain
+            starts.append(m.start())
+
+    starts.sort()
+    return starts
+
+
+def mask_sensitive_data(text: str) -> str:
+    """Mask sensitive data in text before HTML escaping.
+
+    Produces the same result as applying :data:`SENSITIVE_PATTERNS` one by
+    one (see :func:`_mask_sensitive_chain`), but in a single scan; the rare
+    inputs where the two could differ are handed to the chain.
+    """
+    if not text:
+        return text
+
+    try:
+        starts = _mask_candidates(text)
+        if not starts:
+            return text
+
+        parts: list[str] = []
+        last = 0
+        for pos in starts:
+            if pos < last:
+                continue
+            m = _MASK_RE.match(text, pos)
+            if m is None:
+                continue
+            parts.append(text[last:pos])
+            parts.append(_mask_match(m))
+            last = m.end()
+    except _NeedChain:
+        return _mask_sensitive_chain(text)
+
+    if not parts:
+        return text
+    parts.append(text[last:])
+    return "".join(parts)
+
+
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
 
 
@@ -502,6 +635,7 @@ def setup_telegram_logging(
     batch_interval: float = _TELEGRAM_LOG_BATCH_INTERVAL,
     rate_limit: int = _TELEGRAM_LOG_RATE_LIMIT,
     rate_window: int = _TELEGRAM_LOG_RATE_WINDOW,
+    spill_path: str = _TELEGRAM_LOG_SPILL_FILE,
 ) -> TelegramLogHandler:
     """Attach a TelegramLogHandler to a logger for WARNING and ERROR level messages."""
     handler = TelegramLogHandler(
@@ -510,6 +644,7 @@ def setup_telegram_logging(
         batch_interval=batch_interval,
         rate_limit=rate_limit,
         rate_window=rate_window,
+        spill_path=spill_path,
     )
     bridge = _SyncToAsyncBridge(handler)
     bridge.setFormatter(
@@ -544,6 +679,10 @@ class KernelLogger:
 
         self._send_lock = asyncio.Lock()
         self._auth_cache: tuple[bool, datetime] | None = None
+        # time.monotonic() until which Telegram asked us to stay quiet
+        self.flood_wait_until = 0.0
+        # Error that made the last _send_with_retry() give up, if any
+        self.last_send_error: Exception | None = None
 
     @property
     def log_chat_id(self) -> int | None:
@@ -705,15 +844,20 @@ class KernelLogger:
         max_attempts: int = _MAX_RETRIES,
     ) -> bool:
         """Execute *coro_factory()* with automatic FloodWait / network retry."""
+        self.last_send_error = None
         for attempt in range(max_attempts + 1):
             try:
                 await coro_factory()
                 return True
             except Exception as e:
+                self.last_send_error = e
                 if isinstance(e, FloodWaitError):
                     if attempt < max_attempts:
                         await asyncio.sleep(getattr(e, "seconds", 0))
                     else:
+                        self.flood_wait_until = time.monotonic() + getattr(
+                            e, "seconds", 0
+                        )
                         self.k.logger.warning(
                             f"Flood wait exceeded retries: {getattr(e, 'seconds', 0)}s"
                         )
@@ -734,6 +878,7 @@ class KernelLogger:
 
     async def send_log_message(self, text: str, file: IO | str | None = None) -> bool:
         """Send a message to the configured log chat."""
+        self.last_send_error = None
         if not self.log_chat_id:
             return False
 
@@ -1044,7 +1189,19 @@ _RAW_LOG_RE = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} \[")
 
 
 class TelegramLogHandler:
-    """Async handler that sends WARNING/ERROR logs to Telegram with flood protection."""
+    """Async handler that ships WARNING/ERROR logs to Telegram without losing them.
+
+    Messages wait in a bounded in-memory queue; whatever does not fit is
+    appended to an on-disk spill file (one JSON record per line) and sent by
+    the worker once the queue is idle and Telegram accepts messages again.
+    Repeats of the same masked message are folded into one line with a
+    ``(×N)`` count, and a message already delivered within *dedup_ttl* is
+    not sent again.  When the local rate limit is reached or Telegram asks
+    for a flood wait, the pending batch is held and retried after a back-off
+    instead of being discarded.  A batch Telegram rejects outright, or that
+    keeps failing for :data:`_TELEGRAM_LOG_MAX_ATTEMPTS` sends, is dropped
+    and reported with the next batch so it cannot block the ones behind it.
+    """
 
     def __init__(
         self,
@@ -1055,6 +1212,9 @@ class TelegramLogHandler:
         rate_limit: int = _TELEGRAM_LOG_RATE_LIMIT,
         rate_window: int = _TELEGRAM_LOG_RATE_WINDOW,
         dedup_ttl: int = _DEDUP_TTL,
+        queue_size: int = _TELEGRAM_LOG_QUEUE_SIZE,
+        spill_path: str = _TELEGRAM_LOG_SPILL_FILE,
+        spill_max_bytes: int = _TELEGRAM_LOG_SPILL_MAX_BYTES,
     ) -> None:
         self._kernel_logger = kernel_logger
         self._batch_size = batch_size
@@ -1063,13 +1223,40 @@ class TelegramLogHandler:
         self._rate_window = rate_window
         self._dedup_ttl = dedup_ttl
 
-        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=2000)
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
         self._task: asyncio.Task[None] | None = None
         self._shutdown = False
 
         # deque for O(1) left-pop vs list's O(n)
         self._rate_timestamps: deque[float] = deque()
 
+        # signature -> [masked text, repeat count], in arrival order
+        self._pending: dict[str, list] = {}
+        self._backoff_until = 0.0
+        self._failures = 0
+        # First signature of the batch that keeps failing, and its attempts
+        self._failing_sig: str | None = None
+        self._failing_attempts = 0
+        self._send_dropped = 0
+
+        # emit() may be called from non-loop threads, so the spill file has
+        # its own lock.  Records before _spill_offset have been delivered;
+        # _spill_read_offset is how far the catch-up sender has read, and
+        # _spill_inflight maps the signatures it loaded to their spilled
+        # counts.  The delivered prefix is dropped on stop() or once drained.
+        self._spill_path = spill_path
+        self._spill_max_bytes = spill_max_bytes
+        self._spill_lock = threading.Lock()
+        self._spill_offset = 0
+        self._spill_read_offset = 0
+        self._spill_eof = False
+        self._spill_inflight: dict[str, int] = {}
+        self._spill_dropped = 0
+        try:
+            self._spill_has_data = os.path.getsize(spill_path) > 0
+        except OSError:
+            self._spill_has_data = False
+
     async def start(self) -> None:
         """Start the background worker task."""
         if self._task is None or self._task.done():
@@ -1077,7 +1264,7 @@ class TelegramLogHandler:
             self._task = asyncio.create_task(self._worker())
 
     async def stop(self) -> None:
-        """Stop the handler gracefully, flushing any remaining messages."""
+        """Stop the worker and move everything still unsent to the spill file."""
         self._shutdown = True
         if self._task:
             self._task.cancel()
@@ -1086,12 +1273,20 @@ class TelegramLogHandler:
             except asyncio.CancelledError:
                 pass
             self._task = None
-        # Drain queue
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+
+        # Records loaded from the spill file are still in it past the
+        # delivered offset; only counts folded in since then are new.
+        leftovers = []
+        for sig, (text, count) in self._pending.items():
+            count -= self._spill_inflight.get(sig, 0)
+            if count > 0:
+                leftovers.append((text, count))
+        self._pending.clear()
+        self._spill_inflight.clear()
+        leftovers.extend((message, 1) for message in self._drain_queue())
+        if leftovers:
+            self._spill_records(leftovers)
+        self._compact_spill()
 
     def emit(self, message: str) -> None:
         """Queue a log message for sending (safe to call from sync code)."""
@@ -1099,6 +1294,8 @@ class TelegramLogHandler:
             return
         try:
             self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._spill_records([(message, 1)])
         except Exception:
             pass
 
@@ -1106,6 +1303,24 @@ class TelegramLogHandler:
         """Return current queue depth (useful for debugging)."""
         return self._queue.qsize()
 
+    def spill_queue(self) -> int:
+        """Move queued messages to the spill file; return how many were moved."""
+        messages = self._drain_queue()
+        if not messages:
+            return 0
+        return self._spill_records([(message, 1) for message in messages])
+
+    def _drain_queue(self) -> list[str]:
+        messages: list[str] = []
+        while True:
+            try:
+                messages.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return messages
+
+    # Rate limiting and back-off
+
     def _clean_rate_timestamps(self, now: float) -> None:
         """Evict timestamps outside the current rate window."""
         cutoff = now - self._rate_window
@@ -1117,115 +1332,366 @@ class TelegramLogHandler:
         self._clean_rate_timestamps(now)
         return len(self._rate_timestamps) >= self._rate_limit
 
-    async def _worker(self) -> None:
-        """Background task: collect messages into batches and flush them."""
-        batch: list[str] = []
+    def _send_delay(self) -> float:
+        """Seconds to wait before the next send is allowed (0 when allowed)."""
+        until = self._backoff_until
+        flood_until = getattr(self._kernel_logger, "flood_wait_until", 0.0)
+        if isinstance(flood_until, (int, float)):
+            until = max(until, float(flood_until))
+        delay = until - time.monotonic()
 
-        while not self._shutdown:
-            try:
-                try:
-                    message = await asyncio.wait_for(
-                        self._queue.get(), timeout=self._batch_interval
-                    )
-                    batch.append(message)
+        now = datetime.now().timestamp()
+        if self._is_rate_limited(now):
+            delay = max(delay, self._rate_timestamps[0] + self._rate_window - now)
+        return max(delay, 0.0)
 
-                    # Greedily drain whatever is already in the queue
-                    while not self._queue.empty() and len(batch) < self._batch_size:
-                        batch.append(self._queue.get_nowait())
+    def _back_off(self, seconds: float | None = None) -> None:
+        """Delay the next send by *seconds*, or exponentially on repeated failures."""
+        self._failures += 1
+        if seconds is None:
+            seconds = min(2.0**self._failures, _TELEGRAM_LOG_MAX_BACKOFF)
+        self._backoff_until = max(self._backoff_until, time.monotonic() + seconds)
 
-                    if len(batch) >= self._batch_size:
-                        await self._flush_batch(batch)
-                        batch = []
+    # Spill file
 
-                except TimeoutError:
-                    if batch:
-                        await self._flush_batch(batch)
-                        batch = []
+    def _spill_records(self, records: list[tuple[str, int]]) -> int:
+        """Append ``(message, count)`` records to the spill file.
 
-            except asyncio.CancelledError:
-                if batch:
-                    await self._flush_batch(batch)
-                raise
-            except Exception:
+        Records that would push the file past *spill_max_bytes* (or that hit
+        an I/O error) are counted and reported with the next delivered batch.
+        """
+        written = 0
+        with self._spill_lock:
+            try:
+                directory = os.path.dirname(self._spill_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self._spill_path, "ab") as fh:
+                    size = fh.tell()
+                    for message, count in records:
+                        line = json.dumps([message, count]).encode() + b"\n"
+                        if size + len(line) > self._spill_max_bytes:
+                            continue
+                        fh.write(line)
+                        size += len(line)
+                        written += 1
+            except OSError:
                 pass
+            if written:
+                self._spill_has_data = True
+            self._spill_dropped += len(records) - written
+        return written
 
-    async def _flush_batch(self, batch: list[str]) -> None:
-        """Deduplicate, rate-check, and send a batch of messages to Telegram."""
-        if not batch:
-            return
-
-        cache = self._kernel_logger.cache
-        seen: set[str] = set()
-        unique_messages: list[str] = []
+    def _read_spill(self, limit: int) -> list[tuple[str, int]]:
+        """Return up to *limit* spilled records past the read offset.
 
-        for msg in batch:
-            safe_msg = mask_sensitive_data(msg)
-            if not safe_msg.strip():
-                continue
+        Only the read offset advances; the records stay in the file until
+        :meth:`_commit_spill` marks them delivered.
+        """
+        records: list[tuple[str, int]] = []
+        with self._spill_lock:
+            try:
+                with open(self._spill_path, "rb") as fh:
+                    fh.seek(self._spill_read_offset)
+                    while len(records) < limit:
+                        line = fh.readline()
+                        # An unterminated tail is a torn write from a crash.
+                        if not line.endswith(b"\n"):
+                            self._spill_read_offset = fh.tell()
+                            self._spill_eof = True
+                            break
+                        self._spill_read_offset = fh.tell()
+                        try:
+                            message, count = json.loads(line)
+                        except (TypeError, ValueError):
+                            continue
+                        records.append((str(message), max(int(count), 1)))
+                    else:
+                        self._spill_eof = fh.tell() >= os.fstat(fh.fileno()).st_size
+            except FileNotFoundError:
+                self._spill_eof = True
+            except OSError:
+                pass
+        return records
+
+    def _commit_spill(self) -> None:
+        """Mark everything read so far as delivered; drop the file once drained."""
+        with self._spill_lock:
+            self._spill_offset = self._spill_read_offset
+            if not self._spill_eof:
+                return
+            self._spill_eof = False
+            try:
+                drained = os.path.getsize(self._spill_path) <= self._spill_offset
+            except OSError:
+                drained = True
+            if drained:
+                self._remove_spill_locked()
+
+    def _settle(self, sigs: Iterable[str]) -> None:
+        """Note that *sigs* left the pending batch (delivered or dropped)."""
+        inflight = self._spill_inflight
+        for sig in sigs:
+            inflight.pop(sig, None)
+        if not inflight and self._spill_read_offset > self._spill_offset:
+            self._commit_spill()
+
+    def _remove_spill_locked(self) -> None:
+        try:
+            os.remove(self._spill_path)
+        except OSError:
+            pass
+        self._spill_offset = 0
+        self._spill_read_offset = 0
+        self._spill_has_data = False
+
+    def _compact_spill(self) -> None:
+        """Drop the already-sent prefix of the spill file."""
+        with self._spill_lock:
+            if not self._spill_offset:
+                return
+            try:
+                with open(self._spill_path, "rb") as fh:
+                    fh.seek(self._spill_offset)
+                    rest = fh.read()
+                if not rest:
+                    self._remove_spill_locked()
+                    return
+                tmp_path = f"{self._spill_path}.tmp"
+                with open(tmp_path, "wb") as fh:
+                    fh.write(rest)
+                os.replace(tmp_path, self._spill_path)
+                self._spill_offset = 0
+                self._spill_read_offset = 0
+            except OSError:
+                pass
 
-            sig = f"tlog:{_sig_hash(safe_msg)}"
-            if sig in seen:
-                continue
-            if cache and cache.get(sig):
-                continue
+    def _catch_up(self) -> int:
+        """Load spilled records into the pending batch; return how many."""
+        room = self._batch_size - len(self._pending)
+        if room <= 0 or not self._spill_has_data:
+            return 0
+        records = self._read_spill(room)
+        for message, count in records:
+            sig = self._absorb(message, count)
+            if sig is not None:
+                self._spill_inflight[sig] = self._spill_inflight.get(sig, 0) + count
+        # Nothing to deliver (all deduplicated or unreadable): done with them.
+        self._settle(())
+        return len(records)
 
-            seen.add(sig)
-            unique_messages.append(safe_msg)
-            if cache:
-                cache.set(sig, True, ttl=self._dedup_ttl)
+    # Batching
 
-        if not unique_messages:
-            return
+    def _absorb(self, message: str, count: int = 1) -> str | None:
+        """Add *message* to the pending batch, folding repeats into a count.
 
-        now = datetime.now().timestamp()
-        if self._is_rate_limited(now):
-            return
+        Returns the batch signature, or None if the message was skipped.
+        """
+        safe_msg = mask_sensitive_data(message)
+        if not safe_msg.strip():
+            return None
 
-        self._rate_timestamps.append(now)
+        # The bridge formatter prefixes a timestamp; leave it out of the
+        # signature so repeats of one message fold together.
+        sig = f"tlog:{_sig_hash(_RAW_LOG_RE.sub('[', safe_msg, count=1))}"
+        entry = self._pending.get(sig)
+        if entry is not None:
+            entry[1] += count
+            return sig
 
-        if len(unique_messages) == 1:
-            text = (
-                f"<blockquote expandable>"
-                f"<code>{html.escape(unique_messages[0])}</code>"
-                f"</blockquote>"
-            )
+        cache = self._kernel_logger.cache
+        if cache and cache.get(sig):
+            return None
+        self._pending[sig] = [safe_msg, count]
+        return sig
+
+    def _format_line(self, text: str, count: int) -> str:
+        """Escape one batch line, cutting it to fit a message on its own."""
+        suffix = f" (×{count})" if count > 1 else ""
+        limit = _TELEGRAM_LOG_MAX_CHARS - 200 - len(suffix)
+        line = html.escape(text)
+        if len(line) > limit:
+            cut = limit - 1
+            line = html.escape(text[:cut])
+            while len(line) > limit - 1:
+                cut -= len(line) - (limit - 1)
+                line = html.escape(text[:cut])
+            line += "…"
+        return line + suffix
+
+    def _take_batch(self) -> tuple[list[str], list[str]]:
+        """Pick the next batch: its signatures and formatted lines.
+
+        Stops at *batch_size* entries or before the message would exceed
+        :data:`_TELEGRAM_LOG_MAX_CHARS`; a single long entry is cut instead.
+        """
+        sigs: list[str] = []
+        lines: list[str] = []
+        size = 0
+        for sig, (text, count) in self._pending.items():
+            if len(sigs) >= self._batch_size:
+                break
+            line = self._format_line(text, count)
+            if sigs and size + len(line) + 1 > _TELEGRAM_LOG_MAX_CHARS - 200:
+                break
+            sigs.append(sig)
+            lines.append(line)
+            size += len(line) + 1
+        return sigs, lines
+
+    def _format_batch(self, lines: list[str]) -> str:
+        if len(lines) == 1:
+            text = f"<blockquote expandable><code>{lines[0]}</code></blockquote>"
         else:
-            lines = [html.escape(line) for line in unique_messages[: self._batch_size]]
             text = (
                 "<blockquote expandable>\n<code>"
                 + "\n".join(lines)
                 + "\n</code></blockquote>"
             )
-            overflow = len(unique_messages) - self._batch_size
-            if overflow > 0:
-                text += f"\n<blockquote><code>... and {overflow} more errors</code></blockquote>"
+        if self._spill_dropped:
+            text += (
+                f"\n<blockquote><code>... {self._spill_dropped} messages lost: "
+                f"spill file full</code></blockquote>"
+            )
+        if self._send_dropped:
+            text += (
+                f"\n<blockquote><code>... {self._send_dropped} messages lost: "
+                f"rejected by Telegram</code></blockquote>"
+            )
+        return text
+
+    def _drop(self, sigs: list[str]) -> None:
+        for sig in sigs:
+            entry = self._pending.pop(sig, None)
+            if entry is not None:
+                self._send_dropped += entry[1]
+        self._settle(sigs)
+
+    def _note_failure(self, sigs: list[str]) -> None:
+        """Count a failed send of *sigs*; drop the batch if it cannot succeed."""
+        error = getattr(self._kernel_logger, "last_send_error", None)
+        if error is not None and not isinstance(
+            error, (FloodWaitError, *_NETWORK_ERRORS)
+        ):
+            # Rejected outright (forbidden chat, bad markup): resending the
+            # same text fails the same way.
+            self._drop(sigs)
+            self._failing_sig = None
+            return
 
-        await self._kernel_logger.send_log_message(text)
+        if sigs[0] == self._failing_sig:
+            self._failing_attempts += 1
+        else:
+            self._failing_sig = sigs[0]
+            self._failing_attempts = 1
+        if self._failing_attempts >= _TELEGRAM_LOG_MAX_ATTEMPTS:
+            self._drop(sigs)
+            self._failing_sig = None
+        self._back_off()
+
+    async def _flush_pending(self) -> bool:
+        """Send the pending batch; return False if it is being held back."""
+        if not self._pending:
+            return True
+        if not self._kernel_logger.log_chat_id:
+            # Nowhere to ship to; nothing will ever drain the backlog.
+            self._settle(list(self._pending))
+            self._pending.clear()
+            return True
+        if self._send_delay() > 0:
+            return False
+
+        sigs, lines = self._take_batch()
+        spill_dropped = self._spill_dropped
+        send_dropped = self._send_dropped
+        text = self._format_batch(lines)
+        self._rate_timestamps.append(datetime.now().timestamp())
+
+        try:
+            sent = await self._kernel_logger.send_log_message(text)
+        except FloodWaitError as e:
+            self._back_off(getattr(e, "seconds", 0))
+            return False
+        except Exception:
+            sent = False
+        if not sent:
+            flood_until = getattr(self._kernel_logger, "flood_wait_until", 0.0)
+            if isinstance(flood_until, (int, float)) and flood_until > time.monotonic():
+                # Held back by a flood wait, not a failure of this batch.
+                return False
+            self._note_failure(sigs)
+            return False
+
+        self._failures = 0
+        self._failing_sig = None
+        self._spill_dropped -= spill_dropped
+        self._send_dropped -= send_dropped
+        cache = self._kernel_logger.cache
+        for sig in sigs:
+            self._pending.pop(sig, None)
+            if cache:
+                cache.set(sig, True, ttl=self._dedup_ttl)
+        self._settle(sigs)
+        return True
+
+    async def _worker(self) -> None:
+        """Background task: batch queued messages, send them, then catch up on the spill."""
+        while not self._shutdown:
+            try:
+                if (
+                    not self._pending
+                    and self._queue.empty()
+                    and self._spill_has_data
+                    and self._send_delay() <= 0
+                ):
+                    self._catch_up()
+
+                if len(self._pending) >= self._batch_size:
+                    delay = self._send_delay()
+                    if delay > 0:
+                        # Keep the batch; new messages wait in the queue and
+                        # overflow to disk meanwhile.
+                        await asyncio.sleep(min(delay, self._batch_interval))
+                    else:
+                        await self._flush_pending()
+                    continue
+
+                try:
+                    message = await asyncio.wait_for(
+                        self._queue.get(), timeout=self._batch_interval
+                    )
+                except TimeoutError:
+                    if self._pending:
+                        await self._flush_pending()
+                    continue
+
+                self._absorb(message)
+                # Greedily drain whatever is already in the queue
+                while not self._queue.empty() and len(self._pending) < self._batch_size:
+                    self._absorb(self._queue.get_nowait())
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
 
 
 def _flush_log_queue() -> int:
-    """Drain queued Telegram log messages without awaiting network I/O.
+    """Move queued Telegram log messages to disk without awaiting network I/O.
 
     Used by the memory monitor's high-pressure purge path.  The helper is
     intentionally synchronous because purge_caches() may run outside the
     TelegramLogHandler worker task and must not block the event loop on sends.
+    The messages are not lost: each handler's worker sends them from its
+    spill file once it catches up.
 
     Returns:
-        Number of queued log messages dropped.
+        Number of queued log messages moved to the spill files.
     """
-    dropped = 0
+    moved = 0
     for handler in list(_TELEGRAM_LOG_HANDLERS):
-        queue = getattr(handler, "_queue", None)
-        if queue is None:
+        try:
+            moved += handler.spill_queue()
+        except Exception:
             continue
-
-        while True:
-            try:
-                queue.get_nowait()
-                dropped += 1
-            except asyncio.QueueEmpty:
-                break
-            except Exception:
-                break
-
-    return dropped
+    return moved
@@ -0,0 +1,297 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+# author: @Hairpin00
+# version: 1.0.0
+# description: Pipeline stage protocol: text streams and command markers
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from typing import Any
+
+# Characters str.splitlines() treats as line boundaries.
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+_LINE_BREAK_RE = re.compile(f"[{re.escape(_LINE_BREAKS)}]")
+
+# Chunk size used when streaming files.
+FILE_CHUNK_SIZE = 64 * 1024
+# Longest line buffered by PipeStream.lines(); longer ones are split.
+MAX_LINE_CHARS = 1024 * 1024
+
+
+def streaming(func: Callable) -> Callable:
+    """Mark a command handler as able to consume a :class:`PipeStream`.
+
+    Marked handlers receive the upstream output as ``event.pipe_stream``
+    (with ``event.pipe_input`` left empty); every other handler keeps
+    receiving it as a plain string in ``event.pipe_input``.  Place the
+    decorator below ``@command`` so it marks the function being registered.
+    """
+    func.__pipe_stream__ = True
+    return func
+
+
+def pipe_barrier(func: Callable) -> Callable:
+    """Mark a command whose side effects later ``@(...)`` substitutions read.
+
+    ``@(...)`` substitutions of one template run concurrently; a marked
+    command (``export``, ``write``) runs only after every substitution to
+    its left has finished, and the ones to its right start after it.
+    """
+    func.__pipe_barrier__ = True
+    return func
+
+
+def _has_marker(handler: Any, marker: str) -> bool:
+    seen = 0
+    while handler is not None and seen < 8:
+        if getattr(handler, marker, False) is True:
+            return True
+        handler = getattr(handler, "__original__", None) or getattr(
+            handler, "__wrapped__", None
+        )
+        seen += 1
+    return False
+
+
+def accepts_stream(handler: Any) -> bool:
+    """Return True if *handler* (or the function it wraps) is ``@streaming``."""
+    return _has_marker(handler, "__pipe_stream__")
+
+
+def is_pipe_barrier(handler: Any) -> bool:
+    """Return True if *handler* (or the function it wraps) is ``@pipe_barrier``."""
+    return _has_marker(handler, "__pipe_barrier__")
+
+
+class PipeStream:
+    """Text produced by a pipeline stage, delivered in chunks.
+
+    A stage that sees ``event.pipe_stream_ok`` may set ``event.pipe_output``
+    to a stream instead of a string; the next stage then pulls text only as
+    fast as it consumes it.  A consumer that stops early (``head``) leaves
+    the rest unread and the pipeline closes the stream, which closes the
+    producing generator and runs its ``on_close`` callback (closing a file,
+    killing a process).
+
+    A stream can be consumed once, either through :meth:`lines` /
+    :meth:`chunks` or by materializing it with :meth:`read`.
+
+    Example:
+        >>> stream = PipeStream.from_text("b\\na\\n")
+        >>> [line async for line in stream.lines()]
+        ['b', 'a']
+    """
+
+    __slots__ = ("_chunks", "_closed", "_on_close")
+
+    def __init__(
+        self,
+        chunks: AsyncIterable[str],
+        *,
+        on_close: Callable[[], Any] | None = None,
+    ) -> None:
+        self._chunks = chunks
+        self._on_close = on_close
+        self._closed = False
+
+    @classmethod
+    def from_text(cls, text: str) -> PipeStream:
+        """Wrap an already materialized string."""
+
+        async def _one() -> AsyncIterator[str]:
+            if text:
+                yield text
+
+        return cls(_one())
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: AsyncIterable[str] | Iterable[str],
+        *,
+        on_close: Callable[[], Any] | None = None,
+    ) -> PipeStream:
+        """Stream *lines* joined by ``"\\n"``, like ``"\\n".join(lines)``."""
+
+        async def _joined() -> AsyncIterator[str]:
+            first = True
+            if isinstance(lines, AsyncIterable):
+                async for line in lines:
+                    yield line if first else "\n" + line
+                    first = False
+            else:
+                for line in lines:
+                    yield line if first else "\n" + line
+                    first = False
+
+        return cls(_joined(), on_close=on_close)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        *,
+        encoding: str = "utf-8",
+        errors: str = "ignore",
+        chunk_size: int = FILE_CHUNK_SIZE,
+    ) -> PipeStream:
+        """Stream a text file in *chunk_size* pieces, read off the event loop.
+
+        The file is opened immediately, so a missing or unreadable path
+        raises here rather than in the consumer.
+        """
+        handle = open(path, encoding=encoding, errors=errors)
+
+        async def _read() -> AsyncIterator[str]:
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(handle.read, chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+            finally:
+                handle.close()
+
+        return cls(_read(), on_close=handle.close)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def chunks(self) -> AsyncIterator[str]:
+        """Yield the raw chunks as the producer emits them."""
+        if self._closed:
+            return
+        async for chunk in self._chunks:
+            if chunk:
+                yield chunk
+
+    async def lines(self, newline: str | None = None) -> AsyncIterator[str]:
+        """Yield lines without their terminators.
+
+        With the default ``newline=None`` lines are split exactly as
+        ``str.splitlines()`` would split the whole text; with
+        ``newline="\\n"`` they match ``str.split("\\n")`` (including the
+        trailing empty string after a final newline).  Only the current
+        partial line is buffered, and each chunk is scanned once.  A line
+        longer than :data:`MAX_LINE_CHARS` is yielded in pieces of that size
+        so a file without line breaks cannot exhaust memory.
+        """
+        if newline is not None:
+            async for line in self._split_lines(newline):
+                yield line
+            return
+
+        carry: list[str] = []
+        carry_len = 0
+        # The partial line ends with "\r", which may pair with a leading "\n".
+        after_cr = False
+        async for chunk in self.chunks():
+            if not after_cr and _LINE_BREAK_RE.search(chunk) is None:
+                carry.append(chunk)
+                carry_len += len(chunk)
+                if carry_len >= MAX_LINE_CHARS:
+                    line = "".join(carry)
+                    while len(line) >= MAX_LINE_CHARS:
+                        yield line[:MAX_LINE_CHARS]
+                        line = line[MAX_LINE_CHARS:]
+                    carry = [line] if line else []
+                    carry_len = len(line)
+                continue
+
+            parts = ("".join(carry) + chunk).splitlines(keepends=True)
+            # Keep an unterminated tail, and a trailing "\r" that may be the
+            # first half of a "\r\n" split across chunks.
+            tail = parts[-1][-1]
+            rest = parts.pop() if tail not in _LINE_BREAKS or tail == "\r" else ""
+            for part in parts:
+                yield part[:-2] if part.endswith("\r\n") else part[:-1]
+            carry = [rest] if rest else []
+            carry_len = len(rest)
+            after_cr = rest.endswith("\r")
+        if carry:
+            for part in "".join(carry).splitlines():
+                yield part
+
+    async def _split_lines(self, newline: str) -> AsyncIterator[str]:
+        """:meth:`lines` for an explicit separator (``str.split`` semantics)."""
+        carry: list[str] = []
+        carry_len = 0
+        # A separator can straddle chunks; keep the last len - 1 characters
+        # of the partial line to look for one across the boundary.
+        keep = len(newline) - 1
+        tail = ""
+        async for chunk in self.chunks():
+            probe = tail + chunk
+            if newline not in probe:
+                carry.append(chunk)
+                carry_len += len(chunk)
+                tail = probe[-keep:] if keep else ""
+                if carry_len >= MAX_LINE_CHARS + keep:
+                    line = "".join(carry)
+                    cut = len(line) - keep
+                    while cut >= MAX_LINE_CHARS:
+                        yield line[:MAX_LINE_CHARS]
+                        line = line[MAX_LINE_CHARS:]
+                        cut -= MAX_LINE_CHARS
+                    carry = [line] if line else []
+                    carry_len = len(line)
+                continue
+
+            *complete, rest = ("".join(carry) + chunk).split(newline)
+            for line in complete:
+                yield line
+            carry = [rest] if rest else []
+            carry_len = len(rest)
+            tail = rest[-keep:] if keep else ""
+        yield "".join(carry)
+
+    async def read(self) -> str:
+        """Consume the rest of the stream and return it as one string."""
+        return "".join([chunk async for chunk in self.chunks()])
+
+    async def aclose(self) -> None:
+        """Stop the producer; unread output is discarded."""
+        if self._closed:
+            return
+        self._closed = True
+        closer = getattr(self._chunks, "aclose", None)
+        if closer is not None:
+            try:
+                await closer()
+            except Exception:
+                pass
+        if self._on_close is not None:
+            try:
+                result = self._on_close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                pass
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self.lines()
+
+
+async def read_pipe(value: Any) -> str:
+    """Return a pipe value (string, stream or None) as a plain string."""
+    if value is None:
+        return ""
+    if isinstance(value, PipeStream):
+        try:
+            return await value.read()
+        finally:
+            await value.aclose()
+    return value if isinstance(value, str) else str(value)
+
+
+def pipe_source(event: Any) -> PipeStream | None:
+    """Return the upstream stream handed to a ``@streaming`` command, if any."""
+    stream = getattr(event, "pipe_stream", None)
+    return stream if isinstance(stream, PipeStream) else None
@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+
+class VersionedDict(dict):
+    """Plain dict that bumps ``version`` on every mutation.
+
+    Lets derived indexes (e.g. the command resolution index) detect that a
+    registry changed with a single integer comparison instead of rescanning
+    the whole table.
+    """
+
+    # Class-level default so copies/unpickling that populate items before
+    # ``__init__`` runs still have a counter to bump.
+    version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self.version += 1
+        return result
+
+    def pop(self, key, *args):
+        result = super().pop(key, *args)
+        self.version += 1
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self.version += 1
+        return result
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self):
+        super().clear()
+        self.version += 1
@@ -8,6 +8,8 @@ from typing import Any
 
 from telethon import Button
 
+from core.lib.utils.expiry import get_expiry_service, track_inline_callback
+
 
 def get_button_emoji(btn: Any) -> str | None:
     if hasattr(btn, "style") and btn.style:
@@ -135,26 +137,8 @@ def build_button_url(text: str, url: str, emoji: str | None = None) -> dict[str,
 
 
 def cleanup_inline_callback_map(kernel) -> None:
-    """Remove expired entries from kernel.inline_callback_map in-place."""
-
-    real_kernel = _get_real_kernel(kernel)
-    lock = getattr(real_kernel, "_inline_cb_lock", None)
-    if lock is None:
-        return
-
-    with lock:
-        cb_map = getattr(real_kernel, "inline_callback_map", None)
-        if not cb_map:
-            return
-
-        now = time.time()
-        expired = [
-            k
-            for k, v in list(cb_map.items())
-            if v.get("expires_at") and v["expires_at"] < now
-        ]
-        for k in expired:
-            cb_map.pop(k, None)
+    """Remove expired inline state (callback tokens included) right now."""
+    get_expiry_service(_get_real_kernel(kernel)).expire()
 
 
 def _get_real_kernel(kernel: Any) -> Any:
@@ -198,22 +182,14 @@ def make_cb_button(
             cb_map = {}
             real_kernel.inline_callback_map = cb_map
 
-        now = time.time()
-        expired = [
-            k
-            for k, v in list(cb_map.items())
-            if v.get("expires_at") and v["expires_at"] < now
-        ]
-        for k in expired:
-            cb_map.pop(k, None)
-
         tok = token or uuid.uuid4().hex
-        cb_map[tok] = {
+        entry = cb_map[tok] = {
             "handler": callback,
             "args": list(args or []),
             "kwargs": dict(kwargs or {}),
-            "expires_at": now + ttl if ttl else None,
+            "expires_at": time.time() + ttl if ttl else None,
         }
+    track_inline_callback(real_kernel, tok, entry)
 
     return Button.inline(text, tok.encode(), icon=icon, style=style)
 
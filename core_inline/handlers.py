@@ -11,6 +11,7 @@ import threading
 import time
 import traceback
 import uuid
+from collections import OrderedDict
 from typing import Any
 
 import aiohttp
@@ -22,6 +23,10 @@ from telethon.tl.types import (
     UpdateBotInlineSend,
 )
 
+from core.lib.loader.callback_router import get_callback_router
+from core.lib.utils.expiry import get_expiry_service, track_inline_callback
+from core.lib.utils.versioned_dict import VersionedDict
+
 from .api import (
     add_inline_keyboard_to_result,
     build_button_callback,
@@ -66,12 +71,13 @@ except Exception:  # pragma: no cover - optional dependency at runtime
 class _TelethonInlineQueryAdapter:
     """Thin Telethon-compatible wrapper around aiogram InlineQuery."""
 
-    __slots__ = ("_api_bot", "_q", "sender_id", "text")
+    __slots__ = ("_api_bot", "_q", "offset", "sender_id", "text")
 
     def __init__(self, q: Any, api_bot: Any | None) -> None:
         self._q = q
         self._api_bot = api_bot
         self.text: str = getattr(q, "query", "") or ""
+        self.offset: str = getattr(q, "offset", "") or ""
         self.sender_id: int = getattr(getattr(q, "from_user", None), "id", 0) or 0
 
     @property
@@ -158,12 +164,19 @@ class _TelethonInlineQueryAdapter:
 
     builder = _Builder()
 
-    async def answer(self, results: list[Any], cache_time: int = 300) -> None:
+    async def answer(
+        self,
+        results: list[Any],
+        cache_time: int = 300,
+        next_offset: str | None = None,
+    ) -> None:
         if self._api_bot is not None:
+            extra = {"next_offset": next_offset} if next_offset else {}
             await self._api_bot.answer_inline(
                 inline_query_id=self._q.id,
                 results=results,
                 cache_time=cache_time,
+                **extra,
             )
 
 
@@ -267,6 +280,11 @@ class _TelethonCallbackAdapter:
             )
 
 
+# Telegram accepts at most 50 results per inline answer.
+_LISTING_PAGE_SIZE = 50
+_LISTING_CACHE_SIZE = 256
+
+
 class InlineHandlers:
     BTN_URL_PREFIX = "tg://btn/"
     EMOJI_TELESCOPE = '<tg-emoji emoji-id="5429283852684124412">🔭</tg-emoji>'
@@ -292,10 +310,12 @@ class InlineHandlers:
         self._setup_inline_send_handler()
         self._setup_inline_button_cleanup_watcher()
         self._cb_lock = threading.Lock()
-        self._last_cleanup_time = 0.0
         self._cleanup_task: asyncio.Task | None = None
-        self._cleanup_interval = 300.0
         self._form_counter = 0
+        # Inline command listing: (user, prefix, offset) -> (results, next_offset)
+        self._listing_pages: OrderedDict[tuple, tuple[list, str]] = OrderedDict()
+        self._listing_entries: list[tuple[str, str, str, str]] | None = None
+        self._listing_stamp: tuple | None = None
 
     def _dedup_runtime_event(self, kind: str, key: str, ttl: float = 2.0) -> bool:
         """Return True when the same inline event was processed recently."""
@@ -1271,12 +1291,13 @@ class InlineHandlers:
                         cb_map = {}
                         self.kernel.inline_callback_map = cb_map
 
-                    cb_map[token] = {
+                    entry = cb_map[token] = {
                         "handler": callback,
                         "args": btn_dict.get("args", []),
                         "kwargs": btn_dict.get("kwargs", {}),
                         "expires_at": time.time() + (ttl or 3600),
                     }
+                track_inline_callback(self.kernel, token, entry)
 
                 data = token
 
@@ -1345,38 +1366,19 @@ class InlineHandlers:
             self.kernel.logger.warning(f"{self.lang['json_parsing_error']}: {e}")
             return []
 
-    def _cleanup_inline_callback_map(self, force: bool = False) -> None:
-        """Drop expired auto-generated callback tokens to keep the map small.
+    def _cleanup_inline_callback_map(self) -> int:
+        """Drop expired inline state tracked by the shared expiry service.
 
-        Args:
-            force: If True, cleanup regardless of interval. Otherwise, cleanup
-                   only if enough time has passed since last cleanup.
+        Covers callback tokens, inline_temp handlers, gallery/list sessions
+        and hikka-compat units; only entries that are already due are
+        visited.
         """
-        now = time.time()
-        if not force and (now - self._last_cleanup_time) < self._cleanup_interval:
-            return
-
-        self._last_cleanup_time = now
-        lock = getattr(self.kernel, "_inline_cb_lock", None)
-        if lock is None:
-            return
-
-        with lock:
-            cb_map = getattr(self.kernel, "inline_callback_map", None)
-            if not cb_map:
-                return
-
-            expired = [
-                key
-                for key, val in list(cb_map.items())
-                if val.get("expires_at") and val["expires_at"] < now
-            ]
-            if expired:
-                for key in expired:
-                    cb_map.pop(key, None)
-                self.kernel.logger.debug(
-                    f"[InlineHandlers] cleaned {len(expired)} expired callbacks"
-                )
+        removed = get_expiry_service(self.kernel).expire()
+        if removed:
+            self.kernel.logger.debug(
+                "[InlineHandlers] cleaned %d expired inline entries", removed
+            )
+        return removed
 
     async def _save_inline_temp_data(
         self, temp_uuid: str, query_args: str, entry: dict
@@ -1397,20 +1399,19 @@ class InlineHandlers:
         )
 
     def _cleanup_inline_temp(self, force: bool = False) -> int:
-        """Clean up expired temporary inline handlers."""
+        """Clean up temporary inline handlers.
+
+        Expired handlers are removed by the expiry service; *force* drops
+        every handler regardless of its deadline.
+        """
+        if not force:
+            return self._cleanup_inline_callback_map()
         if not hasattr(self.kernel, "_inline_temp_map"):
             return 0
 
-        now = time.time()
         removed = 0
-
         for temp_uuid in list(self.kernel._inline_temp_map.keys()):
-            entry = self.kernel._inline_temp_map.get(temp_uuid)
-            if not entry:
-                continue
-            expires_at = entry.get("expires_at")
-            if force or (expires_at and expires_at < now):
-                del self.kernel._inline_temp_map[temp_uuid]
+            if self.kernel._inline_temp_map.pop(temp_uuid, None) is not None:
                 self.kernel.cache.pop(f"inline_temp_{temp_uuid}", None)
                 removed += 1
 
@@ -1423,11 +1424,17 @@ class InlineHandlers:
     async def _start_cleanup_task(self) -> None:
         """Start background task for periodic cleanup."""
 
+        expiry = get_expiry_service(self.kernel)
+
         async def _periodic_cleanup():
             while True:
-                await asyncio.sleep(60)
-                self._cleanup_inline_callback_map(force=True)
-                self._cleanup_inline_temp(force=False)
+                # Wake up for the next deadline, but at least once a minute.
+                deadline = expiry.next_deadline()
+                delay = 60.0
+                if deadline is not None:
+                    delay = min(delay, max(1.0, deadline - time.monotonic()))
+                await asyncio.sleep(delay)
+                self._cleanup_inline_callback_map()
 
         self._cleanup_task = asyncio.create_task(_periodic_cleanup())
 
@@ -1467,6 +1474,174 @@ class InlineHandlers:
         async def callback_query_handler(event):
             await self.process_callback_query(event)
 
+    def _current_listing_stamp(self) -> tuple | None:
+        """Return the listing cache key, or None if it cannot be tracked.
+
+        Only a :class:`VersionedDict` registry reports re-registration of an
+        existing pattern; a plain dict disables listing caching.
+        """
+        handlers = self.kernel.inline_handlers
+        if not isinstance(handlers, VersionedDict):
+            return None
+        return (
+            id(handlers),
+            handlers.version,
+            len(self.kernel.loaded_modules) + len(self.kernel.system_modules),
+            getattr(self.kernel, "VERSION", None),
+            id(self.lang),
+        )
+
+    def _listing_source(self) -> list[tuple[str, str, str, str]]:
+        """Return ``(pattern, title, text, description)`` per inline handler.
+
+        Escaping and docstring lookup happen once per registry change; the
+        result is shared by every user and page.
+        """
+        stamp = self._current_listing_stamp()
+        if (
+            stamp is None
+            or stamp != self._listing_stamp
+            or self._listing_entries is None
+        ):
+            self._listing_pages.clear()
+            self._listing_stamp = stamp
+            entries = []
+            for pattern, handler in list(self.kernel.inline_handlers.items()):
+                docstring = getattr(handler, "__doc__", None) or "кoмaндa"
+                entries.append(
+                    (
+                        pattern,
+                        f"{self.lang['command']}: {pattern[:20]}",
+                        f"{self.EMOJI_TELESCOPE} <b>{self.lang['command']}:</b>"
+                        f" <code>{html.escape(pattern)}</code>\n\n",
+                        html.escape(docstring.strip()),
+                    )
+                )
+            self._listing_entries = entries
+        return self._listing_entries
+
+    @staticmethod
+    def _parse_listing_offset(raw: Any) -> int:
+        if isinstance(raw, str) and raw.isdigit():
+            return int(raw)
+        return 0
+
+    async def _listing_page(
+        self, event: Any, prefix: str, offset: int
+    ) -> tuple[list, str]:
+        """Return one page of the inline command listing and its next offset.
+
+        With an empty *prefix* the first page starts with the info article
+        and ends with a "no commands" article if nothing is registered; with
+        a prefix only matching commands are listed.  Built pages are cached
+        per ``(user, prefix, offset)`` until inline handlers change.
+        """
+        entries = self._listing_source()
+        key = (getattr(event, "sender_id", None), prefix, offset)
+        page = self._listing_pages.get(key)
+        if page is not None:
+            self._listing_pages.move_to_end(key)
+            return page
+
+        if prefix:
+            entries = [e for e in entries if e[0].lower().startswith(prefix)]
+        show_info = not prefix and offset == 0
+        size = _LISTING_PAGE_SIZE - 1 if show_info else _LISTING_PAGE_SIZE
+        chunk = entries[offset : offset + size]
+        next_offset = str(offset + size) if offset + size < len(entries) else ""
+
+        results = []
+        if show_info:
+            results.append(self._listing_info_article(event))
+        thumb_cmd = InputWebDocument(
+            url="https://x0.at/PVWT.png",
+            size=0,
+            mime_type="image/png",
+            attributes=[],
+        )
+        for pattern, title, text, description in chunk:
+            results.append(
+                event.builder.article(
+                    title,
+                    text=text,
+                    parse_mode="html",
+                    thumb=thumb_cmd,
+                    description=description,
+                    buttons=[
+                        [
+                            Button.switch_inline(
+                                f"🏄 {self.lang['execute']}: {pattern}",
+                                query=pattern,
+                                same_peer=True,
+                            )
+                        ]
+                    ],
+                )
+            )
+        if show_info and not entries:
+            results.append(self._listing_empty_article(event))
+
+        # Resolve builder coroutines once so cached pages can be re-sent.
+        for i, result in enumerate(results):
+            if inspect.isawaitable(result):
+                results[i] = await result
+
+        page = (results, next_offset)
+        if self._listing_stamp is None:
+            return page
+        self._listing_pages[key] = page
+        while len(self._listing_pages) > _LISTING_CACHE_SIZE:
+            self._listing_pages.popitem(last=False)
+        return page
+
+    def _listing_info_article(self, event: Any) -> Any:
+        modules_count = len(self.kernel.loaded_modules) + len(
+            self.kernel.system_modules
+        )
+        info_text = (
+            f"{self.EMOJI_CRYSTAL} <b>{self.lang['mcub_bot_title']}</b>\n"
+            f"<blockquote>{self.EMOJI_SHIELD} {self.lang['version']}: {self.kernel.VERSION}</blockquote>\n"
+            f"<blockquote>{self.EMOJI_TOT} {self.lang['modules']}: {modules_count}</blockquote>\n"
+        )
+        thumb = InputWebDocument(
+            url="https://x0.at/Bz-z.png",
+            size=0,
+            mime_type="image/png",
+            attributes=[],
+        )
+        return event.builder.article(
+            "MCUB Info",
+            text=info_text,
+            description=self.lang["info_description"],
+            parse_mode="html",
+            thumb=thumb,
+        )
+
+    def _listing_empty_article(self, event: Any) -> Any:
+        no_cmds_text = (
+            f"{self.EMOJI_CRYSTAL} <b>{self.lang['mcub_bot_title']}</b>\n\n"
+            f"{self.EMOJI_BLOCK} <i>{self.lang['no_commands']}</i>\n\n"
+        )
+        thumb_not_found = InputWebDocument(
+            url="https://x0.at/Eusf.png",
+            size=0,
+            mime_type="image/png",
+            attributes=[],
+        )
+        return event.builder.article(
+            self.lang["no_commands"],
+            text=no_cmds_text,
+            parse_mode="html",
+            thumb=thumb_not_found,
+        )
+
+    @staticmethod
+    async def _answer_listing(event: Any, results: list, next_offset: str) -> None:
+        if next_offset:
+            await event.answer(results, next_offset=next_offset)
+        else:
+            await event.answer(results)
+
     async def process_inline_query(self, event: Any) -> None:
         """Process an inline query event.
 
@@ -1505,93 +1680,10 @@ class InlineHandlers:
                 )
                 return
 
+            offset = self._parse_listing_offset(getattr(event, "offset", ""))
             if not query.strip():
-                results = []
-                modules_count = len(self.kernel.loaded_modules) + len(
-                    self.kernel.system_modules
-                )
-
-                info_text = (
-                    f"{self.EMOJI_CRYSTAL} <b>{self.lang['mcub_bot_title']}</b>\n"
-                    f"<blockquote>{self.EMOJI_SHIELD} {self.lang['version']}: {self.kernel.VERSION}</blockquote>\n"
-                    f"<blockquote>{self.EMOJI_TOT} {self.lang['modules']}: {modules_count}</blockquote>\n"
-                )
-
-                thumb = InputWebDocument(
-                    url="https://x0.at/Bz-z.png",
-                    size=0,
-                    mime_type="image/png",
-                    attributes=[],
-                )
-
-                results.append(
-                    event.builder.article(
-                        "MCUB Info",
-                        text=info_text,
-                        description=self.lang["info_description"],
-                        parse_mode="html",
-                        thumb=thumb,
-                    )
-                )
-
-                for pattern, handler in self.kernel.inline_handlers.items():
-                    if callable(self._inline_manager):
-                        self._inline_manager.is_allowed(event.sender_id, pattern)
-                        continue
-
-                    if len(results) >= 50:
-                        break
-                    docstring = getattr(handler, "__doc__", None) or "кoмaндa"
-                    cmd_text = (
-                        f"{self.EMOJI_TELESCOPE} <b>{self.lang['command']}:</b>"
-                        f" <code>{html.escape(pattern)}</code>\n\n"
-                    )
-                    thumb_cmd = InputWebDocument(
-                        url="https://x0.at/PVWT.png",
-                        size=0,
-                        mime_type="image/png",
-                        attributes=[],
-                    )
-                    results.append(
-                        event.builder.article(
-                            f"{self.lang['command']}: {pattern[:20]}",
-                            text=cmd_text,
-                            parse_mode="html",
-                            thumb=thumb_cmd,
-                            description=html.escape(docstring.strip()),
-                            buttons=[
-                                [
-                                    Button.switch_inline(
-                                        f"🏄 {self.lang['execute']}: {pattern}",
-                                        query=pattern,
-                                        same_peer=True,
-                                    )
-                                ]
-                            ],
-                        )
-                    )
-
-                if len(results) == 1:
-                    no_cmds_text = (
-                        f"{self.EMOJI_CRYSTAL} <b>{self.lang['mcub_bot_title']}</b>\n\n"
-                        f"{self.EMOJI_BLOCK} <i>{self.lang['no_commands']}</i>\n\n"
-                    )
-                    thumb_not_found = InputWebDocument(
-                        url="https://x0.at/Eusf.png",
-                        size=0,
-                        mime_type="image/png",
-                        attributes=[],
-                    )
-                    results.append(
-                        event.builder.article(
-                            self.lang["no_commands"],
-                            text=no_cmds_text,
-                            parse_mode="html",
-                            thumb=thumb_not_found,
-                        )
-                    )
-
-                await event.answer(results)
+                results, next_offset = await self._listing_page(event, "", offset)
+                await self._answer_listing(event, results, next_offset)
                 return
 
             query_cmd = query.lower().split()[0] if query.strip() else ""
@@ -1729,6 +1821,15 @@ class InlineHandlers:
                     )
                 return
 
+            # Unknown single word: offer the matching part of the command list.
+            if query_cmd and not query_args:
+                results, next_offset = await self._listing_page(
+                    event, query_cmd, offset
+                )
+                if results:
+                    await self._answer_listing(event, results, next_offset)
+                    return
+
             try:
                 await event.answer()
             except Exception as answer_error:
@@ -1804,7 +1905,6 @@ class InlineHandlers:
                 return
 
             # Check auto-generated callback tokens first for allow_all
-            self._cleanup_inline_callback_map()
             with self._cb_lock:
                 cb_map = getattr(self.kernel, "inline_callback_map", None) or {}
 
@@ -1869,11 +1969,10 @@ class InlineHandlers:
                 elif entry.get("kwargs", {}).get("url"):
                     return
 
-            # 3. Legacy prefix/pattern handlers
-            for pattern, handler in list(self.kernel.callback_handlers.items()):
-                p_str = pattern.decode() if isinstance(pattern, bytes) else str(pattern)
-                if data_str.startswith(p_str):
-                    await handler(event)
+            # 3. Legacy prefix/pattern handlers (longest registered prefix wins)
+            route = get_callback_router(self.kernel).match(event.data)
+            if route is not None:
+                await route.handler(event)
 
         except Exception as e:
             error_traceback = "".join(
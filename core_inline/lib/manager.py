@@ -3,13 +3,135 @@
 
 import json
 
+_EMPTY: frozenset = frozenset()
+
+
+def _user_set(value) -> frozenset:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        try:
+            return frozenset(value)
+        except TypeError:
+            return frozenset(v for v in value if isinstance(v, (int, str)))
+    return _EMPTY
+
+
+def _loads(raw):
+    if not raw:
+        return None
+    try:
+        return json.loads(raw if isinstance(raw, str) else str(raw))
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return None
+
+
+class PermissionIndex:
+    """Inline permissions materialized into frozensets.
+
+    Attributes:
+        global_users: Users allowed for every inline command.
+        commands: ``command -> users`` allowed for that command only.
+        denied: ``command -> users`` denied for that command.
+        trusted: Users from the ``trusted`` module.
+    """
+
+    __slots__ = ("commands", "denied", "global_users", "trusted")
+
+    def __init__(self, allowed=None, trusted=None) -> None:
+        allowed = allowed if isinstance(allowed, dict) else {}
+        denied = allowed.get("denied")
+        self.global_users = _user_set(allowed.get("global"))
+        self.commands = {
+            key: _user_set(users)
+            for key, users in allowed.items()
+            if key not in ("global", "denied")
+        }
+        self.denied = (
+            {key: _user_set(users) for key, users in denied.items()}
+            if isinstance(denied, dict)
+            else {}
+        )
+        self.trusted = _user_set(trusted)
+
+    def is_allowed(self, user_id, command: str | None = None) -> bool:
+        if command and user_id in self.denied.get(command, _EMPTY):
+            return False
+        if user_id in self.global_users:
+            return True
+        if command and user_id in self.commands.get(command, _EMPTY):
+            return True
+        return user_id in self.trusted
+
+
+class _PermissionCache:
+    """Per-kernel holder shared by every :class:`InlineManager` instance."""
+
+    __slots__ = ("generation", "index")
+
+    # (module, key) rows the index is built from.
+    SOURCES = frozenset({("inline_permissions", "allowed_users"), ("trusted", "users")})
+
+    def __init__(self) -> None:
+        self.index: PermissionIndex | None = None
+        self.generation = 0
+
+    def invalidate(self) -> None:
+        self.index = None
+        self.generation += 1
+
+    def observe_write(self, module: str, key: str, value) -> None:
+        """``DatabaseManager`` write listener: drop the index on source writes."""
+        if (module, key) in self.SOURCES:
+            self.invalidate()
+
 
 class InlineManager:
     MODULE = "inline_permissions"
+    _CACHE_ATTR = "_inline_permission_cache"
 
     def __init__(self, kernel):
         self.kernel = kernel
 
+    def _cache(self) -> _PermissionCache:
+        cache = getattr(self.kernel, "__dict__", {}).get(self._CACHE_ATTR)
+        if not isinstance(cache, _PermissionCache):
+            cache = _PermissionCache()
+            setattr(self.kernel, self._CACHE_ATTR, cache)
+        return cache
+
+    def invalidate(self) -> None:
+        """Drop the cached permission index; the next check reloads it.
+
+        Writes through ``kernel.db_manager`` invalidate it on their own.
+        """
+        self._cache().invalidate()
+
+    async def get_index(self) -> PermissionIndex:
+        """Return the permission index, loading it from the database once."""
+        cache = self._cache()
+        if cache.index is not None:
+            return cache.index
+        add_write_listener = getattr(
+            getattr(self.kernel, "db_manager", None), "add_write_listener", None
+        )
+        if callable(add_write_listener):
+            add_write_listener(cache.observe_write)
+        generation = cache.generation
+        allowed = trusted = None
+        try:
+            allowed = _loads(await self.kernel.db_get(self.MODULE, "allowed_users"))
+        except Exception:
+            pass
+        # Also check trusted users list (from modules/trusted.py)
+        try:
+            trusted = _loads(await self.kernel.db_get("trusted", "users"))
+        except Exception:
+            pass
+        index = PermissionIndex(allowed, trusted)
+        # Don't publish an index that a concurrent write already invalidated.
+        if cache.generation == generation:
+            cache.index = index
+        return index
+
     async def is_admin(self, user_id: int) -> bool:
         admin_id = getattr(self.kernel, "ADMIN_ID", None)
         if admin_id is None:
@@ -22,36 +144,7 @@ class InlineManager:
     async def is_allowed(self, user_id: int, command: str | None = None) -> bool:
         if await self.is_admin(user_id):
             return True
-
-        # Check inline_permissions module
-        try:
-            all_users = await self.kernel.db_get(self.MODULE, "allowed_users")
-            if all_users:
-                allowed = json.loads(all_users)
-                denied = allowed.get("denied", {})
-                if command and isinstance(denied, dict):
-                    if user_id in denied.get(command, []):
-                        return False
-                if user_id in allowed.get("global", []):
-                    return True
-                if command and user_id in allowed.get(command, []):
-                    return True
-        except (json.JSONDecodeError, TypeError):
-            pass
-
-        # Also check trusted users list (from modules/trusted.py)
-        try:
-            data = await self.kernel.db_get("trusted", "users")
-            if data:
-                trusted = (
-                    json.loads(data) if isinstance(data, str) else json.loads(str(data))
-                )
-                if user_id in trusted:
-                    return True
-        except Exception:
-            pass
-
-        return False
+        return (await self.get_index()).is_allowed(user_id, command)
 
     async def allow_user(self, user_id: int, command: str | None = None) -> bool:
         try:
@@ -80,6 +173,7 @@ class InlineManager:
                 allowed[target].append(user_id)
 
             await self.kernel.db_set(self.MODULE, "allowed_users", json.dumps(allowed))
+            self.invalidate()
             return True
         except Exception as e:
             self.kernel.logger.error(f"InlineManager allow_user error: {e}")
@@ -109,6 +203,7 @@ class InlineManager:
             if target in allowed and user_id in allowed[target]:
                 allowed[target].remove(user_id)
             await self.kernel.db_set(self.MODULE, "allowed_users", json.dumps(allowed))
+            self.invalidate()
             return True
         except Exception as e:
             self.kernel.logger.error(f"InlineManager deny_user error: {e}")
@@ -129,6 +224,7 @@ class InlineManager:
     async def clear_all(self) -> bool:
         try:
             await self.kernel.db_delete(self.MODULE, "allowed_users")
+            self.invalidate()
             return True
         except Exception as e:
             self.kernel.logger.error(f"InlineManager clear_all error: {e}")
@@ -190,7 +190,7 @@ class Loader(ModuleBase):
             inline_owners["catalog"] = self.name
 
         self.kernel.register_callback_handler(
-            "catalog_", self._catalog_callback_handler
+            "catalog_", self._catalog_callback_handler, owner=self.name
         )
 
     def get_config(self):
@@ -5,9 +5,10 @@ from __future__ import annotations
 
 # requires:
 # author: @Hairpin00
-# version: 3.0.0
+# version: 3.1.0
 # description: Terminal commands with real-time output streaming, parallel slots and stdin input
 import asyncio
+import codecs
 import html
 import os
 import re
@@ -24,6 +25,7 @@ from core.lib.loader.module_config import (
     ModuleConfig,
     String,
 )
+from core.lib.utils.pipe_stream import PipeStream
 from utils.strings import Strings
 
 CUSTOM_EMOJI = {
@@ -58,6 +60,9 @@ CUSTOM_EMOJI = {
 
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*[mABCDEFGHJKSTfhilmnprsu]")
 
+# Bytes read from a piped process at a time when its output is streamed.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def _filter_proxychains_output(text: str) -> str:
     """Remove lines containing [proxychains] markers from output."""
@@ -117,6 +122,27 @@ def _apply_output_filters(text: str, cfg) -> str:
     return text
 
 
+def _filter_output_line(line: str, cfg) -> str | None:
+    """Apply the output filters to one line; None means the line is dropped.
+
+    Line by line equivalent of ``_apply_output_filters`` for streamed output.
+    """
+    if cfg.get("filter_ansi", True):
+        line = ANSI_RE.sub("", line)
+    if cfg.get("filter_proxychains", True) and "[proxychains]" in line:
+        return None
+    if cfg.get("strip_trailing_whitespace"):
+        line = line.rstrip(" \t")
+    pattern = cfg.get("filter_pattern", "")
+    if pattern:
+        try:
+            if re.search(pattern, line):
+                return None
+        except re.error:
+            pass
+    return line
+
+
 def _get_shell_path(cfg) -> str:
     """Return effective shell path: custom_shell when shell=custom, else shell name."""
     shell = cfg.get("shell") or "bash"
@@ -584,6 +610,75 @@ def register(kernel):
                 await kernel.handle_error(e, message="Terminal piped command failed")
                 return f"Error: {e!s}"
 
+        async def stream_command_piped(self, command, quiet=False) -> PipeStream:
+            """Run a command and stream its filtered output (pipe mode).
+
+            stdout is handed downstream as the process writes it, so a
+            consumer such as ``head`` can stop early; closing the stream
+            kills the process.  stderr is collected alongside and appended
+            at the end unless *quiet*, as in ``run_command_piped``.
+            """
+            cfg_shell = _get_config()
+            try:
+                process = await self._build_process(
+                    command, cfg_shell, use_setsid=False
+                )
+            except Exception as e:
+                logger.error(f"terminal: piped command error: {e}")
+                await kernel.handle_error(e, message="Terminal piped command failed")
+                return PipeStream.from_text(f"Error: {e!s}")
+
+            if cfg_shell.get("stdin_eof") and process.stdin:
+                process.stdin.close()
+
+            timeout = cfg_shell.get("timeout") or 0
+            deadline = time.monotonic() + timeout if timeout > 0 else None
+            stderr_task = asyncio.ensure_future(process.stderr.read())
+
+            async def _chunks():
+                nonlocal deadline
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+                try:
+                    while True:
+                        read = process.stdout.read(_STREAM_CHUNK_SIZE)
+                        if deadline is None:
+                            data = await read
+                        else:
+                            try:
+                                data = await asyncio.wait_for(
+                                    read, max(deadline - time.monotonic(), 0)
+                                )
+                            except TimeoutError:
+                                # Timeout expired - kill and keep what is left.
+                                process.kill()
+                                deadline = None
+                                continue
+                        if not data:
+                            break
+                        yield decoder.decode(data)
+                    yield decoder.decode(b"", final=True)
+                    stderr = await stderr_task
+                    if not quiet:
+                        yield stderr.decode("utf-8", errors="ignore")
+                finally:
+                    stderr_task.cancel()
+                    if process.returncode is None:
+                        try:
+                            process.kill()
+                        except ProcessLookupError:
+                            pass
+                        await process.wait()
+
+            raw = PipeStream(_chunks())
+
+            async def _filtered():
+                async for line in raw.lines("\n"):
+                    line = _filter_output_line(line, cfg_shell)
+                    if line is not None:
+                        yield line
+
+            return PipeStream.from_lines(_filtered(), on_close=raw.aclose)
+
         async def send_stdin(
             self,
             chat_id,
@@ -926,7 +1021,9 @@ def register(kernel):
             )
             return
 
-        if piped:
+        if piped and getattr(event, "pipe_stream_ok", False):
+            event.pipe_output = await terminal.stream_command_piped(cmd, quiet)
+        elif piped:
             output = await terminal.run_command_piped(
                 event.chat_id, cmd, event.id, quiet
             )
@@ -226,6 +226,7 @@ def register(kernel: Kernel_type) -> None:
 
     async def save_trusted_list(users):
         await kernel.db_set("trusted", "users", json.dumps(users))
+        inline_manager.invalidate()
 
     async def get_nonick_list():
         data = await kernel.db_get("trusted", "nonick")
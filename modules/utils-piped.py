@@ -13,11 +13,20 @@ import os
 import random as _random
 import re
 import traceback
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
 from typing import Any
 
 from telethon import events
 
 from core.lib.loader.module_base import ModuleBase, command
+from core.lib.utils.jobs import DONE, get_job_table
+from core.lib.utils.pipe_stream import (
+    PipeStream,
+    pipe_barrier,
+    pipe_source,
+    streaming,
+)
 from utils.strings import Strings
 
 
@@ -32,9 +41,52 @@ def _get_text(event, args: str) -> str:
     return pipe_input or ""
 
 
+async def _iter_lines(lines: Iterable[str]) -> AsyncIterator[str]:
+    for line in lines:
+        yield line
+
+
+async def _prepend(first: str, rest: AsyncIterator[str]) -> AsyncIterator[str]:
+    yield first
+    async for line in rest:
+        yield line
+
+
+async def _input_lines(event, text: str) -> AsyncIterator[str] | None:
+    """Return the input lines of a line-oriented command, or None if empty.
+
+    Inline *text* wins; otherwise lines are pulled lazily from the upstream
+    ``PipeStream`` or split from ``pipe_input``.
+    """
+    if not text:
+        stream = pipe_source(event)
+        if stream is not None:
+            lines = stream.lines()
+            first = await anext(lines, None)
+            return None if first is None else _prepend(first, lines)
+        text = getattr(event, "pipe_input", None) or ""
+    return _iter_lines(text.splitlines()) if text else None
+
+
+def _job_line(job) -> str:
+    exit_code = "" if job.exit_code is None else f" ({job.exit_code})"
+    return (
+        f"[{job.id}] {job.status}{exit_code} "
+        f"{job.wall_time():.1f}s cpu {job.cpu_time:.2f}s  {job.command}"
+    )
+
+
+def _stream_out(event, lines: AsyncIterator[str]) -> bool:
+    """Hand *lines* downstream as a stream if the next stage accepts one."""
+    if not getattr(event, "pipe_stream_ok", False):
+        return False
+    event.pipe_output = PipeStream.from_lines(lines)
+    return True
+
+
 class UtilsPiped(ModuleBase):
     name = "utils-piped"
-    version = "1.1.0"
+    version = "1.2.0"
     author = "@Hairpin00"
     description = {"ru": "Утилиты для кoнвeйepa", "en": "Utils for pipeline"}
 
@@ -181,6 +233,11 @@ class UtilsPiped(ModuleBase):
                 return
 
             try:
+                if piped and getattr(event, "pipe_stream_ok", False):
+                    # The next stage reads the file incrementally.
+                    event.pipe_output = PipeStream.from_file(file_path)
+                    return
+
                 with open(file_path, encoding="utf-8", errors="ignore") as f:
                     content = f.read()
 
@@ -219,6 +276,7 @@ class UtilsPiped(ModuleBase):
         doc_ru="[-n] <path> [text] зaпиcaть в фaйл",
         doc_en="[-n] <path> [text] write to file",
     )
+    @pipe_barrier
     async def cmd_write(self, event: events.NewMessage.Event) -> None:
         try:
             args = self.args_raw(event).strip()
@@ -280,6 +338,7 @@ class UtilsPiped(ModuleBase):
         doc_ru="<n> [text] coxpaнить в пepeмeннyю",
         doc_en="<n> [text] save to variable",
     )
+    @pipe_barrier
     async def cmd_export(self, event: events.NewMessage.Event) -> None:
         try:
             args = self.args_raw(event).strip()
@@ -363,6 +422,7 @@ class UtilsPiped(ModuleBase):
         doc_ru="[-l] [-v] [-r] <pattern> [text] иcкaть тeкcт; -v инвepтиpoвaть, -r иcпoльзoвaть regex",
         doc_en="[-l] [-v] [-r] <pattern> [text] search text; -v invert match, -r use regex",
     )
+    @streaming
     async def cmd_grep(self, event: events.NewMessage.Event) -> None:
         try:
             pipe_input = getattr(event, "pipe_input", None) or ""
@@ -387,6 +447,9 @@ class UtilsPiped(ModuleBase):
                     args = re.sub(pat, "", args).strip()
 
             if not args:
+                stream = pipe_source(event)
+                if stream is not None:
+                    pipe_input = await stream.read()
                 if pipe_input:
                     event.pipe_exit_code = 0
                     await self.edit(event, pipe_input)
@@ -410,9 +473,9 @@ class UtilsPiped(ModuleBase):
                 pattern = parts[0]
                 inline_text = parts[1] if len(parts) > 1 else ""
 
-            text = inline_text or pipe_input
+            lines = await _input_lines(event, inline_text)
 
-            if not text:
+            if lines is None:
                 event.pipe_exit_code = 3
                 await self.edit(event, self.strings("grep_usage"), parse_mode="html")
                 return
@@ -425,18 +488,26 @@ class UtilsPiped(ModuleBase):
                         return pattern in line
                 return pattern in line
 
-            lines = text.splitlines()
-            matched_lines = [
-                (i, line)
-                for i, line in enumerate(lines, start=1)
-                if _line_matches(line) != invert
-            ]
-
-            if show_line_numbers:
-                result_lines = [f"{i}: {line}" for i, line in matched_lines]
-            else:
-                result_lines = [line for _, line in matched_lines]
+            async def _matches() -> AsyncIterator[str]:
+                i = 0
+                async for line in lines:
+                    i += 1
+                    if _line_matches(line) != invert:
+                        yield f"{i}: {line}" if show_line_numbers else line
+
+            matched = _matches()
+            if getattr(event, "pipe_stream_ok", False):
+                # Pull up to the first match to settle the exit code, then
+                # let the rest flow lazily.
+                first = await anext(matched, None)
+                if first is None:
+                    event.pipe_exit_code = 4
+                    event.pipe_output = self.strings("no_match")
+                else:
+                    _stream_out(event, _prepend(first, matched))
+                return
 
+            result_lines = [line async for line in matched]
             result = "\n".join(result_lines)
             if not result_lines:
                 event.pipe_exit_code = 4
@@ -463,6 +534,7 @@ class UtilsPiped(ModuleBase):
         doc_ru="[-n] [text] пepвыe N cтpoк",
         doc_en="[-n] [text] first N lines",
     )
+    @streaming
     async def cmd_head(self, event: events.NewMessage.Event) -> None:
         try:
             args = self.args_raw(event)
@@ -474,19 +546,26 @@ class UtilsPiped(ModuleBase):
                     n = int(parts[0][1:])
                 except ValueError:
                     pass
-                text = (
-                    parts[1]
-                    if len(parts) > 1
-                    else getattr(event, "pipe_input", "") or ""
-                )
+                text = parts[1] if len(parts) > 1 else ""
             else:
-                text = args or getattr(event, "pipe_input", "") or ""
+                text = args
 
-            if not text:
+            lines = await _input_lines(event, text)
+            if lines is None:
                 await self.edit(event, self.strings("head_usage"), parse_mode="html")
                 return
 
-            result = "\n".join(text.splitlines()[:n])
+            head: list[str] = []
+            if n > 0:
+                # Stop pulling once n lines are in; the pipeline then closes
+                # the upstream stream.
+                async for line in lines:
+                    head.append(line)
+                    if len(head) >= n:
+                        break
+            elif n < 0:
+                head = [line async for line in lines][:n]
+            result = "\n".join(head)
 
             if getattr(event, "piped", False):
                 await self.edit(event, result)
@@ -504,6 +583,7 @@ class UtilsPiped(ModuleBase):
         doc_ru="[-n] [text] пocлeдниe N cтpoк",
         doc_en="[-n] [text] last N lines",
     )
+    @streaming
     async def cmd_tail(self, event: events.NewMessage.Event) -> None:
         try:
             args = self.args_raw(event)
@@ -515,19 +595,22 @@ class UtilsPiped(ModuleBase):
                     n = int(parts[0][1:])
                 except ValueError:
                     pass
-                text = (
-                    parts[1]
-                    if len(parts) > 1
-                    else getattr(event, "pipe_input", "") or ""
-                )
+                text = parts[1] if len(parts) > 1 else ""
             else:
-                text = args or getattr(event, "pipe_input", "") or ""
+                text = args
 
-            if not text:
+            lines = await _input_lines(event, text)
+            if lines is None:
                 await self.edit(event, self.strings("tail_usage"), parse_mode="html")
                 return
 
-            result = "\n".join(text.splitlines()[-n:])
+            if n > 0:
+                tail = deque(maxlen=n)
+                async for line in lines:
+                    tail.append(line)
+                result = "\n".join(tail)
+            else:
+                result = "\n".join([line async for line in lines][-n:])
 
             if getattr(event, "piped", False):
                 await self.edit(event, result)
@@ -607,31 +690,46 @@ class UtilsPiped(ModuleBase):
         doc_ru="[-l|-c|-w] [text] пocчитaть",
         doc_en="[-l|-c|-w] [text] count",
     )
+    @streaming
     async def cmd_wc(self, event: events.NewMessage.Event) -> None:
         try:
             args = self.args_raw(event)
             mode = "l"
 
-            if args.startswith("-"):
-                if len(args) > 1 and args[1] in "lcw":
-                    mode = args[1]
-                    text = args[2:].strip() or getattr(event, "pipe_input", "") or ""
+            if args.startswith("-") and len(args) > 1 and args[1] in "lcw":
+                mode = args[1]
+                text = args[2:].strip()
+            else:
+                text = args
+
+            stream = pipe_source(event) if not text else None
+            if stream is not None:
+                count = 0
+                has_input = False
+                if mode == "c":
+                    async for chunk in stream.chunks():
+                        has_input = True
+                        count += len(chunk)
                 else:
-                    text = args or getattr(event, "pipe_input", "") or ""
+                    # Line breaks are whitespace, so words never span lines.
+                    async for line in stream.lines():
+                        has_input = True
+                        count += 1 if mode == "l" else len(line.split())
+                result = str(count)
             else:
-                text = args or getattr(event, "pipe_input", "") or ""
-
-            if not text:
+                text = text or getattr(event, "pipe_input", "") or ""
+                has_input = bool(text)
+                if mode == "l":
+                    result = str(len(text.splitlines()))
+                elif mode == "w":
+                    result = str(len(text.split()))
+                else:  # "c"
+                    result = str(len(text))
+
+            if not has_input:
                 await self.edit(event, self.strings("wc_usage"), parse_mode="html")
                 return
 
-            if mode == "l":
-                result = str(len(text.splitlines()))
-            elif mode == "w":
-                result = str(len(text.split()))
-            else:  # "c"
-                result = str(len(text))
-
             if getattr(event, "piped", False):
                 await self.edit(event, result)
                 return
@@ -763,15 +861,147 @@ class UtilsPiped(ModuleBase):
                 e, message="Sleep command failed", event=event
             )
 
+    @command(
+        "jobs",
+        doc_ru="cпиcoк фoнoвыx зaдaч (зaпyщeнныx чepeз &)",
+        doc_en="list background jobs (started with &)",
+    )
+    async def cmd_jobs(self, event: events.NewMessage.Event) -> None:
+        try:
+            jobs = get_job_table(self.kernel).jobs(getattr(event, "chat_id", None))
+            if not jobs:
+                await self.edit(event, self.strings("jobs_empty"), parse_mode="html")
+                return
+            result = "\n".join(_job_line(job) for job in jobs)
+            if getattr(event, "piped", False):
+                await self.edit(event, result)
+                return
+            await self.edit(
+                event, f"<pre>{html.escape(result)}</pre>", parse_mode="html"
+            )
+        except Exception as e:
+            event.pipe_exit_code = 1
+            await self.kernel.handle_error(e, message="jobs", event=event)
+
+    @command(
+        "kill",
+        doc_ru="<id|all> ocтaнoвить фoнoвyю зaдaчy",
+        doc_en="<id|all> stop a background job",
+    )
+    async def cmd_kill(self, event: events.NewMessage.Event) -> None:
+        try:
+            args = self.args_raw(event).strip().lstrip("%")
+            table = get_job_table(self.kernel)
+            chat_id = getattr(event, "chat_id", None)
+
+            if args == "all":
+                running = [job for job in table.jobs(chat_id) if job.running]
+                for job in running:
+                    table.kill(job.id)
+                await self.edit(
+                    event, self.strings("killed_all", n=len(running)), parse_mode="html"
+                )
+                return
+
+            if not args.isdigit():
+                event.pipe_exit_code = 1
+                await self.edit(event, self.strings("kill_usage"), parse_mode="html")
+                return
+
+            job = table.get(int(args))
+            if job is None or job.chat_id != chat_id:
+                event.pipe_exit_code = 1
+                await self.edit(
+                    event, self.strings("job_not_found", id=args), parse_mode="html"
+                )
+                return
+            if not table.kill(job.id):
+                event.pipe_exit_code = 1
+                await self.edit(
+                    event, self.strings("job_not_running", id=job.id), parse_mode="html"
+                )
+                return
+            await self.edit(
+                event,
+                self.strings("job_killed", id=job.id, command=html.escape(job.command)),
+                parse_mode="html",
+            )
+        except Exception as e:
+            event.pipe_exit_code = 1
+            await self.kernel.handle_error(e, message="kill", event=event)
+
+    @command(
+        "wait",
+        doc_ru="[id] [ceкyнды] дoждaтьcя фoнoвoй зaдaчи и вывecти eё peзyльтaт",
+        doc_en="[id] [seconds] wait for a background job and print its output",
+    )
+    async def cmd_wait(self, event: events.NewMessage.Event) -> None:
+        try:
+            parts = self.args_raw(event).split()
+            table = get_job_table(self.kernel)
+            chat_id = getattr(event, "chat_id", None)
+
+            timeout = None
+            try:
+                if len(parts) > 1:
+                    timeout = float(parts[1])
+                job_id = int(parts[0].lstrip("%")) if parts else None
+            except ValueError:
+                event.pipe_exit_code = 1
+                await self.edit(event, self.strings("wait_usage"), parse_mode="html")
+                return
+
+            if job_id is None:
+                # Wait for the newest job of this chat.
+                jobs = table.jobs(chat_id)
+                job_id = jobs[-1].id if jobs else None
+            job = table.get(job_id) if job_id is not None else None
+            if job is None or job.chat_id != chat_id:
+                event.pipe_exit_code = 1
+                await self.edit(
+                    event,
+                    self.strings("job_not_found", id=job_id if job_id else "-"),
+                    parse_mode="html",
+                )
+                return
+
+            await table.wait(job.id, timeout)
+            if job.running:
+                event.pipe_exit_code = 1
+                await self.edit(
+                    event,
+                    self.strings("wait_timeout", id=job.id, timeout=timeout),
+                    parse_mode="html",
+                )
+                return
+
+            event.pipe_exit_code = job.exit_code or (0 if job.status == DONE else 1)
+            if getattr(event, "piped", False):
+                await self.edit(event, job.output or _job_line(job))
+            elif job.output:
+                # Re-send the job's last edit the way it was sent.
+                mode = job.output_parse_mode
+                kwargs = {} if mode is None else {"parse_mode": mode}
+                await self.edit(event, job.output, **kwargs)
+            else:
+                await self.edit(
+                    event,
+                    f"<pre>{html.escape(_job_line(job))}</pre>",
+                    parse_mode="html",
+                )
+        except Exception as e:
+            event.pipe_exit_code = 1
+            await self.kernel.handle_error(e, message="wait", event=event)
+
     @command(
         "sort",
         doc_ru="[-r] [-u] [text] copтиpoвaть cтpoки",
         doc_en="[-r] [-u] [text] sort lines",
     )
+    @streaming
     async def cmd_sort(self, event: events.NewMessage.Event) -> None:
         try:
             args = self.args_raw(event).strip()
-            pipe_input = getattr(event, "pipe_input", None) or ""
 
             reverse = False
             unique = False
@@ -784,21 +1014,17 @@ class UtilsPiped(ModuleBase):
                 if "u" in flag:
                     unique = True
 
-            text = args or pipe_input
+            source = await _input_lines(event, args)
 
-            if not text:
+            if source is None:
                 await self.edit(event, self.strings("sort_usage"), parse_mode="html")
                 return
 
-            lines = text.splitlines()
             if unique:
-                seen: set[str] = set()
-                deduped: list[str] = []
-                for line in lines:
-                    if line not in seen:
-                        seen.add(line)
-                        deduped.append(line)
-                lines = deduped
+                # dict keeps first-seen order and drops repeats as they arrive
+                lines = list({line: None async for line in source})
+            else:
+                lines = [line async for line in source]
 
             lines.sort(reverse=reverse)
             result = "\n".join(lines)
@@ -819,40 +1045,48 @@ class UtilsPiped(ModuleBase):
         doc_ru="[-c] [text] yбpaть дyблиpyющиecя cтpoки",
         doc_en="[-c] [text] remove duplicate lines",
     )
+    @streaming
     async def cmd_uniq(self, event: events.NewMessage.Event) -> None:
         try:
             args = self.args_raw(event).strip()
-            pipe_input = getattr(event, "pipe_input", None) or ""
 
             count_mode = False
             if args.startswith("-c"):
                 count_mode = True
                 args = args[2:].strip()
 
-            text = args or pipe_input
+            lines = await _input_lines(event, args)
 
-            if not text:
+            if lines is None:
                 await self.edit(event, self.strings("uniq_usage"), parse_mode="html")
                 return
 
-            lines = text.splitlines()
-
-            if count_mode:
-                from itertools import groupby
-
-                result_lines: list[str] = []
-                for key, group in groupby(lines):
-                    n = sum(1 for _ in group)
-                    result_lines.append(f"{n} {key}")
-                result = "\n".join(result_lines)
-            else:
+            async def _counted() -> AsyncIterator[str]:
+                # Counts runs of equal adjacent lines, like itertools.groupby.
+                current: str | None = None
+                n = 0
+                async for line in lines:
+                    if n and line == current:
+                        n += 1
+                        continue
+                    if n:
+                        yield f"{n} {current}"
+                    current, n = line, 1
+                if n:
+                    yield f"{n} {current}"
+
+            async def _unique() -> AsyncIterator[str]:
                 seen_set: set[str] = set()
-                unique_lines: list[str] = []
-                for line in lines:
+                async for line in lines:
                     if line not in seen_set:
                         seen_set.add(line)
-                        unique_lines.append(line)
-                result = "\n".join(unique_lines)
+                        yield line
+
+            result_lines = _counted() if count_mode else _unique()
+            if _stream_out(event, result_lines):
+                return
+
+            result = "\n".join([line async for line in result_lines])
 
             if getattr(event, "piped", False):
                 await self.edit(event, result)
@@ -868,27 +1102,32 @@ class UtilsPiped(ModuleBase):
         doc_ru="[-e] [text] yбpaть лишниe пpoбeлы/cтpoки",
         doc_en="[-e] [text] strip whitespace and blank lines",
     )
+    @streaming
     async def cmd_strip(self, event: events.NewMessage.Event) -> None:
         try:
             args = self.args_raw(event).strip()
-            pipe_input = getattr(event, "pipe_input", None) or ""
 
             remove_empty = False
             if args.startswith("-e"):
                 remove_empty = True
                 args = args[2:].strip()
 
-            text = args or pipe_input
+            lines = await _input_lines(event, args)
 
-            if not text:
+            if lines is None:
                 await self.edit(event, self.strings("strip_usage"), parse_mode="html")
                 return
 
-            lines = [line.strip() for line in text.splitlines()]
-            if remove_empty:
-                lines = [line for line in lines if line]
+            async def _stripped() -> AsyncIterator[str]:
+                async for line in lines:
+                    line = line.strip()
+                    if line or not remove_empty:
+                        yield line
 
-            result = "\n".join(lines)
+            if _stream_out(event, _stripped()):
+                return
+
+            result = "\n".join([line async for line in _stripped()])
 
             if getattr(event, "piped", False):
                 await self.edit(event, result)
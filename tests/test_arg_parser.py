@@ -76,6 +76,48 @@ class TestPipelineParser:
         assert parser.segments[1].operator == "|>"
         assert parser.segments[1].command == "8.8.8.8"
 
+    def test_operators_and_exit_code(self):
+        parser = PipelineParser(".a | .b && .c & .d ||[2] .e")
+
+        assert [(seg.operator, seg.command) for seg in parser.segments] == [
+            (None, ".a"),
+            ("|", ".b"),
+            ("&&", ".c"),
+            ("&", ".d"),
+            ("||", ".e"),
+        ]
+        assert parser.segments[4].exit_code == 2
+
+    def test_quotes_and_escapes_are_literal(self):
+        parser = PipelineParser(".echo 'a | b' \\&& \"c && d\" | .grep x\\|y")
+
+        assert [seg.command for seg in parser.segments] == [
+            ".echo 'a | b' && \"c && d\"",
+            ".grep x|y",
+        ]
+
+    def test_unterminated_quote_swallows_rest(self):
+        parser = PipelineParser(".echo 'a | .grep b")
+
+        assert parser.is_simple()
+        assert parser.segments[0].command == ".echo 'a | .grep b"
+
+    def test_cached_parse_returns_fresh_segments(self):
+        first = PipelineParser(".man | .grep foo")
+        first.segments[0].command = "changed"
+        second = PipelineParser(".man | .grep foo")
+
+        assert second.segments[0].command == ".man"
+        assert second.segments[1].operator == "|"
+
+    def test_large_input_single_pass(self):
+        body = "word " * 200_000
+        parser = PipelineParser(f".echo {body}| .grep x")
+
+        assert len(parser.segments) == 2
+        assert parser.segments[0].command == f".echo {body}".strip()
+        assert parser.segments[1].command == ".grep x"
+
 
 class TestArgumentParserFlags:
     """Test flags and kwargs parsing"""
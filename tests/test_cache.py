@@ -198,12 +198,9 @@ class TestTTLCache:
         assert cache.get("same") == 199
         assert len(cache._expiry_heap) <= max(cache.max_size * 2, cache.size() * 2, 64)
 
-    def test_equal_expiry_with_incomparable_keys(self, monkeypatch):
+    def test_equal_expiry_with_incomparable_keys(self):
         """Heap ordering must not compare arbitrary cache keys directly."""
-        import core.lib.time.cache as cache_mod
-
-        monkeypatch.setattr(cache_mod.time, "time", lambda: 1000.0)
-        cache = TTLCache(max_size=10, ttl=60)
+        cache = TTLCache(max_size=10, ttl=60, clock=lambda: 1000.0)
 
         object_key = object()
 
@@ -233,3 +230,141 @@ class TestTTLCache:
         cache.clear()
 
         assert any("[TTLCache]" in record.message for record in caplog.records)
+
+
+class TestTTLCacheFastPath:
+    """Test the monotonic, single-heap-node TTLCache internals"""
+
+    def _clocked(self, **kwargs):
+        now = [1000.0]
+        cache = TTLCache(clock=lambda: now[0], **kwargs)
+        return cache, now
+
+    def test_overwrite_reuses_heap_node(self):
+        cache, now = self._clocked(max_size=10, ttl=60)
+        for i in range(100):
+            cache.set("same", i)
+            now[0] += 1
+
+        assert len(cache._expiry_heap) == 1
+        now[0] += 59
+        assert cache.get("same") == 99
+
+    def test_later_deadline_survives_sweep(self):
+        cache, now = self._clocked(max_size=2, ttl=10)
+        cache.set("a", 1)
+        now[0] += 8
+        cache.set("a", 2)
+        now[0] += 5
+        cache._cleanup_expired()
+
+        assert cache.get("a") == 2
+        assert len(cache._expiry_heap) == 1
+
+    def test_shorter_ttl_on_overwrite_expires_early(self):
+        cache, now = self._clocked(max_size=2, ttl=600)
+        cache.set("a", 1)
+        cache.set("a", 2, ttl=5)
+        now[0] += 6
+        cache._cleanup_expired()
+
+        assert cache.size() == 0
+        assert cache.expired == 1
+
+    def test_expired_slot_reclaimed_before_lru_eviction(self):
+        cache, now = self._clocked(max_size=2, ttl=600)
+        cache.set("old", 1, ttl=1)
+        cache.set("keep", 2)
+        now[0] += 2
+        cache.set("new", 3)
+
+        assert cache.get("keep") == 2
+        assert cache.get("new") == 3
+        assert cache.evictions == 0
+
+    def test_wall_clock_jump_does_not_expire(self, monkeypatch):
+        import core.lib.time.cache as cache_mod
+
+        cache = TTLCache(ttl=60)
+        cache.set("key", "value")
+        monkeypatch.setattr(cache_mod.time, "time", lambda: 4e9)
+
+        assert cache.get("key") == "value"
+
+    def test_namespace_budget_evicts_within_namespace(self):
+        cache = TTLCache(max_size=10, budgets={"cfg_view_": 2})
+        cache.set("info:me", "me")
+        cache.set("cfg_view_1", 1)
+        cache.set("cfg_view_2", 2)
+        cache.get("cfg_view_1")
+        cache.set("cfg_view_3", 3)
+
+        assert cache.get("cfg_view_2") is None
+        assert cache.get("cfg_view_1") == 1
+        assert cache.get("info:me") == "me"
+        assert cache.stats()["namespaces"]["cfg_view_"] == {
+            "entries": 2,
+            "budget": 2,
+        }
+
+    def test_kernel_budgets_keep_many_open_config_menus(self):
+        from core.lib.time.cache import KERNEL_CACHE_BUDGETS, KERNEL_CACHE_MAX_SIZE
+
+        cache = TTLCache(
+            max_size=KERNEL_CACHE_MAX_SIZE, ttl=600, budgets=KERNEL_CACHE_BUDGETS
+        )
+        cache.set("info:me", "me")
+        # 60 open menus with a full page of buttons each.
+        for menu in range(60):
+            for button in range(20):
+                cache.set(f"cfg_view_{menu}_{button}", menu, ttl=86400)
+                cache.set(f"module_select_{menu}_{button}", menu, ttl=86400)
+
+        assert cache.get("cfg_view_0_0") == 0
+        assert cache.get("module_select_0_0") == 0
+        assert cache.get("info:me") == "me"
+
+    def test_explicit_namespace_and_shrinking_budget(self):
+        cache = TTLCache(max_size=10)
+        cache.set_many({"a": 1, "b": 2, "c": 3}, namespace="letters")
+        cache.set_budget("letters", 1)
+
+        assert cache.get_many(["a", "b", "c", "d"]) == {"c": 3}
+        cache.delete("c")
+        assert "letters" not in cache._namespaces
+
+    def test_get_many_keeps_cached_none(self):
+        cache = TTLCache()
+        cache.set_many([("x", None), ("y", 0)])
+
+        assert cache.get_many(["x", "y", "z"]) == {"x": None, "y": 0}
+
+    def test_counters(self):
+        cache, now = self._clocked(max_size=1, ttl=5)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+        cache.set("b", 2)
+        now[0] += 6
+        cache.get("b")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["evictions"] == 1
+        assert stats["expired"] == 1
+        assert stats["entries"] == 0
+
+    def test_purge_caches_reports_ttl_stats(self):
+        from types import SimpleNamespace
+
+        from core.lib.utils.cache_purger import purge_caches
+
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.get("a")
+        result = purge_caches(SimpleNamespace(cache=cache), level=1)
+
+        assert result["ttl_cache"]["hits"] == 1
+        assert result["ttl_cache"]["entries"] == 1
+        assert cache.size() == 0
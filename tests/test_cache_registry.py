@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""
+Tests for the cache registry and registry-driven purge_caches
+"""
+
+from types import SimpleNamespace
+
+from core.lib.time.cache import TTLCache
+from core.lib.utils.cache_purger import purge_caches
+from core.lib.utils.cache_registry import (
+    CacheRegistry,
+    dict_bytes,
+    get_cache_registry,
+)
+
+
+def _sized(registry, name, size, cost, cleared, **kwargs):
+    registry.register(
+        name,
+        size=lambda: size,
+        clear=lambda: cleared.append(name),
+        cost=cost,
+        **kwargs,
+    )
+
+
+class TestCacheRegistry:
+    def test_evicts_cheapest_first_until_target(self):
+        registry = CacheRegistry()
+        cleared = []
+        _sized(registry, "remote", 5000, 3.0, cleared)
+        _sized(registry, "small_db", 100, 1.0, cleared)
+        _sized(registry, "big_db", 2000, 1.0, cleared)
+
+        result = registry.evict(1500)
+
+        assert cleared == ["big_db"]
+        assert result["freed"] == 2000
+        assert registry.evict(2200)["evicted"] == ["big_db", "small_db", "remote"]
+
+    def test_evict_all_and_clear_return_value(self):
+        registry = CacheRegistry()
+        registry.register("exact", size=lambda: 10, clear=lambda: 7)
+        registry.register("empty", size=lambda: 0, clear=lambda: None)
+
+        result = registry.evict()
+
+        assert result["freed"] == 7
+        assert sorted(result["evicted"]) == ["empty", "exact"]
+        assert registry.evict(1)["evicted"] == ["exact"]
+
+    def test_broken_cache_does_not_stop_eviction(self):
+        registry = CacheRegistry()
+        cleared = []
+
+        def boom():
+            raise RuntimeError("size")
+
+        registry.register("broken", size=boom, clear=boom, cost=0.1)
+        _sized(registry, "ok", 10, 1.0, cleared)
+
+        assert registry.sizes() == {"broken": 0, "ok": 10}
+        assert registry.evict()["evicted"] == ["ok"]
+
+    def test_remove_owner(self):
+        registry = CacheRegistry()
+        cleared = []
+        _sized(registry, "a", 1, 1.0, cleared, owner="weather")
+        _sized(registry, "b", 1, 1.0, cleared, owner="weather")
+        _sized(registry, "c", 1, 1.0, cleared)
+
+        assert registry.remove_owner("weather") == 2
+        assert [s["name"] for s in registry.stats()] == ["c"]
+
+    def test_get_cache_registry_is_cached_on_kernel(self):
+        kernel = SimpleNamespace()
+        registry = get_cache_registry(kernel)
+        assert get_cache_registry(kernel) is registry
+        assert kernel.cache_registry is registry
+
+    def test_dict_bytes(self):
+        assert dict_bytes(None) == 0
+        assert dict_bytes({"a": "x" * 1000}) > 1000
+
+
+def _kernel(**extra):
+    return SimpleNamespace(
+        cache=TTLCache(),
+        catalog_cache={"repo": "x" * 4096},
+        _module_type_cache={"mod": "class"},
+        command_docs={"ping": "docs"},
+        _module_commands_index={"mod": ["ping"]},
+        _pipe_vars={"x": 1},
+        _pipe_macros={"m": "ping | grep"},
+        inline_callback_map={"tok": {"handler": None}},
+        **extra,
+    )
+
+
+class TestPurgeCaches:
+    def test_level_one_keeps_live_state(self):
+        kernel = _kernel()
+        kernel.cache.set("info:me", "me")
+
+        result = purge_caches(kernel, level=1)
+
+        assert kernel.cache.size() == 0
+        assert kernel.catalog_cache == {}
+        assert kernel._module_type_cache == {}
+        assert kernel.command_docs == {"ping": "docs"}
+        assert kernel._module_commands_index == {"mod": ["ping"]}
+        assert kernel._pipe_vars == {"x": 1}
+        assert kernel._pipe_macros == {"m": "ping | grep"}
+        assert kernel.inline_callback_map == {"tok": {"handler": None}}
+        assert "ttl_cache" in result["cleared"]
+        assert result["ttl_cache"]["entries"] == 1
+
+    def test_target_bytes_stops_at_cheapest(self):
+        kernel = _kernel()
+        kernel.cache.set("info:me", "x" * 8192)
+
+        result = purge_caches(kernel, level=1, target_bytes=100)
+
+        assert result["cleared"] == ["module_type_cache"]
+        assert kernel.cache.size() == 1
+        assert kernel.catalog_cache
+
+    def test_level_two_ignores_target(self):
+        kernel = _kernel()
+        kernel.cache.set("info:me", "me")
+
+        result = purge_caches(kernel, level=2, target_bytes=1)
+
+        assert kernel.cache.size() == 0
+        assert kernel.catalog_cache == {}
+        assert result["freed_estimate"] > 4096
+
+    def test_module_caches_are_evicted_and_unregistered(self):
+        kernel = _kernel()
+        module_cache = {"k": "v"}
+        get_cache_registry(kernel).register(
+            "weather",
+            size=lambda: dict_bytes(module_cache),
+            clear=module_cache.clear,
+            cost=0.5,
+            owner="weather",
+        )
+
+        result = purge_caches(kernel, level=1, target_bytes=1)
+
+        assert result["cleared"] == ["weather"]
+        assert module_cache == {}
+        assert kernel.cache_registry.remove_owner("weather") == 1
@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""
+Tests for the prefix-trie callback router
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.lib.loader.callback_router import CallbackRouter, get_callback_router
+from core.lib.utils.versioned_dict import VersionedDict
+
+
+def _kernel(**extra):
+    return SimpleNamespace(callback_handlers=VersionedDict(), **extra)
+
+
+class TestCallbackRouter:
+    def test_longest_prefix_wins(self):
+        router = CallbackRouter(_kernel())
+        short, long_ = object(), object()
+        router.add("cfg_", short)
+        router.add(b"cfg_module_", long_)
+
+        assert router.match(b"cfg_module_reset_1").handler is long_
+        assert router.match("cfg_view_2").handler is short
+        assert router.match(b"cfg") is None
+        assert router.match(b"") is None
+
+    def test_exact_token_match(self):
+        router = CallbackRouter(_kernel())
+        handler = object()
+        router.add("cfg_close", handler)
+        assert router.match(b"cfg_close").handler is handler
+        assert router.match(b"cfg_clos") is None
+
+    def test_writes_through_to_registry(self):
+        kernel = _kernel()
+        router = CallbackRouter(kernel)
+        handler = object()
+        router.add("menu_", handler)
+        assert kernel.callback_handlers == {b"menu_": handler}
+
+        assert router.remove("menu_") is True
+        assert kernel.callback_handlers == {}
+        assert router.match(b"menu_1") is None
+        assert router.remove("menu_") is False
+
+    def test_remove_prunes_only_dead_branch(self):
+        router = CallbackRouter(_kernel())
+        router.add("ab", "outer")
+        router.add("abcd", "inner")
+        router.remove("abcd")
+        assert router.match(b"abcdef").handler == "outer"
+        assert router._find(b"abc") is None
+        assert len(router) == 1
+
+    def test_remove_module_drops_owned_routes(self):
+        kernel = _kernel()
+        router = CallbackRouter(kernel)
+        router.add("a_", "h1", owner="alpha")
+        router.add("b_", "h2", owner="beta")
+        router.add("a_x_", "h3", owner="alpha")
+
+        assert router.remove_module("alpha") == 2
+        assert list(kernel.callback_handlers) == [b"b_"]
+        assert router.match(b"a_x_1") is None
+
+    def test_regex_patterns_use_re_match(self):
+        kernel = _kernel()
+        router = CallbackRouter(kernel)
+        router.add(rb"menu_\d+", "numbered", owner="menu")
+        router.add("menu_", "prefix")
+
+        # A literal prefix match wins; the regex is the fallback.
+        assert router.match(b"menu_12").handler == "prefix"
+        router.remove("menu_")
+        assert router.match(b"menu_12").handler == "numbered"
+        assert router.match(b"menu_x") is None
+        assert router.match(b"xmenu_1") is None
+        assert rb"menu_\d+" in router
+        assert len(router) == 1
+
+        kernel.callback_handlers[b"(a|b)_go"] = "alt"
+        assert router.match(b"b_go").handler == "alt"
+        assert router.remove_module("menu") == 1
+        assert router.match(b"menu_1") is None
+
+    def test_rebuilds_after_direct_registry_edit(self):
+        kernel = _kernel()
+        router = CallbackRouter(kernel)
+        router.add("keep_", "h1", owner="mod")
+        kernel.callback_handlers["legacy_"] = "h2"
+
+        assert router.match(b"legacy_1").handler == "h2"
+        assert router.remove_module("mod") == 1
+
+    @pytest.mark.asyncio
+    async def test_dispatch_wraps_and_reports_errors(self):
+        handler = AsyncMock(side_effect=RuntimeError("boom"))
+        kernel = _kernel(handle_error=AsyncMock())
+        router = CallbackRouter(kernel)
+        router.add("x_", handler)
+
+        event = SimpleNamespace(data=b"x_1")
+        await router.dispatch(event)
+
+        handler.assert_awaited_once()
+        kernel.handle_error.assert_awaited_once()
+        await router.dispatch(SimpleNamespace(data=b"y_1"))
+        assert handler.await_count == 1
+
+    def test_binds_client_once(self):
+        router = CallbackRouter(_kernel())
+        client = MagicMock()
+        client._event_builders = []
+        client.add_event_handler.side_effect = (
+            lambda cb, ev: client._event_builders.append((ev, cb))
+        )
+        assert router.ensure_bound(client) is True
+        assert router.ensure_bound(client) is False
+        assert client.add_event_handler.call_count == 1
+
+
+def test_get_callback_router_is_cached_on_kernel():
+    kernel = _kernel()
+    router = get_callback_router(kernel)
+    assert get_callback_router(kernel) is router
+    assert kernel.callback_router is router
+
+
+@pytest.mark.asyncio
+async def test_process_callback_query_runs_single_route():
+    from core_inline.handlers import InlineHandlers
+
+    short, long_ = AsyncMock(), AsyncMock()
+    kernel = _kernel(
+        inline_callback_map={},
+        logger=MagicMock(),
+    )
+    router = get_callback_router(kernel)
+    router.add("page_", short)
+    router.add("page_next_", long_)
+
+    handlers = InlineHandlers.__new__(InlineHandlers)
+    handlers.kernel = kernel
+    handlers._wrap_aiogram_callback_query = lambda e: e
+    handlers._dedup_runtime_event = lambda *a: False
+    handlers._callback_dedup_key = lambda *a: "k"
+    handlers._cleanup_inline_callback_map = lambda: None
+    handlers._cb_lock = MagicMock()
+    handlers.check_admin = AsyncMock(return_value=True)
+
+    event = SimpleNamespace(data=b"page_next_3", sender_id=1)
+    await handlers.process_callback_query(event)
+
+    long_.assert_awaited_once_with(event)
+    short.assert_not_awaited()
+
+
+def test_runtime_registration_through_module_proxy_keeps_owner():
+    from core.lib.loader.inline import InlineManager
+    from core.lib.loader.kernel_proxy import ModuleKernelProxy
+
+    kernel = _kernel(current_loading_module="other", client=None, logger=MagicMock())
+    manager = InlineManager.__new__(InlineManager)
+    manager.k = kernel
+    kernel.register_callback_handler = manager.register_callback_handler
+
+    ModuleKernelProxy(kernel, "mine").register_callback_handler("mine_", "h")
+    manager.register_callback_handler("other_", "h2")
+
+    router = get_callback_router(kernel)
+    assert router.match(b"mine_1").owner == "mine"
+    assert router.match(b"other_1").owner == "other"
+    assert router.remove_module("mine") == 1
@@ -327,3 +327,86 @@ class TestBotCommands:
             "settings": AsyncMock(),
         }
         assert len(kernel_with_bot_commands.bot_command_handlers) == 3
+
+
+class TestCommandIndex:
+    """Test flattened command/alias resolution in the dispatcher"""
+
+    @pytest.fixture
+    def dispatcher_kernel(self):
+        from types import SimpleNamespace
+
+        from core.lib.loader.dispatcher import CommandDispatcher
+        from core.lib.utils.versioned_dict import VersionedDict
+
+        calls = []
+
+        async def echo(event):
+            calls.append(event.text)
+
+        kernel = SimpleNamespace(
+            calls=calls,
+            config={"piped": True},
+            command_handlers=VersionedDict(echo=echo),
+            command_owners=VersionedDict(echo="utils"),
+            aliases=VersionedDict(e="echo hi", ee="e there"),
+            get_prefix_for_sender=lambda sender_id: ".",
+        )
+
+        def _set_event_text(event, text):
+            event.text = text
+
+        kernel._set_event_text = _set_event_text
+        kernel.dispatcher = CommandDispatcher(kernel)
+        return kernel
+
+    @staticmethod
+    def _event(text):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(text=text, sender_id=1, chat_id=1)
+
+    @pytest.mark.asyncio
+    async def test_alias_chain_is_flattened(self, dispatcher_kernel):
+        """Test nested aliases resolve to one route and keep the args"""
+        route = dispatcher_kernel.dispatcher.command_index.resolve("ee")
+        assert route.command == "echo"
+        assert route.expansion == "echo hi there"
+        assert route.hops == 2
+
+        assert await dispatcher_kernel.dispatcher.process_command(
+            self._event(".ee you")
+        )
+        assert dispatcher_kernel.calls == [".echo hi there you"]
+
+    @pytest.mark.asyncio
+    async def test_index_follows_registry_changes(self, dispatcher_kernel):
+        """Test the index drops stale routes when registries change"""
+        index = dispatcher_kernel.dispatcher.command_index
+        assert index.resolve("ping") is None
+
+        async def ping(event):
+            dispatcher_kernel.calls.append("pong")
+
+        dispatcher_kernel.command_handlers["ping"] = ping
+        assert index.resolve("ping").handler is ping
+
+        event = self._event(".nope")
+        assert not await dispatcher_kernel.dispatcher.process_command(event)
+        assert event.pipe_exit_code == 5
+
+    @pytest.mark.asyncio
+    async def test_plain_command_skips_pipeline_parser(
+        self, dispatcher_kernel, monkeypatch
+    ):
+        """Test the pipeline parser only runs when an operator is present"""
+        import utils.arg_parser
+
+        def _boom(text):
+            raise AssertionError("parser should not run")
+
+        monkeypatch.setattr(utils.arg_parser, "PipelineParser", _boom)
+        assert await dispatcher_kernel.dispatcher.process_command(
+            self._event(".echo a; b")
+        )
+        assert dispatcher_kernel.calls == [".echo a; b"]
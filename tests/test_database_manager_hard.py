@@ -5,7 +5,7 @@
 Hard tests for core.lib.base.database.DatabaseManager.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -216,3 +216,157 @@ class TestDatabaseManagerHard:
 
         rows = await db.db_query("SELECT '; DROP TABLE users'")
         assert rows == [("",)]
+
+    async def _memory_db(self, **config) -> DatabaseManager:
+        import aiosqlite
+
+        kernel = _make_kernel()
+        kernel.config = dict(config)
+        db = DatabaseManager(kernel)
+        db.conn = await aiosqlite.connect(":memory:")
+        await db._create_tables()
+        db._configure_write_behind()
+        return db
+
+    async def test_write_behind_coalesces_and_reads_own_writes(self):
+        db = await self._memory_db(db_write_behind=True, db_write_behind_delay=60)
+        try:
+            for i in range(5):
+                await db.db_set("mod", "counter", i)
+            db._get_cache.clear()
+
+            assert await db.db_get("mod", "counter") == "4"
+            cursor = await db.conn.execute("SELECT COUNT(*) FROM module_data")
+            assert (await cursor.fetchone())[0] == 0
+
+            assert await db.flush_writes() == 1
+            cursor = await db.conn.execute("SELECT value FROM module_data")
+            assert (await cursor.fetchone())[0] == "4"
+            assert db.write_stats["coalesced"] == 4
+            assert db.write_stats["rows"] == 1
+        finally:
+            if db._flush_task is not None:
+                db._flush_task.cancel()
+            await db.conn.close()
+
+    async def test_write_behind_flushes_at_size_threshold(self):
+        db = await self._memory_db(db_write_behind=True, db_write_behind_delay=60)
+        db.write_behind_max_rows = 3
+        try:
+            for key in ("a", "b", "c"):
+                await db.db_set("mod", key, key)
+            assert db._write_buf == {}
+            assert db.write_stats["flushes"] == 1
+        finally:
+            if db._flush_task is not None:
+                db._flush_task.cancel()
+            await db.conn.close()
+
+    async def test_write_behind_delete_drops_pending_row(self):
+        db = await self._memory_db(db_write_behind=True, db_write_behind_delay=60)
+        try:
+            await db.db_set("mod", "key", "v")
+            await db.db_delete("mod", "key")
+            await db.flush_writes()
+            assert await db.db_get("mod", "key") is None
+        finally:
+            if db._flush_task is not None:
+                db._flush_task.cancel()
+            await db.conn.close()
+
+    async def test_get_cache_hit_refreshes_recency(self):
+        from core.lib.base.database import _CACHE_ENTRY_OVERHEAD, DbGetCache
+
+        cache = DbGetCache(max_bytes=(_CACHE_ENTRY_OVERHEAD + 4) * 16, negative_ttl=60)
+        cache.max_entry_bytes = cache.max_bytes
+        cache.put("m:a", "1")
+        cache.put("m:b", "2")
+        assert cache.lookup("m:a") == "1"
+        for i in range(14):
+            cache.put(f"m:{i:02d}", "x")
+
+        assert "m:a" in cache
+        assert "m:b" not in cache
+        assert cache.evictions == 1
+        assert cache.stats()["hits"] == 1
+
+    async def test_get_cache_negative_entries_expire(self, monkeypatch):
+        from core.lib.base import database
+
+        now = [100.0]
+        monkeypatch.setattr(database.time, "monotonic", lambda: now[0])
+        cache = database.DbGetCache(max_bytes=1 << 20, negative_ttl=5)
+        cache.put("m:gone", None)
+        assert cache.lookup("m:gone") is None
+
+        now[0] += 6
+        assert cache.lookup("m:gone") is database._MISS
+        assert cache.expired == 1
+        assert cache.bytes == 0
+
+    async def test_db_get_is_single_query_and_cached(self):
+        db = await self._memory_db()
+        try:
+            await db.db_set("mod", "key", "value")
+            assert await db.db_get("mod", "key") == "value"
+            assert await db.db_get("mod", "key") == "value"
+            stats = db.get_cache_stats()
+            assert stats["hits"] == 1 and stats["misses"] == 1
+        finally:
+            await db.conn.close()
+
+    async def test_purge_caches_reports_db_cache_stats(self):
+        from core.lib.utils import purge_caches
+
+        db = DatabaseManager(_make_kernel())
+        db._cache_put("mod:key", "value")
+        kernel = MagicMock()
+        kernel.db_manager = db
+
+        result = purge_caches(kernel, level=1)
+
+        assert result["db_get_cache"]["entries"] == 1
+        assert result["freed_estimate"] > 0
+        assert len(db._get_cache) == 0
+
+    async def test_prefetch_module_warms_cache_with_one_query(self):
+        db = await self._memory_db()
+        try:
+            await db.db_set_many(
+                [("mod", "a", "1"), ("mod", "b", "2"), ("x", "a", "3")]
+            )
+            assert await db.prefetch_module("mod") == {"a": "1", "b": "2"}
+
+            no_query = AsyncMock(side_effect=AssertionError("unexpected query"))
+            with patch.object(db.conn, "execute", no_query):
+                assert await db.db_get("mod", "a") == "1"
+                assert await db.db_get("mod", "b") == "2"
+        finally:
+            await db.conn.close()
+
+    async def test_prefetch_module_keeps_pending_write_in_cache(self):
+        db = await self._memory_db(db_write_behind_delay=60)
+        try:
+            await db.db_set("mod", "k", "old")
+            db.write_behind = True
+            await db.db_set("mod", "k", "new")
+
+            assert await db.prefetch_module("mod") == {"k": "new"}
+            await db.flush_writes()
+
+            assert await db.db_get("mod", "k") == "new"
+        finally:
+            await db.conn.close()
+
+    async def test_db_get_many_caches_found_and_missing_keys(self):
+        db = await self._memory_db()
+        try:
+            await db.db_set("module_configs", "alpha", "{}")
+            result = await db.db_get_many("module_configs", ["alpha", "beta"])
+            assert result == {"alpha": "{}", "beta": None}
+
+            misses = db.get_cache_stats()["misses"]
+            assert await db.db_get("module_configs", "beta") is None
+            assert db.get_cache_stats()["misses"] == misses
+        finally:
+            await db.conn.close()
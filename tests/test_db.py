@@ -62,17 +62,44 @@ class TestDatabaseOperations:
         db_manager.conn.commit.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_db_set_truncates_large_wal(self, db_manager, tmp_path):
-        """Large WAL files are checkpointed to avoid runaway DB directory size."""
+    async def test_db_set_does_not_checkpoint_inline(self, db_manager, tmp_path):
+        """The write path leaves WAL checkpoints to background maintenance."""
         db_file = tmp_path / "userbot.db"
-        wal_file = tmp_path / "userbot.db-wal"
-        wal_file.write_bytes(b"x" * 32)
+        (tmp_path / "userbot.db-wal").write_bytes(b"x" * 32)
         db_manager._WAL_TRUNCATE_BYTES = 8
         db_manager._resolve_db_file = lambda: str(db_file)
 
         await db_manager.db_set("module", "key", "value")
 
+        assert db_manager.conn.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_maintenance_truncates_large_idle_wal(self, db_manager, tmp_path):
+        """Large WAL files are truncated by maintenance once writes go idle."""
+        db_file = tmp_path / "userbot.db"
+        db_file.write_bytes(b"x" * 16)
+        (tmp_path / "userbot.db-wal").write_bytes(b"x" * 32)
+        db_manager._WAL_TRUNCATE_BYTES = 8
+        db_manager._resolve_db_file = lambda: str(db_file)
+
+        report = await db_manager.run_maintenance()
+
         db_manager.conn.execute.assert_any_await("PRAGMA wal_checkpoint(TRUNCATE)")
+        db_manager.conn.execute.assert_any_await("PRAGMA optimize")
+        assert report["wal_bytes"] == 32
+        assert report["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_maintenance_skips_checkpoint_while_busy(self, db_manager, tmp_path):
+        """Recent writes postpone the checkpoint to a later, idle run."""
+        db_manager._resolve_db_file = lambda: str(tmp_path / "userbot.db")
+        await db_manager.db_set("module", "key", "value")
+
+        report = await db_manager.run_maintenance()
+
+        assert not any(a.startswith("checkpoint") for a in report["actions"])
+        report = await db_manager.run_maintenance(force=True)
+        assert "checkpoint:passive" in report["actions"]
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -91,17 +118,15 @@ class TestDatabaseOperations:
         from core.lib.base.database import DatabaseManager
 
         db = DatabaseManager(mock_kernel)
-        size_cursor = AsyncMock()
-        value_cursor = AsyncMock()
-        size_cursor.fetchone = AsyncMock(
-            return_value=(len(stored_value[0]) if stored_value[0] is not None else 0,)
-        )
-        value_cursor.fetchone = AsyncMock(return_value=stored_value)
+        cursor = AsyncMock()
+        size = len(stored_value[0]) if stored_value[0] is not None else 0
+        cursor.fetchone = AsyncMock(return_value=(size, *stored_value))
         db.conn = AsyncMock()
-        db.conn.execute = AsyncMock(side_effect=[size_cursor, value_cursor])
+        db.conn.execute = AsyncMock(return_value=cursor)
 
         result = await db.db_get("module", "key")
         assert result == expected
+        assert db.conn.execute.await_count == 1
 
     @pytest.mark.asyncio
     async def test_db_get_skips_oversized_value(self, mock_kernel):
@@ -111,7 +136,7 @@ class TestDatabaseOperations:
         db = DatabaseManager(mock_kernel)
         db._MAX_VALUE_BYTES = 8
         size_cursor = AsyncMock()
-        size_cursor.fetchone = AsyncMock(return_value=(9,))
+        size_cursor.fetchone = AsyncMock(return_value=(9, None))
         db.conn = AsyncMock()
         db.conn.execute = AsyncMock(return_value=size_cursor)
 
@@ -337,3 +362,67 @@ class TestDataTypes:
 
         assert len(deserialized["large_list"]) == 10000
         assert deserialized["large_list"][-1] == 9999
+
+
+class TestModuleConfigCache:
+    """Test ConfigManager's parsed module config cache"""
+
+    @pytest.fixture
+    def config_manager(self):
+        from core.lib.base.config import ConfigManager
+
+        store = {}
+        kernel = MagicMock()
+        kernel.db_get = AsyncMock(side_effect=lambda m, k: store.get((m, k)))
+
+        async def db_set(module, key, value):
+            store[(module, key)] = value
+
+        kernel.db_set = AsyncMock(side_effect=db_set)
+        manager = ConfigManager(kernel)
+        manager.store = store
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_unchanged_blob_is_parsed_once(self, config_manager, monkeypatch):
+        import core.lib.base.config as config_module
+
+        config_manager.store[("module_configs", "demo")] = json.dumps({"a": 1})
+        loads = MagicMock(side_effect=json.loads)
+        monkeypatch.setattr(config_module.json, "loads", loads)
+
+        for _ in range(3):
+            assert await config_manager.get_key("demo", "a") == 1
+        assert loads.call_count == 1
+
+        config_manager.store[("module_configs", "demo")] = json.dumps({"a": 2})
+        assert await config_manager.get_key("demo", "a") == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_are_compact_and_skip_unchanged_values(self, config_manager):
+        assert await config_manager.set_key("demo", "a", [1])
+        assert config_manager.store[("module_configs", "demo")] == '{"a":[1]}'
+
+        assert await config_manager.set_key("demo", "a", [1])
+        assert config_manager.k.db_set.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_equal_values_of_another_type_are_written(self, config_manager):
+        assert await config_manager.set_key("demo", "a", 1)
+        assert await config_manager.set_key("demo", "a", True)
+        assert config_manager.store[("module_configs", "demo")] == '{"a":true}'
+
+        assert await config_manager.update("demo", {"a": 1.0})
+        assert config_manager.store[("module_configs", "demo")] == '{"a":1.0}'
+
+        assert await config_manager.update("demo", {"a": 1.0})
+        assert config_manager.k.db_set.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_callers_cannot_mutate_cached_config(self, config_manager):
+        config_manager.store[("module_configs", "demo")] = json.dumps({"a": [1]})
+
+        (await config_manager.get_module_config("demo"))["a"].append(2)
+        (await config_manager.get_key("demo", "a")).append(3)
+
+        assert await config_manager.get_key("demo", "a") == [1]
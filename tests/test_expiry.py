@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""
+Tests for the shared inline expiry service
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from core.lib.utils.expiry import (
+    ExpiryService,
+    get_expiry_service,
+    track_inline_callback,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestExpiryService:
+    def test_expires_only_due_entries(self):
+        clock = _Clock()
+        service = ExpiryService(clock)
+        store = {"a": object(), "b": object()}
+        service.track("session", store, "a", store["a"], 5)
+        service.track("session", store, "b", store["b"], 50)
+
+        assert service.expire() == 0
+        clock.now += 10
+        assert service.expire() == 1
+        assert list(store) == ["b"]
+        assert service.next_deadline() == 150.0
+
+    def test_replaced_or_removed_entries_are_skipped(self):
+        clock = _Clock()
+        service = ExpiryService(clock)
+        store = {"a": "old", "b": "x"}
+        service.track("callback", store, "a", "old", 1)
+        service.track("callback", store, "b", "x", 1)
+        store["a"] = "new"
+        del store["b"]
+
+        clock.now += 2
+        assert service.expire() == 0
+        assert store == {"a": "new"}
+        stats = service.stats()["callback"]
+        assert stats["skipped"] == 2 and stats["tracked"] == 0
+
+    def test_custom_remover_and_lock(self):
+        clock = _Clock()
+        service = ExpiryService(clock)
+        store = {"u": {"x": 1}}
+        removed = []
+        service.track(
+            "hikka_unit",
+            store,
+            "u",
+            store["u"],
+            0,
+            lock=threading.Lock(),
+            remove=lambda key: removed.append(store.pop(key)),
+        )
+        assert service.expire() == 1
+        assert removed == [{"x": 1}] and store == {}
+
+    def test_stats_report_per_kind_occupancy(self):
+        service = ExpiryService(_Clock())
+        sessions, tokens = {"s": 1}, {"t": 2, "u": 3}
+        service.track("session", sessions, "s", 1, 10)
+        service.track("callback", tokens, "t", 2, 10)
+        service.track("callback", tokens, "u", 3, 10)
+        tokens.pop("u")
+
+        stats = service.stats()
+        assert stats["session"]["live"] == 1
+        assert stats["callback"]["tracked"] == 2
+        assert stats["callback"]["live"] == 1
+
+    def test_compact_drops_stale_items(self):
+        service = ExpiryService(_Clock())
+        store = {}
+        for i in range(10):
+            store[i] = i
+            service.track("callback", store, i, i, 60)
+        store.clear()
+        assert service.compact() == 10
+        assert len(service) == 0
+
+
+def test_track_inline_callback_uses_kernel_map_and_lock():
+    kernel = SimpleNamespace(
+        inline_callback_map={}, _inline_cb_lock=threading.Lock(), logger=MagicMock()
+    )
+    entry = kernel.inline_callback_map["tok"] = {"expires_at": time.time() - 1}
+    kernel.inline_callback_map["forever"] = {"expires_at": None}
+    track_inline_callback(kernel, "tok", entry)
+    track_inline_callback(kernel, "forever", kernel.inline_callback_map["forever"])
+
+    service = get_expiry_service(kernel)
+    assert service is kernel.inline_expiry
+    assert len(service) == 1
+    assert service.expire() == 1
+    assert list(kernel.inline_callback_map) == ["forever"]
+
+
+def test_inline_manager_sessions_expire_through_service():
+    from core.lib.loader.inline import InlineManager
+
+    kernel = SimpleNamespace(logger=MagicMock())
+    manager = InlineManager.__new__(InlineManager)
+    manager.k = kernel
+    manager._sessions = {}
+
+    manager._session_put("gallery:1", {"rows": []}, ttl=1)
+    assert manager._session_get("gallery:1") == {"rows": []}
+
+    session = manager._sessions["gallery:1"]
+    session.expires_at = time.monotonic() - 1
+    assert manager._session_get("gallery:1") is None
+    assert get_expiry_service(kernel).stats()["session"]["tracked"] == 1
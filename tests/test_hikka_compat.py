@@ -5,7 +5,7 @@
 
 import sys
 import types
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -667,6 +667,28 @@ class TestInlineCall:
         assert callable(call.answer)
 
 
+class TestInlineProxyCleanup:
+    """Test InlineProxy drops state left behind by removed units."""
+
+    def test_orphaned_callback_tokens_are_dropped(self):
+        from core.lib.loader.hikka_compat.runtime import InlineProxy
+
+        kernel = MagicMock()
+        kernel._hikka_compat_inline_state = {}
+        kernel.inline_callback_map = {
+            "live": {"unit_id": "u_live", "expires_at": 0},
+            "orphan": {"unit_id": "u_gone", "expires_at": 0},
+            "plain": {"handler": None},
+        }
+        proxy = InlineProxy(kernel)
+        proxy._units["u_live"] = {}
+        proxy._custom_map["c_orphan"] = {"unit_id": "u_gone"}
+
+        assert proxy._cleanup_custom_map() == 2
+        assert set(kernel.inline_callback_map) == {"live", "plain"}
+        assert proxy._custom_map == {}
+
+
 class TestBotInlineCall:
     """Test BotInlineCall inherits from InlineCall."""
 
@@ -1180,6 +1202,165 @@ class TestDbProxy:
         assert db1.get("key") == "val_a"
         assert db2.get("key") == "val_b"
 
+    @staticmethod
+    async def _attach_db(kernel, rows):
+        import aiosqlite
+
+        conn = await aiosqlite.connect(":memory:")
+        await conn.execute(
+            "CREATE TABLE module_data (module TEXT, key TEXT, value TEXT, "
+            "PRIMARY KEY (module, key))"
+        )
+        await conn.executemany("INSERT INTO module_data VALUES (?, ?, ?)", rows)
+        await conn.commit()
+        kernel.db_manager.conn = conn
+        return conn
+
+    def test_prefetch_serves_sync_get_from_memory(self, kernel):
+        import asyncio
+
+        from core.lib.loader.hikka_compat import runtime
+
+        async def scenario():
+            conn = await self._attach_db(
+                kernel,
+                [("TestModule", "items", '["a", "b"]'), ("TestModule", "n", "3")],
+            )
+            try:
+                db = runtime.DbProxy(kernel, "TestModule")
+                await db.prefetch()
+                kernel.db_manager._resolve_db_file.side_effect = AssertionError(
+                    "sync sqlite read on the event loop"
+                )
+                assert db.get("items", []) == ["a", "b"]
+                assert db.get("n") == 3
+                # Known module, unknown key: a real miss without touching SQLite.
+                assert db.get("missing", "dflt") == "dflt"
+                # Another proxy for the same module shares the prefetched rows.
+                assert (
+                    runtime.DbProxy(kernel, "Other").get("TestModule", "n", None) == 3
+                )
+            finally:
+                await conn.close()
+
+        asyncio.run(scenario())
+
+    def test_snapshot_follows_writes_outside_the_proxy(self, kernel):
+        import asyncio
+
+        from core.lib.base.database import DatabaseManager
+        from core.lib.loader.hikka_compat import runtime
+
+        async def scenario():
+            manager = DatabaseManager(kernel)
+            kernel.db_manager = manager
+            conn = await self._attach_db(
+                kernel, [("Mod", "n", "3"), ("Mod", "gone", '"x"')]
+            )
+            manager.conn = conn
+            try:
+                db = runtime.DbProxy(kernel, "Mod")
+                await db.prefetch()
+                await manager.db_delete("Mod", "gone")
+                await manager.db_set("Mod", "n", 4)
+                await manager.db_set_many([("Mod", "new", [1])])
+                fresh = runtime.DbProxy(kernel, "Reader")
+                assert fresh.get("Mod", "gone", "dflt") == "dflt"
+                assert fresh.get("Mod", "n", None) == 4
+                assert fresh.get("Mod", "new", None) == [1]
+
+                db.clear()
+                assert "Mod" not in runtime._db_read_cache(kernel).rows
+            finally:
+                await conn.close()
+
+        asyncio.run(scenario())
+
+    def test_prefetch_keeps_writes_made_while_fetching(self, kernel):
+        import asyncio
+
+        from core.lib.base.database import DatabaseManager
+        from core.lib.loader.hikka_compat import runtime
+
+        async def scenario():
+            manager = DatabaseManager(kernel)
+            kernel.db_manager = manager
+            conn = await self._attach_db(kernel, [("Mod", "n", "3")])
+            manager.conn = conn
+            try:
+                cache = runtime._db_read_cache(kernel)
+                fetch = asyncio.ensure_future(cache.prefetch(kernel, "Mod"))
+                await asyncio.sleep(0)
+                cache.observe_write("Mod", "n", 5)
+                cache.observe_write("Mod", "k", DatabaseManager.DELETED)
+                await fetch
+                assert cache.lookup("Mod", "n") == (True, 5)
+            finally:
+                await conn.close()
+
+        asyncio.run(scenario())
+
+    def test_unprefetched_read_on_loop_returns_stored_value(self, kernel, tmp_path):
+        import asyncio
+
+        from core.lib.loader.hikka_compat import runtime
+
+        db_file = str(tmp_path / "db.sqlite")
+        kernel.db_manager._resolve_db_file.return_value = db_file
+
+        async def scenario():
+            import aiosqlite
+
+            conn = await aiosqlite.connect(db_file)
+            await conn.execute(
+                "CREATE TABLE module_data (module TEXT, key TEXT, value TEXT, "
+                "PRIMARY KEY (module, key))"
+            )
+            await conn.execute(
+                "INSERT INTO module_data VALUES (?, ?, ?)", ("Other", "k", '"v"')
+            )
+            await conn.commit()
+            kernel.db_manager.conn = conn
+            try:
+                db = runtime.DbProxy(kernel, "Reader")
+                assert db.get("Other", "k", "dflt") == "v"
+                await asyncio.sleep(0.05)
+                # The owner is prefetched now; later reads skip SQLite.
+                kernel.db_manager._resolve_db_file.side_effect = AssertionError(
+                    "sync sqlite read after prefetch"
+                )
+                assert runtime.DbProxy(kernel, "Other").get("k", "dflt") == "v"
+            finally:
+                await conn.close()
+                runtime._RO_CONNECTIONS.pop(db_file).close()
+
+        asyncio.run(scenario())
+
+    def test_module_list_prefetch_is_shared(self, kernel):
+        import asyncio
+
+        from core.lib.loader.hikka_compat import runtime
+
+        async def scenario():
+            conn = await self._attach_db(kernel, [("A", "k", "1")])
+            try:
+                db = runtime.DbProxy(kernel, "A")
+                with patch.object(
+                    runtime._DbReadCache,
+                    "prefetch_module_list",
+                    autospec=True,
+                    side_effect=runtime._DbReadCache.prefetch_module_list,
+                ) as fetch:
+                    db.keys()
+                    db.keys()
+                    await asyncio.sleep(0.05)
+                    assert fetch.call_count == 1
+                assert db.keys() == ["A"]
+            finally:
+                await conn.close()
+
+        asyncio.run(scenario())
+
 
 class TestInlineProxyFormGalleryList:
     """Test InlineProxy high-level API methods."""
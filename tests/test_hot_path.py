@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""
+Tests for hot-path debug gating and stage tracing
+"""
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.lib.utils import hot_path
+from core.lib.utils.hot_path import HotPathTrace, debug_enabled
+
+
+class TestDebugEnabled:
+    @pytest.fixture(autouse=True)
+    def hot_debug(self, monkeypatch):
+        monkeypatch.setattr(hot_path, "_HOT_DEBUG", True)
+
+    def test_off_by_default_even_at_debug_level(self):
+        logger = logging.getLogger("mcub.test.hot_path")
+        logger.setLevel(logging.DEBUG)
+        hot_path.set_hot_debug(False)
+        assert debug_enabled(logger) is False
+        assert debug_enabled(SimpleNamespace(debug=print)) is False
+        hot_path.set_hot_debug(True)
+        assert debug_enabled(logger) is True
+
+    def test_follows_logger_level(self):
+        logger = logging.getLogger("mcub.test.hot_path")
+        logger.setLevel(logging.INFO)
+        assert debug_enabled(logger) is False
+        logger.setLevel(logging.DEBUG)
+        assert debug_enabled(logger) is True
+
+    def test_plain_objects_count_as_enabled(self):
+        assert debug_enabled(SimpleNamespace(debug=print)) is True
+        assert debug_enabled(None) is False
+
+
+class TestHotPathTrace:
+    def test_disabled_trace_records_nothing(self):
+        trace = HotPathTrace(size=4)
+        started = trace.start()
+        assert started == 0.0
+        trace.record("command", started)
+        assert trace.entries() == []
+
+    def test_ring_buffer_keeps_latest_entries(self):
+        trace = HotPathTrace(size=3, enabled=True)
+        for i in range(5):
+            trace.record("handler", trace.start(), cmd=f"c{i}")
+
+        entries = trace.entries()
+        assert [e["cmd"] for e in entries] == ["c2", "c3", "c4"]
+        assert trace.stats()["handler"]["count"] == 3
+
+    def test_enable_resizes_buffer(self):
+        trace = HotPathTrace(size=2)
+        trace.enable(8)
+        assert trace.enabled and trace.size == 8
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_miss_builds_no_debug_args_when_disabled():
+    from core.lib.loader.dispatcher import CommandDispatcher
+
+    handlers = MagicMock()
+    handlers.__contains__.return_value = False
+    handlers.__len__.return_value = 0
+    kernel = SimpleNamespace(
+        config={},
+        command_handlers=handlers,
+        command_owners={},
+        aliases={},
+        get_prefix_for_sender=lambda sender_id: ".",
+    )
+    dispatcher = CommandDispatcher(kernel)
+    dispatcher.logger = MagicMock()
+    dispatcher.logger.isEnabledFor.return_value = False
+
+    event = SimpleNamespace(text=".missing", sender_id=1, chat_id=1)
+    assert await dispatcher.process_command(event) is False
+
+    assert event.pipe_exit_code == 5
+    dispatcher.logger.debug.assert_not_called()
+    handlers.keys.assert_not_called()
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""
+Tests for the UTF-16 helpers of utils.html_parser.
+"""
+
+import random
+
+from telethon.tl.types import MessageEntityBold, MessageEntityEmail
+
+from utils.html_parser import UTF16Text, _utf16_len, telegram_to_html
+
+
+def _reference_slice(text: str, offset: int, length: int) -> str:
+    data = text.encode("utf-16-le")
+    return data[offset * 2 : (offset + length) * 2].decode("utf-16-le")
+
+
+class TestUTF16Text:
+    def test_length_counts_surrogate_pairs(self):
+        assert len(UTF16Text("")) == 0
+        assert len(UTF16Text("abc")) == 3
+        assert len(UTF16Text("A😀𝔘B")) == 6
+
+    def test_offset_and_index_round_trip(self):
+        text = "😀a😀😀bc😀"
+        index = UTF16Text(text)
+
+        for i in range(len(text) + 1):
+            offset = index.offset(i)
+            assert offset == _utf16_len(text[:i])
+            assert index.index(offset) == i
+
+    def test_index_inside_pair_moves_to_pair_start(self):
+        index = UTF16Text("A😀B")
+
+        assert index.index(2) == 1
+        assert index.truncate(2) == "A"
+        assert index.truncate(3) == "A😀"
+        assert index.truncate(100) == "A😀B"
+        assert index.truncate(0) == ""
+
+    def test_slice_matches_utf16_encoding(self):
+        rng = random.Random(7)
+        alphabet = "ab\n<😀𝔘é"
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 16)))
+            index = UTF16Text(text)
+            boundaries = [index.offset(i) for i in range(len(text) + 1)]
+            start, end = sorted(rng.sample(boundaries, 2) if len(text) else (0, 0))
+            assert index.slice(start, end - start) == _reference_slice(
+                text, start, end - start
+            )
+
+    def test_slice_out_of_range_is_empty(self):
+        index = UTF16Text("ab😀")
+
+        assert index.slice(10, 3) == ""
+        assert index.slice(1, 0) == ""
+        assert UTF16Text("").slice(0, 5) == ""
+
+
+class TestHTMLDecoratorUTF16:
+    def test_unparse_with_surrogate_pairs(self):
+        text = "😀 bold mail@x.io"
+        entities = [
+            MessageEntityBold(offset=3, length=4),
+            MessageEntityEmail(offset=8, length=9),
+        ]
+
+        assert telegram_to_html(text, entities) == (
+            '😀 <b>bold</b> <a href="mailto:mail@x.io">mail@x.io</a>'
+        )
@@ -6,6 +6,7 @@ Tests for inline features
 """
 
 import json
+from collections import OrderedDict
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -264,6 +265,73 @@ class TestInlineManagerEdgeCases:
         assert await inline_manager.is_allowed(123, command="catalog") is True
         assert storage.get("denied", {}).get("catalog") is None
 
+    @pytest.mark.asyncio
+    async def test_permission_index_is_cached(self, inline_manager, mock_kernel):
+        """Test repeated checks reuse the parsed index instead of the database."""
+        mock_kernel.db_get = AsyncMock(
+            side_effect=lambda module, _key: (
+                json.dumps({"global": [5], "ping": [6]})
+                if module == "inline_permissions"
+                else json.dumps([7])
+            )
+        )
+
+        for _ in range(3):
+            assert await inline_manager.is_allowed(5) is True
+            assert await inline_manager.is_allowed(6, "ping") is True
+            assert await inline_manager.is_allowed(7, "ping") is True
+            assert await inline_manager.is_allowed(8, "ping") is False
+        assert mock_kernel.db_get.await_count == 2
+        assert isinstance((await inline_manager.get_index()).global_users, frozenset)
+
+    @pytest.mark.asyncio
+    async def test_index_shared_and_invalidated(self, inline_manager, mock_kernel):
+        """Test another manager's invalidate() (trusted writes) drops the index."""
+        from core_inline.lib.manager import InlineManager
+
+        trusted = []
+
+        async def db_get(module, _key):
+            return json.dumps(trusted) if module == "trusted" else None
+
+        mock_kernel.db_get = AsyncMock(side_effect=db_get)
+        assert await inline_manager.is_allowed(42) is False
+
+        trusted.append(42)
+        assert await inline_manager.is_allowed(42) is False
+        InlineManager(mock_kernel).invalidate()
+        assert await inline_manager.is_allowed(42) is True
+
+    @pytest.mark.asyncio
+    async def test_any_db_write_to_sources_invalidates_index(
+        self, inline_manager, mock_kernel
+    ):
+        """Test writes that bypass InlineManager still drop the index."""
+        import aiosqlite
+
+        from core.lib.base.database import DatabaseManager
+
+        db = DatabaseManager(mock_kernel)
+        db.conn = await aiosqlite.connect(":memory:")
+        await db._create_tables()
+        mock_kernel.db_manager = db
+        mock_kernel.db_get = db.db_get
+        try:
+            assert await inline_manager.is_allowed(42) is False
+
+            await db.db_set("trusted", "users", json.dumps([42]))
+            assert await inline_manager.is_allowed(42) is True
+
+            await db.db_set(
+                "inline_permissions", "allowed_users", json.dumps({"global": [7]})
+            )
+            assert await inline_manager.is_allowed(7) is True
+
+            await db.db_delete("trusted", "users")
+            assert await inline_manager.is_allowed(42) is False
+        finally:
+            await db.conn.close()
+
     @pytest.mark.asyncio
     async def test_empty_global_list(self, inline_manager, mock_kernel):
         """Test empty global list denies all non-admins"""
@@ -501,8 +569,8 @@ class TestInlineFeatures:
             if kernel.current_loading_module:
                 kernel.inline_handlers_owners[pattern] = kernel.current_loading_module
 
-        def register_callback_handler(pattern, handler):
-            callbacks[pattern] = handler
+        def register_callback_handler(pattern, handler, owner=None):
+            callbacks[pattern] = (handler, owner)
 
         kernel.register_inline_handler = register_inline_handler
         kernel.register_callback_handler = register_callback_handler
@@ -514,7 +582,7 @@ class TestInlineFeatures:
 
         assert "catalog" in kernel.inline_handlers
         assert kernel.inline_handlers_owners["catalog"] == "loader"
-        assert "catalog_" in callbacks
+        assert callbacks["catalog_"][1] == "loader"
 
 
 class TestInlineButtonCleanupWatcher:
@@ -787,3 +855,116 @@ class TestCoreInlineMessageRichEdit:
         args, kwargs = client.edit_message_calls[0]
         assert args[1] == "<b>hello</b>"
         assert kwargs["parse_mode"] == "html"
+
+
+class TestInlineCommandListing:
+    """Test cached, paginated inline command listing"""
+
+    @staticmethod
+    def _handlers(count):
+        from core.lib.utils.versioned_dict import VersionedDict
+        from core_inline.handlers import InlineHandlers
+
+        kernel = SimpleNamespace(
+            inline_handlers=VersionedDict(
+                (f"cmd{i:03d}", AsyncMock(__doc__=f"doc {i}")) for i in range(count)
+            ),
+            loaded_modules={},
+            system_modules={},
+            VERSION="1.0",
+        )
+        handlers = InlineHandlers.__new__(InlineHandlers)
+        handlers.kernel = kernel
+        handlers.lang = {
+            key: key
+            for key in (
+                "command",
+                "execute",
+                "mcub_bot_title",
+                "version",
+                "modules",
+                "info_description",
+                "no_commands",
+            )
+        }
+        handlers._listing_pages = OrderedDict()
+        handlers._listing_entries = None
+        handlers._listing_stamp = None
+        return handlers
+
+    @staticmethod
+    def _event(sender_id=1):
+        async def article(title, **kwargs):
+            return {"title": title, **kwargs}
+
+        builder = SimpleNamespace(article=MagicMock(side_effect=article))
+        return SimpleNamespace(sender_id=sender_id, builder=builder)
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_command(self):
+        handlers = self._handlers(120)
+        event = self._event()
+
+        titles, offset = [], 0
+        while True:
+            results, next_offset = await handlers._listing_page(event, "", offset)
+            assert len(results) <= 50
+            titles.extend(r["title"] for r in results)
+            if not next_offset:
+                break
+            offset = int(next_offset)
+
+        assert titles[0] == "MCUB Info"
+        assert len(titles) == 121
+        assert titles[-1] == "command: cmd119"
+
+    @pytest.mark.asyncio
+    async def test_page_cache_until_handlers_change(self):
+        handlers = self._handlers(3)
+        event = self._event()
+
+        first = await handlers._listing_page(event, "", 0)
+        again = await handlers._listing_page(event, "", 0)
+        assert again is first
+        assert event.builder.article.call_count == 4
+
+        handlers.kernel.inline_handlers["zzz"] = AsyncMock(__doc__="new")
+        results, _ = await handlers._listing_page(event, "", 0)
+        assert results[-1]["title"] == "command: zzz"
+
+    @pytest.mark.asyncio
+    async def test_reregistered_pattern_rebuilds_page(self):
+        handlers = self._handlers(3)
+        event = self._event()
+        await handlers._listing_page(event, "", 0)
+
+        handlers.kernel.inline_handlers["cmd001"] = AsyncMock(__doc__="reloaded")
+        results, _ = await handlers._listing_page(event, "", 0)
+        assert results[2]["description"] == "reloaded"
+
+    @pytest.mark.asyncio
+    async def test_plain_dict_registry_is_not_cached(self):
+        handlers = self._handlers(3)
+        handlers.kernel.inline_handlers = dict(handlers.kernel.inline_handlers)
+        event = self._event()
+        first = await handlers._listing_page(event, "", 0)
+
+        handlers.kernel.inline_handlers["cmd001"] = AsyncMock(__doc__="reloaded")
+        results, _ = await handlers._listing_page(event, "", 0)
+        assert results is not first[0]
+        assert results[2]["description"] == "reloaded"
+
+    @pytest.mark.asyncio
+    async def test_prefix_filters_without_info(self):
+        handlers = self._handlers(30)
+        results, next_offset = await handlers._listing_page(self._event(), "cmd02", 0)
+        assert [r["title"] for r in results] == [
+            f"command: cmd02{i}" for i in range(10)
+        ]
+        assert next_offset == ""
+
+    @pytest.mark.asyncio
+    async def test_empty_registry_shows_no_commands(self):
+        handlers = self._handlers(0)
+        results, _ = await handlers._listing_page(self._event(), "", 0)
+        assert [r["title"] for r in results] == ["MCUB Info", "no_commands"]
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""
+Tests for the background job table
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core.lib.utils import jobs as jobs_mod
+from core.lib.utils.jobs import DONE, FAILED, KILLED, JobTable, get_job_table
+
+
+class TestJobTable:
+    @pytest.mark.asyncio
+    async def test_job_records_output_and_exit_code(self):
+        table = JobTable()
+
+        async def _work(job):
+            job.record("step 1")
+            await asyncio.sleep(0)
+            job.record("step 2")
+            return 4
+
+        job = table.spawn(".work", _work, chat_id=1)
+        assert job.running
+        assert table.jobs(1) == [job]
+        assert table.jobs(2) == []
+
+        assert await table.wait(job.id) is job
+        assert job.status == DONE
+        assert job.exit_code == 4
+        assert job.output == "step 2"
+        assert job.outputs() == ["step 1", "step 2"]
+        assert job.finished is not None
+
+    @pytest.mark.asyncio
+    async def test_kill_cancels_running_job(self):
+        table = JobTable()
+        started = asyncio.Event()
+
+        async def _forever(job):
+            started.set()
+            await asyncio.sleep(3600)
+
+        job = table.spawn(".forever", _forever)
+        await started.wait()
+
+        assert table.kill(job.id)
+        await table.wait(job.id)
+
+        assert job.status == KILLED
+        assert not table.kill(job.id)
+        assert not table.kill(999)
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_leaves_job_running(self):
+        table = JobTable()
+
+        async def _slow(job):
+            await asyncio.sleep(3600)
+
+        job = table.spawn(".slow", _slow)
+        await table.wait(job.id, timeout=0.01)
+
+        assert job.running
+        assert await table.kill_all() == 1
+        assert job.status == KILLED
+
+    @pytest.mark.asyncio
+    async def test_failed_job_keeps_error(self):
+        table = JobTable()
+
+        async def _boom(job):
+            raise ValueError("bad input")
+
+        job = table.spawn(".boom", _boom)
+        await table.wait(job.id)
+
+        assert job.status == FAILED
+        assert job.exit_code == 1
+        assert job.error == "ValueError: bad input"
+
+    @pytest.mark.asyncio
+    async def test_cpu_time_counts_only_loop_work(self):
+        table = JobTable()
+
+        async def _mixed(job):
+            await asyncio.sleep(0.05)
+            deadline = time.thread_time() + 0.03
+            while time.thread_time() < deadline:
+                pass
+
+        job = table.spawn(".mixed", _mixed)
+        await table.wait(job.id)
+
+        assert 0.02 < job.cpu_time < 0.05
+        assert job.wall_time() >= 0.08
+
+    def test_output_buffer_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(jobs_mod, "MAX_OUTPUT_CHARS", 10)
+        job = jobs_mod.Job(1, ".x", None, 0.0)
+
+        for text in ("aaaa", "bbbb", "cccc", "", None):
+            job.record(text)
+
+        assert job.outputs() == ["bbbb", "cccc"]
+
+    def test_output_keeps_parse_mode(self):
+        job = jobs_mod.Job(1, ".x", None, 0.0)
+        job.record("<b>x</b>", "html")
+        assert (job.output, job.output_parse_mode) == ("<b>x</b>", "html")
+
+        job.record("a < b")
+        assert (job.output, job.output_parse_mode) == ("a < b", None)
+        assert job.outputs() == ["<b>x</b>", "a < b"]
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_are_pruned(self, monkeypatch):
+        monkeypatch.setattr(jobs_mod, "MAX_FINISHED_JOBS", 2)
+        table = JobTable()
+
+        async def _noop(job):
+            return 0
+
+        for _ in range(4):
+            job = table.spawn(".noop", _noop)
+            await table.wait(job.id)
+        table.spawn(".noop", _noop)
+
+        assert [job.id for job in table.jobs()] == [3, 4, 5]
+
+    def test_get_job_table_is_per_kernel(self):
+        kernel = SimpleNamespace()
+
+        assert get_job_table(kernel) is get_job_table(kernel)
+        assert get_job_table(SimpleNamespace()) is not kernel.job_table
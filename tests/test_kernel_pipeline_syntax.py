@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2026 Шмэлькa | @hairpin01
 
+import asyncio
 from types import SimpleNamespace
 from unittest import TestCase
 
@@ -8,6 +9,7 @@ import pytest
 
 from core.lib.kernel_pipeline import KernelPipelineMixin
 from core.lib.loader.dispatcher import CommandDispatcher
+from core.lib.utils.pipe_stream import PipeStream, pipe_barrier, streaming
 
 
 class DummyDispatcher:
@@ -99,6 +101,75 @@ async def test_async_pipe_interpolate_runs_commands_left_to_right():
     assert result == "1echo exported -> text"
 
 
+class SlowDispatcher:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def process_command(self, event, depth=0):
+        self.calls.append(event.text)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(float(event.text.split()[1]))
+        finally:
+            self.active -= 1
+        output = event.text.split()[2]
+        event.pipe_exit_code = len(output)
+        await event.edit(output)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_async_pipe_interpolate_runs_substitutions_concurrently():
+    kernel = DummyKernel()
+    kernel.dispatcher = SlowDispatcher()
+    event = SimpleNamespace(chat_id=1, sender_id=2)
+
+    started = asyncio.get_running_loop().time()
+    result = await kernel.async_pipe_interpolate(
+        ".echo @(.s 0.05 a) @(.s 0.05 b) @(.s 0.05 c)", event=event
+    )
+
+    assert result == ".echo a b c"
+    assert kernel.dispatcher.max_active == 3
+    assert asyncio.get_running_loop().time() - started < 0.14
+
+
+@pytest.mark.asyncio
+async def test_async_pipe_interpolate_memoizes_identical_substitutions():
+    kernel = DummyKernel()
+    kernel.dispatcher = SlowDispatcher()
+    event = SimpleNamespace(chat_id=1, sender_id=2)
+
+    result = await kernel.async_pipe_interpolate(
+        "@(.s 0 x)-@(.s 0 y)-@( .s 0 x )", event=event
+    )
+
+    assert result == "x-y-x"
+    assert kernel.dispatcher.calls == [".s 0 x", ".s 0 y"]
+
+
+@pytest.mark.asyncio
+async def test_async_pipe_interpolate_honours_fan_out_limit_and_timeout():
+    kernel = DummyKernel()
+    kernel.dispatcher = SlowDispatcher()
+    kernel.config = {"pipe_subst_concurrency": 2, "pipe_subst_timeout": 0.1}
+    event = SimpleNamespace(chat_id=1, sender_id=2)
+
+    result = await kernel.async_pipe_interpolate(
+        "@(.s 0 a) @(.s 0 bb) @(.s 0 ccc) @(.s 5 slow)", event=event
+    )
+
+    assert result == "a bb ccc <@timeout: .s 5 slow>"
+    assert kernel.dispatcher.max_active == 2
+    # The timed-out substitution reports no exit code; the last one that
+    # finished (left to right) wins.
+    assert event.pipe_exit_code == len("ccc")
+
+
 class PipelineKernel(KernelPipelineMixin):
     def __init__(self):
         self.calls = []
@@ -287,3 +358,175 @@ async def test_pipeline_merge_when_segment_lacks_prefix():
         "t",
         ".t ls | grep home",
     ) in kernel.calls, f"expected .t to receive full text in {kernel.calls}"
+
+
+class StreamingPipelineKernel(DispatcherPipelineKernel):
+    """Dispatcher kernel with an endless streamed producer."""
+
+    def __init__(self):
+        super().__init__()
+        self.produced = 0
+        self.producer_closed = False
+        self.command_handlers.update(
+            gen=self.cmd_gen, take=self.cmd_take, count=self.cmd_count
+        )
+
+    async def cmd_gen(self, event):
+        self.calls.append(("gen", event.text))
+        if not getattr(event, "pipe_stream_ok", False):
+            await event.edit("\n".join(f"line {i}" for i in range(5)))
+            return
+
+        async def _endless():
+            try:
+                while True:
+                    yield f"line {self.produced}\n"
+                    self.produced += 1
+            finally:
+                self.producer_closed = True
+
+        event.pipe_output = PipeStream(_endless())
+
+    @streaming
+    async def cmd_take(self, event):
+        lines = event.pipe_stream.lines()
+        taken = [await anext(lines) for _ in range(int(event.text.split()[1]))]
+        await event.edit("\n".join(taken))
+
+    async def cmd_count(self, event):
+        await event.edit(str(len(event.pipe_input.splitlines())))
+
+
+@pytest.mark.asyncio
+async def test_pipeline_streaming_consumer_stops_producer_early():
+    kernel = StreamingPipelineKernel()
+    event = make_event(".gen | .take 3")
+
+    await kernel.process_command(event)
+
+    assert event.captured == ["line 0\nline 1\nline 2"]
+    assert kernel.produced <= 3
+    assert kernel.producer_closed
+    assert event.pipe_stream is None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_string_consumer_gets_materialized_input():
+    kernel = StreamingPipelineKernel()
+    event = make_event(".gen | .count")
+
+    await kernel.process_command(event)
+
+    assert event.captured == ["5"]
+    assert kernel.produced == 0
+
+
+@pytest.mark.asyncio
+async def test_async_pipe_interpolate_waits_for_barrier_commands():
+    kernel = DispatcherPipelineKernel()
+    order = []
+
+    @pipe_barrier
+    async def cmd_export(event):
+        await asyncio.sleep(0.02)
+        _cmd, name, value = event.text.split(maxsplit=2)
+        kernel._pipe_vars[name] = value
+        order.append("export")
+        await event.edit("exported")
+
+    async def cmd_import(event):
+        order.append("import")
+        await event.edit(kernel._pipe_vars.get(event.text.split()[1], "missing"))
+
+    kernel.command_handlers.update({"export": cmd_export, "import": cmd_import})
+    event = SimpleNamespace(chat_id=1, sender_id=2)
+
+    result = await kernel.async_pipe_interpolate(
+        "@(.import v) @(.export v new) @(.import v)", event=event, active_prefix="."
+    )
+
+    assert order == ["import", "export", "import"]
+    assert result == "missing exported new"
+
+
+class JobPipelineKernel(PipelineKernel):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+        self.sent = []
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append(text)
+        return SimpleNamespace(id=100 + len(self.sent), sender_id=10)
+
+    async def process_command(self, event, depth=0):
+        if event.text.startswith(".slow"):
+            self.calls.append(event.text)
+            await self.release.wait()
+            event.pipe_exit_code = 3
+            if "html" in event.text:
+                await event.edit("<b>slow</b> done", parse_mode="html")
+            else:
+                await event.edit("slow a < b & c")
+            return True
+        return await super().process_command(event, depth)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_ampersand_runs_group_as_background_job():
+    from core.lib.utils.jobs import get_job_table
+    from utils.arg_parser import PipelineParser
+
+    kernel = JobPipelineKernel()
+    event = make_event(".slow x | .wc & .echo next")
+
+    await kernel._execute_pipeline(event, PipelineParser(event.text), 0)
+
+    # The foreground segment ran without waiting for the job.
+    assert event.captured == ["ok .echo next"]
+    assert kernel.sent == [".slow x | .wc"]
+    (job,) = get_job_table(kernel).jobs(1)
+    assert job.running
+    assert job.command == ".slow x | .wc"
+
+    kernel.release.set()
+    await get_job_table(kernel).wait(job.id)
+
+    assert job.exit_code == 0
+    assert job.output == "ok .wc"
+    assert kernel.calls == [".echo next", ".slow x", ".wc"]
+
+
+@pytest.mark.asyncio
+async def test_background_job_records_parse_mode_of_each_edit():
+    from core.lib.utils.jobs import get_job_table
+    from utils.arg_parser import PipelineParser
+
+    kernel = JobPipelineKernel()
+    kernel.release.set()
+    event = make_event(".slow html & .slow plain & .echo next")
+
+    await kernel._execute_pipeline(event, PipelineParser(event.text), 0)
+    html_job, plain_job = get_job_table(kernel).jobs(1)
+    await get_job_table(kernel).wait(html_job.id)
+    await get_job_table(kernel).wait(plain_job.id)
+
+    assert html_job.output == "<b>slow</b> done"
+    assert html_job.output_parse_mode == "html"
+    assert plain_job.output == "slow a < b & c"
+    assert plain_job.output_parse_mode is None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_ampersand_without_chat_runs_inline():
+    from core.lib.utils.jobs import get_job_table
+    from utils.arg_parser import PipelineParser
+
+    kernel = PipelineKernel()
+    event = make_event(".echo a & .echo b")
+    event.chat_id = None
+
+    await kernel._execute_pipeline(event, PipelineParser(event.text), 0)
+
+    assert kernel.calls == [".echo a", ".echo b"]
+    assert len(get_job_table(kernel)) == 0
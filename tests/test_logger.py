@@ -6,9 +6,13 @@ Unit tests for logger.py
 """
 
 import asyncio
+import json
+import os
 import sys
+import tempfile
 import types
 import unittest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -169,6 +173,50 @@ class TestMaskSensitiveData(unittest.TestCase):
         result = mask_sensitive_data("TOKEN='XYZ'")
         self.assertNotIn("XYZ", result)
 
+    def test_emoji_id_kept(self):
+        text = '<tg-emoji emoji-id="5368324170671202286">👍</tg-emoji> 79991234567'
+        result = mask_sensitive_data(text)
+        self.assertIn("5368324170671202286", result)
+        self.assertNotIn("79991234567", result)
+
+    def test_number_before_emoji_id_masked(self):
+        self.assertEqual(
+            mask_sensitive_data(']12345678901234emoji-id="1234567890"'),
+            ']XXXXXXXXXXXXXXemoji-id="1234567890"',
+        )
+
+    def test_long_api_id_masked_like_chain(self):
+        self.assertEqual(
+            mask_sensitive_data("api_id=12345678901"), "api_id=XXXXXXXXXXX"
+        )
+
+    def test_matches_per_pattern_chain(self):
+        from core.lib.utils.logger import _mask_sensitive_chain
+
+        samples = [
+            'File "/app/telethon/sessions/sqlite.py", line 12, in save',
+            "bot token='1234567890:AAHdqTcvCH1vGWJxfSeofSAs0K5PALDsaw' ok",
+            "api_hash=&quot;0123abcd&quot; api_key: k1, password hunter2",
+            "Authorization: Bearer abc\nnext line 12345678901",
+            # nested names are resolved by the chain fallback
+            "session=token=abc",
+            "password: x Authorization: api_hash\nsecret",
+            "TOKEN:\u0661\u0662\u0663\u0664\u066512345678901",
+            "ſession=abc İ",
+            # a long number ending right at an emoji id is masked
+            ']12345678901234emoji-id="1234567890"',
+            "x 0000000000EMOJI-ID='55' tail",
+            "",
+            "no secrets here, line 42",
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                self.assertEqual(mask_sensitive_data(text), _mask_sensitive_chain(text))
+
+    def test_clean_text_returned_as_is(self):
+        text = "Traceback (most recent call last):\n  line 10, in <module>"
+        self.assertIs(mask_sensitive_data(text), text)
+
 
 class TestOverrideText(unittest.TestCase):
     def test_flood_wait_returns_string(self):
@@ -563,14 +611,239 @@ class TestTelegramLogHandler(unittest.TestCase):
         kl = KernelLogger(k)
         logger = logging.getLogger("test_flush_log_queue")
         logger.handlers = []
-        handler = setup_telegram_logging(logger, kl, batch_size=5, batch_interval=0.1)
+        with tempfile.TemporaryDirectory() as tmp:
+            spill = os.path.join(tmp, "spill.log")
+            handler = setup_telegram_logging(
+                logger, kl, batch_size=5, batch_interval=0.1, spill_path=spill
+            )
+
+            handler.emit("queued-1")
+            handler.emit("queued-2")
+
+            self.assertEqual(handler.queue_size(), 2)
+            self.assertGreaterEqual(_flush_log_queue(), 2)
+            self.assertEqual(handler.queue_size(), 0)
+            with open(spill, encoding="utf-8") as fh:
+                spilled = [json.loads(line)[0] for line in fh]
+            self.assertEqual(spilled, ["queued-1", "queued-2"])
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
 
-        handler.emit("queued-1")
-        handler.emit("queued-2")
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value, ttl=0):
+        self.data[key] = value
+
+
+class TestTelegramLogShipping(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.spill = os.path.join(self._tmp.name, "logs", "spill.log")
+        self.kl = types.SimpleNamespace(
+            log_chat_id=1,
+            cache=_DictCache(),
+            flood_wait_until=0.0,
+            send_log_message=AsyncMock(return_value=True),
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _handler(self, **kwargs):
+        kwargs.setdefault("batch_size", 5)
+        kwargs.setdefault("batch_interval", 0.01)
+        return TelegramLogHandler(self.kl, spill_path=self.spill, **kwargs)
+
+    def _sent(self):
+        return [c.args[0] for c in self.kl.send_log_message.await_args_list]
+
+    def test_queue_overflow_spills_to_disk(self):
+        handler = self._handler(queue_size=2)
+        for i in range(5):
+            handler.emit(f"msg-{i}")
 
         self.assertEqual(handler.queue_size(), 2)
-        self.assertGreaterEqual(_flush_log_queue(), 2)
-        self.assertEqual(handler.queue_size(), 0)
+        with open(self.spill, encoding="utf-8") as fh:
+            spilled = [json.loads(line) for line in fh]
+        self.assertEqual(spilled, [["msg-2", 1], ["msg-3", 1], ["msg-4", 1]])
+
+    def test_repeats_are_sent_once_with_count(self):
+        handler = self._handler()
+        for _ in range(3):
+            handler._absorb("disk full")
+        handler._absorb("other")
+
+        self.assertTrue(run(handler._flush_pending()))
+        (text,) = self._sent()
+        self.assertIn("disk full (×3)", text)
+        self.assertNotIn("other (×", text)
+
+        # Delivered within the dedup window: not queued again.
+        handler._absorb("disk full")
+        self.assertEqual(handler._pending, {})
+
+    def test_rate_limited_batch_is_held_not_dropped(self):
+        handler = self._handler(rate_limit=1, rate_window=60)
+        handler._rate_timestamps.append(datetime.now().timestamp())
+        handler._absorb("held")
+
+        self.assertFalse(run(handler._flush_pending()))
+        self.kl.send_log_message.assert_not_awaited()
+        self.assertEqual(len(handler._pending), 1)
+
+        handler._rate_timestamps.clear()
+        self.assertTrue(run(handler._flush_pending()))
+        self.assertIn("held", self._sent()[0])
+
+    def test_flood_wait_backs_off_and_keeps_batch(self):
+        self.kl.send_log_message.side_effect = FloodWaitError()
+        handler = self._handler()
+        handler._absorb("flooded")
+
+        self.assertFalse(run(handler._flush_pending()))
+        self.assertGreater(handler._send_delay(), 40)
+        self.assertEqual(len(handler._pending), 1)
+
+    def test_kernel_logger_flood_wait_is_respected(self):
+        import time
+
+        self.kl.flood_wait_until = time.monotonic() + 30
+        handler = self._handler()
+        handler._absorb("later")
+
+        self.assertFalse(run(handler._flush_pending()))
+        self.kl.send_log_message.assert_not_awaited()
+
+    def test_catch_up_drains_spill_and_removes_file(self):
+        handler = self._handler(batch_size=2)
+        handler._spill_records([("a", 1), ("b", 2), ("c", 1)])
+
+        self.assertEqual(handler._catch_up(), 2)
+        self.assertTrue(run(handler._flush_pending()))
+        self.assertTrue(os.path.exists(self.spill))
+
+        self.assertEqual(handler._catch_up(), 1)
+        # Read but not yet delivered: still on disk.
+        self.assertTrue(os.path.exists(self.spill))
+        self.assertTrue(run(handler._flush_pending()))
+        self.assertFalse(os.path.exists(self.spill))
+
+        first, second = self._sent()
+        self.assertIn("b (×2)", first)
+        self.assertIn("c", second)
+
+    def test_spilled_records_survive_failed_delivery(self):
+        self.kl.send_log_message.return_value = False
+        handler = self._handler()
+        handler._spill_records([("a", 1), ("b", 1)])
+
+        self.assertEqual(handler._catch_up(), 2)
+        self.assertFalse(run(handler._flush_pending()))
+        run(handler.stop())
+
+        with open(self.spill, encoding="utf-8") as fh:
+            spilled = [json.loads(line) for line in fh]
+        self.assertEqual(spilled, [["a", 1], ["b", 1]])
+
+    def test_timestamped_repeats_are_folded(self):
+        handler = self._handler()
+        for ms in ("001", "002", "003"):
+            handler._absorb(f"2026-01-01 10:00:00,{ms} [ERROR] app: same error")
+
+        self.assertEqual(len(handler._pending), 1)
+        run(handler._flush_pending())
+        self.assertIn("same error (×3)", self._sent()[0])
+
+    def test_failing_batch_is_dropped_after_max_attempts(self):
+        handler = self._handler()
+        handler._absorb("poison")
+        for _ in range(5):
+            handler._backoff_until = 0.0
+            self.kl.send_log_message.return_value = False
+            self.assertFalse(run(handler._flush_pending()))
+        self.assertEqual(handler._pending, {})
+
+        handler._backoff_until = 0.0
+        self.kl.send_log_message.return_value = True
+        handler._absorb("later")
+        self.assertTrue(run(handler._flush_pending()))
+        self.assertIn("later", self._sent()[-1])
+        self.assertIn("1 messages lost: rejected by Telegram", self._sent()[-1])
+
+    def test_rejected_batch_is_dropped_at_once(self):
+        async def rejected(text):
+            self.kl.last_send_error = ValueError("MESSAGE_TOO_LONG")
+            return False
+
+        self.kl.send_log_message = AsyncMock(side_effect=rejected)
+        handler = self._handler()
+        handler._absorb("poison")
+
+        self.assertFalse(run(handler._flush_pending()))
+        self.assertEqual(handler._pending, {})
+        self.assertEqual(handler._send_dropped, 1)
+
+    def test_batches_fit_telegram_message_limit(self):
+        handler = self._handler(batch_size=10)
+        for i in range(10):
+            handler._absorb(f"{i} " + "<trace> " * 300)
+
+        while handler._pending:
+            self.assertTrue(run(handler._flush_pending()))
+        sent = self._sent()
+        self.assertGreater(len(sent), 1)
+        self.assertTrue(all(len(text) < 4096 for text in sent))
+
+        handler._absorb("x" * 10_000)
+        run(handler._flush_pending())
+        self.assertLess(len(self._sent()[-1]), 4096)
+        self.assertTrue(self._sent()[-1].endswith("…</code></blockquote>"))
+
+    def test_stop_spills_unsent_messages_and_compacts(self):
+        async def scenario():
+            handler = self._handler(batch_size=1)
+            handler._spill_records([("old-1", 1), ("old-2", 1)])
+            handler._catch_up()
+            await handler._flush_pending()
+            handler._absorb("pending")
+            handler.emit("queued")
+            await handler.stop()
+
+        run(scenario())
+        with open(self.spill, encoding="utf-8") as fh:
+            spilled = [json.loads(line)[0] for line in fh]
+        self.assertEqual(spilled, ["old-2", "pending", "queued"])
+
+    def test_worker_ships_spill_after_queue(self):
+        async def scenario():
+            handler = self._handler(queue_size=1)
+            handler.emit("first")
+            handler.emit("second")
+            await handler.start()
+            for _ in range(100):
+                if len(self.kl.send_log_message.await_args_list) >= 2:
+                    break
+                await asyncio.sleep(0.01)
+            await handler.stop()
+
+        run(scenario())
+        sent = self._sent()
+        self.assertEqual(len(sent), 2)
+        self.assertIn("first", sent[0])
+        self.assertIn("second", sent[1])
+        self.assertFalse(os.path.exists(self.spill))
+
+    def test_spill_cap_is_reported(self):
+        handler = self._handler(spill_max_bytes=20)
+        self.assertEqual(handler._spill_records([("x" * 40, 1)]), 0)
+        handler._absorb("after")
+        run(handler._flush_pending())
+        self.assertIn("1 messages lost", self._sent()[0])
+        self.assertEqual(handler._spill_dropped, 0)
 
 
 class TestSetupTelegramLogging(unittest.TestCase):
@@ -42,6 +42,21 @@ class TestTruncateTextWithEntities:
         assert truncated_entities[0].offset == 0
         assert truncated_entities[0].length == 3
 
+    def test_never_splits_surrogate_pair(self):
+        text = "ab" + "😀" * 3000
+        entities = [MessageEntityBold(offset=2, length=6000)]
+        truncated_text, truncated_entities = mh.truncate_text_with_entities(
+            text, entities, max_length=4097
+        )
+        assert truncated_text == "ab" + "😀" * 2047
+        assert truncated_entities[0].length == 4094
+
+    def test_short_text_is_returned_unchanged(self):
+        entities = [MessageEntityBold(offset=0, length=2)]
+        text, result = mh.truncate_text_with_entities("hi😀", entities)
+        assert text == "hi😀"
+        assert result is entities
+
 
 class TestSendHtmlGeneric:
     @pytest.mark.asyncio
@@ -108,7 +108,7 @@ class TestHikkaInlineDelete:
             inline_callback_map={},
         )
         inline = InlineProxy(kernel)
-        inline._units["old"] = {"expires_at": time.time() - 1}
+        inline._register_unit("old", {"expires_at": time.time() - 1})
         inline._custom_map["old-cb"] = {
             "unit_id": "old",
             "args": (bytearray(1024), object()),
@@ -1471,6 +1471,36 @@ class TestClassStyleOnInstall:
         assert inst.on_install_calls == 1
         kernel.db_set.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_prefetched_install_flag_matches_written_flag(self):
+        from core.lib.loader.loader import ModuleLoader
+
+        kernel = MagicMock()
+        kernel.logger = MagicMock()
+        kernel.db_get = AsyncMock(return_value=None)
+        kernel.db_set = AsyncMock()
+        kernel.db_manager.conn = object()
+        kernel.db_manager._validate_identifier = lambda name: True
+        kernel.db_manager.prefetch_module = AsyncMock()
+        kernel.db_manager.db_get_many = AsyncMock()
+
+        loader = ModuleLoader(kernel)
+        module = MagicMock()
+        module.register = MagicMock()
+        module.register.__loops__ = []
+        module.register.__watchers__ = []
+        module.register.__event_handlers__ = []
+        module.register.__on_load__ = None
+        module.register.__on_install__ = MagicMock(return_value=None)
+        module._class_instance = None
+
+        await loader.run_post_load(module, "My Mod+v2", is_install=True)
+
+        prefetched = kernel.db_manager.db_get_many.await_args_list[-1].args
+        written = kernel.db_set.await_args.args
+        assert prefetched == ("mcub_module_flags", [written[1]])
+        assert written[:2] == ("mcub_module_flags", "__installed__My_Mod_v2")
+
 
 class TestClassStylePreInstallRequirements:
     """Test pre_install_requirements for class-style modules"""
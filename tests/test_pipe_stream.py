@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Шмэлькa | @hairpin01
+
+"""
+Tests for PipeStream and streamed pipeline stages
+"""
+
+import pytest
+
+from core.lib.utils import pipe_stream
+from core.lib.utils.pipe_stream import (
+    PipeStream,
+    accepts_stream,
+    read_pipe,
+    streaming,
+)
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestPipeStreamLines:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "parts",
+        [
+            ("a\nb\n",),
+            ("a\nb", "c\n", "\nd"),
+            ("a\r", "\nb\r\n", "c\r"),
+            ("x\x0by\x1cz ", "w"),
+            ("", "\n", "\n"),
+        ],
+    )
+    async def test_lines_match_splitlines_across_chunk_borders(self, parts):
+        text = "".join(parts)
+
+        assert await _collect(PipeStream(_chunks(*parts)).lines()) == (
+            text.splitlines()
+        )
+
+    @pytest.mark.asyncio
+    async def test_lines_with_newline_match_str_split(self):
+        parts = ("a\r\nb", "\n", "c\n")
+
+        lines = await _collect(PipeStream(_chunks(*parts)).lines("\n"))
+
+        assert lines == "".join(parts).split("\n")
+
+    @pytest.mark.asyncio
+    async def test_multichar_separator_split_across_chunks(self):
+        parts = ("a-", "-b", "--", "c-")
+
+        lines = await _collect(PipeStream(_chunks(*parts)).lines("--"))
+
+        assert lines == "".join(parts).split("--")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("newline", [None, "\n"])
+    async def test_overlong_line_is_split_at_cap(self, monkeypatch, newline):
+        monkeypatch.setattr(pipe_stream, "MAX_LINE_CHARS", 4)
+        parts = ("ab", "cde", "fgh", "ij\nk")
+
+        lines = await _collect(PipeStream(_chunks(*parts)).lines(newline))
+
+        assert lines == ["abcd", "efgh", "ij", "k"]
+
+    @pytest.mark.asyncio
+    async def test_from_lines_joins_like_str_join(self):
+        stream = PipeStream.from_lines(["a", "", "b"])
+
+        assert await stream.read() == "a\n\nb"
+
+    @pytest.mark.asyncio
+    async def test_from_file_streams_in_chunks(self, tmp_path):
+        path = tmp_path / "big.txt"
+        path.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+        stream = PipeStream.from_file(str(path), chunk_size=100)
+        chunks = await _collect(stream.chunks())
+
+        assert max(len(chunk) for chunk in chunks) == 100
+        assert "".join(chunks) == path.read_text()
+
+
+class TestPipeStreamClose:
+    @pytest.mark.asyncio
+    async def test_aclose_stops_producer_and_runs_on_close(self):
+        produced = []
+        closed = []
+
+        async def _endless():
+            i = 0
+            try:
+                while True:
+                    produced.append(i)
+                    yield f"{i}\n"
+                    i += 1
+            finally:
+                closed.append("gen")
+
+        stream = PipeStream(_endless(), on_close=lambda: closed.append("cb"))
+        lines = stream.lines()
+        assert [await anext(lines) for _ in range(3)] == ["0", "1", "2"]
+
+        await stream.aclose()
+
+        assert len(produced) <= 4
+        assert closed == ["gen", "cb"]
+        assert stream.closed
+        assert await stream.read() == ""
+
+    @pytest.mark.asyncio
+    async def test_read_pipe_materializes_any_value(self):
+        assert await read_pipe(None) == ""
+        assert await read_pipe("text") == "text"
+        assert await read_pipe(42) == "42"
+        stream = PipeStream.from_text("a\nb")
+        assert await read_pipe(stream) == "a\nb"
+        assert stream.closed
+
+
+class TestStreamingMarker:
+    def test_marker_found_through_wrappers(self):
+        @streaming
+        async def cmd_head(self, event):
+            pass
+
+        async def wrapper(event):
+            pass
+
+        async def owner_wrapper(event):
+            pass
+
+        wrapper.__original__ = cmd_head
+        owner_wrapper.__original__ = wrapper
+
+        assert accepts_stream(cmd_head)
+        assert accepts_stream(owner_wrapper)
+
+    def test_unmarked_handler_does_not_accept_streams(self):
+        async def cmd_echo(event):
+            pass
+
+        assert not accepts_stream(cmd_echo)
+        assert not accepts_stream(None)
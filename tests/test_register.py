@@ -273,12 +273,12 @@ class TestInfiniteLoop:
         loop._kernel = MagicMock()
 
         loop.start()
-        first_task = loop._task
+        first_job = loop._job_id
 
         loop.start()
-        second_task = loop._task
+        second_job = loop._job_id
 
-        assert first_task is second_task
+        assert first_job is second_job
 
         loop.stop()
 
@@ -324,6 +324,92 @@ class TestInfiniteLoop:
 
         loop.stop()
 
+    @pytest.mark.asyncio
+    async def test_loop_runs_on_kernel_scheduler(self):
+        """Loops become jobs on the kernel's running scheduler."""
+        from types import SimpleNamespace
+
+        from core.lib.loader.register import InfiniteLoop
+        from core.lib.time.scheduler import TaskScheduler
+
+        kernel = SimpleNamespace(logger=MagicMock(), power_save_mode=False)
+        kernel.scheduler = TaskScheduler(kernel)
+        await kernel.scheduler.start()
+        calls = []
+
+        async def tick(k):
+            calls.append(k)
+
+        loop = InfiniteLoop(tick, interval=60, autostart=True, wait_before=False)
+        loop._kernel = kernel
+        loop.start()
+        await asyncio.sleep(0.02)
+
+        assert calls == [kernel]
+        assert kernel.scheduler.get_task_count() == 1
+        assert 59 < loop.stats()["next_run_in"] <= 60
+
+        loop.stop()
+        assert kernel.scheduler.get_task_count() == 0
+        await kernel.scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_loop_pauses_in_power_save_and_counts_overruns(self):
+        """Power-save mode skips iterations; overlapping ones are overruns."""
+        from types import SimpleNamespace
+
+        from core.lib.loader.register import InfiniteLoop
+
+        kernel = SimpleNamespace(logger=MagicMock(), power_save_mode=True)
+        calls = []
+
+        async def slow(k):
+            calls.append(1)
+            await asyncio.sleep(0.05)
+
+        loop = InfiniteLoop(slow, interval=0.01, autostart=True, wait_before=False)
+        loop._kernel = kernel
+        loop.start()
+        await asyncio.sleep(0.03)
+        assert calls == []
+        assert loop.stats()["paused"] >= 2
+
+        kernel.power_save_mode = False
+        await asyncio.sleep(0.04)
+        stats = loop.stats()
+        loop.stop()
+
+        assert calls == [1]
+        assert stats["overruns"] >= 1
+        assert stats["next_run_in"] is not None
+        assert loop.stats()["next_run_in"] is None
+
+
+def test_get_loop_stats_covers_every_module():
+    """get_loop_stats reports each module loop with its module name."""
+    from types import SimpleNamespace
+
+    from core.lib.loader.register import InfiniteLoop, Register
+
+    async def ping(kernel):
+        pass
+
+    loop = InfiniteLoop(ping, interval=30, autostart=False, wait_before=True)
+    kernel = MagicMock()
+    kernel.loaded_modules = {
+        "pinger": SimpleNamespace(register=SimpleNamespace(__loops__=[loop]))
+    }
+    kernel.system_modules = {"core": SimpleNamespace()}
+
+    stats = Register(kernel).get_loop_stats()
+
+    assert len(stats) == 1
+    assert stats[0]["module"] == "pinger"
+    assert stats[0]["name"] == "ping"
+    assert stats[0]["interval"] == 30
+    assert stats[0]["running"] is False
+    assert stats[0]["next_run_in"] is None
+
 
 class TestWatcherFilters:
     """Test _watcher_passes_filters function"""
@@ -662,3 +748,147 @@ class TestWatcherManagement:
                 delattr(module_obj, "register")
             else:
                 module_obj.register = previous_register
+
+
+class TestWatcherRouter:
+    """Test single-binding watcher fan-out."""
+
+    @staticmethod
+    def _make_kernel():
+        kernel = MagicMock()
+        kernel.client = MagicMock()
+        kernel.client._event_builders = []
+        kernel.client.add_event_handler.side_effect = (
+            lambda cb, ev: kernel.client._event_builders.append((ev, cb))
+        )
+        kernel.bot_client = None
+        kernel.current_loading_module = "router_mod"
+        kernel.loaded_modules = {}
+        kernel.system_modules = {}
+        kernel._disabled_watchers = set()
+        return kernel
+
+    @staticmethod
+    def _make_event(out=False, megagroup=False, text=""):
+        from types import SimpleNamespace
+
+        msg = SimpleNamespace(
+            out=out, media=None, fwd_from=None, reply_to=None, text=text
+        )
+        chat = SimpleNamespace(megagroup=megagroup, broadcast=False, gigagroup=False)
+        return SimpleNamespace(message=msg, chat=chat, chat_id=1, sender_id=2)
+
+    @pytest.mark.asyncio
+    async def test_watchers_share_one_binding_and_route_by_tags(self):
+        from types import SimpleNamespace
+
+        from core.lib.loader.register import Register
+
+        kernel = self._make_kernel()
+        register = Register(kernel)
+        module = SimpleNamespace(__name__="router_mod")
+        calls = []
+
+        async def on_pm(event):
+            calls.append("pm")
+
+        async def on_group(event):
+            calls.append("group")
+
+        async def on_hello(event):
+            calls.append("hello")
+
+        register.watcher(module=module, only_pm=True)(on_pm)
+        register.watcher(module=module, only_groups=True)(on_group)
+        register.watcher(module=module, contains="hello")(on_hello)
+
+        assert kernel.client.add_event_handler.call_count == 1
+        router = register.get_watcher_router(kernel.client)
+        assert len(router) == 3
+
+        await router.dispatch(self._make_event(megagroup=True, text="hello there"))
+        assert calls == ["group", "hello"]
+
+        calls.clear()
+        await router.dispatch(self._make_event(text="bye"))
+        assert calls == ["pm"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_and_unbound_watchers_are_skipped(self):
+        from types import SimpleNamespace
+
+        from core.lib.loader.register import Register
+
+        kernel = self._make_kernel()
+        register = Register(kernel)
+        module = SimpleNamespace(__name__="router_mod")
+        calls = []
+
+        async def first(event):
+            calls.append("first")
+
+        async def second(event):
+            calls.append("second")
+
+        register.watcher(module=module)(first)
+        register.watcher(module=module)(second)
+        router = register.get_watcher_router(kernel.client)
+
+        kernel._disabled_watchers.add(("router_mod", "first"))
+        await router.dispatch(self._make_event())
+        assert calls == ["second"]
+
+        wrapper = module.register.__watchers__[1][0]
+        router.remove(wrapper)
+        calls.clear()
+        await router.dispatch(self._make_event())
+        assert calls == []
+
+
+class TestWatcherFilterCompilation:
+    """Test precompiled watcher predicates."""
+
+    def test_only_present_checks_are_evaluated(self):
+        from types import SimpleNamespace
+
+        from core.lib.loader.watchers import WatcherEventFacts, WatcherFilter
+
+        class ExplodingMessage:
+            out = False
+            text = ""
+
+            @property
+            def media(self):
+                raise AssertionError("media inspected for an only_pm watcher")
+
+        event = SimpleNamespace(
+            message=ExplodingMessage(),
+            chat=SimpleNamespace(megagroup=False, broadcast=False, gigagroup=False),
+        )
+        assert WatcherFilter({"only_pm": True})(WatcherEventFacts(event)) is True
+
+    def test_regex_is_compiled_once(self, monkeypatch):
+        import re
+
+        from core.lib.loader.watchers import WatcherEventFacts, WatcherFilter
+
+        watcher_filter = WatcherFilter({"regex": r"^ping\s+\d+$"})
+
+        def _no_search(*_args, **_kwargs):
+            raise AssertionError("re.search called on the hot path")
+
+        monkeypatch.setattr(re, "search", _no_search)
+
+        event = MagicMock()
+        event.message.text = "ping 42"
+        assert watcher_filter(WatcherEventFacts(event)) is True
+        event.message.text = "pong"
+        assert watcher_filter(WatcherEventFacts(event)) is False
+
+    def test_compile_watcher_filter_is_cached(self):
+        from core.lib.loader.watchers import compile_watcher_filter
+
+        first = compile_watcher_filter({"contains": "x", "out": True})
+        second = compile_watcher_filter({"out": True, "contains": "x"})
+        assert first is second
+        assert not compile_watcher_filter({"only_pm": False})
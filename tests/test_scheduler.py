@@ -6,6 +6,7 @@ Tests for task scheduler
 """
 
 import asyncio
+import itertools
 import time
 from unittest.mock import MagicMock
 
@@ -388,3 +389,279 @@ class TestSchedulerState:
         await scheduler.stop()
 
         assert scheduler.running is False
+
+
+@pytest.mark.asyncio
+class TestSchedulerDispatcher:
+    """Test the heap-driven dispatcher"""
+
+    async def _scheduler(self):
+        from core.lib.time.scheduler import TaskScheduler
+
+        kernel = MagicMock()
+        kernel.log_error = MagicMock()
+        scheduler = TaskScheduler(kernel)
+        await scheduler.start()
+        return scheduler
+
+    async def test_idle_jobs_do_not_own_tasks(self):
+        scheduler = await self._scheduler()
+
+        async def job():
+            pass
+
+        for _ in range(50):
+            await scheduler.add_interval_task(job, 60)
+
+        assert scheduler.get_task_count() == 50
+        assert scheduler.get_active_tasks() == []
+        names = {t.get_name() for t in asyncio.all_tasks()}
+        assert sum(name.startswith("interval_") for name in names) == 0
+        await scheduler.stop()
+
+    async def test_interval_is_fixed_rate(self):
+        scheduler = await self._scheduler()
+        starts = []
+
+        async def slow():
+            starts.append(time.monotonic())
+            await asyncio.sleep(0.04)
+
+        await scheduler.add_interval_task(slow, 0.1)
+        await asyncio.sleep(0.45)
+        await scheduler.stop()
+
+        assert len(starts) >= 3
+        # With sleep-then-run the gap would be interval + 0.04.
+        gaps = [b - a for a, b in itertools.pairwise(starts)]
+        assert all(gap < 0.13 for gap in gaps)
+
+    async def test_max_concurrency_skips_overlapping_runs(self):
+        scheduler = await self._scheduler()
+        active = []
+        peak = []
+
+        async def long_job():
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.25)
+            active.pop()
+
+        job_id = await scheduler.add_interval_task(long_job, 0.05)
+        await asyncio.sleep(0.4)
+        stats = scheduler.get_job_stats()[job_id]
+        await scheduler.stop()
+
+        assert max(peak) == 1
+        assert stats["skipped"] >= 2
+
+    async def test_misfire_grace_skips_late_runs(self):
+        scheduler = await self._scheduler()
+        ran = []
+
+        async def job():
+            ran.append(1)
+
+        job_id = await scheduler.add_interval_task(job, 0.05, misfire_grace=0.01)
+        # Block the loop so the first run is due long before it can start.
+        time.sleep(0.12)
+        await asyncio.sleep(0.01)
+        stats = scheduler.get_job_stats()[job_id]
+        await scheduler.stop()
+
+        assert ran == []
+        assert stats["misfired"] == 1
+        assert stats["last_lag"] >= 0.05
+
+    async def test_jitter_delays_within_bound(self):
+        scheduler = await self._scheduler()
+
+        async def job():
+            pass
+
+        base = time.monotonic()
+        job_id = await scheduler.add_interval_task(job, 10, jitter=2)
+        due = scheduler._task_registry[job_id].due
+        await scheduler.stop()
+
+        assert base + 10 <= due <= time.monotonic() + 12
+
+    async def test_stats_record_duration_and_failures(self):
+        scheduler = await self._scheduler()
+
+        async def failing():
+            await asyncio.sleep(0.02)
+            raise ValueError("boom")
+
+        job_id = await scheduler.add_interval_task(failing, 0.05)
+        await asyncio.sleep(0.12)
+        stats = scheduler.get_job_stats()[job_id]
+        await scheduler.stop()
+
+        assert stats["runs"] >= 1
+        assert stats["failures"] == stats["runs"]
+        assert stats["max_duration"] >= 0.02
+        assert scheduler.kernel.log_error.called
+
+    async def test_cancel_task_removes_periodic_job(self):
+        scheduler = await self._scheduler()
+        ran = []
+
+        async def job():
+            ran.append(1)
+
+        job_id = await scheduler.add_interval_task(job, 0.05)
+        assert scheduler.cancel_task(job_id) is True
+        await asyncio.sleep(0.12)
+        await scheduler.stop()
+
+        assert ran == []
+        assert scheduler.cancel_task(job_id) is False
+
+    async def test_reusing_task_id_replaces_job(self):
+        scheduler = await self._scheduler()
+        ran = []
+
+        async def first():
+            ran.append("first")
+
+        async def second():
+            ran.append("second")
+
+        await scheduler.add_task(first, 0.05, task_id="same")
+        await scheduler.add_task(second, 0.05, task_id="same")
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+
+        assert ran == ["second"]
+
+    async def test_cron_task_waits_for_next_match(self):
+        scheduler = await self._scheduler()
+
+        async def job():
+            pass
+
+        job_id = await scheduler.add_cron_task(job, "*/5 * * * *")
+        job = scheduler._task_registry[job_id]
+        await scheduler.stop()
+
+        assert job.wall_target.minute % 5 == 0
+        assert 0 < job.due - time.monotonic() <= 300
+
+    async def test_invalid_cron_rejected(self):
+        scheduler = await self._scheduler()
+
+        async def job():
+            pass
+
+        with pytest.raises(ValueError):
+            await scheduler.add_cron_task(job, "61 * * * *")
+        await scheduler.stop()
+
+    async def test_first_delay_runs_immediately(self):
+        scheduler = await self._scheduler()
+        ran = []
+
+        async def job():
+            ran.append(time.monotonic())
+
+        await scheduler.add_interval_task(job, 60, first_delay=0)
+        await asyncio.sleep(0.02)
+        await scheduler.stop()
+
+        assert len(ran) == 1
+
+    async def test_failures_back_off_until_success(self):
+        scheduler = await self._scheduler()
+        errors = []
+        outcomes = iter([False, False, False, True])
+
+        async def flaky():
+            if not next(outcomes, True):
+                raise RuntimeError("down")
+
+        job_id = await scheduler.add_interval_task(
+            flaky,
+            0.02,
+            first_delay=0,
+            max_backoff=0.05,
+            on_error=errors.append,
+        )
+        job = scheduler.get_job(job_id)
+        await asyncio.sleep(0.01)
+        assert job.consecutive_failures == 1
+        assert job.due - time.monotonic() <= 0.02
+
+        await asyncio.sleep(0.02)
+        # Second failure in a row: next run two intervals out.
+        assert job.consecutive_failures == 2
+        assert job.due - time.monotonic() > 0.02
+
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+
+        assert len(errors) == 3
+        assert job.consecutive_failures == 0
+        scheduler.kernel.log_error.assert_not_called()
+
+    async def test_pause_if_skips_due_runs(self):
+        scheduler = await self._scheduler()
+        paused = True
+        ran = []
+
+        async def job():
+            ran.append(1)
+
+        job_id = await scheduler.add_interval_task(
+            job, 0.01, first_delay=0, pause_if=lambda: paused
+        )
+        await asyncio.sleep(0.035)
+        assert ran == []
+        assert scheduler.get_job(job_id).paused >= 2
+
+        paused = False
+        await asyncio.sleep(0.03)
+        await scheduler.stop()
+        assert ran
+
+
+class TestCronExpression:
+    """Test cron expression parsing"""
+
+    def test_next_after(self):
+        from datetime import datetime
+
+        from core.lib.time.cron import CronExpression
+
+        weekdays = CronExpression("30 9 * * 1-5")
+        assert weekdays.next_after(datetime(2026, 1, 2, 10)) == datetime(
+            2026, 1, 5, 9, 30
+        )
+        every = CronExpression("*/15 * * * *")
+        assert every.next_after(datetime(2026, 1, 2, 10, 15)) == datetime(
+            2026, 1, 2, 10, 30
+        )
+        leap = CronExpression("0 0 29 2 *")
+        assert leap.next_after(datetime(2026, 1, 1)) == datetime(2028, 2, 29)
+
+    def test_day_or_weekday(self):
+        from datetime import datetime
+
+        from core.lib.time.cron import CronExpression
+
+        # 13th of the month or any Friday
+        expr = CronExpression("0 12 13 * 5")
+        assert expr.next_after(datetime(2026, 1, 3)) == datetime(2026, 1, 9, 12)
+
+    def test_aliases_and_sunday_seven(self):
+        from core.lib.time.cron import CronExpression
+
+        assert CronExpression("@weekly").weekdays == frozenset({0})
+        assert CronExpression("0 0 * * 7").weekdays == frozenset({0})
+
+    def test_invalid(self):
+        from core.lib.time.cron import CronExpression
+
+        for bad in ("* * * *", "60 * * * *", "*/0 * * * *", "a * * * *"):
+            with pytest.raises(ValueError):
+                CronExpression(bad)
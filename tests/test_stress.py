@@ -39,7 +39,9 @@ class TestSchedulerStress:
 
             elapsed = loop.time() - start
             assert elapsed < 2.0, f"Scheduling 100 tasks took {elapsed}s"
-            assert len(scheduler.tasks) == 100
+            assert scheduler.get_task_count() == 100
+            # Idle jobs wait on the shared heap, not in tasks of their own.
+            assert scheduler.tasks == []
         finally:
             await scheduler.stop()
 
@@ -101,7 +103,9 @@ class TestSchedulerStress:
 
             elapsed = loop.time() - start
             assert elapsed < 3.0, f"Concurrent task addition took {elapsed}s"
-            assert len(scheduler.tasks) == 100
+            assert scheduler.get_task_count() == 100
+            # Idle jobs wait on the shared heap, not in tasks of their own.
+            assert scheduler.tasks == []
         finally:
             await scheduler.stop()
 
@@ -216,7 +220,7 @@ class TestSchedulerReliability:
 
             await asyncio.sleep(0.2)
 
-            assert len(scheduler.tasks) == 2
+            assert scheduler.get_task_count() == 2
         finally:
             await scheduler.stop()
 
@@ -265,13 +269,14 @@ class TestSchedulerReliability:
 
                 await scheduler.add_interval_task(dummy_task, 60.0)
 
-            assert len(scheduler.tasks) == 10
+            assert scheduler.get_task_count() == 10
 
             scheduler.cancel_all_tasks()
 
             await asyncio.sleep(0.1)
 
-            assert len(scheduler.tasks) == 0, "All tasks should be cancelled"
+            assert scheduler.get_task_count() == 0, "All tasks should be cancelled"
+            assert len(scheduler.tasks) == 0
         finally:
             await scheduler.stop()
 
@@ -292,11 +297,12 @@ class TestSchedulerReliability:
 
             await scheduler.add_interval_task(dummy_task, 60.0)
 
-        assert len(scheduler.tasks) == 5
+        assert scheduler.get_task_count() == 5
 
         await scheduler.stop()
 
         assert len(scheduler.tasks) == 0, "Tasks should be empty after stop"
+        assert scheduler.get_task_count() == 0
         assert scheduler.running is False
 
 
@@ -336,7 +342,7 @@ class TestSchedulerConcurrency:
 
             elapsed = loop.time() - start
             assert elapsed < 3.0, f"Concurrent writes took {elapsed}s"
-            assert len(scheduler.tasks) == 200
+            assert scheduler.get_task_count() == 200
         finally:
             await scheduler.stop()
 
@@ -363,7 +369,7 @@ class TestSchedulerConcurrency:
 
             elapsed = loop.time() - start
             assert elapsed < 2.0, f"200 rapid writes took {elapsed}s"
-            assert len(scheduler.tasks) == 200
+            assert scheduler.get_task_count() == 200
         finally:
             await scheduler.stop()
 
@@ -4,8 +4,9 @@
 from __future__ import annotations
 
 # author: @Hairpin00
-# version: 1.1.0
+# version: 1.2.0
 # description: MCUB command argument parser
+import functools
 import re
 import shlex
 from dataclasses import dataclass
@@ -345,7 +346,7 @@ class PipelineSegment:
     None  = first segment (no preceding operator)
     '|'   = pipe from previous output
     '&&'  = new-message sequential (run after previous finishes)
-    '&'   = same-message sequential (no pipe)
+    '&'   = run the preceding segments as a background job
     '||'  = conditional: run only if previous command returned an error
     """
 
@@ -426,7 +427,11 @@ class PipelineParser:
         "&",
     )
 
-    _OP_PATTERN = re.compile(r"^((\|>|\|\||&&)\s*)")
+    _OP_PATTERN = re.compile(r"((\|>|\|\||&&)\s*)")
+
+    # Characters the tokenizer has to stop at; everything between two of
+    # them is copied as one slice.
+    _SPECIAL = re.compile(r"[\\\"'|&]")
 
     @staticmethod
     def _detect_operator(text: str, i: int) -> tuple[str | None, str | None]:
@@ -434,128 +439,123 @@ class PipelineParser:
 
         Returns (matched_string, operator_key) or (None, None).
         """
-        remaining = text[i:]
         for op_str, op_key in PipelineParser._OPERATORS:
-            if remaining.startswith(op_str):
+            if text.startswith(op_str, i):
                 return op_str, op_key
-        match = PipelineParser._OP_PATTERN.match(remaining)
+        match = PipelineParser._OP_PATTERN.match(text, i)
         if match:
-            op = match.group(2)
-            op_map = {"|": "|", "|>": "|>", "&": "&", "&&": "&&", "||": "||"}
-            return match.group(1), op_map.get(op)
+            return match.group(1), match.group(2)
         return None, None
 
     def __init__(self, text: str) -> None:
         self.text = text
-        self._pending_exit_code: int | None = None
-        self.segments: list[PipelineSegment] = self._parse()
+        if len(text) <= _PARSE_CACHE_MAX_TEXT:
+            parsed = _parse_cached(text)
+        else:
+            parsed = PipelineParser._tokenize(text)
+        self.segments: list[PipelineSegment] = [
+            PipelineSegment(command, operator, exit_code)
+            for command, operator, exit_code in parsed
+        ]
 
-    def _parse(self) -> list[PipelineSegment]:
-        segments: list[PipelineSegment] = []
-        buf: list[str] = []
-        pending_op: str | None = None
-        i = 0
-        length = len(self.text)
-        in_quotes = False
-        quote_char: str | None = None
-
-        while i < length:
-            ch = self.text[i]
-
-            if ch == "\\" and not in_quotes:
-                i += 1
-                if i < length:
-                    remaining_after = self.text[i:]
-                    escaped = False
-
-                    for core in self._ESCAPE_CORES:
-                        if remaining_after.startswith(core):
-                            result = core.strip()
-                            buf.append(result)
-                            i += len(core)
-                            escaped = True
-                            break
+    @staticmethod
+    def _tokenize(text: str) -> tuple[tuple[str, str | None, int | None], ...]:
+        """Split *text* into ``(command, operator, exit_code)`` triples.
 
-                    if not escaped:
-                        # Try single operator (no leading space): \| -> |, &&& -> &&, etc.
-                        for op in ("||", "&&", "|", "&"):
-                            if remaining_after.startswith(op):
-                                buf.append(op)
-                                i += len(op)
-                                escaped = True
-                                break
-
-                    if not escaped:
-                        buf.append(self.text[i])
-                        i += 1
+        Single pass over *text*: a regex search jumps to the next backslash,
+        quote, ``|`` or ``&``, quoted strings are skipped with ``str.find``
+        and operators are matched in place, so the only copies made are the
+        segment slices themselves.
+        """
+        detect = PipelineParser._detect_operator
+        special = PipelineParser._SPECIAL.search
+        segments: list[tuple[str, str | None, int | None]] = []
+        pieces: list[str] = []
+        pending_op: str | None = None
+        pending_exit_code: int | None = None
+        length = len(text)
+        # text[start:i] is plain text not yet copied into pieces
+        start = i = 0
+        quote: str | None = None
+
+        while True:
+            if quote is not None:
+                end = text.find(quote, i)
+                if end == -1:
+                    break
+                quote = None
+                i = end + 1
                 continue
 
-            if ch in ('"', "'"):
-                if in_quotes and ch == quote_char:
-                    in_quotes = False
-                    quote_char = None
-                elif not in_quotes:
-                    in_quotes = True
-                    quote_char = ch
-                buf.append(ch)
-                i += 1
+            found = special(text, i)
+            if found is None:
+                break
+            j = found.start()
+            ch = text[j]
+
+            if ch == "\\":
+                pieces.append(text[start:j])
+                j += 1
+                if j < length:
+                    for core in PipelineParser._ESCAPE_CORES:
+                        if text.startswith(core, j):
+                            pieces.append(core.strip())
+                            j += len(core)
+                            break
+                    else:
+                        pieces.append(text[j])
+                        j += 1
+                start = i = j
                 continue
 
-            if in_quotes:
-                buf.append(ch)
-                i += 1
+            if ch in "\"'":
+                quote = ch
+                i = j + 1
                 continue
 
-            matched_str, matched_key = self._detect_operator(self.text, i)
-
-            if matched_str and matched_key:
-                seg = "".join(buf).strip()
-                exit_code: int | None = None
-
-                # ||[code] syntax
-                if matched_key == "||":
-                    after = i + len(matched_str)
-                    if after < length and self.text[after : after + 1] == "[":
-                        end_b = self.text.find("]", after + 1)
-                        if end_b != -1:
-                            try:
-                                exit_code = int(self.text[after + 1 : end_b])
-                            except ValueError:
-                                pass
-                            i = end_b + 1
-                            matched_str = ""  # i yжe нa нyжнoй пoзиции
-
-                if seg:
-                    segments.append(
-                        PipelineSegment(
-                            command=seg,
-                            operator=pending_op,
-                            exit_code=self._pending_exit_code,
-                        )
-                    )
-                    self._pending_exit_code = None
-                pending_op = matched_key
-                buf = []
-                if exit_code is not None:
-                    self._pending_exit_code = exit_code
-                i += len(matched_str)
+            # '|' or '&': operators may also start at the space before it.
+            op_at = j
+            matched_str, matched_key = None, None
+            if j > start and text[j - 1] == " ":
+                op_at = j - 1
+                matched_str, matched_key = detect(text, op_at)
+            if not matched_key:
+                op_at = j
+                matched_str, matched_key = detect(text, op_at)
+            if not (matched_str and matched_key):
+                i = j + 1
                 continue
 
-            buf.append(ch)
-            i += 1
+            pieces.append(text[start:op_at])
+            seg = "".join(pieces).strip()
+            pieces = []
+            after = op_at + len(matched_str)
+            exit_code: int | None = None
+
+            # ||[code] syntax
+            if matched_key == "||" and text.startswith("[", after):
+                end_b = text.find("]", after + 1)
+                if end_b != -1:
+                    try:
+                        exit_code = int(text[after + 1 : end_b])
+                    except ValueError:
+                        pass
+                    after = end_b + 1
+
+            if seg:
+                segments.append((seg, pending_op, pending_exit_code))
+                pending_exit_code = None
+            pending_op = matched_key
+            if exit_code is not None:
+                pending_exit_code = exit_code
+            start = i = after
 
         # trailing segment
-        seg = "".join(buf).strip()
+        pieces.append(text[start:])
+        seg = "".join(pieces).strip()
         if seg:
-            segments.append(
-                PipelineSegment(
-                    command=seg,
-                    operator=pending_op,
-                    exit_code=self._pending_exit_code,
-                )
-            )
-
-        return segments
+            segments.append((seg, pending_op, pending_exit_code))
+        return tuple(segments)
 
     def is_simple(self) -> bool:
         """True when there are no pipeline operators (single command)."""
@@ -565,6 +565,16 @@ class PipelineParser:
         return f"PipelineParser(segments={self.segments!r})"
 
 
+# Command texts up to this length have their parse cached (aliases, macros
+# and repeated commands); longer pastes are parsed every time.
+_PARSE_CACHE_MAX_TEXT = 4096
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(text: str) -> tuple[tuple[str, str | None, int | None], ...]:
+    return PipelineParser._tokenize(text)
+
+
 def parse_pipeline(text: str) -> PipelineParser:
     """Parse *text* into a :class:`PipelineParser`.  Convenience wrapper."""
     return PipelineParser(text)
@@ -8,6 +8,8 @@ Fixed: Correctly handles nested entities, multi-byte characters, and preserves \
 """
 
 import html
+import re
+from bisect import bisect_left, bisect_right
 from collections import deque
 from html.parser import HTMLParser
 
@@ -25,6 +27,9 @@ from telethon.tl.types import (
     MessageEntityUnderline,
 )
 
+# Characters outside the BMP take two UTF-16 code units (a surrogate pair).
+_ASTRAL_RE = re.compile("[\U00010000-\U0010ffff]")
+
 
 def _utf16_len(text: str) -> int:
     """Calculate UTF-16 length of a string."""
@@ -33,20 +38,88 @@ def _utf16_len(text: str) -> int:
 
 def _utf16_slice(text: str, offset: int, length: int) -> str:
     """Extract a substring using UTF-16 offsets."""
-    if not text:
-        return ""
-
-    try:
-        utf16_bytes = text.encode("utf-16-le")
-        start_byte = offset * 2
-        end_byte = min((offset + length) * 2, len(utf16_bytes))
-        if start_byte >= end_byte:
+    return UTF16Text(text).slice(offset, length)
+
+
+class UTF16Text:
+    """
+    A string indexed by UTF-16 code units, as Telegram entity offsets are.
+
+    The text is scanned once for surrogate pairs and their positions are kept
+    as sorted lists, so slicing by entity offsets costs only the slice itself
+    and mapping between UTF-16 offsets and character indices is a binary
+    search.
+    Build one per message and reuse it for every entity instead of calling
+    :func:`_utf16_slice` repeatedly.
+
+    Example:
+        >>> t = UTF16Text("A😀BC")
+        >>> len(t), t.slice(1, 2), t.truncate(2), t.offset(2)
+        (5, '😀', 'A', 3)
+    """
+
+    __slots__ = ("_chars", "_encoded", "_units", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._encoded: bytes | None = None
+        # Character indices of the surrogate-pair characters, and the UTF-16
+        # offsets they start at; both empty for BMP-only text.
+        self._chars = [match.start() for match in _ASTRAL_RE.finditer(text)]
+        self._units = [index + n for n, index in enumerate(self._chars)]
+
+    def __len__(self) -> int:
+        return len(self.text) + len(self._chars)
+
+    def offset(self, index: int) -> int:
+        """Return the UTF-16 offset of character *index*."""
+        index = max(0, min(index, len(self.text)))
+        return index + bisect_left(self._chars, index)
+
+    def index(self, offset: int) -> int:
+        """
+        Return the character index at UTF-16 *offset*.
+
+        An offset that falls inside a surrogate pair is moved back to the
+        start of that pair, so ``text[:index(n)]`` never splits a character.
+        """
+        offset = max(0, min(offset, len(self)))
+        units = self._units
+        if not units:
+            return offset
+        # Pairs that end at or before the offset.
+        pairs = bisect_right(units, offset - 2)
+        if pairs < len(units) and units[pairs] == offset - 1:
+            offset -= 1
+        return offset - pairs
+
+    def slice(self, offset: int, length: int) -> str:
+        """Return the text between UTF-16 *offset* and ``offset + length``."""
+        text = self.text
+        if not text:
             return ""
-        return utf16_bytes[start_byte:end_byte].decode("utf-16-le")
-    except Exception:
-        if offset < len(text):
-            return text[offset : min(offset + length, len(text))]
-        return ""
+        if not self._chars:
+            # One code unit per character: slice the string directly.
+            end = min(offset + length, len(text))
+            return text[offset:end] if offset < end else ""
+        encoded = self._encoded
+        if encoded is None:
+            encoded = self._encoded = text.encode("utf-16-le")
+        try:
+            start_byte = offset * 2
+            end_byte = min((offset + length) * 2, len(encoded))
+            if start_byte >= end_byte:
+                return ""
+            return encoded[start_byte:end_byte].decode("utf-16-le")
+        except Exception:
+            # The range splits a surrogate pair.
+            if offset < len(text):
+                return text[offset : min(offset + length, len(text))]
+            return ""
+
+    def truncate(self, max_length: int) -> str:
+        """Return the longest prefix that fits in *max_length* UTF-16 units."""
+        return self.text[: self.index(max_length)]
 
 
 class TelegramHTMLParser(HTMLParser):
@@ -146,8 +219,8 @@ class HTMLDecorator:
         if not entities:
             return html.escape(text, quote=False)
 
-        utf16_bytes = text.encode("utf-16-le")
-        total_len = len(utf16_bytes) // 2
+        source = UTF16Text(text)
+        total_len = len(source)
 
         # Create events for the sweep-line algorithm
         events = []
@@ -167,11 +240,7 @@ class HTMLDecorator:
         logical_stack = []
         last_pos = 0
 
-        def get_chunk(start, length):
-            """Extract text chunk using UTF-16 offsets."""
-            s = start * 2
-            e = (start + length) * 2
-            return utf16_bytes[s:e].decode("utf-16-le")
+        get_chunk = source.slice
 
         for pos, event_type, _, _, entity in events:
             # Add text before this position
@@ -205,7 +274,7 @@ class HTMLDecorator:
             # Open new tags
             while len(current_tags) < len(logical_stack):
                 ent = logical_stack[len(current_tags)]
-                tag, attrs = self._get_tag_attrs(ent, text)
+                tag, attrs = self._get_tag_attrs(ent, source)
                 attr_str = "".join(
                     [
                         f' {k}="{v}"' if v is not None else f" {k}"
@@ -264,7 +333,9 @@ class HTMLDecorator:
             tag = "a"
             # Extract email text from the content
             try:
-                email_text = _utf16_slice(text_content, entity.offset, entity.length)
+                if not isinstance(text_content, UTF16Text):
+                    text_content = UTF16Text(text_content)
+                email_text = text_content.slice(entity.offset, entity.length)
                 attrs["href"] = f"mailto:{email_text}"
             except Exception:
                 attrs["href"] = "mailto:"
@@ -332,6 +403,7 @@ def format_message(
 __all__ = [
     "HTMLDecorator",
     "TelegramHTMLParser",
+    "UTF16Text",
     "_utf16_len",
     "_utf16_slice",
     "format_message",
@@ -3,13 +3,13 @@
 
 # utils/message_helpers.py
 # author: @Hairpin00
-# version: 1.2.0
+# version: 1.3.0
 # description: Helpers for sending messages with HTML markup
 
 import html
 import re
 
-from .html_parser import _utf16_len, parse_html
+from .html_parser import UTF16Text, parse_html
 
 _CUSTOM_EMOJI_TAG_RE = re.compile(r"<tg-emoji[^>]*>(.*?)</tg-emoji>", re.IGNORECASE)
 _LEGACY_EMOJI_WITH_ALT_RE = re.compile(
@@ -79,23 +79,16 @@ def truncate_text_with_entities(text: str, entities: list, max_length: int = 409
     Returns:
         tuple: (truncated text, truncated entities)
     """
-    # Check text length in UTF-16
-    text_length = _utf16_len(text)
+    # A character is at least one UTF-16 unit, so the cut always falls
+    # within the first max_length characters; only that prefix is indexed.
+    index = UTF16Text(text[:max_length])
 
-    if text_length <= max_length:
+    if len(text) <= max_length and len(index) <= max_length:
         return text, entities
 
-    # Truncate text
-    # Find position where we can safely truncate (by UTF-16 character boundary)
-    truncated_text = ""
-    current_length = 0
-
-    for char in text:
-        char_length = _utf16_len(char)
-        if current_length + char_length > max_length:
-            break
-        truncated_text += char
-        current_length += char_length
+    # Truncate on a character boundary, never inside a surrogate pair
+    truncated_text = index.truncate(max_length)
+    current_length = index.offset(len(truncated_text))
 
     # Adjust entities
     truncated_entities = []
@@ -2,7 +2,7 @@
 # Copyright (c) 2026 Шмэлькa | @hairpin01
 
 # author: @Hairpin00
-# version: 1.3.0
+# version: 1.4.0
 # description: raw_html for extracting HTML markup from Telethon messages
 # Fixed: Line breaks now preserved as \n, improved entity handling
 
@@ -32,7 +32,7 @@ from telethon.tl.types import (
     MessageEntityUrl,
 )
 
-from .html_parser import _utf16_len, _utf16_slice
+from .html_parser import UTF16Text
 
 
 class RawHTMLConverter:
@@ -218,6 +218,8 @@ class RawHTMLConverter:
         # Sort events: Position -> Type (end before start) -> Priority
         events.sort(key=lambda x: (x[0], 0 if x[1] == "end" else 1, x[2]))
 
+        # Index the text once; every segment below is sliced from it
+        source = UTF16Text(text)
         result_parts = []
         # Currently open HTML tags as tuples: (entity, closing_html)
         current_tags = []
@@ -227,7 +229,7 @@ class RawHTMLConverter:
         for pos, event_type, _, _, entity in events:
             # Add text segment before this position
             if pos > last_pos:
-                segment = _utf16_slice(text, last_pos, pos - last_pos)
+                segment = source.slice(last_pos, pos - last_pos)
                 if segment:
                     result_parts.append(self._escape_html(segment))
                 last_pos = pos
@@ -259,9 +261,7 @@ class RawHTMLConverter:
             while len(current_tags) < len(logical_stack):
                 entity_to_open = logical_stack[len(current_tags)]
                 # Get entity text for attributes that need it
-                entity_text = _utf16_slice(
-                    text, entity_to_open.offset, entity_to_open.length
-                )
+                entity_text = source.slice(entity_to_open.offset, entity_to_open.length)
                 opening_html, closing_html = self._entity_to_html(
                     entity_to_open, entity_text
                 )
@@ -270,9 +270,9 @@ class RawHTMLConverter:
                 current_tags.append((entity_to_open, closing_html))
 
         # Add remaining text after last entity
-        total_len = _utf16_len(text)
+        total_len = len(source)
         if last_pos < total_len:
-            segment = _utf16_slice(text, last_pos, total_len - last_pos)
+            segment = source.slice(last_pos, total_len - last_pos)
             if segment:
                 result_parts.append(self._escape_html(segment))
 
@@ -457,9 +457,10 @@ def debug_entities(message) -> list[dict]:
     text = text or ""
 
     # Create debug info for each entity
+    source = UTF16Text(text)
     entities_info = []
     for entity in entity_list:
-        entity_text = _utf16_slice(text, entity.offset, entity.length)
+        entity_text = source.slice(entity.offset, entity.length)
         entities_info.append(
             {
                 "type": type(entity).__name__,